@@ -1,3 +1,26 @@
 from django.contrib import admin
+from .models import Application, ApplicationStatus
 
-# Register your models here.
+
+@admin.register(Application)
+class ApplicationAdmin(admin.ModelAdmin):
+    list_display = ['reference', 'merchant', 'product', 'status', 'submitted_at', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['=reference', 'merchant__legal_name']
+    raw_id_fields = ['merchant']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'submitted_at', 'decided_at']
+
+
+@admin.register(ApplicationStatus)
+class ApplicationStatusAdmin(admin.ModelAdmin):
+    list_display = [
+        'application_id', 'application_status', 'stage', 'documents_classified', 'documents_requiring_review',
+        'jobs_in_progress', 'last_activity_at'
+    ]
+    list_filter = ['stage', 'application_status']
+    search_fields = ['^application_id']
+    readonly_fields = ['id', 'application_id'] + ApplicationStatus.SNAPSHOT_FIELDS
+    
+    def has_add_permission(self, request):
+        # Snapshots are maintained from document and job changes
+        return False
@@ -1,4 +1,57 @@
 from rest_framework import serializers
+from ..models import Application, ApplicationStatus
 
 
-# TODO: Add serializers for application_profile models
+class ApplicationSerializer(serializers.ModelSerializer):
+    """Serializer for Application."""
+    
+    class Meta:
+        model = Application
+        fields = [
+            'id',
+            'merchant',
+            'reference',
+            'product',
+            'status',
+            'notes',
+            'created_at',
+            'updated_at',
+            'submitted_at',
+            'decided_at',
+            'created_by',
+        ]
+        read_only_fields = [
+            'id', 'reference', 'created_at', 'updated_at', 'submitted_at', 'decided_at', 'created_by'
+        ]
+
+
+class ApplicationStatusSerializer(serializers.ModelSerializer):
+    """Serializer for the ApplicationStatus snapshot."""
+    
+    class Meta:
+        model = ApplicationStatus
+        fields = [
+            'application_id',
+            'merchant_id',
+            'application_status',
+            'stage',
+            'uploads_pending',
+            'uploads_failed',
+            'documents_uploaded',
+            'documents_classified',
+            'documents_extracted',
+            'documents_requiring_review',
+            'jobs_in_progress',
+            'jobs_failed',
+            'document_types',
+            'missing_document_types',
+            'last_activity_at',
+            'refreshed_at',
+        ]
+        read_only_fields = fields
+
+
+class DashboardQuerySerializer(serializers.Serializer):
+    """Query params of the merchant dashboard."""
+    
+    merchant_id = serializers.UUIDField()
@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import Application_profileViewSet
+from .views import Application_profileViewSet, ApplicationStatusViewSet
 
 router = DefaultRouter()
 router.register(r'application_profile', Application_profileViewSet, basename='application_profile')
+router.register(r'status', ApplicationStatusViewSet, basename='application_status')
 
 urlpatterns = [
     path('', include(router.urls)),
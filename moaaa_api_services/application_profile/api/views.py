@@ -1,26 +1,106 @@
-from rest_framework import viewsets, status
-from rest_framework.response import Response
-
+from collections import Counter
 
-class Application_profileViewSet(viewsets.ViewSet):
-    """API ViewSet for application_profile."""
+from django.http import Http404
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
-    def list(self, request):
-        # TODO: Implement
-        return Response([])
+from document_classification.api.serializers import ClassificationResultSerializer
+from document_classification.models import ClassificationResult
+from merchant_profile.core.implementations.merchant_profile_service_impl import Merchant_profileServiceImpl
+from merchant_profile.dao.implementations.merchant_profile_repository_impl import Merchant_profileRepositoryImpl
+from moaaa_api_services.read_through_cache import get_profile_cache
+from ..models import Application, ApplicationStatus
+from .serializers import ApplicationSerializer, ApplicationStatusSerializer, DashboardQuerySerializer
 
-    def retrieve(self, request, pk=None):
-        # TODO: Implement
-        return Response({})
 
-    def create(self, request):
-        # TODO: Implement
-        return Response({}, status=status.HTTP_201_CREATED)
+class Application_profileViewSet(viewsets.ModelViewSet):
+    """
+    API ViewSet for application_profile.
+    
+    Endpoints:
+        GET /api/applications/application_profile/?merchant_id={id} - List applications
+        POST /api/applications/application_profile/ - Create an application
+        GET /api/applications/application_profile/{id}/ - Get an application
+        PUT/PATCH /api/applications/application_profile/{id}/ - Update an application
+        DELETE /api/applications/application_profile/{id}/ - Delete an application
+        GET /api/applications/application_profile/{id}/documents/ - Active classified documents
+        GET /api/applications/application_profile/cache_stats/ - Profile cache hit-rate metrics
+    
+    Documents are uploaded against the application's ``reference``; its
+    status is at /api/applications/status/{reference}/.
+    """
+    
+    queryset = Application.objects.all()
+    serializer_class = ApplicationSerializer
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        merchant_id = self.request.query_params.get('merchant_id')
+        if merchant_id:
+            queryset = queryset.filter(merchant_id=merchant_id)
+        return queryset
+    
+    def perform_create(self, serializer):
+        created_by = self.request.user.username if self.request.user.is_authenticated else 'anonymous'
+        serializer.save(created_by=created_by)
+    
+    @action(detail=True, methods=['get'])
+    def documents(self, request, pk=None):
+        """The application's active classification results, found through the FK index."""
+        application = self.get_object()
+        results = (
+            ClassificationResult.objects
+            .filter(application=application, is_active=True)
+            .order_by('document_type', '-created_at')
+        )
+        return Response(ClassificationResultSerializer(results, many=True).data)
+    
+    @action(detail=False, methods=['get'])
+    def cache_stats(self, request):
+        """Application lookup cache metrics for this process (hits, misses, loads, hit_rate, ...)."""
+        return Response(get_profile_cache('application').stats())
 
-    def update(self, request, pk=None):
-        # TODO: Implement
-        return Response({})
 
-    def destroy(self, request, pk=None):
-        # TODO: Implement
-        return Response(status=status.HTTP_204_NO_CONTENT)
+class ApplicationStatusViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Precomputed application status snapshots.
+    
+    Endpoints:
+        GET /api/applications/status/ - List snapshots
+        GET /api/applications/status/{application_id}/ - Get one application's snapshot
+        GET /api/applications/status/dashboard/?merchant_id={id} - A merchant's applications
+    """
+    
+    queryset = ApplicationStatus.objects.all()
+    serializer_class = ApplicationStatusSerializer
+    lookup_field = 'application_id'
+    lookup_value_regex = '[^/]+'
+    
+    def get_object(self):
+        snapshot = ApplicationStatus.objects.for_application(self.kwargs['application_id'])
+        if snapshot is None:
+            raise Http404
+        return snapshot
+    
+    @action(detail=False, methods=['get'])
+    def dashboard(self, request):
+        """
+        A merchant's applications with their status, most recently active first.
+        
+        Response:
+            {"merchant_id": "...", "stages": {"READY": 1, ...}, "applications": [{...}, ...]}
+        """
+        serializer = DashboardQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        merchant_id = serializer.validated_data['merchant_id']
+        
+        snapshots = list(ApplicationStatus.objects.filter(merchant_id=merchant_id).order_by('-last_activity_at'))
+        merchants = Merchant_profileServiceImpl(Merchant_profileRepositoryImpl())
+        if not snapshots and merchants.get_by_id(merchant_id) is None:
+            raise Http404
+        return Response({
+            'merchant_id': str(merchant_id),
+            'stages': Counter(snapshot.stage for snapshot in snapshots),
+            'applications': ApplicationStatusSerializer(snapshots, many=True).data,
+        })
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApplicationProfileConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'application_profile'
+
+    def ready(self):
+        # Keep ApplicationStatus snapshots current and cached lookups fresh
+        from . import signals  # noqa: F401
@@ -1,16 +1,40 @@
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
+import uuid
+
+from moaaa_api_services.read_through_cache import ReadThroughCache, get_profile_cache
 from ..interfaces.application_profile_service import IApplication_profileService
 from ...dao.interfaces.application_profile_repository import IApplication_profileRepository
 
 
+
+def _canonical_ids(ids: Iterable) -> List[str]:
+    """IDs in the form cache keys use, skipping ones that aren't UUIDs."""
+    canonical = []
+    for id in ids:
+        try:
+            canonical.append(str(uuid.UUID(str(id))))
+        except ValueError:
+            continue
+    return canonical
+
+
 class Application_profileServiceImpl(IApplication_profileService):
-    """Concrete implementation of application_profile service."""
+    """
+    Concrete implementation of application_profile service.
 
-    def __init__(self, repository: IApplication_profileRepository):
+    Lookups by ID read through the profile cache; the Application signal
+    handlers and the repository's bulk writes invalidate it.
+    """
+
+    def __init__(self, repository: IApplication_profileRepository, cache: Optional[ReadThroughCache] = None):
         self.repository = repository
+        self.cache = cache or get_profile_cache('application')
 
     def get_by_id(self, id: str) -> Optional[dict]:
-        return self.repository.get_by_id(id)
+        ids = _canonical_ids([id])
+        if not ids:
+            return None
+        return self.cache.get(ids[0], self.repository.get_by_id)
 
     def get_all(self) -> List[dict]:
         return self.repository.get_all()
@@ -25,3 +49,12 @@ class Application_profileServiceImpl(IApplication_profileService):
 
     def delete(self, id: str) -> bool:
         return self.repository.delete(id)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, dict]:
+        return self.cache.get_many(_canonical_ids(ids), self.repository.get_many)
+
+    def upsert_many(self, rows: List[dict]) -> List[dict]:
+        return self.repository.upsert_many(rows)
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[dict]:
+        return self.repository.iter_all(chunk_size)
@@ -1,27 +1,48 @@
-from typing import List, Optional
-from ..interfaces.application_profile_repository import IApplication_profileRepository
-from ..models import *
+from typing import Any, Dict, List
+
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
 
+from document_classification.models import ClassificationResult
+from moaaa_api_services.read_through_cache import invalidate_on_commit
+from moaaa_api_services.repository import DjangoModelRepository
+from ..interfaces.application_profile_repository import IApplication_profileRepository
+from ...models import Application
+from ...signals import schedule_refresh
 
-class Application_profileRepositoryImpl(IApplication_profileRepository):
-    """Concrete implementation of application_profile repository."""
 
-    def get_by_id(self, id: str) -> Optional[dict]:
-        # TODO: Implement
-        pass
+class Application_profileRepositoryImpl(DjangoModelRepository, IApplication_profileRepository):
+    """Concrete implementation of application_profile repository, over Application."""
 
-    def get_all(self) -> List[dict]:
-        # TODO: Implement
-        pass
+    model = Application
 
-    def create(self, data: dict) -> dict:
-        # TODO: Implement
-        pass
+    def _bulk_written(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
 
-    def update(self, id: str, data: dict) -> Optional[dict]:
-        # TODO: Implement
-        pass
+        # The timestamps Application.save() would have set
+        now = timezone.now()
+        stamped = {
+            'submitted_at': [row for row in rows
+                             if row['status'] != Application.Status.DRAFT and row['submitted_at'] is None],
+            'decided_at': [row for row in rows
+                           if row['status'] in Application.DECIDED_STATUSES and row['decided_at'] is None],
+        }
+        for field, stamped_rows in stamped.items():
+            if not stamped_rows:
+                continue
+            Application.objects.filter(
+                pk__in=[row['id'] for row in stamped_rows], **{f'{field}__isnull': True}
+            ).update(**{field: now})
+            for row in stamped_rows:
+                row[field] = now
+        if any(stamped.values()):
+            self._remember([dict(row) for row in rows])
 
-    def delete(self, id: str) -> bool:
-        # TODO: Implement
-        pass
+        # What the Application signal handlers do for single-row writes
+        references = [row['reference'] for row in rows]
+        ClassificationResult.objects.filter(application_ref__in=references, application__isnull=True).update(
+            application=Subquery(Application.objects.filter(reference=OuterRef('application_ref')).values('pk')[:1])
+        )
+        schedule_refresh(references)
+        invalidate_on_commit('application', [row['id'] for row in rows])
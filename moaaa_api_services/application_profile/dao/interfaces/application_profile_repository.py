@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 
 class IApplication_profileRepository(ABC):
@@ -24,3 +24,15 @@ class IApplication_profileRepository(ABC):
     @abstractmethod
     def delete(self, id: str) -> bool:
         pass
+
+    @abstractmethod
+    def get_many(self, ids: Iterable[str]) -> Dict[str, dict]:
+        pass
+
+    @abstractmethod
+    def upsert_many(self, rows: List[dict]) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[dict]:
+        pass
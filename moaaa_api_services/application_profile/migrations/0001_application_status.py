@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:13
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatus',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('application_id', models.CharField(max_length=255, unique=True)),
+                ('stage', models.CharField(choices=[('AWAITING_DOCUMENTS', 'Awaiting Documents'), ('PROCESSING', 'Processing'), ('NEEDS_REVIEW', 'Needs Review'), ('READY', 'Ready')], default='AWAITING_DOCUMENTS', max_length=20)),
+                ('uploads_pending', models.IntegerField(default=0)),
+                ('uploads_failed', models.IntegerField(default=0)),
+                ('documents_uploaded', models.IntegerField(default=0)),
+                ('documents_classified', models.IntegerField(default=0)),
+                ('documents_extracted', models.IntegerField(default=0)),
+                ('documents_requiring_review', models.IntegerField(default=0)),
+                ('jobs_in_progress', models.IntegerField(default=0)),
+                ('jobs_failed', models.IntegerField(default=0)),
+                ('document_types', models.JSONField(blank=True, default=list)),
+                ('missing_document_types', models.JSONField(blank=True, default=list)),
+                ('last_activity_at', models.DateTimeField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name_plural': 'application statuses',
+                'db_table': 'application_status',
+                'ordering': ['-last_activity_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:26
+
+import application_profile.models
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application_profile', '0001_application_status'),
+        ('merchant_profile', '0001_merchant'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Application',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('reference', models.CharField(default=application_profile.models._default_reference, max_length=255, unique=True)),
+                ('product', models.CharField(blank=True, max_length=100)),
+                ('status', models.CharField(choices=[('DRAFT', 'Draft'), ('SUBMITTED', 'Submitted'), ('APPROVED', 'Approved'), ('REJECTED', 'Rejected'), ('WITHDRAWN', 'Withdrawn')], default='DRAFT', max_length=20)),
+                ('notes', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('submitted_at', models.DateTimeField(blank=True, null=True)),
+                ('decided_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'db_table': 'application',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='applicationstatus',
+            name='application_status',
+            field=models.CharField(blank=True, choices=[('DRAFT', 'Draft'), ('SUBMITTED', 'Submitted'), ('APPROVED', 'Approved'), ('REJECTED', 'Rejected'), ('WITHDRAWN', 'Withdrawn')], max_length=20),
+        ),
+        migrations.AddField(
+            model_name='applicationstatus',
+            name='merchant_id',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='applicationstatus',
+            index=models.Index(fields=['merchant_id', '-last_activity_at'], name='app_status_merchant_idx'),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='merchant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='merchant_profile.merchant'),
+        ),
+    ]
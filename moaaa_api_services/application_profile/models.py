@@ -1,3 +1,321 @@
+from collections import defaultdict
+from typing import Iterable, List, Optional
+import uuid
+
+from django.conf import settings
 from django.db import models
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from document_classification.models import ClassificationJob, ClassificationResult, DocumentUpload
+from document_extraction.models import ExtractionResult
+from merchant_profile.models import Merchant
+
+# Job statuses that count as work in progress / failed for an application
+_JOB_ACTIVE_STATUSES = [ClassificationJob.Status.PENDING, ClassificationJob.Status.IN_PROGRESS]
+_JOB_FAILED_STATUSES = [ClassificationJob.Status.FAILED]
+
+
+def _default_reference() -> str:
+    return f"APP-{uuid.uuid4().hex[:12].upper()}"
+
+
+class Application(models.Model):
+    """
+    A merchant's onboarding application.
+
+    Uploads, results and conversations refer to an application by its
+    `reference` (their `application_id` field). Classification results keep
+    the reference in `application_ref` and link to the Application itself.
+    """
+
+    class Status(models.TextChoices):
+        DRAFT = 'DRAFT', 'Draft'
+        SUBMITTED = 'SUBMITTED', 'Submitted'
+        APPROVED = 'APPROVED', 'Approved'
+        REJECTED = 'REJECTED', 'Rejected'
+        WITHDRAWN = 'WITHDRAWN', 'Withdrawn'
+
+    # Statuses that close the application
+    DECIDED_STATUSES = [Status.APPROVED, Status.REJECTED, Status.WITHDRAWN]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Relationships
+    merchant = models.ForeignKey(
+        Merchant,
+        on_delete=models.CASCADE,
+        related_name='applications'
+    )
+
+    reference = models.CharField(max_length=255, unique=True, default=_default_reference)
+    product = models.CharField(max_length=100, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.DRAFT
+    )
+    notes = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    submitted_at = models.DateTimeField(null=True, blank=True)
+    decided_at = models.DateTimeField(null=True, blank=True)
+
+    # Created by (for audit)
+    created_by = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = 'application'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Application({self.reference}) - {self.status}"
+
+    def save(self, *args, **kwargs):
+        now = timezone.now()
+        if self.status != self.Status.DRAFT and self.submitted_at is None:
+            self.submitted_at = now
+        if self.status in self.DECIDED_STATUSES and self.decided_at is None:
+            self.decided_at = now
+        super().save(*args, **kwargs)
+
+
+class ApplicationStatusQuerySet(models.QuerySet):
+
+    def refresh(self, application_ids: Iterable[str]) -> List['ApplicationStatus']:
+        """
+        Recompute the status snapshots of the given applications.
+
+        Every application is aggregated together, so the query count does
+        not grow with the number of applications. References with neither
+        an Application nor any uploads or results have their snapshot
+        removed.
+
+        Args:
+            application_ids: Applications whose documents or jobs changed
+
+        Returns:
+            The refreshed snapshots (unsaved copies of the upserted rows)
+        """
+        application_ids = sorted({application_id for application_id in application_ids if application_id})
+        if not application_ids:
+            return []
+
+        snapshots = {}
+
+        def snapshot(application_id: str) -> 'ApplicationStatus':
+            if application_id not in snapshots:
+                snapshots[application_id] = self.model(application_id=application_id)
+            return snapshots[application_id]
+
+        def touch(status: 'ApplicationStatus', at) -> None:
+            if at and (status.last_activity_at is None or at > status.last_activity_at):
+                status.last_activity_at = at
+
+        # Applications get a snapshot before their first upload
+        applications = {
+            application.reference: application
+            for application in Application.objects.filter(reference__in=application_ids).only(
+                'reference', 'merchant_id', 'status', 'updated_at'
+            )
+        }
+        for reference, application in applications.items():
+            status = snapshot(reference)
+            status.merchant_id = application.merchant_id
+            status.application_status = application.status
+            touch(status, application.updated_at)
+
+        # Uploads by status
+        uploads = (
+            DocumentUpload.objects
+            .filter(application_id__in=application_ids)
+            .values('application_id', 'status')
+            .annotate(count=Count('id'), latest=Max('updated_at'))
+        )
+        for row in uploads:
+            status = snapshot(row['application_id'])
+            if row['status'] == DocumentUpload.Status.PENDING:
+                status.uploads_pending = row['count']
+            elif row['status'] == DocumentUpload.Status.COMPLETED:
+                status.documents_uploaded = row['count']
+            elif row['status'] == DocumentUpload.Status.FAILED:
+                status.uploads_failed = row['count']
+            touch(status, row['latest'])
+
+        # Active classification results by document type
+        classified = (
+            ClassificationResult.objects
+            .filter(application_ref__in=application_ids, is_active=True)
+            .values('application_ref', 'document_type')
+            .annotate(
+                count=Count('id'),
+                review=Count('id', filter=Q(requires_review=True)),
+                latest=Max('created_at')
+            )
+        )
+        document_types = defaultdict(set)
+        for row in classified:
+            status = snapshot(row['application_ref'])
+            status.documents_classified += row['count']
+            status.documents_requiring_review += row['review']
+            if row['count'] > row['review']:
+                document_types[row['application_ref']].add(row['document_type'])
+            touch(status, row['latest'])
+
+        # Active extraction results
+        extracted = (
+            ExtractionResult.objects
+            .filter(application_id__in=application_ids, is_active=True)
+            .values('application_id')
+            .annotate(
+                count=Count('id'),
+                review=Count('id', filter=Q(requires_review=True)),
+                latest=Max('created_at')
+            )
+        )
+        for row in extracted:
+            status = snapshot(row['application_id'])
+            status.documents_extracted = row['count']
+            status.documents_requiring_review += row['review']
+            touch(status, row['latest'])
+
+        # Unfinished and failed jobs, reached through uploads and results
+        job_statuses = _JOB_ACTIVE_STATUSES + _JOB_FAILED_STATUSES
+        job_rows = [
+            DocumentUpload.objects.filter(
+                application_id__in=application_ids,
+                classification_job__status__in=job_statuses
+            ).values_list('application_id', 'classification_job_id', 'classification_job__status'),
+            ClassificationResult.objects.filter(
+                application_ref__in=application_ids,
+                job__status__in=job_statuses
+            ).values_list('application_ref', 'job_id', 'job__status'),
+            ExtractionResult.objects.filter(
+                application_id__in=application_ids,
+                job__status__in=job_statuses
+            ).values_list('application_id', 'job_id', 'job__status'),
+        ]
+        jobs = set()
+        for rows in job_rows:
+            jobs.update(rows.distinct())
+        for application_id, _, job_status in jobs:
+            status = snapshot(application_id)
+            if job_status in _JOB_ACTIVE_STATUSES:
+                status.jobs_in_progress += 1
+            else:
+                status.jobs_failed += 1
+
+        required = settings.APPLICATION_REQUIRED_DOCUMENT_TYPES
+        now = timezone.now()
+        for application_id, status in snapshots.items():
+            status.document_types = sorted(document_types[application_id])
+            status.missing_document_types = [
+                document_type for document_type in required
+                if document_type not in document_types[application_id]
+            ]
+            status.stage = status.compute_stage()
+            status.refreshed_at = now
+
+        self.filter(application_id__in=application_ids).exclude(application_id__in=snapshots).delete()
+        self.bulk_create(
+            snapshots.values(),
+            update_conflicts=True,
+            unique_fields=['application_id'],
+            update_fields=ApplicationStatus.SNAPSHOT_FIELDS
+        )
+        return list(snapshots.values())
+
+    def for_application(self, application_id: str) -> Optional['ApplicationStatus']:
+        """Snapshot for an application, built on first use if it doesn't exist yet."""
+        status = self.filter(application_id=application_id).first()
+        if status is None:
+            refreshed = self.refresh([application_id])
+            status = refreshed[0] if refreshed else None
+        return status
+
+
+class ApplicationStatus(models.Model):
+    """
+    Precomputed status snapshot of a merchant application.
+
+    Kept current by signal handlers whenever the Application or its
+    uploads, classification/extraction results or jobs change (see
+    signals.py), so reading an application's status is a single-row lookup
+    and a merchant's dashboard is one index range scan.
+    """
+
+    class Stage(models.TextChoices):
+        AWAITING_DOCUMENTS = 'AWAITING_DOCUMENTS', 'Awaiting Documents'
+        PROCESSING = 'PROCESSING', 'Processing'
+        NEEDS_REVIEW = 'NEEDS_REVIEW', 'Needs Review'
+        READY = 'READY', 'Ready'
+
+    # Fields recomputed on every refresh
+    SNAPSHOT_FIELDS = [
+        'merchant_id', 'application_status', 'stage', 'uploads_pending', 'uploads_failed', 'documents_uploaded',
+        'documents_classified', 'documents_extracted', 'documents_requiring_review',
+        'jobs_in_progress', 'jobs_failed', 'document_types', 'missing_document_types',
+        'last_activity_at', 'refreshed_at',
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Application reference (string for now, matching the document apps)
+    application_id = models.CharField(max_length=255, unique=True)
+
+    # Copied from the Application, if there is one
+    merchant_id = models.UUIDField(null=True, blank=True)
+    application_status = models.CharField(max_length=20, choices=Application.Status.choices, blank=True)
+
+    stage = models.CharField(
+        max_length=20,
+        choices=Stage.choices,
+        default=Stage.AWAITING_DOCUMENTS
+    )
+
+    # Uploads
+    uploads_pending = models.IntegerField(default=0)
+    uploads_failed = models.IntegerField(default=0)
+    documents_uploaded = models.IntegerField(default=0)
+
+    # Active results
+    documents_classified = models.IntegerField(default=0)
+    documents_extracted = models.IntegerField(default=0)
+    documents_requiring_review = models.IntegerField(default=0)
+
+    # Job progress
+    jobs_in_progress = models.IntegerField(default=0)
+    jobs_failed = models.IntegerField(default=0)
+
+    # Document types accepted so far / still required
+    document_types = models.JSONField(default=list, blank=True)
+    missing_document_types = models.JSONField(default=list, blank=True)
+
+    # Timestamps
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+    refreshed_at = models.DateTimeField(default=timezone.now)
+
+    objects = ApplicationStatusQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'application_status'
+        ordering = ['-last_activity_at']
+        indexes = [
+            # Merchant dashboards
+            models.Index(fields=['merchant_id', '-last_activity_at'], name='app_status_merchant_idx'),
+        ]
+        verbose_name_plural = 'application statuses'
+
+    def __str__(self):
+        return f"ApplicationStatus({self.application_id}, {self.stage})"
 
-# Create your models here.
+    def compute_stage(self) -> str:
+        if self.jobs_in_progress:
+            return self.Stage.PROCESSING
+        if self.documents_requiring_review:
+            return self.Stage.NEEDS_REVIEW
+        if self.missing_document_types:
+            return self.Stage.AWAITING_DOCUMENTS
+        return self.Stage.READY
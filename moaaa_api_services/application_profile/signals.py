@@ -0,0 +1,99 @@
+import threading
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from document_classification.models import ClassificationJob, ClassificationResult, DocumentUpload
+from document_classification.signals import results_changed as classification_results_changed
+from document_extraction.models import ExtractionJob, ExtractionResult
+from document_extraction.signals import results_changed as extraction_results_changed
+from moaaa_api_services.read_through_cache import invalidate_on_commit
+from .models import Application, ApplicationStatus
+
+# Bound on the per-thread refresh bookkeeping (cleared when exceeded)
+MAX_TRACKED_APPLICATIONS = 10000
+
+_state = threading.local()
+
+
+def schedule_refresh(application_ids: Iterable[str]) -> None:
+    """
+    Refresh the status snapshots of the given applications once the current
+    transaction commits (immediately in autocommit mode).
+
+    A save loop that touches the same application many times in one
+    transaction refreshes its snapshot once: each scheduled refresh carries
+    a sequence number, and is skipped if the application was refreshed
+    after it was scheduled. Refreshes discarded by a rollback leave no state.
+    """
+    application_ids = {application_id for application_id in application_ids if application_id}
+    if not application_ids:
+        return
+    _state.sequence = getattr(_state, 'sequence', 0) + 1
+    sequence = _state.sequence
+    transaction.on_commit(lambda: _refresh(application_ids, sequence))
+
+
+def _refresh(application_ids: set, sequence: int) -> None:
+    refreshed = getattr(_state, 'refreshed', None)
+    if refreshed is None or len(refreshed) > MAX_TRACKED_APPLICATIONS:
+        refreshed = _state.refreshed = {}
+
+    stale = [application_id for application_id in application_ids if refreshed.get(application_id, 0) < sequence]
+    if not stale:
+        return
+    ApplicationStatus.objects.refresh(stale)
+    for application_id in stale:
+        refreshed[application_id] = _state.sequence
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def application_changed(sender, instance, created=False, **kwargs):
+    if created:
+        # Results classified before the Application existed carry only its reference
+        ClassificationResult.objects.filter(
+            application_ref=instance.reference, application__isnull=True
+        ).update(application=instance)
+    schedule_refresh([instance.reference])
+    invalidate_on_commit('application', [instance.pk])
+
+
+@receiver(post_save, sender=DocumentUpload)
+@receiver(post_delete, sender=DocumentUpload)
+@receiver(post_save, sender=ExtractionResult)
+@receiver(post_delete, sender=ExtractionResult)
+def document_changed(sender, instance, **kwargs):
+    schedule_refresh([instance.application_id])
+
+
+@receiver(post_save, sender=ClassificationResult)
+@receiver(post_delete, sender=ClassificationResult)
+def classification_result_changed(sender, instance, **kwargs):
+    schedule_refresh([instance.application_ref])
+
+
+@receiver(classification_results_changed)
+@receiver(extraction_results_changed)
+def results_changed(sender, application_ids, **kwargs):
+    schedule_refresh(application_ids)
+
+
+@receiver(post_save, sender=ClassificationJob)
+def classification_job_changed(sender, instance, created, **kwargs):
+    # A new job has no uploads or results yet
+    if created:
+        return
+    schedule_refresh(
+        set(instance.uploads.values_list('application_id', flat=True).distinct())
+        | set(instance.results.values_list('application_ref', flat=True).distinct())
+    )
+
+
+@receiver(post_save, sender=ExtractionJob)
+def extraction_job_changed(sender, instance, created, **kwargs):
+    if created:
+        return
+    schedule_refresh(set(instance.results.values_list('application_id', flat=True).distinct()))
@@ -0,0 +1,69 @@
+from django.test import TestCase
+
+from application_profile.dao.implementations.application_profile_repository_impl import (
+    Application_profileRepositoryImpl,
+)
+from application_profile.models import Application, ApplicationStatus
+from document_classification.models import ClassificationJob, ClassificationResult
+from merchant_profile.models import Merchant
+
+
+class ApplicationUpsertManyTests(TestCase):
+    def setUp(self):
+        self.repository = Application_profileRepositoryImpl()
+        self.merchant = Merchant.objects.create(legal_name='Acme Corp')
+
+    def test_partial_rows_update_existing_applications(self):
+        first = Application.objects.create(merchant=self.merchant, reference='APP-1', product='terminal')
+        second = Application.objects.create(merchant=self.merchant, reference='APP-2', notes='keep')
+
+        rows = self.repository.upsert_many([
+            {'id': str(first.pk), 'status': Application.Status.SUBMITTED},
+            {'id': second.pk, 'status': Application.Status.APPROVED},
+        ])
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.product, 'terminal')
+        self.assertEqual(second.notes, 'keep')
+        self.assertEqual([row['status'] for row in rows], [Application.Status.SUBMITTED, Application.Status.APPROVED])
+
+        # Stamped as save() would have, in the database and the returned rows
+        self.assertIsNotNone(first.submitted_at)
+        self.assertIsNone(first.decided_at)
+        self.assertIsNotNone(second.submitted_at)
+        self.assertIsNotNone(second.decided_at)
+        self.assertEqual(rows[1]['decided_at'], second.decided_at)
+
+    def test_existing_timestamps_are_kept(self):
+        application = Application.objects.create(
+            merchant=self.merchant, reference='APP-1', status=Application.Status.SUBMITTED
+        )
+        submitted_at = application.submitted_at
+
+        self.repository.upsert_many([{'id': application.pk, 'status': Application.Status.REJECTED}])
+
+        application.refresh_from_db()
+        self.assertEqual(application.submitted_at, submitted_at)
+        self.assertIsNotNone(application.decided_at)
+
+    def test_new_rows_are_inserted_linked_and_refreshed(self):
+        result = ClassificationResult.objects.create(
+            job=ClassificationJob.objects.create(),
+            application_ref='APP-NEW',
+            document_s3_bucket='bucket',
+            document_s3_key='uploads/APP-NEW/license.pdf',
+            document_filename='license.pdf'
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            rows = self.repository.upsert_many([
+                {'merchant_id': self.merchant.pk, 'reference': 'APP-NEW', 'status': Application.Status.SUBMITTED},
+            ])
+
+        application = Application.objects.get(reference='APP-NEW')
+        self.assertEqual(rows[0]['id'], application.pk)
+        self.assertIsNotNone(application.submitted_at)
+        result.refresh_from_db()
+        self.assertEqual(result.application_id, application.pk)
+        self.assertTrue(ApplicationStatus.objects.filter(application_id='APP-NEW').exists())
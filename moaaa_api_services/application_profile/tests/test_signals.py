@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from application_profile.models import Application
+from document_classification.models import ClassificationJob, ClassificationResult
+from merchant_profile.models import Merchant
+
+
+class ApplicationCreatedTests(TestCase):
+    def setUp(self):
+        self.merchant = Merchant.objects.create(legal_name='Acme Corp')
+        self.job = ClassificationJob.objects.create()
+
+    def _result(self, reference: str) -> ClassificationResult:
+        return ClassificationResult.objects.create(
+            job=self.job,
+            application_ref=reference,
+            document_s3_bucket='bucket',
+            document_s3_key=f'uploads/{reference}/license.pdf',
+            document_filename='license.pdf'
+        )
+
+    def test_links_results_classified_before_the_application(self):
+        early = self._result('APP-1001')
+        other = self._result('APP-2002')
+        self.assertIsNone(early.application_id)
+
+        application = Application.objects.create(merchant=self.merchant, reference='APP-1001')
+
+        early.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(early.application_id, application.pk)
+        self.assertIsNone(other.application_id)
+        self.assertEqual(list(application.classification_results.all()), [early])
+
+    def test_results_created_afterwards_are_linked_on_save(self):
+        application = Application.objects.create(merchant=self.merchant, reference='APP-1001')
+        self.assertEqual(self._result('APP-1001').application_id, application.pk)
@@ -1,3 +1,30 @@
 from django.contrib import admin
+from .models import ProvisioningJob, ProvisioningTask
 
-# Register your models here.
+
+class ProvisioningTaskInline(admin.TabularInline):
+    model = ProvisioningTask
+    fields = ['portal', 'application_id', 'status', 'portal_account_id', 'attempts', 'error_message']
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(ProvisioningJob)
+class ProvisioningJobAdmin(admin.ModelAdmin):
+    list_display = [
+        'id', 'name', 'status', 'total_tasks', 'provisioned_tasks',
+        'rejected_tasks', 'failed_tasks', 'unknown_tasks', 'created_at'
+    ]
+    list_filter = ['status', 'created_at']
+    search_fields = ['id', 'name']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'started_at', 'completed_at']
+    inlines = [ProvisioningTaskInline]
+
+
+@admin.register(ProvisioningTask)
+class ProvisioningTaskAdmin(admin.ModelAdmin):
+    list_display = ['id', 'portal', 'application_id', 'status', 'portal_account_id', 'attempts', 'updated_at']
+    list_filter = ['portal', 'status']
+    search_fields = ['=idempotency_key', '^application_id', '=portal_account_id']
+    readonly_fields = ['id', 'job', 'idempotency_key', 'attempts', 'created_at', 'updated_at', 'completed_at']
@@ -0,0 +1,14 @@
+from .interfaces import IBrowser_automation, IPortal, NotSubmittedError, ProvisioningError, SessionExpiredError
+from .implementations import Browser_automationImpl, StandinPortal
+from .browser_pool import BrowserPool
+
+__all__ = [
+    'IBrowser_automation',
+    'IPortal',
+    'NotSubmittedError',
+    'ProvisioningError',
+    'SessionExpiredError',
+    'Browser_automationImpl',
+    'StandinPortal',
+    'BrowserPool'
+]
@@ -0,0 +1,234 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from .interfaces.portal import IPortal, ProvisioningError, SessionExpiredError
+
+logger = logging.getLogger(__name__)
+
+# Sentinel telling a worker to shut down
+_STOP = object()
+
+
+class _Session:
+    """A browser context (and its page) authenticated against the portal."""
+
+    def __init__(self, context, page):
+        self.context = context
+        self.page = page
+        self.tasks = 0
+        self.checked_at = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.context.close()
+        except Exception:
+            pass
+
+
+class _Worker(threading.Thread):
+    """
+    Owns one Playwright instance, one browser and at most one session.
+
+    Playwright's sync API must be used from the thread that started it, so
+    every browser object lives and dies in its worker thread.
+    """
+
+    def __init__(self, pool: 'BrowserPool', index: int):
+        super().__init__(name=f'browser-{pool.portal.name}-{index}', daemon=True)
+        self.pool = pool
+        self.playwright = None
+        self.browser = None
+        self.session: Optional[_Session] = None
+
+    def _launch(self) -> None:
+        if self.playwright is None:
+            from playwright.sync_api import sync_playwright
+            self.playwright = sync_playwright().start()
+        if self.browser is None or not self.browser.is_connected():
+            self.browser = self.playwright.chromium.launch(headless=self.pool.headless)
+
+    def _new_session(self) -> _Session:
+        self._launch()
+        context = self.browser.new_context(storage_state=self.pool._get_storage_state())
+        context.set_default_timeout(self.pool.timeout_seconds * 1000)
+        session = _Session(context, context.new_page())
+
+        # Contexts start from the pool's shared login; log in only if it is missing or stale
+        if not self.pool.portal.is_logged_in(session.page):
+            self.pool.portal.login(session.page)
+            self.pool._record('logins')
+            self.pool._set_storage_state(context.storage_state())
+        self.pool._record('sessions_created')
+        return session
+
+    def _discard_session(self, reason: str) -> None:
+        if self.session is not None:
+            logger.info("%s: recycling browser session (%s)", self.name, reason)
+            self.session.close()
+            self.session = None
+            self.pool._record('sessions_recycled')
+
+    def _healthy(self) -> bool:
+        session = self.session
+        if not self.browser.is_connected() or session.page.is_closed():
+            return False
+        if time.monotonic() - session.checked_at >= self.pool.health_check_interval:
+            session.checked_at = time.monotonic()
+            return self.pool.portal.is_logged_in(session.page)
+        return True
+
+    def _ready_session(self) -> _Session:
+        if self.session is not None:
+            try:
+                healthy = self._healthy()
+            except Exception:
+                healthy = False
+            if not healthy:
+                self.pool._record('health_check_failures')
+                self._discard_session('failed health check')
+        if self.session is None:
+            self.session = self._new_session()
+        return self.session
+
+    def _run_task(self, task: Callable[[IPortal, Any], Any]) -> Any:
+        try:
+            return task(self.pool.portal, self._ready_session().page)
+        except SessionExpiredError:
+            # Logged out mid-task: log in again once and retry
+            self._discard_session('session expired')
+            self.pool._set_storage_state(None)
+            return task(self.pool.portal, self._ready_session().page)
+
+    def run(self) -> None:
+        try:
+            # Warm up so the first task doesn't pay for browser start and login
+            self.session = self._new_session()
+        except Exception as e:
+            logger.warning("%s: could not start browser session: %s", self.name, e)
+
+        while True:
+            item = self.pool._tasks.get()
+            if item is _STOP:
+                break
+            future, task = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(self._run_task(task))
+                self.pool._record('tasks_completed')
+            except ProvisioningError as e:
+                # Rejected by the portal; the session itself is fine
+                future.set_exception(e)
+                self.pool._record('tasks_failed')
+            except Exception as e:
+                future.set_exception(e)
+                self.pool._record('tasks_failed')
+                # The page may be in an unknown state after a failure
+                self._discard_session(f'task failed: {e.__class__.__name__}')
+
+            if self.session is not None:
+                self.session.tasks += 1
+                if self.session.tasks >= self.pool.max_tasks_per_session:
+                    self._discard_session(f'{self.session.tasks} tasks')
+
+        self._discard_session('pool closed')
+        if self.browser is not None:
+            self.browser.close()
+        if self.playwright is not None:
+            self.playwright.stop()
+
+
+class BrowserPool:
+    """
+    Pool of long-lived, pre-authenticated browser sessions for one portal.
+
+    Each of `size` worker threads keeps a browser and an authenticated
+    context, so tasks skip browser startup and login. Contexts share the
+    login's storage state (cookies), so the portal is logged into once and
+    new or recycled contexts start authenticated. Sessions are health
+    checked (at most every `health_check_interval` seconds), replaced after
+    a failure, and recycled after `max_tasks_per_session` tasks.
+
+    Requires the optional `playwright` package and its Chromium build
+    (`python -m playwright install chromium`).
+    """
+
+    def __init__(self, portal: IPortal, size: int = 2, max_tasks_per_session: int = 50,
+                 health_check_interval: float = 60.0, timeout_seconds: int = 60,
+                 headless: bool = True):
+        """
+        Args:
+            portal: Portal driver
+            size: Concurrent browser sessions
+            max_tasks_per_session: Tasks before a session is recycled
+            health_check_interval: Seconds between logged-in checks
+            timeout_seconds: Default timeout of page actions
+            headless: Run browsers headless
+        """
+        try:
+            import playwright  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "Browser automation requires playwright: pip install playwright && "
+                "python -m playwright install chromium"
+            )
+
+        self.portal = portal
+        self.size = size
+        self.max_tasks_per_session = max_tasks_per_session
+        self.health_check_interval = health_check_interval
+        self.timeout_seconds = timeout_seconds
+        self.headless = headless
+
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._storage_state = None
+        self._stats = {
+            'sessions_created': 0, 'sessions_recycled': 0, 'logins': 0,
+            'health_check_failures': 0, 'tasks_completed': 0, 'tasks_failed': 0,
+        }
+        self._workers = [_Worker(self, index) for index in range(size)]
+        for worker in self._workers:
+            worker.start()
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+
+    def _get_storage_state(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._storage_state
+
+    def _set_storage_state(self, storage_state: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._storage_state = storage_state
+
+    def submit(self, task: Callable[[IPortal, Any], Any]) -> Future:
+        """
+        Schedule a task on the next free session.
+
+        Args:
+            task: fn(portal, page) -> result, run on a worker thread
+
+        Returns:
+            Future for the task's result
+        """
+        future = Future()
+        self._tasks.put((future, task))
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'portal': self.portal.name, 'size': self.size, 'queued': self._tasks.qsize(), **self._stats}
+
+    def close(self) -> None:
+        """Finish queued tasks, then close every browser."""
+        for _ in self._workers:
+            self._tasks.put(_STOP)
+        for worker in self._workers:
+            worker.join()
@@ -0,0 +1,4 @@
+from .automator_impl import Browser_automationImpl
+from .standin_portal import StandinPortal
+
+__all__ = ['Browser_automationImpl', 'StandinPortal']
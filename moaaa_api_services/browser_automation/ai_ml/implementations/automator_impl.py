@@ -1,26 +1,68 @@
+import time
 from typing import List, Dict, Any
-import boto3
+
+from ..browser_pool import BrowserPool
 from ..interfaces.automator import IBrowser_automation
+from ..interfaces.portal import IPortal, NotSubmittedError, ProvisioningError, SessionExpiredError
+
+# Provisioning outcomes
+STATUS_PROVISIONED = 'PROVISIONED'
+STATUS_REJECTED = 'REJECTED'
+STATUS_FAILED = 'FAILED'
+# Failed after the form was submitted; the merchant may exist
+STATUS_UNKNOWN = 'UNKNOWN'
+
+
+def _provision(portal: IPortal, page, merchant: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    result = portal.provision(page, merchant)
+    return {**result, 'latency_ms': round((time.perf_counter() - started) * 1000, 1)}
 
 
 class Browser_automationImpl(IBrowser_automation):
-    """Concrete implementation using Amazon Bedrock."""
+    """
+    Provisions merchants into a portal through a pool of pre-authenticated
+    browser sessions. Batches are scheduled onto every session concurrently.
+
+    Input:
+        {"merchant": {"business_name": "...", "ein": "...", "routing_number": "...", ...}}
+
+    Output:
+        {
+            "portal": "standin",
+            "status": "PROVISIONED",    # or REJECTED (by the portal) / FAILED / UNKNOWN
+            "portal_account_id": "M-000042",
+            "error": "",
+            "latency_ms": 850.2
+        }
+    """
+
+    def __init__(self, pool: BrowserPool):
+        """
+        Args:
+            pool: Browser pool of the target portal
+        """
+        self.pool = pool
 
-    def __init__(self, region: str = "us-east-1"):
-        self.bedrock_client = boto3.client(
-            "bedrock-runtime",
-            region_name=region
-        )
+    def _output(self, future) -> Dict[str, Any]:
+        output = {'portal': self.pool.portal.name, 'portal_account_id': '', 'error': '', 'latency_ms': None}
+        try:
+            return {**output, 'status': STATUS_PROVISIONED, **future.result()}
+        except ProvisioningError as e:
+            return {**output, 'status': STATUS_REJECTED, 'error': str(e)}
+        except (NotSubmittedError, SessionExpiredError) as e:
+            return {**output, 'status': STATUS_FAILED, 'error': f'{e.__class__.__name__}: {e}'}
+        except Exception as e:
+            return {**output, 'status': STATUS_UNKNOWN, 'error': f'{e.__class__.__name__}: {e}'}
 
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process single input using Bedrock."""
-        # TODO: Implement Bedrock API call
-        pass
+        """Provision a single merchant."""
+        return self.process_batch([input_data])[0]
 
     def process_batch(self, input_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process multiple inputs using Bedrock."""
-        results = []
-        for input_data in input_data_list:
-            result = self.process(input_data)
-            results.append(result)
-        return results
+        """Provision many merchants concurrently, preserving input order."""
+        futures = [
+            self.pool.submit(lambda portal, page, merchant=input_data['merchant']: _provision(portal, page, merchant))
+            for input_data in input_data_list
+        ]
+        return [self._output(future) for future in futures]
@@ -0,0 +1,70 @@
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode
+
+from ..interfaces.portal import IPortal, NotSubmittedError, ProvisioningError, SessionExpiredError
+
+# Merchant fields entered into the new-merchant form
+MERCHANT_FORM_FIELDS = ['business_name', 'address', 'ein', 'routing_number', 'account_number']
+
+
+class StandinPortal(IPortal):
+    """
+    Driver for the local portal stand-in (browser_automation/portal_standin.py).
+
+    Also the reference for real portal drivers: log in once per browser
+    context, then provision merchants through the new-merchant form.
+    """
+
+    name = 'standin'
+
+    def __init__(self, base_url: str, username: str, password: str):
+        self.base_url = base_url.rstrip('/')
+        self.username = username
+        self.password = password
+
+    def login(self, page) -> None:
+        page.goto(f'{self.base_url}/login')
+        page.fill('#username', self.username)
+        page.fill('#password', self.password)
+        page.click('#login')
+        page.wait_for_selector('#account-menu, .error')
+        if page.locator('.error').count():
+            raise SessionExpiredError(page.inner_text('.error'))
+
+    def is_logged_in(self, page) -> bool:
+        page.goto(f'{self.base_url}/dashboard')
+        return page.locator('#account-menu').count() > 0
+
+    def provision(self, page, merchant: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            page.goto(f'{self.base_url}/merchants/new')
+            if page.locator('#login').count():
+                raise SessionExpiredError('redirected to login')
+            for field in MERCHANT_FORM_FIELDS:
+                page.fill(f'[name="{field}"]', str(merchant.get(field) or ''))
+        except SessionExpiredError:
+            raise
+        except Exception as e:
+            raise NotSubmittedError(f'{e.__class__.__name__}: {e}') from e
+
+        # From here on the portal may have created the merchant
+        page.click('#create')
+        page.wait_for_selector('#merchant-id, .error')
+        if page.locator('.error').count():
+            raise ProvisioningError(page.inner_text('.error'))
+        return {'portal_account_id': page.inner_text('#merchant-id').strip()}
+
+    def find_merchant(self, page, merchant: Dict[str, Any]) -> Optional[str]:
+        # By EIN when there is one, else by business name and bank account
+        if merchant.get('ein'):
+            query = {'ein': merchant['ein']}
+        else:
+            query = {
+                'business_name': merchant.get('business_name') or '',
+                'account_number': merchant.get('account_number') or '',
+            }
+        page.goto(f'{self.base_url}/merchants/search?{urlencode(query)}')
+        if page.locator('#login').count():
+            raise SessionExpiredError('redirected to login')
+        account_ids = page.locator('.merchant-id').all_inner_texts()
+        return account_ids[0].strip() if account_ids else None
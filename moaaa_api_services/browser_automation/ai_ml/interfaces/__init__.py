@@ -0,0 +1,4 @@
+from .automator import IBrowser_automation
+from .portal import IPortal, NotSubmittedError, ProvisioningError, SessionExpiredError
+
+__all__ = ['IBrowser_automation', 'IPortal', 'NotSubmittedError', 'ProvisioningError', 'SessionExpiredError']
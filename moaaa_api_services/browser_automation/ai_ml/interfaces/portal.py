@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+
+class ProvisioningError(Exception):
+    """The portal rejected the merchant (retrying will not help)."""
+
+
+class SessionExpiredError(Exception):
+    """The portal session is no longer authenticated (raised before submitting)."""
+
+
+class NotSubmittedError(Exception):
+    """The merchant's form was never submitted (retrying cannot create a duplicate)."""
+
+
+class IPortal(ABC):
+    """
+    A merchant portal driven through a browser page.
+
+    Implementations receive a Playwright `Page` that belongs to a pooled,
+    already-authenticated browser context and must only use it from the
+    calling thread.
+    """
+
+    # Portal name used in settings and results
+    name: str = ''
+
+    @abstractmethod
+    def login(self, page) -> None:
+        """Authenticate the page's browser context."""
+        pass
+
+    @abstractmethod
+    def is_logged_in(self, page) -> bool:
+        """Return whether the context is still authenticated."""
+        pass
+
+    @abstractmethod
+    def provision(self, page, merchant: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create the merchant in the portal.
+
+        Returns:
+            {"portal_account_id": "..."}
+
+        Any exception other than the ones below means the form may have
+        been submitted, so the merchant may exist in the portal.
+
+        Raises:
+            ProvisioningError: The portal rejected the merchant
+            SessionExpiredError: The session was logged out
+            NotSubmittedError: Failed before the form was submitted
+        """
+        pass
+
+    @abstractmethod
+    def find_merchant(self, page, merchant: Dict[str, Any]) -> Optional[str]:
+        """
+        Look up a merchant created by an earlier attempt.
+
+        Used to reconcile attempts whose outcome is unknown before the
+        merchant is created again.
+
+        Returns:
+            The merchant's portal account ID, or None if it does not exist
+
+        Raises:
+            SessionExpiredError: The session was logged out
+        """
+        pass
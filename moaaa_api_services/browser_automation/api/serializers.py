@@ -1,4 +1,82 @@
+from django.conf import settings
 from rest_framework import serializers
 
+from ..models import ProvisioningJob, ProvisioningTask
 
-# TODO: Add serializers for browser_automation models
+
+class MerchantSerializer(serializers.Serializer):
+    """Merchant details entered into a portal."""
+    
+    business_name = serializers.CharField(max_length=500)
+    address = serializers.CharField(max_length=500, required=False, allow_blank=True)
+    ein = serializers.CharField(max_length=20, required=False, allow_blank=True)
+    routing_number = serializers.CharField(max_length=9)
+    account_number = serializers.CharField(max_length=17)
+
+
+class ProvisionRequestSerializer(serializers.Serializer):
+    """Request serializer for provisioning one merchant."""
+    
+    portal = serializers.ChoiceField(choices=[])
+    merchant = MerchantSerializer()
+    # Retries with the same key never create a second account (derived from the merchant if omitted)
+    idempotency_key = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    application_id = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['portal'].choices = list(settings.PROVISIONING_PORTALS)
+
+
+class ProvisionBatchRequestSerializer(serializers.Serializer):
+    """Request serializer for provisioning many merchants, possibly into several portals."""
+    
+    name = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    items = ProvisionRequestSerializer(many=True, allow_empty=False)
+
+
+class ProvisioningJobSerializer(serializers.ModelSerializer):
+    """Serializer for ProvisioningJob model."""
+    
+    class Meta:
+        model = ProvisioningJob
+        fields = [
+            'id',
+            'name',
+            'status',
+            'total_tasks',
+            'skipped_tasks',
+            'provisioned_tasks',
+            'rejected_tasks',
+            'failed_tasks',
+            'unknown_tasks',
+            'error_message',
+            'created_at',
+            'updated_at',
+            'started_at',
+            'completed_at',
+            'created_by',
+        ]
+        read_only_fields = fields
+
+
+class ProvisioningTaskSerializer(serializers.ModelSerializer):
+    """Serializer for ProvisioningTask model."""
+    
+    class Meta:
+        model = ProvisioningTask
+        fields = [
+            'id',
+            'job',
+            'portal',
+            'idempotency_key',
+            'application_id',
+            'status',
+            'portal_account_id',
+            'error_message',
+            'attempts',
+            'created_at',
+            'updated_at',
+            'completed_at',
+        ]
+        read_only_fields = fields
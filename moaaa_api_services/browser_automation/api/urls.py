@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import Browser_automationViewSet
+from .views import Browser_automationViewSet, ProvisioningJobViewSet
 
 router = DefaultRouter()
 router.register(r'browser_automation', Browser_automationViewSet, basename='browser_automation')
+router.register(r'jobs', ProvisioningJobViewSet, basename='provisioning_job')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,10 +1,39 @@
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
+from ..models import ProvisioningJob
+from ..pools import get_browser_pool, pool_stats
+from ..provisioning import schedule_provisioning, wait_for_job
+from .serializers import (
+    ProvisionRequestSerializer, ProvisionBatchRequestSerializer,
+    ProvisioningJobSerializer, ProvisioningTaskSerializer
+)
+
+
+def _start_pools(items) -> None:
+    """Start the pools the items need up front; raises RuntimeError without playwright."""
+    for portal in {item['portal'] for item in items}:
+        get_browser_pool(portal)
+
+
+def _task_outputs(entries) -> list:
+    return [
+        {**ProvisioningTaskSerializer(entry['task']).data, 'duplicate': entry['duplicate']}
+        for entry in entries
+    ]
+
 
 class Browser_automationViewSet(viewsets.ViewSet):
-    """API ViewSet for browser_automation."""
+    """
+    API ViewSet for browser_automation.
+    
+    Endpoints:
+        POST /api/browser/browser_automation/process/ - Provision one merchant
+        POST /api/browser/browser_automation/process_batch/ - Start a provisioning job
+        GET /api/browser/browser_automation/pools/ - Browser pool stats
+    """
 
     def list(self, request):
         # TODO: Implement
@@ -28,12 +57,91 @@ class Browser_automationViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['post'])
     def process(self, request):
-        """Trigger AI/ML processing."""
-        # TODO: Implement
-        return Response({"status": "processing"})
+        """
+        Provision a merchant into a portal and wait for the outcome.
+        
+        Resubmitting a merchant (same idempotency key) returns its existing
+        task instead of creating another account; failed tasks are retried,
+        and tasks whose outcome is unknown are looked up in the portal first.
+        
+        Request:
+            {
+                "portal": "standin",
+                "merchant": {"business_name": "...", "routing_number": "...", ...},
+                "idempotency_key": "optional",
+                "application_id": "optional"
+            }
+        """
+        serializer = ProvisionRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        try:
+            _start_pools([data])
+        except RuntimeError as e:
+            return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        
+        created_by = request.user.username if request.user.is_authenticated else 'anonymous'
+        job, entries = schedule_provisioning([data], name='Single merchant', created_by=created_by)
+        job = wait_for_job(job.id, timeout=settings.BROWSER_TIMEOUT_SECONDS)
+        
+        entries[0]['task'].refresh_from_db()
+        finished = job.status in (ProvisioningJob.Status.COMPLETED, ProvisioningJob.Status.FAILED)
+        return Response(
+            _task_outputs(entries)[0],
+            status=status.HTTP_200_OK if finished else status.HTTP_202_ACCEPTED
+        )
 
     @action(detail=False, methods=['post'])
     def process_batch(self, request):
-        """Trigger batch AI/ML processing."""
-        # TODO: Implement
-        return Response({"status": "batch_processing"})
+        """
+        Start a provisioning job; poll /api/browser/jobs/{id}/ for progress.
+        
+        Each portal's merchants are provisioned in per-session batches on
+        at most `pool_size` sessions at once.
+        
+        Request:
+            {"name": "optional", "items": [{"portal": "standin", "merchant": {...}, "idempotency_key": "..."}, ...]}
+        
+        Response (202):
+            {"job": {...}, "tasks": [{"id": "...", "status": "PENDING", "duplicate": false, ...}, ...]}
+        """
+        serializer = ProvisionBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        try:
+            _start_pools(data['items'])
+        except RuntimeError as e:
+            return Response({'error': str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        
+        created_by = request.user.username if request.user.is_authenticated else 'anonymous'
+        job, entries = schedule_provisioning(data['items'], name=data.get('name', ''), created_by=created_by)
+        return Response(
+            {'job': ProvisioningJobSerializer(job).data, 'tasks': _task_outputs(entries)},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=False, methods=['get'])
+    def pools(self, request):
+        """Stats of the browser pools started in this process."""
+        return Response(pool_stats())
+
+
+class ProvisioningJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Provisioning job progress.
+    
+    Endpoints:
+        GET /api/browser/jobs/ - List jobs
+        GET /api/browser/jobs/{id}/ - Get a job
+        GET /api/browser/jobs/{id}/tasks/ - Tasks scheduled by the job
+    """
+    
+    queryset = ProvisioningJob.objects.all()
+    serializer_class = ProvisioningJobSerializer
+    
+    @action(detail=True, methods=['get'])
+    def tasks(self, request, pk=None):
+        job = self.get_object()
+        return Response(ProvisioningTaskSerializer(job.tasks.all(), many=True).data)
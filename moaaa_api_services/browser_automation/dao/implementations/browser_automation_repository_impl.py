@@ -1,27 +1,9 @@
-from typing import List, Optional
+from moaaa_api_services.repository import DjangoModelRepository
 from ..interfaces.browser_automation_repository import IBrowser_automationRepository
-from ..models import *
+from ...models import ProvisioningTask
 
 
-class Browser_automationRepositoryImpl(IBrowser_automationRepository):
-    """Concrete implementation of browser_automation repository."""
+class Browser_automationRepositoryImpl(DjangoModelRepository, IBrowser_automationRepository):
+    """Concrete implementation of browser_automation repository, over ProvisioningTask."""
 
-    def get_by_id(self, id: str) -> Optional[dict]:
-        # TODO: Implement
-        pass
-
-    def get_all(self) -> List[dict]:
-        # TODO: Implement
-        pass
-
-    def create(self, data: dict) -> dict:
-        # TODO: Implement
-        pass
-
-    def update(self, id: str, data: dict) -> Optional[dict]:
-        # TODO: Implement
-        pass
-
-    def delete(self, id: str) -> bool:
-        # TODO: Implement
-        pass
+    model = ProvisioningTask
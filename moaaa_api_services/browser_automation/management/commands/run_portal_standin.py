@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from browser_automation.portal_standin import PortalStandinServer
+
+
+class Command(BaseCommand):
+    help = 'Serve the local merchant portal stand-in used to exercise browser automation.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+
+    def handle(self, *args, **options):
+        credentials = settings.PROVISIONING_PORTALS['standin']['options']
+        server = PortalStandinServer(
+            options['host'], options['port'],
+            username=credentials['username'],
+            password=credentials['password']
+        )
+        self.stdout.write(f'Portal stand-in at {server.url} (Ctrl+C to stop)')
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:23
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProvisioningJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('IN_PROGRESS', 'In Progress'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('total_tasks', models.IntegerField(default=0)),
+                ('skipped_tasks', models.IntegerField(default=0)),
+                ('provisioned_tasks', models.IntegerField(default=0)),
+                ('rejected_tasks', models.IntegerField(default=0)),
+                ('failed_tasks', models.IntegerField(default=0)),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'db_table': 'provisioning_job',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProvisioningTask',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('portal', models.CharField(max_length=100)),
+                ('idempotency_key', models.CharField(max_length=255)),
+                ('application_id', models.CharField(blank=True, db_index=True, max_length=255)),
+                ('merchant', models.JSONField(default=dict)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('IN_PROGRESS', 'In Progress'), ('PROVISIONED', 'Provisioned'), ('REJECTED', 'Rejected'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('portal_account_id', models.CharField(blank=True, max_length=255)),
+                ('error_message', models.TextField(blank=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='browser_automation.provisioningjob')),
+            ],
+            options={
+                'db_table': 'provisioning_task',
+                'ordering': ['created_at'],
+                'constraints': [models.UniqueConstraint(fields=('portal', 'idempotency_key'), name='provisioning_task_portal_key_uniq')],
+            },
+        ),
+    ]
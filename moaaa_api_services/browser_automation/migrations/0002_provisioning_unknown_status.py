@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('browser_automation', '0001_provisioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='provisioningjob',
+            name='unknown_tasks',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='provisioningtask',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('IN_PROGRESS', 'In Progress'), ('PROVISIONED', 'Provisioned'), ('REJECTED', 'Rejected'), ('FAILED', 'Failed'), ('UNKNOWN', 'Unknown (needs reconcile)')], default='PENDING', max_length=20),
+        ),
+    ]
@@ -1,3 +1,196 @@
 from django.db import models
+from django.db.models import Count, Q
+from django.utils import timezone
+import uuid
 
-# Create your models here.
+
+class ProvisioningJob(models.Model):
+    """
+    A batch of merchants to provision, possibly across several portals.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        IN_PROGRESS = 'IN_PROGRESS', 'In Progress'
+        COMPLETED = 'COMPLETED', 'Completed'
+        FAILED = 'FAILED', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Job metadata
+    name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+
+    # Progress
+    total_tasks = models.IntegerField(default=0)
+    # Merchants already provisioned or in flight under an earlier job
+    skipped_tasks = models.IntegerField(default=0)
+    provisioned_tasks = models.IntegerField(default=0)
+    rejected_tasks = models.IntegerField(default=0)
+    failed_tasks = models.IntegerField(default=0)
+    # Submitted, outcome not known; reconciled when resubmitted
+    unknown_tasks = models.IntegerField(default=0)
+
+    # Error tracking
+    error_message = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    # Created by (for audit)
+    created_by = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = 'provisioning_job'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"ProvisioningJob({self.id}) - {self.status}"
+
+    def start(self):
+        self.status = self.Status.IN_PROGRESS
+        self.started_at = timezone.now()
+        self.save()
+
+    def complete(self):
+        self.status = self.Status.COMPLETED
+        self.completed_at = timezone.now()
+        self.save()
+
+    def fail(self, error_message: str):
+        self.status = self.Status.FAILED
+        self.error_message = error_message
+        self.completed_at = timezone.now()
+        self.save()
+
+    def update_progress(self) -> bool:
+        """
+        Recount the job's tasks and finish the job once none are left.
+
+        Writes are conditional on the job still being in progress, so chunks
+        finishing together cannot reopen a finished job or overwrite its
+        final counts.
+
+        Returns:
+            True if this call finished the job
+        """
+        S = ProvisioningTask.Status
+        counts = self.tasks.aggregate(
+            provisioned_tasks=Count('id', filter=Q(status=S.PROVISIONED)),
+            rejected_tasks=Count('id', filter=Q(status=S.REJECTED)),
+            failed_tasks=Count('id', filter=Q(status=S.FAILED)),
+            unknown_tasks=Count('id', filter=Q(status=S.UNKNOWN)),
+            open=Count('id', filter=Q(status__in=[S.PENDING, S.IN_PROGRESS]))
+        )
+        values = {'updated_at': timezone.now()}
+        if not counts.pop('open'):
+            scheduled = self.total_tasks - self.skipped_tasks
+            failed = scheduled and counts['failed_tasks'] == scheduled
+            values.update(
+                status=self.Status.FAILED if failed else self.Status.COMPLETED,
+                error_message="All tasks failed" if failed else '',
+                completed_at=values['updated_at']
+            )
+        values.update(counts)
+
+        updated = ProvisioningJob.objects.filter(pk=self.pk, status=self.Status.IN_PROGRESS).update(**values)
+        if updated:
+            for field, value in values.items():
+                setattr(self, field, value)
+        return bool(updated) and 'status' in values
+
+
+class ProvisioningTask(models.Model):
+    """
+    One merchant to create in a portal.
+
+    (portal, idempotency_key) is unique: resubmitting a merchant returns the
+    existing task instead of creating a second portal account.
+
+    FAILED tasks never reached the portal's form and are run again when
+    resubmitted. UNKNOWN tasks failed after the form was submitted, so the
+    account may exist: they are never retried automatically, and when
+    resubmitted they are first looked up in the portal (every task with an
+    earlier attempt is). A task left IN_PROGRESS by a crash is left alone.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        IN_PROGRESS = 'IN_PROGRESS', 'In Progress'
+        PROVISIONED = 'PROVISIONED', 'Provisioned'
+        REJECTED = 'REJECTED', 'Rejected'
+        FAILED = 'FAILED', 'Failed'
+        UNKNOWN = 'UNKNOWN', 'Unknown (needs reconcile)'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Relationships (the job that last scheduled the task)
+    job = models.ForeignKey(
+        ProvisioningJob,
+        on_delete=models.CASCADE,
+        related_name='tasks'
+    )
+
+    portal = models.CharField(max_length=100)
+    idempotency_key = models.CharField(max_length=255)
+
+    # Application reference (string for now, matching the document apps)
+    application_id = models.CharField(max_length=255, blank=True, db_index=True)
+    merchant = models.JSONField(default=dict)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    portal_account_id = models.CharField(max_length=255, blank=True)
+    error_message = models.TextField(blank=True)
+    attempts = models.IntegerField(default=0)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'provisioning_task'
+        ordering = ['created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['portal', 'idempotency_key'],
+                name='provisioning_task_portal_key_uniq'
+            ),
+        ]
+
+    def __str__(self):
+        return f"ProvisioningTask({self.portal}, {self.status})"
+
+    def claim(self) -> bool:
+        """Move PENDING -> IN_PROGRESS; False if another worker got there first."""
+        claimed = ProvisioningTask.objects.filter(pk=self.pk, status=self.Status.PENDING).update(
+            status=self.Status.IN_PROGRESS,
+            attempts=models.F('attempts') + 1,
+            updated_at=timezone.now()
+        )
+        return bool(claimed)
+
+    def finish(self, status: str, portal_account_id: str = '', error_message: str = ''):
+        self.status = status
+        self.portal_account_id = portal_account_id
+        self.error_message = error_message
+        self.completed_at = timezone.now()
+        self.save(update_fields=['status', 'portal_account_id', 'error_message', 'completed_at', 'updated_at'])
+
+    def release(self):
+        """Return an IN_PROGRESS task to PENDING (the portal never saw it)."""
+        ProvisioningTask.objects.filter(pk=self.pk, status=self.Status.IN_PROGRESS).update(
+            status=self.Status.PENDING,
+            updated_at=timezone.now()
+        )
@@ -0,0 +1,39 @@
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .ai_ml import BrowserPool, IPortal
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def get_portal(name: str) -> IPortal:
+    """Instantiate the driver configured for a portal in PROVISIONING_PORTALS."""
+    try:
+        config = settings.PROVISIONING_PORTALS[name]
+    except KeyError:
+        raise ValueError(f"Unknown portal '{name}'")
+    return import_string(config['driver'])(**config.get('options', {}))
+
+
+def get_browser_pool(name: str) -> BrowserPool:
+    """Browser pool of a portal, started on first use and shared by the process."""
+    with _lock:
+        if name not in _pools:
+            _pools[name] = BrowserPool(
+                get_portal(name),
+                size=settings.PROVISIONING_PORTALS[name].get('pool_size', 2),
+                max_tasks_per_session=settings.BROWSER_MAX_TASKS_PER_SESSION,
+                health_check_interval=settings.BROWSER_HEALTH_CHECK_INTERVAL_SECONDS,
+                timeout_seconds=settings.BROWSER_TIMEOUT_SECONDS,
+                headless=settings.BROWSER_HEADLESS
+            )
+        return _pools[name]
+
+
+def pool_stats() -> list:
+    """Stats of every pool started in this process."""
+    with _lock:
+        return [pool.stats() for pool in _pools.values()]
@@ -0,0 +1,185 @@
+"""
+Local stand-in for a merchant provisioning portal.
+
+Plain HTML pages with a login form, a dashboard, a new-merchant form and a
+merchant search, served by the standard library so browser automation can
+be exercised without a real portal:
+
+    python manage.py run_portal_standin --port 8765
+"""
+import html
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+_PAGE = """<!doctype html>
+<html><head><title>{title}</title></head>
+<body>
+{nav}
+<h1>{title}</h1>
+{body}
+</body></html>
+"""
+
+_LOGIN_FORM = """<form method="post" action="/login">
+  {error}
+  <label>Username <input id="username" name="username"></label>
+  <label>Password <input id="password" name="password" type="password"></label>
+  <button id="login" type="submit">Log in</button>
+</form>"""
+
+_MERCHANT_FORM = """<form method="post" action="/merchants">
+  <label>Business name <input name="business_name"></label>
+  <label>Address <input name="address"></label>
+  <label>EIN <input name="ein"></label>
+  <label>Routing number <input name="routing_number"></label>
+  <label>Account number <input name="account_number"></label>
+  <button id="create" type="submit">Create merchant</button>
+</form>"""
+
+_REQUIRED_FIELDS = ['business_name', 'routing_number', 'account_number']
+
+
+class PortalState:
+    """In-memory sessions and merchants of the stand-in portal."""
+
+    def __init__(self, username: str, password: str):
+        self.username = username
+        self.password = password
+        self.sessions = set()
+        self.merchants: Dict[str, Dict[str, str]] = {}
+        self.logins = 0
+        self.lock = threading.Lock()
+
+    def login(self, username: str, password: str):
+        if username != self.username or password != self.password:
+            return None
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions.add(token)
+            self.logins += 1
+        return token
+
+    def create_merchant(self, fields: Dict[str, str]) -> str:
+        """Create a merchant and return its ID; raises ValueError if rejected."""
+        missing = [name for name in _REQUIRED_FIELDS if not fields.get(name)]
+        if missing:
+            raise ValueError(f"Missing {', '.join(missing)}")
+        with self.lock:
+            if fields.get('ein') and any(m.get('ein') == fields['ein'] for m in self.merchants.values()):
+                raise ValueError(f"A merchant with EIN {fields['ein']} already exists")
+            merchant_id = f'M-{len(self.merchants) + 1:06d}'
+            self.merchants[merchant_id] = fields
+        return merchant_id
+
+    def find_merchants(self, query: Dict[str, str]) -> List[str]:
+        """IDs of the merchants whose fields equal every non-empty value in query."""
+        query = {name: value for name, value in query.items() if value}
+        if not query:
+            return []
+        with self.lock:
+            return [
+                merchant_id for merchant_id, fields in self.merchants.items()
+                if all(fields.get(name) == value for name, value in query.items())
+            ]
+
+
+def _make_handler(state: PortalState):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def log_message(self, format, *args):
+            pass
+
+        def _session(self):
+            cookie = SimpleCookie(self.headers.get('Cookie', ''))
+            token = cookie['session'].value if 'session' in cookie else None
+            return token if token in state.sessions else None
+
+        def _form(self) -> Dict[str, str]:
+            length = int(self.headers.get('Content-Length') or 0)
+            data = parse_qs(self.rfile.read(length).decode('utf-8'))
+            return {name: values[0].strip() for name, values in data.items()}
+
+        def _send(self, title: str, body: str, status: int = 200, cookie: str = None):
+            nav = '<nav id="account-menu"><a href="/merchants/new">New merchant</a></nav>' if self._session() or cookie else ''
+            content = _PAGE.format(title=title, nav=nav, body=body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(content)))
+            if cookie:
+                self.send_header('Set-Cookie', f'session={cookie}; Path=/; HttpOnly')
+            self.end_headers()
+            self.wfile.write(content)
+
+        def _redirect(self, location: str):
+            self.send_response(303)
+            self.send_header('Location', location)
+            self.end_headers()
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path == '/health':
+                return self._send('OK', '')
+            if url.path == '/login':
+                return self._send('Log in', _LOGIN_FORM.format(error=''))
+            if not self._session():
+                return self._redirect('/login')
+            if url.path in ('/', '/dashboard'):
+                return self._send('Dashboard', f'<p>{len(state.merchants)} merchants</p>')
+            if url.path == '/merchants/new':
+                return self._send('New merchant', _MERCHANT_FORM)
+            if url.path == '/merchants/search':
+                query = {name: values[0].strip() for name, values in parse_qs(url.query).items()}
+                rows = ''.join(
+                    f'<li class="merchant-id">{merchant_id}</li>' for merchant_id in state.find_merchants(query)
+                )
+                return self._send('Merchants', f'<ul>{rows}</ul>')
+            return self._send('Not found', '', status=404)
+
+        def do_POST(self):
+            if self.path == '/login':
+                form = self._form()
+                token = state.login(form.get('username', ''), form.get('password', ''))
+                if token is None:
+                    error = '<div class="error">Invalid username or password</div>'
+                    return self._send('Log in', _LOGIN_FORM.format(error=error), status=401)
+                return self._send('Dashboard', f'<p>{len(state.merchants)} merchants</p>', cookie=token)
+            if not self._session():
+                return self._redirect('/login')
+            if self.path == '/merchants':
+                try:
+                    merchant_id = state.create_merchant(self._form())
+                except ValueError as e:
+                    return self._send('New merchant', f'<div class="error">{html.escape(str(e))}</div>', status=422)
+                return self._send('Merchant created', f'<div id="merchant-id">{merchant_id}</div>', status=201)
+            return self._send('Not found', '', status=404)
+
+    return Handler
+
+
+class PortalStandinServer:
+    """The stand-in portal served on a background thread."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 username: str = 'automation', password: str = 'automation'):
+        self.state = PortalState(username, password)
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self.state))
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'PortalStandinServer':
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='portal-standin', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,255 @@
+"""
+Provisioning scheduler.
+
+Merchants are recorded as ProvisioningTask rows under a ProvisioningJob and
+then run on the browser pool of their portal. Each portal's pool size caps
+how many sessions work against it at once, and the merchants for a portal
+are handed to the pool in chunks that are provisioned one after another on
+the same logged-in page.
+"""
+import hashlib
+import logging
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .ai_ml import IPortal, NotSubmittedError, ProvisioningError, SessionExpiredError
+from .models import ProvisioningJob, ProvisioningTask
+from .pools import get_browser_pool
+
+logger = logging.getLogger(__name__)
+
+# Jobs someone is waiting on in this process
+_job_events: Dict[Any, threading.Event] = {}
+_job_events_lock = threading.Lock()
+
+
+def idempotency_key(merchant: Dict[str, Any]) -> str:
+    """
+    Key identifying a merchant within a portal when the caller sends none.
+
+    Based on the EIN when there is one, else on the business name and bank
+    account, so resubmitting the same merchant maps to the same task.
+    """
+    ein = re.sub(r'\D', '', merchant.get('ein') or '')
+    if ein:
+        identity = f"ein:{ein}"
+    else:
+        identity = "bank:{}|{}|{}".format(
+            ' '.join(merchant.get('business_name', '').lower().split()),
+            re.sub(r'\D', '', merchant.get('routing_number', '')),
+            re.sub(r'\D', '', merchant.get('account_number', ''))
+        )
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+
+def _schedule_task(job: ProvisioningJob, item: Dict[str, Any]) -> Tuple[ProvisioningTask, bool]:
+    """
+    Get or create the task for an item, claiming it for the job if it can run.
+
+    Returns:
+        (task, scheduled) - scheduled is False when the merchant is already
+        provisioned, rejected or in flight
+    """
+    key = item.get('idempotency_key') or idempotency_key(item['merchant'])
+    task, created = ProvisioningTask.objects.get_or_create(
+        portal=item['portal'],
+        idempotency_key=key,
+        defaults={
+            'job': job,
+            'application_id': item.get('application_id', ''),
+            'merchant': item['merchant'],
+        }
+    )
+    if created:
+        return task, True
+
+    # Failed attempts never submitted the form; unknown ones are looked up
+    # in the portal before the merchant is created again (see _run_chunk)
+    retried = ProvisioningTask.objects.filter(
+        pk=task.pk, status__in=[ProvisioningTask.Status.FAILED, ProvisioningTask.Status.UNKNOWN]
+    ).update(
+        job=job,
+        status=ProvisioningTask.Status.PENDING,
+        merchant=item['merchant'],
+        error_message='',
+        completed_at=None,
+        updated_at=timezone.now()
+    )
+    task.refresh_from_db()
+    return task, bool(retried)
+
+
+def schedule_provisioning(items: List[Dict[str, Any]], name: str = '',
+                          created_by: str = '') -> Tuple[ProvisioningJob, List[Dict[str, Any]]]:
+    """
+    Record a provisioning job and run its tasks on the portals' browser pools.
+
+    Tasks are submitted after the surrounding transaction commits, so the
+    workers always see the job and task rows.
+
+    Args:
+        items: [{"portal", "merchant", "idempotency_key"?, "application_id"?}, ...]
+        name: Job name
+        created_by: Audit user
+
+    Returns:
+        (job, one entry per item: {"task": ProvisioningTask, "duplicate": bool})
+    """
+    with transaction.atomic():
+        job = ProvisioningJob.objects.create(name=name, total_tasks=len(items), created_by=created_by)
+
+        entries = []
+        runnable = defaultdict(list)
+        for item in items:
+            # A key repeated within the batch finds the task pending and runs once
+            task, scheduled = _schedule_task(job, item)
+            if scheduled:
+                runnable[task.portal].append(task.pk)
+            entries.append({'task': task, 'duplicate': not scheduled})
+
+        job.skipped_tasks = sum(entry['duplicate'] for entry in entries)
+        if job.skipped_tasks == job.total_tasks:
+            job.complete()
+        else:
+            job.start()
+            transaction.on_commit(lambda: _submit(job.pk, dict(runnable)))
+
+    return job, entries
+
+
+def _chunks(task_ids: list, sessions: int) -> List[list]:
+    """Split a portal's tasks into per-session batches, using every session."""
+    size = max(1, min(settings.PROVISIONING_SESSION_BATCH_SIZE, math.ceil(len(task_ids) / sessions)))
+    return [task_ids[i:i + size] for i in range(0, len(task_ids), size)]
+
+
+def _submit(job_id, task_ids_by_portal: Dict[str, list]) -> None:
+    for portal, task_ids in task_ids_by_portal.items():
+        try:
+            pool = get_browser_pool(portal)
+        except Exception as e:
+            logger.exception("Could not start browser pool for portal %s", portal)
+            ProvisioningTask.objects.filter(pk__in=task_ids, status=ProvisioningTask.Status.PENDING).update(
+                status=ProvisioningTask.Status.FAILED,
+                error_message=f'{e.__class__.__name__}: {e}',
+                completed_at=timezone.now()
+            )
+            _update_job(job_id)
+            continue
+
+        for chunk in _chunks(task_ids, pool.size):
+            _submit_chunk(pool, job_id, chunk)
+
+
+def _submit_chunk(pool, job_id, task_ids: list) -> None:
+    future = pool.submit(lambda portal, page: _run_chunk(portal, page, task_ids))
+    future.add_done_callback(lambda f: _chunk_done(f, pool, job_id, task_ids))
+
+
+def _run_chunk(portal: IPortal, page, task_ids: list) -> None:
+    """
+    Provision a chunk of tasks one after another on one session's page.
+
+    A task attempted before is first looked up in the portal, so an earlier
+    attempt that created the merchant without us seeing the result is
+    recorded instead of creating a second account. An error after the form
+    was submitted leaves the task UNKNOWN, never FAILED.
+
+    Re-entrant: the pool re-runs the chunk after a session expiry, and
+    tasks that already finished are skipped because they can no longer be
+    claimed.
+    """
+    close_old_connections()
+    try:
+        for task in ProvisioningTask.objects.filter(pk__in=task_ids).order_by('created_at'):
+            if not task.claim():
+                continue
+            try:
+                # attempts was loaded before the claim counted this one
+                existing = portal.find_merchant(page, task.merchant) if task.attempts else None
+                if existing:
+                    result = {'portal_account_id': existing}
+                else:
+                    result = portal.provision(page, task.merchant)
+            except SessionExpiredError:
+                # Logged out before the form was submitted
+                task.release()
+                raise
+            except ProvisioningError as e:
+                task.finish(ProvisioningTask.Status.REJECTED, error_message=str(e))
+            except NotSubmittedError as e:
+                task.finish(ProvisioningTask.Status.FAILED, error_message=str(e))
+                # Let the pool replace the session; the rest of the chunk is requeued
+                raise
+            except Exception as e:
+                # The portal may have created the merchant; resubmitting reconciles it
+                task.finish(ProvisioningTask.Status.UNKNOWN, error_message=f'{e.__class__.__name__}: {e}')
+                raise
+            else:
+                task.finish(ProvisioningTask.Status.PROVISIONED, portal_account_id=result['portal_account_id'])
+    finally:
+        close_old_connections()
+
+
+def _chunk_done(future, pool, job_id, task_ids: list) -> None:
+    close_old_connections()
+    try:
+        error = future.exception()
+        if error is not None:
+            pending = list(ProvisioningTask.objects.filter(
+                pk__in=task_ids, status=ProvisioningTask.Status.PENDING
+            ).values_list('pk', flat=True))
+            if pending and len(pending) < len(task_ids) and not isinstance(error, SessionExpiredError):
+                # A task failed mid-chunk on a now-replaced session; the rest never reached the portal
+                _submit_chunk(pool, job_id, pending)
+                return
+            # Failed before any progress (or expired again after the pool's retry)
+            ProvisioningTask.objects.filter(pk__in=pending).update(
+                status=ProvisioningTask.Status.FAILED,
+                error_message=f'{error.__class__.__name__}: {error}',
+                completed_at=timezone.now()
+            )
+        _update_job(job_id)
+    except Exception:
+        logger.exception("Could not record provisioning progress for job %s", job_id)
+    finally:
+        close_old_connections()
+
+
+def _update_job(job_id) -> None:
+    job = ProvisioningJob.objects.get(pk=job_id)
+    if job.status != ProvisioningJob.Status.IN_PROGRESS or not job.update_progress():
+        return
+    with _job_events_lock:
+        event = _job_events.get(job_id)
+    if event is not None:
+        event.set()
+
+
+def wait_for_job(job_id, timeout: float) -> ProvisioningJob:
+    """
+    Block until a job scheduled by this process finishes or timeout passes.
+
+    Returns:
+        The job as last saved
+    """
+    event = threading.Event()
+    with _job_events_lock:
+        _job_events[job_id] = event
+    try:
+        job = ProvisioningJob.objects.get(pk=job_id)
+        if job.status in (ProvisioningJob.Status.PENDING, ProvisioningJob.Status.IN_PROGRESS):
+            event.wait(timeout)
+            job.refresh_from_db()
+        return job
+    finally:
+        with _job_events_lock:
+            _job_events.pop(job_id, None)
+
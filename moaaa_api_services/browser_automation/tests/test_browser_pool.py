@@ -0,0 +1,116 @@
+import unittest
+
+from django.test import SimpleTestCase
+
+from browser_automation.ai_ml import BrowserPool, ProvisioningError, StandinPortal
+from browser_automation.portal_standin import PortalStandinServer
+
+_chromium = None
+
+
+def chromium_available() -> bool:
+    """Whether playwright can launch its Chromium build here (checked once)."""
+    global _chromium
+    if _chromium is None:
+        try:
+            from playwright.sync_api import sync_playwright
+            with sync_playwright() as playwright:
+                playwright.chromium.launch().close()
+            _chromium = True
+        except Exception:
+            _chromium = False
+    return _chromium
+
+
+def provision(merchant):
+    return lambda portal, page: portal.provision(page, merchant)
+
+
+def merchant(n: int) -> dict:
+    return {
+        'business_name': f'Merchant {n}',
+        'ein': f'12-{n:07d}',
+        'routing_number': '011000015',
+        'account_number': f'{n:08d}',
+    }
+
+
+class BrowserPoolTests(SimpleTestCase):
+    """BrowserPool against the local portal stand-in."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if not chromium_available():
+            raise unittest.SkipTest('Chromium for playwright is not installed (python -m playwright install chromium)')
+
+    def setUp(self):
+        self.server = PortalStandinServer().start()
+        self.addCleanup(self.server.stop)
+
+    def make_pool(self, **options) -> BrowserPool:
+        portal = StandinPortal(self.server.url, 'automation', 'automation')
+        pool = BrowserPool(portal, timeout_seconds=10, **options)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_sessions_share_one_login(self):
+        pool = self.make_pool(size=2)
+
+        results = [f.result(timeout=30) for f in [pool.submit(provision(merchant(n))) for n in range(4)]]
+
+        self.assertEqual(len({result['portal_account_id'] for result in results}), 4)
+        self.assertEqual(len(self.server.state.merchants), 4)
+        # Each worker may log in while warming up, never once per task
+        self.assertLessEqual(self.server.state.logins, 2)
+        self.assertEqual(pool.stats()['tasks_completed'], 4)
+
+    def test_sessions_are_recycled_after_max_tasks(self):
+        pool = self.make_pool(size=1, max_tasks_per_session=2)
+
+        for n in range(5):
+            pool.submit(provision(merchant(n))).result(timeout=30)
+
+        stats = pool.stats()
+        self.assertEqual(stats['sessions_recycled'], 2)
+        self.assertEqual(stats['sessions_created'], 3)
+        # Recycled contexts start from the saved login
+        self.assertEqual(self.server.state.logins, 1)
+
+    def test_failed_health_check_replaces_the_session(self):
+        pool = self.make_pool(size=1, health_check_interval=0)
+        pool.submit(provision(merchant(1))).result(timeout=30)
+
+        # The portal forgets every session
+        self.server.state.sessions.clear()
+        result = pool.submit(provision(merchant(2))).result(timeout=30)
+
+        self.assertTrue(result['portal_account_id'])
+        stats = pool.stats()
+        self.assertEqual(stats['health_check_failures'], 1)
+        self.assertEqual(stats['sessions_recycled'], 1)
+        self.assertEqual(self.server.state.logins, 2)
+
+    def test_session_expired_mid_task_logs_in_again(self):
+        pool = self.make_pool(size=1)
+        pool.submit(provision(merchant(1))).result(timeout=30)
+
+        # Expired between the health check and the task
+        self.server.state.sessions.clear()
+        result = pool.submit(provision(merchant(2))).result(timeout=30)
+
+        self.assertTrue(result['portal_account_id'])
+        self.assertEqual(len(self.server.state.merchants), 2)
+        self.assertEqual(self.server.state.logins, 2)
+
+    def test_rejected_merchant_keeps_the_session(self):
+        pool = self.make_pool(size=1)
+        pool.submit(provision(merchant(1))).result(timeout=30)
+
+        with self.assertRaises(ProvisioningError) as raised:
+            pool.submit(provision(merchant(1))).result(timeout=30)
+
+        self.assertIn('already exists', str(raised.exception))
+        stats = pool.stats()
+        self.assertEqual(stats['tasks_failed'], 1)
+        self.assertEqual(stats['sessions_recycled'], 0)
@@ -0,0 +1,198 @@
+import unittest
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+from unittest import mock
+
+from django.test import TestCase
+
+from browser_automation.ai_ml import (
+    BrowserPool,
+    IPortal,
+    NotSubmittedError,
+    ProvisioningError,
+    StandinPortal,
+)
+from browser_automation.models import ProvisioningJob, ProvisioningTask
+from browser_automation.portal_standin import PortalStandinServer, PortalState
+from browser_automation.provisioning import schedule_provisioning
+from browser_automation.tests.test_browser_pool import chromium_available
+
+MERCHANT = {
+    'business_name': 'Blue Bottle Bakery',
+    'routing_number': '011000015',
+    'account_number': '12345678',
+}
+
+
+class StateDriver(IPortal):
+    """
+    Drives the stand-in portal's state directly, the way StandinPortal
+    drives its pages, failing on request before or after the form is submitted.
+    """
+
+    name = 'standin'
+
+    def __init__(self, state: PortalState):
+        self.state = state
+        self.fail_before_submit = False
+        self.fail_after_submit = False
+
+    def login(self, page) -> None:
+        pass
+
+    def is_logged_in(self, page) -> bool:
+        return True
+
+    def provision(self, page, merchant: Dict[str, Any]) -> Dict[str, Any]:
+        if self.fail_before_submit:
+            raise NotSubmittedError('Timeout 60000ms exceeded waiting for [name="business_name"]')
+        try:
+            merchant_id = self.state.create_merchant(merchant)
+        except ValueError as e:
+            raise ProvisioningError(str(e))
+        if self.fail_after_submit:
+            raise TimeoutError('Timeout 60000ms exceeded waiting for #merchant-id')
+        return {'portal_account_id': merchant_id}
+
+    def find_merchant(self, page, merchant: Dict[str, Any]) -> Optional[str]:
+        if merchant.get('ein'):
+            query = {'ein': merchant['ein']}
+        else:
+            query = {'business_name': merchant['business_name'], 'account_number': merchant['account_number']}
+        found = self.state.find_merchants(query)
+        return found[0] if found else None
+
+
+class InlinePool:
+    """Runs each submitted task immediately on the calling thread."""
+
+    size = 1
+
+    def __init__(self, portal: IPortal):
+        self.portal = portal
+
+    def submit(self, task) -> Future:
+        future = Future()
+        try:
+            future.set_result(task(self.portal, None))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ProvisioningTests(TestCase):
+    """Scheduling, retry and reconciliation of provisioning tasks."""
+
+    def setUp(self):
+        self.state = PortalState('automation', 'automation')
+        self.portal = StateDriver(self.state)
+        patcher = mock.patch('browser_automation.provisioning.get_browser_pool',
+                             return_value=InlinePool(self.portal))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def provision(self, merchant=MERCHANT):
+        with self.captureOnCommitCallbacks(execute=True):
+            job, entries = schedule_provisioning([{'portal': 'standin', 'merchant': merchant}])
+        job.refresh_from_db()
+        task = entries[0]['task']
+        task.refresh_from_db()
+        return job, task, entries[0]['duplicate']
+
+    def test_provisions_a_merchant_once(self):
+        _, task, _ = self.provision()
+        self.assertEqual(task.status, ProvisioningTask.Status.PROVISIONED)
+
+        job, again, duplicate = self.provision()
+        self.assertTrue(duplicate)
+        self.assertEqual(again.pk, task.pk)
+        self.assertEqual(job.skipped_tasks, 1)
+        self.assertEqual(len(self.state.merchants), 1)
+
+    def test_failure_after_submit_is_unknown_not_failed(self):
+        self.portal.fail_after_submit = True
+
+        job, task, _ = self.provision()
+
+        self.assertEqual(task.status, ProvisioningTask.Status.UNKNOWN)
+        self.assertIn('merchant-id', task.error_message)
+        self.assertEqual(job.status, ProvisioningJob.Status.COMPLETED)
+        self.assertEqual((job.unknown_tasks, job.failed_tasks), (1, 0))
+        # The portal did create the merchant
+        self.assertEqual(len(self.state.merchants), 1)
+
+    def test_resubmitted_unknown_task_is_reconciled_not_created_again(self):
+        self.portal.fail_after_submit = True
+        _, task, _ = self.provision()
+        self.portal.fail_after_submit = False
+
+        _, task, duplicate = self.provision()
+
+        self.assertFalse(duplicate)
+        self.assertEqual(task.status, ProvisioningTask.Status.PROVISIONED)
+        self.assertEqual(task.portal_account_id, 'M-000001')
+        self.assertEqual(task.attempts, 2)
+        self.assertEqual(len(self.state.merchants), 1)
+
+    def test_failure_before_submit_is_retried_on_resubmit(self):
+        self.portal.fail_before_submit = True
+        job, task, _ = self.provision()
+        self.assertEqual(task.status, ProvisioningTask.Status.FAILED)
+        self.assertEqual(job.status, ProvisioningJob.Status.FAILED)
+        self.assertFalse(self.state.merchants)
+
+        self.portal.fail_before_submit = False
+        _, task, _ = self.provision()
+
+        self.assertEqual(task.status, ProvisioningTask.Status.PROVISIONED)
+        self.assertEqual(len(self.state.merchants), 1)
+
+    def test_unknown_task_does_not_stop_the_rest_of_the_batch(self):
+        merchants = [
+            {**MERCHANT, 'business_name': f'Merchant {n}', 'account_number': f'{n:08d}'}
+            for n in range(3)
+        ]
+        self.portal.fail_after_submit = True
+        calls = []
+        provision = self.portal.provision
+
+        def fail_first(page, merchant):
+            calls.append(merchant['business_name'])
+            self.portal.fail_after_submit = len(calls) == 1
+            return provision(page, merchant)
+
+        with mock.patch.object(self.portal, 'provision', side_effect=fail_first):
+            with self.captureOnCommitCallbacks(execute=True):
+                job, entries = schedule_provisioning([{'portal': 'standin', 'merchant': m} for m in merchants])
+
+        job.refresh_from_db()
+        statuses = [ProvisioningTask.objects.get(pk=entry['task'].pk).status for entry in entries]
+        self.assertEqual(statuses, ['UNKNOWN', 'PROVISIONED', 'PROVISIONED'])
+        # The unknown task was not tried again
+        self.assertEqual(calls, ['Merchant 0', 'Merchant 1', 'Merchant 2'])
+        self.assertEqual((job.provisioned_tasks, job.unknown_tasks), (2, 1))
+
+
+class StandinPortalLookupTests(TestCase):
+    """StandinPortal.find_merchant against the portal stand-in."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if not chromium_available():
+            raise unittest.SkipTest('Chromium for playwright is not installed (python -m playwright install chromium)')
+
+    def test_find_merchant(self):
+        server = PortalStandinServer().start()
+        self.addCleanup(server.stop)
+        pool = BrowserPool(StandinPortal(server.url, 'automation', 'automation'), size=1, timeout_seconds=10)
+        self.addCleanup(pool.close)
+
+        created = pool.submit(lambda portal, page: portal.provision(page, MERCHANT)).result(timeout=30)
+        found = pool.submit(lambda portal, page: portal.find_merchant(page, MERCHANT)).result(timeout=30)
+        missing = pool.submit(
+            lambda portal, page: portal.find_merchant(page, {**MERCHANT, 'account_number': '999'})
+        ).result(timeout=30)
+
+        self.assertEqual(found, created['portal_account_id'])
+        self.assertIsNone(missing)
@@ -1,5 +1,9 @@
+import uuid
+
 from django.contrib import admin
-from .models import ClassificationJob, ClassificationResult
+from django.db.models import Q
+from .models import ClassificationJob, ClassificationResult, ClassificationRawResponse, DocumentUpload
+from .paginators import EstimatedCountPaginator
 
 
 @admin.register(ClassificationJob)
@@ -34,19 +38,40 @@ class ClassificationJobAdmin(admin.ModelAdmin):
     )
 
 
+class ClassificationRawResponseInline(admin.StackedInline):
+    """Raw Bedrock response, shown on the change page only."""
+    model = ClassificationRawResponse
+    fields = ['payload', 'created_at']
+    readonly_fields = ['payload', 'created_at']
+    can_delete = False
+    classes = ['collapse']
+    
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(ClassificationResult)
 class ClassificationResultAdmin(admin.ModelAdmin):
     list_display = [
-        'id', 'job', 'application_id', 'document_type', 
+        'id', 'job', 'application_ref', 'document_type', 
         'confidence_score', 'is_active', 'requires_review', 'created_at'
     ]
     list_filter = ['document_type', 'is_active', 'requires_review', 'created_at']
-    search_fields = ['id', 'application_id', 'document_filename']
+    list_select_related = ['job']
+    # Searched by get_search_results below, not by the admin's istartswith
+    search_fields = ['application_ref', 'document_filename']
+    search_help_text = 'Result ID (exact), or application reference / filename prefix (case-sensitive)'
     readonly_fields = ['id', 'created_at', 'updated_at']
+    raw_id_fields = ['application']
+    inlines = [ClassificationRawResponseInline]
+    
+    # Large table: estimate the unfiltered total and skip the second COUNT(*)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Result Info', {
-            'fields': ('id', 'job', 'application_id')
+            'fields': ('id', 'job', 'application_ref', 'application')
         }),
         ('Document', {
             'fields': ('document_s3_bucket', 'document_s3_key', 'document_filename')
@@ -57,12 +82,40 @@ class ClassificationResultAdmin(admin.ModelAdmin):
         ('Status', {
             'fields': ('is_active', 'deactivated_at', 'deactivated_by')
         }),
-        ('Raw Response', {
-            'fields': ('raw_response',),
-            'classes': ('collapse',)
-        }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
+    
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Look up a full result UUID by primary key, otherwise prefix-search.
+
+        The prefix match is case-sensitive (startswith: LIKE 'term%'), which
+        PostgreSQL answers from the varchar_pattern_ops indexes on both
+        columns. The admin's '^' prefix is istartswith, UPPER(column) LIKE,
+        which no plain or pattern_ops index serves.
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        try:
+            result_id = uuid.UUID(search_term)
+        except ValueError:
+            return queryset.filter(
+                Q(application_ref__startswith=search_term) | Q(document_filename__startswith=search_term)
+            ), False
+        return queryset.filter(id=result_id), False
+
+
+@admin.register(DocumentUpload)
+class DocumentUploadAdmin(admin.ModelAdmin):
+    list_display = [
+        'id', 'application_id', 'filename', 'size_bytes',
+        'status', 'classification_job', 'created_at'
+    ]
+    list_filter = ['status', 'created_at']
+    list_select_related = ['classification_job']
+    search_fields = ['^application_id', '^filename']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'completed_at']
@@ -1,5 +1,15 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
 from .interfaces import IClassifier, ClassificationInput, ClassificationOutput
-from .implementations import BedrockClassifier
+
+if TYPE_CHECKING:
+    from .implementations import BedrockClassifier
+
+# Implementations (and boto3) load on first use
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BedrockClassifier': '.implementations',
+})
 
 __all__ = [
     'IClassifier', 
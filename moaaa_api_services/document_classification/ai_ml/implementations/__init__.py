@@ -1,3 +1,12 @@
-from .bedrock_classifier import BedrockClassifier
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .bedrock_classifier import BedrockClassifier
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BedrockClassifier': '.bedrock_classifier',
+})
 
 __all__ = ['BedrockClassifier']
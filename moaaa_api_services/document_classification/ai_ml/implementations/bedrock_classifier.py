@@ -1,11 +1,19 @@
 import os
 import json
-import base64
-import boto3
+import time
+from functools import cached_property
 from typing import List, Dict, Any
-from botocore.config import Config
 
+from moaaa_api_services.aws import default_profile
 from ..interfaces.classifier import IClassifier, ClassificationInput, ClassificationOutput
+from ..text_layer import (
+    PATH_TEXT_MODEL,
+    PATH_VISION,
+    document_content_block,
+    extract_text_layer,
+    media_type_for,
+    path_latency,
+)
 
 
 class BedrockClassifier(IClassifier):
@@ -30,60 +38,65 @@ class BedrockClassifier(IClassifier):
         'UNKNOWN'
     ]
     
-    def __init__(self, profile_name: str = None, region: str = None):
+    def __init__(self, profile_name: str = None, region: str = None, storage=None, fetcher=None):
         """
         Initialize Bedrock classifier.
         
         Args:
             profile_name: AWS profile name (default: moaaa_api_services)
             region: AWS region (default: from profile or us-east-1)
+            storage: Optional IDocumentStorage to read documents from
+                instead of S3 directly (e.g. the local stand-in)
+            fetcher: Optional DocumentFetcher to read documents through its
+                disk cache (takes precedence over storage)
         """
-        self.profile_name = profile_name or os.environ.get('AWS_PROFILE', 'moaaa_api_services')
+        self.profile_name = profile_name or default_profile()
         self.region = region or os.environ.get('AWS_REGION', 'us-east-1')
         
-        # Create boto3 session with profile
-        self.session = boto3.Session(profile_name=self.profile_name)
-        
-        # Configure retry settings
-        config = Config(
-            retries={'max_attempts': 3, 'mode': 'adaptive'}
-        )
+        # Model ID for Claude
+        self.model_id = 'anthropic.claude-3-sonnet-20240229-v1:0'
         
-        # Create clients
-        self.bedrock_client = self.session.client(
+        self.storage = storage
+        self.fetcher = fetcher
+    
+    # boto3 and the clients are created on first use, not at construction
+    
+    @cached_property
+    def session(self):
+        import boto3
+        return boto3.Session(profile_name=self.profile_name)
+    
+    @cached_property
+    def bedrock_client(self):
+        from botocore.config import Config
+        return self.session.client(
             'bedrock-runtime',
             region_name=self.region,
-            config=config
+            config=Config(retries={'max_attempts': 3, 'mode': 'adaptive'})
         )
-        
-        self.s3_client = self.session.client(
+    
+    @cached_property
+    def s3_client(self):
+        return self.session.client(
             's3',
             region_name=self.region
         )
-        
-        # Model ID for Claude
-        self.model_id = 'anthropic.claude-3-sonnet-20240229-v1:0'
     
     def _get_document_from_s3(self, bucket: str, key: str) -> bytes:
-        """Download document from S3."""
+        """
+        Download document from S3 (through the fetcher's cache when set).
+        Large cached documents come back as a read-only mmap, not bytes.
+        """
+        if self.fetcher is not None:
+            return self.fetcher.fetch(bucket, key)
+        if self.storage is not None:
+            return self.storage.get_object(bucket, key)
         response = self.s3_client.get_object(Bucket=bucket, Key=key)
         return response['Body'].read()
     
     def _get_media_type(self, filename: str) -> str:
         """Determine media type from filename."""
-        lower_name = filename.lower()
-        if lower_name.endswith('.pdf'):
-            return 'application/pdf'
-        elif lower_name.endswith('.png'):
-            return 'image/png'
-        elif lower_name.endswith('.jpg') or lower_name.endswith('.jpeg'):
-            return 'image/jpeg'
-        elif lower_name.endswith('.gif'):
-            return 'image/gif'
-        elif lower_name.endswith('.webp'):
-            return 'image/webp'
-        else:
-            return 'application/octet-stream'
+        return media_type_for(filename)
     
     def _build_classification_prompt(self) -> str:
         """Build the classification prompt."""
@@ -112,6 +125,90 @@ Important:
 - If you're unsure, use UNKNOWN with low confidence
 """
     
+    def parse_classification(self, result: Dict[str, Any]) -> ClassificationOutput:
+        """
+        Build a ClassificationOutput from the model's parsed JSON reply.
+        
+        Also used by the fused classify-and-extract pipeline, whose reply
+        carries the same classification keys.
+        """
+        document_type = str(result.get('document_type', 'UNKNOWN')).upper()
+        confidence = float(result.get('confidence', 0.0))
+        
+        # Validate document type
+        if document_type not in self.VALID_DOCUMENT_TYPES:
+            document_type = 'UNKNOWN'
+        
+        # Determine if review is needed
+        requires_review = confidence < self.CONFIDENCE_THRESHOLD
+        
+        return ClassificationOutput(
+            document_type=document_type,
+            confidence_score=confidence,
+            requires_review=requires_review,
+            raw_response=result
+        )
+    
+    def classify_bytes(self, document_bytes: bytes, filename: str) -> ClassificationOutput:
+        """
+        Classify a document whose bytes have already been fetched.
+        
+        Args:
+            document_bytes: Raw document content
+            filename: Original filename (used for the media type)
+            
+        Returns:
+            ClassificationOutput with document type and confidence
+        """
+        started = time.perf_counter()
+        
+        # Digital PDFs are classified from their text layer; scans and images by vision
+        media_type = self._get_media_type(filename)
+        text_layer = extract_text_layer(document_bytes, media_type)
+        path = PATH_TEXT_MODEL if text_layer is not None else PATH_VISION
+        
+        # Build request for Claude
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    document_content_block(document_bytes, media_type, text_layer),
+                    {
+                        "type": "text",
+                        "text": self._build_classification_prompt()
+                    }
+                ]
+            }
+        ]
+        
+        # Call Bedrock
+        response = self.bedrock_client.invoke_model(
+            modelId=self.model_id,
+            contentType='application/json',
+            accept='application/json',
+            body=json.dumps({
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": 1024,
+                "messages": messages
+            })
+        )
+        
+        # Parse response
+        response_body = json.loads(response['body'].read())
+        assistant_message = response_body['content'][0]['text']
+        
+        # Parse JSON from response
+        output = self.parse_classification(json.loads(assistant_message))
+        
+        elapsed = time.perf_counter() - started
+        path_latency.record('classification', path, elapsed)
+        output.raw_response = {
+            **output.raw_response,
+            'pipeline_path': path,
+            'latency_ms': round(elapsed * 1000, 1)
+        }
+        return output
+    
     def classify(self, input_data: ClassificationInput) -> ClassificationOutput:
         """
         Classify a single document using Bedrock Claude.
@@ -129,68 +226,7 @@ Important:
                 input_data.s3_key
             )
             
-            # Encode as base64
-            document_base64 = base64.standard_b64encode(document_bytes).decode('utf-8')
-            
-            # Get media type
-            media_type = self._get_media_type(input_data.filename)
-            
-            # Build request for Claude
-            messages = [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": document_base64
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": self._build_classification_prompt()
-                        }
-                    ]
-                }
-            ]
-            
-            # Call Bedrock
-            response = self.bedrock_client.invoke_model(
-                modelId=self.model_id,
-                contentType='application/json',
-                accept='application/json',
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": 1024,
-                    "messages": messages
-                })
-            )
-            
-            # Parse response
-            response_body = json.loads(response['body'].read())
-            assistant_message = response_body['content'][0]['text']
-            
-            # Parse JSON from response
-            result = json.loads(assistant_message)
-            
-            document_type = result.get('document_type', 'UNKNOWN').upper()
-            confidence = float(result.get('confidence', 0.0))
-            
-            # Validate document type
-            if document_type not in self.VALID_DOCUMENT_TYPES:
-                document_type = 'UNKNOWN'
-            
-            # Determine if review is needed
-            requires_review = confidence < self.CONFIDENCE_THRESHOLD
-            
-            return ClassificationOutput(
-                document_type=document_type,
-                confidence_score=confidence,
-                requires_review=requires_review,
-                raw_response=result
-            )
+            return self.classify_bytes(document_bytes, input_data.filename)
             
         except Exception as e:
             # Return UNKNOWN on error
@@ -0,0 +1,150 @@
+import base64
+import io
+import logging
+import mmap
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pages read from the text layer (statements rarely need more for our fields)
+MAX_PAGES = 10
+
+# Average characters per page below which a PDF is treated as a scan
+MIN_CHARS_PER_PAGE = 100
+
+# Characters of document text sent to the model
+MAX_PROMPT_CHARS = 20000
+
+# Pipeline paths, reported in raw responses and latency stats
+PATH_VISION = 'vision'
+PATH_TEXT_MODEL = 'text_model'
+PATH_LOCAL_REGEX = 'local_regex'
+
+
+MEDIA_TYPES = {
+    '.pdf': 'application/pdf',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+
+def media_type_for(filename: str) -> str:
+    """Determine a document's media type from its filename."""
+    lower_name = filename.lower()
+    for extension, media_type in MEDIA_TYPES.items():
+        if lower_name.endswith(extension):
+            return media_type
+    return 'application/octet-stream'
+
+
+@dataclass
+class TextLayer:
+    """Text read from a PDF's text layer."""
+    text: str
+    page_count: int
+    pages_read: int
+
+    @property
+    def is_digital(self) -> bool:
+        return len(self.text.strip()) >= MIN_CHARS_PER_PAGE * max(self.pages_read, 1)
+
+
+def extract_text_layer(document_bytes: bytes, media_type: str) -> Optional[TextLayer]:
+    """
+    Read the text layer of a PDF locally (CPU only, no network).
+
+    Born-digital PDFs such as most bank statements and tax returns can then
+    be sent to the model as text or handled by local regex extraction;
+    only scans and images need the vision path.
+
+    Args:
+        document_bytes: Raw document content (bytes or a read-only mmap)
+        media_type: Document media type
+
+    Returns:
+        TextLayer for digital PDFs, or None for images, scans, unreadable
+        PDFs, or when pypdf is not installed
+    """
+    if media_type != 'application/pdf':
+        return None
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+
+    try:
+        # A memory-mapped document is already a seekable stream; don't copy it
+        stream = document_bytes if isinstance(document_bytes, mmap.mmap) else io.BytesIO(document_bytes)
+        reader = PdfReader(stream)
+        pages = reader.pages[:MAX_PAGES]
+        text = '\n'.join(page.extract_text() or '' for page in pages)
+        layer = TextLayer(text=text, page_count=len(reader.pages), pages_read=len(pages))
+    except Exception as e:
+        logger.debug("Could not read PDF text layer: %s", e)
+        return None
+
+    return layer if layer.is_digital else None
+
+
+def document_content_block(document_bytes: bytes, media_type: str,
+                           text_layer: Optional[TextLayer]) -> Dict[str, Any]:
+    """
+    Build the Claude message content block for a document.
+
+    Digital PDFs are sent as text; everything else is sent as an image.
+    """
+    if text_layer is not None:
+        return {
+            "type": "text",
+            "text": f"Document text (extracted from the PDF text layer):\n\n{text_layer.text[:MAX_PROMPT_CHARS]}"
+        }
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": media_type,
+            "data": base64.standard_b64encode(document_bytes).decode('utf-8')
+        }
+    }
+
+
+class PathLatencyStats:
+    """Thread-safe in-process latency counters per (stage, path)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, stage: str, path: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stats.setdefault((stage, path), {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+        logger.info("%s via %s took %.1f ms", stage, path, seconds * 1000)
+
+    def report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return {stage: {path: {count, avg_ms, max_ms}}}."""
+        with self._lock:
+            report = {}
+            for (stage, path), entry in sorted(self._stats.items()):
+                report.setdefault(stage, {})[path] = {
+                    'count': entry['count'],
+                    'avg_ms': round(entry['total'] / entry['count'] * 1000, 1),
+                    'max_ms': round(entry['max'] * 1000, 1),
+                }
+            return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# Process-wide stats shared by the classifier and the extraction engine
+path_latency = PathLatencyStats()
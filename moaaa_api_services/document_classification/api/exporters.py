@@ -0,0 +1,148 @@
+import csv
+from datetime import datetime
+from typing import Dict, Iterator
+
+# Columns written by the export endpoint, in order
+# (column name -> model attname). Named like the results API: application_id
+# is the application reference, application_pk the linked Application's ID
+EXPORT_FIELDS = {
+    'id': 'id',
+    'job_id': 'job_id',
+    'application_id': 'application_ref',
+    'application_pk': 'application_id',
+    'document_s3_bucket': 'document_s3_bucket',
+    'document_s3_key': 'document_s3_key',
+    'document_filename': 'document_filename',
+    'document_type': 'document_type',
+    'confidence_score': 'confidence_score',
+    'is_active': 'is_active',
+    'requires_review': 'requires_review',
+    'created_at': 'created_at',
+}
+
+# Rows fetched per round-trip from the server-side cursor
+CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """File-like object whose write() returns the value instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+class _ChunkSink:
+    """
+    Minimal writable file object that hands written bytes back to a generator.
+
+    Lets pyarrow write Parquet row groups incrementally while the response
+    streams them out, so only one row group is held in memory.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _format_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(queryset, fields: Dict[str, str] = EXPORT_FIELDS) -> Iterator[str]:
+    """
+    Yield CSV lines for the queryset, one database chunk at a time.
+
+    Args:
+        queryset: ClassificationResult queryset to export
+        fields: Column name -> model attname, for the columns to include
+
+    Yields:
+        CSV-encoded lines, header first
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(list(fields))
+
+    rows = queryset.values_list(*fields.values()).iterator(chunk_size=CHUNK_SIZE)
+    for row in rows:
+        yield writer.writerow([_format_value(value) for value in row])
+
+
+def parquet_available() -> bool:
+    """Whether the optional pyarrow dependency is installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def stream_parquet(queryset, fields: Dict[str, str] = EXPORT_FIELDS) -> Iterator[bytes]:
+    """
+    Yield a Parquet file for the queryset, one row group per database chunk.
+
+    Args:
+        queryset: ClassificationResult queryset to export
+        fields: Column name -> model attname, for the columns to include
+
+    Yields:
+        Parquet file bytes
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {
+        'confidence_score': pa.float64(),
+        'is_active': pa.bool_(),
+        'requires_review': pa.bool_(),
+        'created_at': pa.timestamp('us', tz='UTC'),
+    }
+    schema = pa.schema([(name, types.get(name, pa.string())) for name in fields])
+    string_columns = {name for name in fields if name not in types}
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    def write_batch(rows):
+        columns = list(zip(*rows))
+        arrays = []
+        for name, values in zip(fields, columns):
+            if name in string_columns:
+                values = [None if value is None else str(value) for value in values]
+            arrays.append(pa.array(values, type=schema.field(name).type))
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    batch = []
+    for row in queryset.values_list(*fields.values()).iterator(chunk_size=CHUNK_SIZE):
+        batch.append(row)
+        if len(batch) >= CHUNK_SIZE:
+            write_batch(batch)
+            batch = []
+            yield sink.drain()
+    if batch:
+        write_batch(batch)
+
+    writer.close()
+    yield sink.drain()
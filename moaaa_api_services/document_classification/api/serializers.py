@@ -1,16 +1,41 @@
 from rest_framework import serializers
-from ..models import ClassificationJob, ClassificationResult
+from django.conf import settings
+from ..models import ClassificationJob, ClassificationResult, DocumentUpload
 
 
-class ClassificationResultSerializer(serializers.ModelSerializer):
+class SparseFieldsetSerializerMixin:
+    """
+    Restricts output to the fields listed in the serializer context.
+    
+    Fields named in ``Meta.deferred_fields`` are only included when they are
+    explicitly requested.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get('fields')
+        deferred = getattr(self.Meta, 'deferred_fields', [])
+        for name in list(self.fields):
+            if requested is not None and name not in requested:
+                self.fields.pop(name)
+            elif requested is None and name in deferred:
+                self.fields.pop(name)
+
+
+class ClassificationResultSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for ClassificationResult."""
     
+    raw_response = serializers.JSONField(read_only=True)
+    # The client's application reference, named as in the other document APIs
+    application_id = serializers.CharField(source='application_ref', max_length=255)
+    
     class Meta:
         model = ClassificationResult
         fields = [
             'id',
             'job',
             'application_id',
+            'application',
             'document_s3_bucket',
             'document_s3_key',
             'document_filename',
@@ -20,8 +45,10 @@ class ClassificationResultSerializer(serializers.ModelSerializer):
             'requires_review',
             'created_at',
             'updated_at',
+            'raw_response',
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'application', 'created_at', 'updated_at']
+        deferred_fields = ['raw_response']
 
 
 class ClassificationJobSerializer(serializers.ModelSerializer):
@@ -60,6 +87,7 @@ class ClassifyDocumentRequestSerializer(serializers.Serializer):
     s3_key = serializers.CharField(max_length=1024)
     filename = serializers.CharField(max_length=255)
     application_id = serializers.CharField(max_length=255)
+    supersede_previous = serializers.BooleanField(required=False, default=False)
 
 
 class ClassifyBatchRequestSerializer(serializers.Serializer):
@@ -68,6 +96,7 @@ class ClassifyBatchRequestSerializer(serializers.Serializer):
     documents = ClassifyDocumentRequestSerializer(many=True)
     job_name = serializers.CharField(max_length=255, required=False, default='')
     job_description = serializers.CharField(required=False, default='')
+    supersede_previous = serializers.BooleanField(required=False, default=False)
 
 
 class ClassifyDocumentResponseSerializer(serializers.Serializer):
@@ -83,3 +112,125 @@ class ActivateDeactivateSerializer(serializers.Serializer):
     """Request serializer for activate/deactivate actions."""
     
     user = serializers.CharField(max_length=255, required=False, default='')
+
+
+class BulkActivateDeactivateSerializer(ActivateDeactivateSerializer):
+    """
+    Request serializer for bulk activate/deactivate actions.
+    
+    Select results either by `ids` or by `application_id` (optionally
+    narrowed by `document_type`).
+    """
+    
+    ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False)
+    application_id = serializers.CharField(max_length=255, required=False)
+    document_type = serializers.ChoiceField(
+        choices=ClassificationResult.DocumentType.choices,
+        required=False
+    )
+    
+    def validate(self, attrs):
+        has_ids = 'ids' in attrs
+        has_application = 'application_id' in attrs
+        if has_ids == has_application:
+            raise serializers.ValidationError(
+                "Provide either 'ids' or 'application_id' (with optional 'document_type')."
+            )
+        if 'document_type' in attrs and not has_application:
+            raise serializers.ValidationError("'document_type' requires 'application_id'.")
+        return attrs
+
+
+class ResultFilterSerializer(serializers.Serializer):
+    """Query params for filtering results in export and stats endpoints."""
+    
+    job = serializers.UUIDField(required=False)
+    document_type = serializers.ChoiceField(
+        choices=ClassificationResult.DocumentType.choices,
+        required=False
+    )
+    requires_review = serializers.BooleanField(required=False, allow_null=True, default=None)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+
+
+class ResultExportSerializer(ResultFilterSerializer):
+    """Query params for the result export endpoint."""
+    
+    output = serializers.ChoiceField(choices=['csv', 'parquet'], required=False, default='csv')
+
+
+class ResultStatsSerializer(ResultFilterSerializer):
+    """Query params for the result stats endpoint."""
+    
+    bins = serializers.IntegerField(required=False, default=10, min_value=1, max_value=20)
+
+
+class DocumentUploadSerializer(serializers.ModelSerializer):
+    """Serializer for DocumentUpload."""
+    
+    class Meta:
+        model = DocumentUpload
+        fields = [
+            'id',
+            'application_id',
+            's3_bucket',
+            's3_key',
+            'filename',
+            'content_type',
+            'size_bytes',
+            'etag',
+            'part_size',
+            'part_count',
+            'status',
+            'error_message',
+            'classification_job',
+            'created_at',
+            'updated_at',
+            'expires_at',
+            'completed_at',
+        ]
+        read_only_fields = fields
+
+
+class CreateUploadRequestSerializer(serializers.Serializer):
+    """Request serializer for starting a document upload."""
+    
+    # Media types the classifier can read
+    ALLOWED_CONTENT_TYPES = [
+        'application/pdf',
+        'image/png',
+        'image/jpeg',
+        'image/gif',
+        'image/webp',
+    ]
+    
+    application_id = serializers.CharField(max_length=255)
+    filename = serializers.CharField(max_length=255)
+    content_type = serializers.ChoiceField(choices=ALLOWED_CONTENT_TYPES)
+    size_bytes = serializers.IntegerField(min_value=1)
+    
+    def validate_size_bytes(self, value):
+        if value > settings.DOCUMENT_UPLOAD_MAX_BYTES:
+            raise serializers.ValidationError(
+                f"File exceeds the {settings.DOCUMENT_UPLOAD_MAX_BYTES} byte upload limit."
+            )
+        return value
+    
+    def validate_filename(self, value):
+        if '/' in value or '\\' in value:
+            raise serializers.ValidationError("Filename must not contain path separators.")
+        return value
+
+
+class UploadPartSerializer(serializers.Serializer):
+    """A completed multipart upload part."""
+    
+    part_number = serializers.IntegerField(min_value=1, max_value=10000)
+    etag = serializers.CharField(max_length=255)
+
+
+class CompleteUploadRequestSerializer(serializers.Serializer):
+    """Request serializer for completing a document upload."""
+    
+    parts = UploadPartSerializer(many=True, required=False, default=list)
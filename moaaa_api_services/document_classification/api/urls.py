@@ -1,11 +1,17 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ClassificationJobViewSet, ClassificationResultViewSet, ClassifyViewSet
+from .views import (
+    ClassificationJobViewSet,
+    ClassificationResultViewSet,
+    ClassifyViewSet,
+    DocumentUploadViewSet,
+)
 
 router = DefaultRouter()
 router.register(r'jobs', ClassificationJobViewSet, basename='classification-jobs')
 router.register(r'results', ClassificationResultViewSet, basename='classification-results')
 router.register(r'classify', ClassifyViewSet, basename='classify')
+router.register(r'uploads', DocumentUploadViewSet, basename='classification-uploads')
 
 urlpatterns = [
     path('', include(router.urls)),
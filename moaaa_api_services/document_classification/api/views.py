@@ -1,9 +1,28 @@
+import math
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
-from ..models import ClassificationJob, ClassificationResult
-from ..ai_ml import BedrockClassifier, ClassificationInput
+from pipeline.events import DOCUMENT_CLASSIFIED, document_classified
+from pipeline.outbox import record_event
+from ..models import ClassificationJob, ClassificationResult, DocumentUpload
+from ..ai_ml import ClassificationInput
+from ..ai_ml.text_layer import path_latency
+from ..storage import get_document_storage
+from ..tasks import (
+    complete_upload,
+    get_classifier,
+    pending_single_put_upload,
+    s3_created_objects,
+)
 from .serializers import (
     ClassificationJobSerializer,
     ClassificationResultSerializer,
@@ -11,7 +30,14 @@ from .serializers import (
     ClassifyBatchRequestSerializer,
     ClassifyDocumentResponseSerializer,
     ActivateDeactivateSerializer,
+    BulkActivateDeactivateSerializer,
+    ResultExportSerializer,
+    ResultStatsSerializer,
+    DocumentUploadSerializer,
+    CreateUploadRequestSerializer,
+    CompleteUploadRequestSerializer,
 )
+from .exporters import parquet_available, stream_csv, stream_parquet
 
 
 class ClassificationJobViewSet(viewsets.ModelViewSet):
@@ -38,11 +64,51 @@ class ClassificationResultViewSet(viewsets.ModelViewSet):
         GET /api/classification/results/{id}/ - Get result details
         POST /api/classification/results/{id}/activate/ - Activate result
         POST /api/classification/results/{id}/deactivate/ - Deactivate result
+        POST /api/classification/results/bulk_activate/ - Activate many results
+        POST /api/classification/results/bulk_deactivate/ - Deactivate many results
+        GET /api/classification/results/export/ - Stream results as CSV or Parquet
+        GET /api/classification/results/stats/ - Counts and confidence histograms
+    
+    Reads accept ``?fields=id,document_type,...`` to return (and load) only
+    the listed fields. ``raw_response`` is omitted unless requested.
     """
     
     queryset = ClassificationResult.objects.all()
     serializer_class = ClassificationResultSerializer
     
+    def get_requested_fields(self):
+        """Parse the ``fields`` query param into a list of field names."""
+        if self.request is None or self.request.method != 'GET':
+            return None
+        param = self.request.query_params.get('fields')
+        if not param:
+            return None
+        
+        requested = [name.strip() for name in param.split(',') if name.strip()]
+        unknown = set(requested) - set(ClassificationResultSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({'fields': f"Unknown fields: {', '.join(sorted(unknown))}"})
+        return requested
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        requested = self.get_requested_fields()
+        if requested is None:
+            return queryset
+        
+        # Only select the columns the response needs
+        fields = ClassificationResultSerializer().fields
+        columns = {'id'} | {fields[name].source for name in requested if name != 'raw_response'}
+        if 'raw_response' in requested:
+            queryset = queryset.select_related('raw')
+            columns.add('raw__payload')
+        return queryset.only(*columns)
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_requested_fields()
+        return context
+    
     @action(detail=True, methods=['post'])
     def activate(self, request, pk=None):
         """Activate a classification result."""
@@ -68,6 +134,179 @@ class ClassificationResultViewSet(viewsets.ModelViewSet):
             'id': str(result.id),
             'is_active': result.is_active
         })
+    
+    def _bulk_queryset(self, data):
+        """Results selected by a validated BulkActivateDeactivateSerializer payload."""
+        queryset = ClassificationResult.objects.all()
+        if 'ids' in data:
+            return queryset.filter(id__in=data['ids'])
+        
+        queryset = queryset.filter(application_ref=data['application_id'])
+        if 'document_type' in data:
+            queryset = queryset.filter(document_type=data['document_type'])
+        return queryset
+    
+    @action(detail=False, methods=['post'])
+    def bulk_activate(self, request):
+        """
+        Activate many results with a single UPDATE.
+        
+        Request:
+            {"ids": ["uuid", ...]}
+            or
+            {"application_id": "app-001", "document_type": "BANK_STATEMENT"}
+        """
+        serializer = BulkActivateDeactivateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        updated = self._bulk_queryset(serializer.validated_data).activate()
+        
+        return Response({
+            'status': 'activated',
+            'updated': updated
+        })
+    
+    @action(detail=False, methods=['post'])
+    def bulk_deactivate(self, request):
+        """
+        Deactivate many results with a single UPDATE.
+        
+        Request:
+            {"ids": ["uuid", ...], "user": "ops@example.com"}
+            or
+            {"application_id": "app-001", "document_type": "BANK_STATEMENT"}
+        """
+        serializer = BulkActivateDeactivateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        updated = self._bulk_queryset(data).deactivate(user=data.get('user', ''))
+        
+        return Response({
+            'status': 'deactivated',
+            'updated': updated
+        })
+    
+    def _filtered_results(self, data):
+        """Results matching a validated ResultFilterSerializer payload."""
+        queryset = ClassificationResult.objects.all()
+        if 'job' in data:
+            queryset = queryset.filter(job_id=data['job'])
+        if 'document_type' in data:
+            queryset = queryset.filter(document_type=data['document_type'])
+        if data.get('requires_review') is not None:
+            queryset = queryset.filter(requires_review=data['requires_review'])
+        if 'created_after' in data:
+            queryset = queryset.filter(created_at__gte=data['created_after'])
+        if 'created_before' in data:
+            queryset = queryset.filter(created_at__lt=data['created_before'])
+        return queryset
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream matching results as CSV (default) or Parquet.
+        
+        Query params:
+            job, document_type, requires_review, created_after, created_before,
+            output=csv|parquet
+        
+        Rows are read through a server-side cursor in chunks, so memory use
+        does not grow with the number of results.
+        """
+        serializer = ResultExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        queryset = self._filtered_results(data)
+        stamp = timezone.now().strftime('%Y%m%d%H%M%S')
+        
+        if data['output'] == 'parquet':
+            if not parquet_available():
+                return Response(
+                    {'error': 'Parquet export requires pyarrow'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            response = StreamingHttpResponse(
+                stream_parquet(queryset),
+                content_type='application/vnd.apache.parquet'
+            )
+            response['Content-Disposition'] = f'attachment; filename="classification_results_{stamp}.parquet"'
+            return response
+        
+        response = StreamingHttpResponse(stream_csv(queryset), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="classification_results_{stamp}.csv"'
+        return response
+    
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """
+        Aggregate matching results by document type, computed in SQL.
+        
+        Query params:
+            job, document_type, requires_review, created_after, created_before,
+            bins (confidence histogram buckets, default 10)
+        
+        Response:
+            {
+                "total": 120,
+                "by_document_type": [
+                    {
+                        "document_type": "BANK_STATEMENT",
+                        "count": 40,
+                        "active": 38,
+                        "requires_review": 5,
+                        "avg_confidence": 0.91,
+                        "histogram": [{"min": 0.0, "max": 0.1, "count": 0}, ...]
+                    },
+                    ...
+                ]
+            }
+        """
+        serializer = ResultStatsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        bins = data['bins']
+        edges = [round(i / bins, 6) for i in range(bins + 1)]
+        
+        # One conditional COUNT per histogram bucket; the last bucket includes 1.0
+        aggregates = {
+            'count': Count('id'),
+            'active': Count('id', filter=Q(is_active=True)),
+            'requires_review': Count('id', filter=Q(requires_review=True)),
+            'avg_confidence': Avg('confidence_score'),
+        }
+        for i in range(bins):
+            upper = Q(confidence_score__lte=edges[i + 1]) if i == bins - 1 else Q(confidence_score__lt=edges[i + 1])
+            aggregates[f'bin_{i}'] = Count('id', filter=Q(confidence_score__gte=edges[i]) & upper)
+        
+        rows = (
+            self._filtered_results(data)
+            .order_by()
+            .values('document_type')
+            .annotate(**aggregates)
+            .order_by('document_type')
+        )
+        
+        by_document_type = []
+        for row in rows:
+            by_document_type.append({
+                'document_type': row['document_type'],
+                'count': row['count'],
+                'active': row['active'],
+                'requires_review': row['requires_review'],
+                'avg_confidence': row['avg_confidence'],
+                'histogram': [
+                    {'min': edges[i], 'max': edges[i + 1], 'count': row[f'bin_{i}']}
+                    for i in range(bins)
+                ],
+            })
+        
+        return Response({
+            'total': sum(item['count'] for item in by_document_type),
+            'by_document_type': by_document_type
+        })
 
 
 class ClassifyViewSet(viewsets.ViewSet):
@@ -77,11 +316,16 @@ class ClassifyViewSet(viewsets.ViewSet):
     Endpoints:
         POST /api/classification/classify/ - Classify a single document
         POST /api/classification/classify/batch/ - Classify multiple documents
+        GET /api/classification/classify/latency/ - Per-path latency in this process
+    
+    Every saved result is announced with a document.classified event,
+    written to the outbox in the result's transaction (see pipeline.outbox).
     """
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.classifier = BedrockClassifier()
+        # Shared across requests, reading documents through the disk cache
+        self.classifier = get_classifier()
     
     def create(self, request):
         """
@@ -92,7 +336,8 @@ class ClassifyViewSet(viewsets.ViewSet):
                 "s3_bucket": "my-bucket",
                 "s3_key": "documents/license.pdf",
                 "filename": "license.pdf",
-                "application_id": "app-001"
+                "application_id": "app-001",
+                "supersede_previous": false
             }
         
         Response:
@@ -127,19 +372,22 @@ class ClassifyViewSet(viewsets.ViewSet):
             # Classify
             output = self.classifier.classify(input_data)
             
-            # Save result
-            result = ClassificationResult.objects.create(
-                job=job,
-                application_id=data['application_id'],
-                document_s3_bucket=data['s3_bucket'],
-                document_s3_key=data['s3_key'],
-                document_filename=data['filename'],
-                document_type=output.document_type,
-                confidence_score=output.confidence_score,
-                requires_review=output.requires_review,
-                raw_response=output.raw_response,
-                created_by=request.user.username if request.user.is_authenticated else 'anonymous'
-            )
+            # Save result and its outbox event in one transaction
+            with transaction.atomic():
+                result = ClassificationResult.objects.create_with_raw_response(
+                    job=job,
+                    application_ref=data['application_id'],
+                    document_s3_bucket=data['s3_bucket'],
+                    document_s3_key=data['s3_key'],
+                    document_filename=data['filename'],
+                    document_type=output.document_type,
+                    confidence_score=output.confidence_score,
+                    requires_review=output.requires_review,
+                    raw_response=output.raw_response,
+                    supersede_previous=data['supersede_previous'],
+                    created_by=request.user.username if request.user.is_authenticated else 'anonymous'
+                )
+                record_event(DOCUMENT_CLASSIFIED, document_classified(result))
             
             # Update job
             job.processed_documents = 1
@@ -163,6 +411,18 @@ class ClassifyViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=False, methods=['get'])
+    def latency(self, request):
+        """
+        Report latency per stage and pipeline path (vision, text_model,
+        local_regex) for classification, extraction and the fused pipeline
+        in this process.
+        
+        Response:
+            {"classification": {"vision": {"count": 12, "avg_ms": 4100.2, "max_ms": 6022.0}, ...}, ...}
+        """
+        return Response(path_latency.report())
+    
     @action(detail=False, methods=['post'])
     def batch(self, request):
         """
@@ -172,6 +432,7 @@ class ClassifyViewSet(viewsets.ViewSet):
             {
                 "job_name": "Batch classification",
                 "job_description": "Optional description",
+                "supersede_previous": false,
                 "documents": [
                     {
                         "s3_bucket": "my-bucket",
@@ -224,19 +485,22 @@ class ClassifyViewSet(viewsets.ViewSet):
                 # Classify
                 output = self.classifier.classify(input_data)
                 
-                # Save result
-                result = ClassificationResult.objects.create(
-                    job=job,
-                    application_id=doc['application_id'],
-                    document_s3_bucket=doc['s3_bucket'],
-                    document_s3_key=doc['s3_key'],
-                    document_filename=doc['filename'],
-                    document_type=output.document_type,
-                    confidence_score=output.confidence_score,
-                    requires_review=output.requires_review,
-                    raw_response=output.raw_response,
-                    created_by=request.user.username if request.user.is_authenticated else 'anonymous'
-                )
+                # Save result and its outbox event in one transaction
+                with transaction.atomic():
+                    result = ClassificationResult.objects.create_with_raw_response(
+                        job=job,
+                        application_ref=doc['application_id'],
+                        document_s3_bucket=doc['s3_bucket'],
+                        document_s3_key=doc['s3_key'],
+                        document_filename=doc['filename'],
+                        document_type=output.document_type,
+                        confidence_score=output.confidence_score,
+                        requires_review=output.requires_review,
+                        raw_response=output.raw_response,
+                        supersede_previous=data['supersede_previous'] or doc['supersede_previous'],
+                        created_by=request.user.username if request.user.is_authenticated else 'anonymous'
+                    )
+                    record_event(DOCUMENT_CLASSIFIED, document_classified(result))
                 
                 results.append({
                     'result_id': str(result.id),
@@ -270,3 +534,183 @@ class ClassifyViewSet(viewsets.ViewSet):
             'failed': job.failed_documents,
             'results': results
         }, status=status.HTTP_201_CREATED)
+
+
+class DocumentUploadViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet for direct-to-S3 document uploads.
+    
+    Clients upload bytes straight to S3 with presigned URLs; the API only
+    issues URLs and records completion, then queues classification.
+    
+    Endpoints:
+        GET /api/classification/uploads/ - List uploads
+        GET /api/classification/uploads/{id}/ - Get upload details
+        POST /api/classification/uploads/ - Start an upload, get presigned URL(s)
+        POST /api/classification/uploads/{id}/complete/ - Complete an upload
+        POST /api/classification/uploads/{id}/abort/ - Abort an upload
+        POST /api/classification/uploads/s3_events/ - S3 ObjectCreated notifications
+    """
+    
+    queryset = DocumentUpload.objects.all()
+    serializer_class = DocumentUploadSerializer
+    
+    def create(self, request):
+        """
+        Start an upload.
+        
+        Request:
+            {
+                "application_id": "app-001",
+                "filename": "statement.pdf",
+                "content_type": "application/pdf",
+                "size_bytes": 52428800
+            }
+        
+        Response (single PUT):
+            {"upload_id": "uuid", "method": "PUT", "url": "https://...", ...}
+        
+        Response (multipart, for files above the multipart threshold):
+            {"upload_id": "uuid", "method": "PUT", "part_size": 8388608,
+             "parts": [{"part_number": 1, "url": "https://..."}, ...], ...}
+        """
+        serializer = CreateUploadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        storage = get_document_storage()
+        expires_in = settings.DOCUMENT_UPLOAD_URL_EXPIRY_SECONDS
+        
+        upload = DocumentUpload(
+            application_id=data['application_id'],
+            s3_bucket=settings.DOCUMENT_UPLOAD_BUCKET,
+            filename=data['filename'],
+            content_type=data['content_type'],
+            size_bytes=data['size_bytes'],
+            expires_at=timezone.now() + timedelta(seconds=expires_in),
+            created_by=request.user.username if request.user.is_authenticated else 'anonymous'
+        )
+        upload.s3_key = f"uploads/{data['application_id']}/{upload.id}/{data['filename']}"
+        
+        response_data = {
+            'upload_id': str(upload.id),
+            's3_bucket': upload.s3_bucket,
+            's3_key': upload.s3_key,
+            'method': 'PUT',
+            'expires_in': expires_in,
+        }
+        
+        if upload.size_bytes > settings.DOCUMENT_UPLOAD_MULTIPART_THRESHOLD:
+            upload.part_size = settings.DOCUMENT_UPLOAD_PART_SIZE
+            upload.part_count = math.ceil(upload.size_bytes / upload.part_size)
+            upload.multipart_upload_id = storage.create_multipart_upload(
+                upload.s3_bucket, upload.s3_key, upload.content_type
+            )
+            response_data['part_size'] = upload.part_size
+            response_data['parts'] = [
+                {
+                    'part_number': part_number,
+                    'url': storage.presign_upload_part(
+                        upload.s3_bucket, upload.s3_key, upload.multipart_upload_id,
+                        part_number, expires_in
+                    )
+                }
+                for part_number in range(1, upload.part_count + 1)
+            ]
+        else:
+            response_data['url'] = storage.presign_put(
+                upload.s3_bucket, upload.s3_key, upload.content_type, expires_in
+            )
+            response_data['headers'] = {'Content-Type': upload.content_type}
+        
+        upload.save()
+        return Response(response_data, status=status.HTTP_201_CREATED)
+    
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        """
+        Complete an upload and queue it for classification.
+        
+        Request (multipart only):
+            {"parts": [{"part_number": 1, "etag": "..."}, ...]}
+        """
+        serializer = CompleteUploadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        upload = self.get_object()
+        if upload.status != DocumentUpload.Status.PENDING:
+            return Response(
+                {'error': f"Upload is {upload.status}"},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        try:
+            job = complete_upload(upload, serializer.validated_data['parts'])
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        if job is None:
+            # Completed (or ended) by a concurrent call or S3 notification
+            return Response(
+                {'error': f"Upload is {upload.status}"},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(DocumentUploadSerializer(upload).data)
+    
+    @action(detail=True, methods=['post'])
+    def abort(self, request, pk=None):
+        """Abort a pending upload and discard any uploaded parts."""
+        upload = self.get_object()
+        if upload.status != DocumentUpload.Status.PENDING:
+            return Response(
+                {'error': f"Upload is {upload.status}"},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        if not upload.abort():
+            return Response(
+                {'error': f"Upload is {upload.status}"},
+                status=status.HTTP_409_CONFLICT
+            )
+        if upload.is_multipart:
+            get_document_storage().abort_multipart_upload(
+                upload.s3_bucket, upload.s3_key, upload.multipart_upload_id
+            )
+        
+        return Response(DocumentUploadSerializer(upload).data)
+    
+    @action(detail=False, methods=['post'])
+    def s3_events(self, request):
+        """
+        Complete single-PUT uploads from S3 ObjectCreated notifications.
+        
+        Request:
+            {"Records": [{"eventName": "ObjectCreated:Put",
+                          "s3": {"bucket": {"name": "..."}, "object": {"key": "..."}}}]}
+        
+        Multipart uploads are completed through the complete endpoint, so their
+        notifications are ignored.
+        """
+        completed = []
+        objects, skipped = s3_created_objects(request.data)
+        
+        for bucket, key in objects:
+            upload = pending_single_put_upload(bucket, key)
+            if upload is None:
+                skipped += 1
+                continue
+            
+            try:
+                job = complete_upload(upload)
+            except ValueError as e:
+                upload.fail(str(e))
+                skipped += 1
+                continue
+            
+            if job is None:
+                # Repeated notification, or completed through the API meanwhile
+                skipped += 1
+            else:
+                completed.append(str(upload.id))
+        
+        return Response({'completed': completed, 'skipped': skipped})
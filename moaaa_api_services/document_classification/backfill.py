@@ -0,0 +1,67 @@
+"""
+Backfill of ClassificationResult.application from application_ref.
+
+Runs in small batches, each in its own short transaction, walking the
+table by primary key. Only rows that are still unlinked are touched, so an
+interrupted run can simply be started again.
+"""
+import time
+from collections import defaultdict
+from typing import Callable, Optional
+
+from django.db import transaction
+
+
+def backfill_result_applications(result_model, application_model, chunk_size: int = 1000,
+                                 pause_seconds: float = 0.0,
+                                 log: Optional[Callable[[str], None]] = None) -> int:
+    """
+    Link unlinked classification results to the Application their
+    reference names.
+
+    Takes the models as arguments so migrations can pass historical models.
+
+    Args:
+        result_model: ClassificationResult model
+        application_model: Application model
+        chunk_size: Rows read and updated per transaction
+        pause_seconds: Sleep between chunks, to go easy on a busy database
+        log: Optional progress callback
+
+    Returns:
+        Number of results linked
+    """
+    unlinked = result_model.objects.filter(application__isnull=True).exclude(application_ref='')
+    linked = 0
+    last_pk = None
+
+    while True:
+        chunk = unlinked if last_pk is None else unlinked.filter(pk__gt=last_pk)
+        rows = list(chunk.order_by('pk').values_list('pk', 'application_ref')[:chunk_size])
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+
+        applications = dict(
+            application_model.objects
+            .filter(reference__in={reference for _, reference in rows})
+            .values_list('reference', 'pk')
+        )
+        by_application = defaultdict(list)
+        for pk, reference in rows:
+            if reference in applications:
+                by_application[applications[reference]].append(pk)
+
+        with transaction.atomic():
+            for application_pk, pks in by_application.items():
+                # Re-check the NULL so rows linked meanwhile are left alone
+                linked += result_model.objects.filter(pk__in=pks, application__isnull=True).update(
+                    application=application_pk
+                )
+
+        if log:
+            log(f"Linked {linked} results (through {last_pk})")
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    return linked
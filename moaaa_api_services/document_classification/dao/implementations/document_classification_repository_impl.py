@@ -1,27 +1,15 @@
-from typing import List, Optional
+from typing import List
+from moaaa_api_services.repository import DjangoModelRepository
 from ..interfaces.document_classification_repository import IDocument_classificationRepository
-from ..models import *
+from ...models import ClassificationResult
+from ...signals import results_changed
 
 
-class Document_classificationRepositoryImpl(IDocument_classificationRepository):
-    """Concrete implementation of document_classification repository."""
+class Document_classificationRepositoryImpl(DjangoModelRepository, IDocument_classificationRepository):
+    """Concrete implementation of document_classification repository, over ClassificationResult."""
 
-    def get_by_id(self, id: str) -> Optional[dict]:
-        # TODO: Implement
-        pass
+    model = ClassificationResult
 
-    def get_all(self) -> List[dict]:
-        # TODO: Implement
-        pass
-
-    def create(self, data: dict) -> dict:
-        # TODO: Implement
-        pass
-
-    def update(self, id: str, data: dict) -> Optional[dict]:
-        # TODO: Implement
-        pass
-
-    def delete(self, id: str) -> bool:
-        # TODO: Implement
-        pass
+    def _bulk_written(self, rows: List[dict]) -> None:
+        # Bulk writes skip post_save; keep the application status snapshots current
+        results_changed.send(sender=self.model, application_ids={row['application_ref'] for row in rows})
@@ -0,0 +1,194 @@
+"""
+AWS Lambda entry point: classify documents from S3 ObjectCreated events.
+
+Configure the upload bucket to notify the function. For each object that
+belongs to a pending single-PUT DocumentUpload, the handler completes the
+upload, runs classification inline and saves the result through the ORM,
+the same path as the s3_events endpoint and the pipeline's classify stage.
+Other objects, repeated notifications and multipart uploads (completed
+through the API) are skipped, as is an upload that a concurrent
+invocation or API call completed first.
+
+Only the apps are set up (models, ready() hooks), not the URLconf or
+middleware. Django, the classifier and its boto3 clients are created once
+per container at module scope, during Lambda's init phase, and reused by
+warm invocations; set DB_CONN_MAX_AGE to keep the database connection too.
+
+Recommended function environment:
+    DJANGO_SETTINGS_MODULE=moaaa_api_services.settings
+    PIPELINE_OUTBOX_RELAY_IN_PROCESS=false  (Lambda freezes background
+        threads; run `manage.py relay_outbox` or the queue workers elsewhere)
+    DB_CONN_MAX_AGE=300
+Credentials come from the function's role (see moaaa_api_services.aws).
+
+Every invocation logs and returns cold/warm timings. To try it locally with
+the sample event (DOCUMENT_STORAGE_BACKEND=local and the object under
+DOCUMENT_STORAGE_LOCAL_ROOT):
+
+    python -m document_classification.lambda_handler \\
+        document_classification/lambda_events/s3_object_created.json \\
+        --register-uploads --invocations 5
+"""
+import time
+
+# Module init is the cold start; measured up to the end of the warm-up below
+_init_started = time.perf_counter()
+
+import json  # noqa: E402
+import logging  # noqa: E402
+import os  # noqa: E402
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'moaaa_api_services.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from .tasks import (  # noqa: E402
+    complete_upload,
+    get_classifier,
+    pending_single_put_upload,
+    run_upload_classification,
+    s3_created_objects,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up() -> None:
+    """Create the classifier and its clients now, while the init phase runs."""
+    classifier = get_classifier()
+    try:
+        classifier.bedrock_client
+        classifier.s3_client
+    except Exception:
+        # Reported again by the first classification that needs them
+        logger.exception("Could not create AWS clients during init")
+
+
+_warm_up()
+INIT_MS = (time.perf_counter() - _init_started) * 1000
+_invocations = 0
+
+
+def handler(event: dict, context=None) -> dict:
+    """
+    Classify the uploads named in an S3 event notification.
+
+    Returns:
+        {'classified': [...], 'failed': [...], 'skipped': int, 'metrics': {...}}
+    """
+    global _invocations
+    _invocations += 1
+    started = time.perf_counter()
+
+    classified = []
+    failed = []
+    objects, skipped = s3_created_objects(event)
+
+    for bucket, key in objects:
+        upload = pending_single_put_upload(bucket, key)
+        if upload is None:
+            skipped += 1
+            continue
+
+        try:
+            job = complete_upload(upload, enqueue=False)
+        except ValueError as e:
+            upload.fail(str(e))
+            failed.append({'upload_id': str(upload.id), 'error': str(e)})
+            continue
+        if job is None:
+            skipped += 1
+            continue
+
+        result = run_upload_classification(upload.id)
+        if result is None:
+            job.refresh_from_db(fields=['error_message'])
+            failed.append({'upload_id': str(upload.id), 'error': job.error_message})
+            continue
+        classified.append({
+            'upload_id': str(upload.id),
+            'result_id': str(result.id),
+            'document_type': result.document_type,
+            'confidence_score': result.confidence_score,
+            'requires_review': result.requires_review,
+        })
+
+    metrics = {
+        'cold_start': _invocations == 1,
+        'init_ms': round(INIT_MS, 1),
+        'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info("Lambda classification %s", json.dumps({
+        **metrics,
+        'classified': len(classified),
+        'failed': len(failed),
+        'skipped': skipped,
+    }))
+    return {'classified': classified, 'failed': failed, 'skipped': skipped, 'metrics': metrics}
+
+
+def _register_uploads(event: dict) -> None:
+    """
+    Create a pending DocumentUpload for every object in the event that is
+    already in storage, as the uploads API would have before the PUT, so the
+    sample event can be replayed locally.
+    """
+    from datetime import timedelta
+
+    from django.conf import settings
+    from django.utils import timezone
+
+    from .models import DocumentUpload
+    from .storage import get_document_storage
+
+    storage = get_document_storage()
+    objects, _ = s3_created_objects(event)
+    for bucket, key in objects:
+        head = storage.head_object(bucket, key)
+        if head is None:
+            raise SystemExit(f"s3://{bucket}/{key} is not in storage")
+        # uploads/<application_id>/<upload_id>/<filename>
+        parts = key.split('/')
+        DocumentUpload.objects.create(
+            application_id=parts[1] if len(parts) == 4 else 'local-test',
+            s3_bucket=bucket,
+            s3_key=key,
+            filename=parts[-1],
+            content_type='application/pdf' if key.lower().endswith('.pdf') else 'application/octet-stream',
+            size_bytes=head['size'],
+            expires_at=timezone.now() + timedelta(seconds=settings.DOCUMENT_UPLOAD_URL_EXPIRY_SECONDS),
+            created_by='lambda-local'
+        )
+
+
+def main() -> None:
+    import argparse
+    import statistics
+
+    parser = argparse.ArgumentParser(description='Invoke the classification handler with an S3 event file.')
+    parser.add_argument('event', help='S3 event notification JSON')
+    parser.add_argument('--invocations', type=int, default=1, help='Times to invoke the handler')
+    parser.add_argument('--register-uploads', action='store_true',
+                        help='Create a pending upload for each object before every invocation')
+    args = parser.parse_args()
+
+    with open(args.event) as f:
+        event = json.load(f)
+
+    durations = []
+    for _ in range(args.invocations):
+        if args.register_uploads:
+            _register_uploads(event)
+        response = handler(event)
+        print(json.dumps(response, indent=2))
+        durations.append(response['metrics']['duration_ms'])
+
+    print(f"Cold start: {INIT_MS:.1f} ms init + {durations[0]:.1f} ms first invocation")
+    if len(durations) > 1:
+        print(f"Warm invocations: median {statistics.median(durations[1:]):.1f} ms over {len(durations) - 1}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from application_profile.models import Application
+from document_classification.backfill import backfill_result_applications
+from document_classification.models import ClassificationResult
+
+
+class Command(BaseCommand):
+    help = (
+        'Link classification results to their Application by reference. '
+        'Safe to interrupt and re-run; only unlinked results are touched.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between chunks')
+
+    def handle(self, *args, **options):
+        linked = backfill_result_applications(
+            ClassificationResult, Application,
+            chunk_size=options['chunk_size'],
+            pause_seconds=options['pause'],
+            log=self.stdout.write if options['verbosity'] > 1 else None
+        )
+        self.stdout.write(self.style.SUCCESS(f'Linked {linked} classification results'))
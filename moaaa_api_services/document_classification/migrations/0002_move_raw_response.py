@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def copy_raw_responses(apps, schema_editor):
+    """Copy inline raw_response payloads into classification_raw_response."""
+    ClassificationResult = apps.get_model('document_classification', 'ClassificationResult')
+    ClassificationRawResponse = apps.get_model('document_classification', 'ClassificationRawResponse')
+    
+    batch = []
+    rows = ClassificationResult.objects.values_list('id', 'raw_response')
+    for result_id, raw_response in rows.iterator(chunk_size=BATCH_SIZE):
+        batch.append(ClassificationRawResponse(result_id=result_id, payload=raw_response or {}))
+        if len(batch) >= BATCH_SIZE:
+            ClassificationRawResponse.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        ClassificationRawResponse.objects.bulk_create(batch)
+
+
+def restore_raw_responses(apps, schema_editor):
+    """Copy payloads back onto classification_result rows."""
+    ClassificationResult = apps.get_model('document_classification', 'ClassificationResult')
+    ClassificationRawResponse = apps.get_model('document_classification', 'ClassificationRawResponse')
+    
+    rows = ClassificationRawResponse.objects.values_list('result_id', 'payload')
+    for result_id, payload in rows.iterator(chunk_size=BATCH_SIZE):
+        ClassificationResult.objects.filter(id=result_id).update(raw_response=payload)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_classification', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClassificationRawResponse',
+            fields=[
+                ('result', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='raw', serialize=False, to='document_classification.classificationresult')),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'classification_raw_response',
+            },
+        ),
+        migrations.RunPython(copy_raw_responses, restore_raw_responses),
+        migrations.RemoveField(
+            model_name='classificationresult',
+            name='raw_response',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_classification', '0002_move_raw_response'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='classificationresult',
+            index=models.Index(fields=['application_id', 'document_type', 'is_active'], name='cls_result_app_type_active_idx'),
+        ),
+    ]
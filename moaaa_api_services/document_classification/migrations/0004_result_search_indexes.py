@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_classification', '0003_result_app_type_active_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='classificationresult',
+            name='application_id',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='classificationresult',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='classificationresult',
+            name='document_filename',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
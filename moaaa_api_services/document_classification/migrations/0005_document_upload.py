@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:02
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_classification', '0004_result_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('application_id', models.CharField(db_index=True, max_length=255)),
+                ('s3_bucket', models.CharField(max_length=255)),
+                ('s3_key', models.CharField(max_length=1024)),
+                ('filename', models.CharField(max_length=255)),
+                ('content_type', models.CharField(max_length=100)),
+                ('size_bytes', models.BigIntegerField()),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('multipart_upload_id', models.CharField(blank=True, max_length=1024)),
+                ('part_size', models.BigIntegerField(default=0)),
+                ('part_count', models.IntegerField(default=0)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('COMPLETED', 'Completed'), ('ABORTED', 'Aborted'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('expires_at', models.DateTimeField()),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.CharField(blank=True, max_length=255)),
+                ('classification_job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='uploads', to='document_classification.classificationjob')),
+            ],
+            options={
+                'db_table': 'document_upload',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['s3_bucket', 's3_key'], name='doc_upload_bucket_key_idx')],
+            },
+        ),
+    ]
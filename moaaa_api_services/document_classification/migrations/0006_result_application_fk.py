@@ -0,0 +1,43 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application_profile', '0002_application'),
+        ('document_classification', '0005_document_upload'),
+    ]
+
+    operations = [
+        # Column renames are metadata-only, and the indexes follow the column
+        migrations.RenameField(
+            model_name='classificationresult',
+            old_name='application_id',
+            new_name='application_ref',
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name='classificationresult',
+                    name='cls_result_app_type_active_idx',
+                ),
+                migrations.AddIndex(
+                    model_name='classificationresult',
+                    index=models.Index(fields=['application_ref', 'document_type', 'is_active'], name='cls_result_app_type_active_idx'),
+                ),
+            ],
+        ),
+        # The single-column index is covered by cls_result_app_type_active_idx;
+        # dropping it also frees its name, which the FK's index would reuse
+        migrations.AlterField(
+            model_name='classificationresult',
+            name='application_ref',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AddField(
+            model_name='classificationresult',
+            name='application',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='classification_results', to='application_profile.application'),
+        ),
+    ]
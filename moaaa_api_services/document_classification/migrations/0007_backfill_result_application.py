@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def backfill(apps, schema_editor):
+    from document_classification.backfill import backfill_result_applications
+
+    backfill_result_applications(
+        apps.get_model('document_classification', 'ClassificationResult'),
+        apps.get_model('application_profile', 'Application')
+    )
+
+
+class Migration(migrations.Migration):
+    """
+    Link existing results to their Application.
+
+    Not atomic: every chunk commits on its own, so the table is never
+    locked for the whole backfill, and a failed or interrupted run resumes
+    from the rows still unlinked. Large tables can be backfilled ahead of
+    the deploy with `manage.py backfill_result_applications`, leaving this
+    migration little to do.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ('document_classification', '0006_result_application_fk'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
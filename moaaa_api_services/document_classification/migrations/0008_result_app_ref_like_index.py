@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application_profile', '0002_application'),
+        ('document_classification', '0007_backfill_result_application'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='classificationresult',
+            index=models.Index(fields=['application_ref'], name='cls_result_app_ref_like_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -1,7 +1,10 @@
-from django.db import models
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
 from django.utils import timezone
 import uuid
 
+from .signals import results_changed
+
 
 class ClassificationJob(models.Model):
     """
@@ -55,6 +58,17 @@ class ClassificationJob(models.Model):
         self.started_at = timezone.now()
         self.save()
     
+    def claim(self) -> bool:
+        """Start a PENDING job; False if another worker already started it."""
+        now = timezone.now()
+        claimed = type(self).objects.filter(pk=self.pk, status=self.Status.PENDING).update(
+            status=self.Status.IN_PROGRESS, started_at=now, updated_at=now
+        )
+        if claimed:
+            self.status = self.Status.IN_PROGRESS
+            self.started_at = now
+        return bool(claimed)
+    
     def complete(self):
         self.status = self.Status.COMPLETED
         self.completed_at = timezone.now()
@@ -67,6 +81,88 @@ class ClassificationJob(models.Model):
         self.save()
 
 
+class ClassificationResultQuerySet(models.QuerySet):
+    """QuerySet helpers for ClassificationResult."""
+    
+    def create_with_raw_response(self, raw_response: dict = None, supersede_previous: bool = False,
+                                 **fields):
+        """
+        Create a result and store its raw model response in the side table.
+        
+        Args:
+            raw_response: Raw response payload from the classifier
+            supersede_previous: Deactivate older active results for the same
+                application and document type in the same transaction
+            **fields: ClassificationResult field values
+            
+        Returns:
+            The created ClassificationResult
+        """
+        with transaction.atomic(using=self.db):
+            result = self.create(**fields)
+            ClassificationRawResponse.objects.using(self.db).create(
+                result=result,
+                payload=raw_response or {}
+            )
+            if supersede_previous:
+                self.superseded_by(result).deactivate(user=result.created_by)
+        return result
+    
+    def superseded_by(self, result: 'ClassificationResult'):
+        """Active results for the same application and document type, excluding `result`."""
+        return self.filter(
+            application_ref=result.application_ref,
+            document_type=result.document_type,
+            is_active=True
+        ).exclude(pk=result.pk)
+    
+    def link_applications(self, results) -> None:
+        """Set `application` on results that have none from their references, in one query."""
+        references = {result.application_ref for result in results if result.application_id is None}
+        if not references:
+            return
+        applications = dict(
+            self.model._meta.get_field('application').related_model.objects.using(self.db)
+            .filter(reference__in=references)
+            .values_list('reference', 'id')
+        )
+        for result in results:
+            if result.application_id is None:
+                result.application_id = applications.get(result.application_ref)
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        self.link_applications(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+    
+    def _update_and_notify(self, **values) -> int:
+        """UPDATE the queryset and send results_changed for the applications touched."""
+        application_ids = set(self.values_list('application_ref', flat=True).distinct())
+        updated = self.update(**values)
+        if updated:
+            results_changed.send(sender=self.model, application_ids=application_ids)
+        return updated
+    
+    def activate(self) -> int:
+        """Activate every result in the queryset with a single UPDATE."""
+        return self.filter(is_active=False)._update_and_notify(
+            is_active=True,
+            deactivated_at=None,
+            deactivated_by='',
+            updated_at=timezone.now()
+        )
+    
+    def deactivate(self, user: str = '') -> int:
+        """Deactivate every result in the queryset with a single UPDATE."""
+        now = timezone.now()
+        return self.filter(is_active=True)._update_and_notify(
+            is_active=False,
+            deactivated_at=now,
+            deactivated_by=user,
+            updated_at=now
+        )
+
+
 class ClassificationResult(models.Model):
     """
     Represents a classification result for a single document.
@@ -93,13 +189,22 @@ class ClassificationResult(models.Model):
         related_name='results'
     )
     
-    # Application reference (string for now, FK to application_profile later)
-    application_id = models.CharField(max_length=255)
+    application = models.ForeignKey(
+        'application_profile.Application',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='classification_results'
+    )
+    # Application reference as sent by the client; `application` is resolved
+    # from it on save (left empty while no such Application exists). Lookups
+    # use the leading column of cls_result_app_type_active_idx.
+    application_ref = models.CharField(max_length=255)
     
     # Document info
     document_s3_bucket = models.CharField(max_length=255)
     document_s3_key = models.CharField(max_length=1024)
-    document_filename = models.CharField(max_length=255)
+    document_filename = models.CharField(max_length=255, db_index=True)
     
     # Classification results
     document_type = models.CharField(
@@ -109,15 +214,12 @@ class ClassificationResult(models.Model):
     )
     confidence_score = models.FloatField(default=0.0)
     
-    # Raw response from Bedrock
-    raw_response = models.JSONField(default=dict, blank=True)
-    
     # Status flags
     is_active = models.BooleanField(default=True)
     requires_review = models.BooleanField(default=False)
     
     # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     # Audit
@@ -125,13 +227,42 @@ class ClassificationResult(models.Model):
     deactivated_at = models.DateTimeField(null=True, blank=True)
     deactivated_by = models.CharField(max_length=255, blank=True)
     
+    objects = ClassificationResultQuerySet.as_manager()
+    
     class Meta:
         db_table = 'classification_result'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['application_ref', 'document_type', 'is_active'],
+                name='cls_result_app_type_active_idx'
+            ),
+            # Admin prefix search (LIKE 'term%'); PostgreSQL only uses a
+            # pattern_ops index for LIKE, whatever the collation. The
+            # document_filename index gets one automatically (db_index)
+            models.Index(
+                fields=['application_ref'],
+                name='cls_result_app_ref_like_idx',
+                opclasses=['varchar_pattern_ops']
+            ),
+        ]
     
     def __str__(self):
         return f"ClassificationResult({self.document_type}, {self.confidence_score:.2%})"
     
+    def save(self, *args, **kwargs):
+        if self.application_id is None and self.application_ref:
+            ClassificationResult.objects.link_applications([self])
+        super().save(*args, **kwargs)
+    
+    @property
+    def raw_response(self) -> dict:
+        """Raw Bedrock response, loaded from its own table on first access."""
+        try:
+            return self.raw.payload
+        except ObjectDoesNotExist:
+            return {}
+    
     def deactivate(self, user: str = ''):
         self.is_active = False
         self.deactivated_at = timezone.now()
@@ -143,3 +274,135 @@ class ClassificationResult(models.Model):
         self.deactivated_at = None
         self.deactivated_by = ''
         self.save()
+
+
+class ClassificationRawResponse(models.Model):
+    """
+    Raw Bedrock response for a classification result.
+    Stored outside classification_result so list queries and table scans
+    only touch the narrow columns; the payload is read on demand.
+    """
+    
+    result = models.OneToOneField(
+        ClassificationResult,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='raw'
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'classification_raw_response'
+    
+    def __str__(self):
+        return f"ClassificationRawResponse({self.result_id})"
+
+
+class DocumentUpload(models.Model):
+    """
+    A direct-to-S3 upload session for one merchant document.
+    The client PUTs bytes to presigned URLs; once the upload is completed
+    the document is queued for classification.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        COMPLETED = 'COMPLETED', 'Completed'
+        ABORTED = 'ABORTED', 'Aborted'
+        FAILED = 'FAILED', 'Failed'
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    # Application reference (string for now, FK to application_profile later)
+    application_id = models.CharField(max_length=255, db_index=True)
+    
+    # Document location
+    s3_bucket = models.CharField(max_length=255)
+    s3_key = models.CharField(max_length=1024)
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    size_bytes = models.BigIntegerField()
+    etag = models.CharField(max_length=255, blank=True)
+    
+    # Multipart upload (empty for single PUT uploads)
+    multipart_upload_id = models.CharField(max_length=1024, blank=True)
+    part_size = models.BigIntegerField(default=0)
+    part_count = models.IntegerField(default=0)
+    
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    error_message = models.TextField(blank=True)
+    
+    # Classification triggered on completion
+    classification_job = models.ForeignKey(
+        ClassificationJob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='uploads'
+    )
+    
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    # Audit
+    created_by = models.CharField(max_length=255, blank=True)
+    
+    class Meta:
+        db_table = 'document_upload'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['s3_bucket', 's3_key'], name='doc_upload_bucket_key_idx'),
+        ]
+    
+    def __str__(self):
+        return f"DocumentUpload({self.filename}) - {self.status}"
+    
+    @property
+    def is_multipart(self) -> bool:
+        return bool(self.multipart_upload_id)
+    
+    @property
+    def is_expired(self) -> bool:
+        return timezone.now() >= self.expires_at
+    
+    def _leave_pending(self, **fields) -> bool:
+        """
+        Move a pending upload to another status.
+        
+        The API's complete call and S3 notifications (delivered at least
+        once, possibly concurrently) race to finish the same upload, so the
+        update is conditional on the row still being PENDING: exactly one
+        caller wins, the others get False and leave it alone.
+        
+        Returns:
+            True if this call moved the upload
+        """
+        fields['updated_at'] = timezone.now()
+        moved = DocumentUpload.objects.filter(
+            pk=self.pk, status=self.Status.PENDING
+        ).update(**fields)
+        if moved:
+            for name, value in fields.items():
+                setattr(self, name, value)
+        else:
+            self.refresh_from_db(fields=['status', 'updated_at'])
+        return bool(moved)
+    
+    def complete(self, etag: str = '') -> bool:
+        return self._leave_pending(
+            status=self.Status.COMPLETED, etag=etag, completed_at=timezone.now()
+        )
+    
+    def abort(self) -> bool:
+        return self._leave_pending(status=self.Status.ABORTED)
+    
+    def fail(self, error_message: str) -> bool:
+        return self._leave_pending(status=self.Status.FAILED, error_message=error_message)
@@ -0,0 +1,44 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids a full COUNT(*) on large, unfiltered tables.
+    
+    On PostgreSQL the planner's row estimate (pg_class.reltuples) is used for
+    unfiltered querysets once the table is past ESTIMATE_THRESHOLD rows.
+    Filtered querysets and other databases fall back to an exact count.
+    """
+    
+    # Below this many rows an exact count is cheap enough
+    ESTIMATE_THRESHOLD = 100_000
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            estimate = self._estimated_count()
+            if estimate is not None and estimate >= self.ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
+    
+    def _estimated_count(self):
+        """Return the planner's row estimate for the table, or None."""
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        
+        table = self.object_list.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [table]
+            )
+            row = cursor.fetchone()
+        
+        # reltuples is -1 (or 0) until the table has been analyzed
+        if not row or row[0] <= 0:
+            return None
+        return int(row[0])
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent after classification results change through bulk queryset operations
+# (which bypass post_save). Receivers get `application_ids`.
+results_changed = Signal()
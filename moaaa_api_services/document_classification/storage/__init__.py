@@ -0,0 +1,61 @@
+import threading
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+from moaaa_api_services.lazy_imports import lazy_exports
+from .document_fetcher import DocumentFetcher
+from .interfaces import IDocumentStorage
+from .implementations import LocalDocumentStorage
+
+if TYPE_CHECKING:
+    from .implementations import S3DocumentStorage
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'S3DocumentStorage': '.implementations',
+})
+
+_storage = None
+_fetcher = None
+# Reentrant: creating the fetcher creates the storage
+_lock = threading.RLock()
+
+
+def get_document_storage() -> IDocumentStorage:
+    """Return the configured document storage backend (created once per process)."""
+    global _storage
+    with _lock:
+        if _storage is None:
+            if settings.DOCUMENT_STORAGE_BACKEND == 'local':
+                _storage = LocalDocumentStorage(settings.DOCUMENT_STORAGE_LOCAL_ROOT)
+            else:
+                from .implementations import S3DocumentStorage
+                _storage = S3DocumentStorage(
+                    profile_name=settings.AWS_PROFILE,
+                    region=settings.AWS_REGION
+                )
+        return _storage
+
+
+def get_document_fetcher() -> DocumentFetcher:
+    """Return the document fetcher over the configured storage, with its disk cache (created once per process)."""
+    global _fetcher
+    with _lock:
+        if _fetcher is None:
+            _fetcher = DocumentFetcher(
+                get_document_storage(),
+                cache_dir=settings.DOCUMENT_CACHE_DIR,
+                max_bytes=settings.DOCUMENT_CACHE_MAX_BYTES,
+                mmap_threshold_bytes=settings.DOCUMENT_CACHE_MMAP_THRESHOLD_BYTES
+            )
+        return _fetcher
+
+
+__all__ = [
+    'IDocumentStorage',
+    'S3DocumentStorage',
+    'LocalDocumentStorage',
+    'DocumentFetcher',
+    'get_document_storage',
+    'get_document_fetcher'
+]
@@ -0,0 +1,242 @@
+"""
+Document fetcher with a local disk cache.
+
+Classification reruns, extraction and the fused pipeline read the same
+objects again and again. The fetcher keeps a copy of each object on local
+disk and revalidates it with a conditional GET (If-None-Match: <etag>), so
+an unchanged object costs a 304 with no body instead of a full download.
+
+- The cache is bounded by total bytes and evicts least recently used
+  objects first. Entries survive restarts (and warm Lambda invocations
+  under /tmp): the ETag of every cached file is kept next to it.
+- Each fetcher caches in its own slot directory under cache_dir, held with
+  a file lock while the process lives, so no other process can add to the
+  bytes it counts. A shared cache_dir therefore holds at most max_bytes per
+  process running at once; a restarted process takes over a free slot and
+  the objects cached in it.
+- Objects of mmap_threshold_bytes or more are returned as read-only memory
+  maps of the cached file instead of being read into `bytes`; both are
+  bytes-like, and consumers only need the buffer (base64, pypdf).
+- Objects larger than the whole cache are downloaded to a temporary file
+  and not kept.
+- Concurrent fetches of one object are serialized, so it is downloaded
+  once and the other readers revalidate the fresh copy.
+"""
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Tuple, Union
+
+from .interfaces import IDocumentStorage
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# bytes, or a read-only mmap.mmap for large objects
+Document = Union[bytes, mmap.mmap]
+
+CHUNK_SIZE = 1024 * 1024
+# Per-object fetch locks, striped by key hash
+LOCK_STRIPES = 64
+
+
+@dataclass
+class _Entry:
+    etag: str
+    size: int
+
+
+def _claim_slot(root: Path) -> Tuple[Path, Optional[IO]]:
+    """
+    The first slot directory under root that no live fetcher holds, and the
+    open lock file holding it (the lock is released when the file closes).
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        # No flock: a directory per process, not reused after a restart
+        return root / f'pid-{os.getpid()}', None
+    for slot in itertools.count():
+        path = root / f'slot-{slot}'
+        path.mkdir(exist_ok=True)
+        lock_file = open(path / '.lock', 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            continue
+        return path, lock_file
+
+
+class DocumentFetcher:
+    """Reads documents through a bounded, ETag-validated local disk cache."""
+
+    def __init__(self, storage: IDocumentStorage, cache_dir: str, max_bytes: int,
+                 mmap_threshold_bytes: int = 8 * 1024 * 1024):
+        """
+        Args:
+            storage: Storage the objects are read from
+            cache_dir: Directory the fetcher claims a slot directory in for
+                its cached objects (created if missing)
+            max_bytes: Most bytes of objects this fetcher keeps on disk
+            mmap_threshold_bytes: Objects at least this large are returned memory-mapped
+        """
+        self.storage = storage
+        self.cache_dir, self._slot_lock = _claim_slot(Path(cache_dir))
+        self.max_bytes = max_bytes
+        self.mmap_threshold_bytes = mmap_threshold_bytes
+
+        # (bucket, key) -> entry, least recently used first
+        self._entries: 'OrderedDict[Tuple[str, str], _Entry]' = OrderedDict()
+        self._total_bytes = 0
+        self._counters = {'hits': 0, 'downloads': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self._fetch_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def _name(bucket: str, key: str) -> str:
+        return hashlib.sha256(f'{bucket}\0{key}'.encode()).hexdigest()
+
+    def _paths(self, bucket: str, key: str) -> Tuple[Path, Path]:
+        name = self._name(bucket, key)
+        return self.cache_dir / f'{name}.bin', self.cache_dir / f'{name}.json'
+
+    def _load_index(self) -> None:
+        """Pick up objects cached by earlier processes, oldest use first."""
+        # Downloads interrupted by a crash, and objects whose metadata is gone
+        for path in self.cache_dir.glob('*.part'):
+            path.unlink(missing_ok=True)
+        for path in self.cache_dir.glob('*.bin'):
+            if not path.with_suffix('.json').exists():
+                path.unlink(missing_ok=True)
+
+        found = []
+        for meta_path in self.cache_dir.glob('*.json'):
+            data_path = meta_path.with_suffix('.bin')
+            try:
+                meta = json.loads(meta_path.read_text())
+                stat = data_path.stat()
+            except (OSError, ValueError, KeyError):
+                meta_path.unlink(missing_ok=True)
+                data_path.unlink(missing_ok=True)
+                continue
+            found.append((stat.st_mtime, (meta['bucket'], meta['key']), _Entry(meta['etag'], stat.st_size)))
+
+        for _, location, entry in sorted(found, key=lambda item: item[0]):
+            self._entries[location] = entry
+            self._total_bytes += entry.size
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used objects until the cache fits (lock held)."""
+        while self._total_bytes > self.max_bytes and self._entries:
+            (bucket, key), entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self._counters['evictions'] += 1
+            # Readers that mapped the file keep their mapping after the unlink
+            for path in self._paths(bucket, key):
+                path.unlink(missing_ok=True)
+
+    def _read(self, f) -> Document:
+        """Read (or map) an open cache file and close it."""
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return b''
+            if size >= self.mmap_threshold_bytes:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
+
+    def _download(self, response: Dict[str, Any]) -> Path:
+        """Stream a response body to a temporary file in the cache directory."""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f, response['body'] as body:
+                for chunk in iter(lambda: body.read(CHUNK_SIZE), b''):
+                    f.write(chunk)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return Path(temp_path)
+
+    def fetch(self, bucket: str, key: str) -> Document:
+        """
+        Return an object's content, from the cache when its ETag still matches.
+
+        Returns:
+            bytes, or a read-only mmap for objects of mmap_threshold_bytes or more
+        """
+        with self._fetch_locks[int(self._name(bucket, key)[:8], 16) % LOCK_STRIPES]:
+            return self._fetch(bucket, key)
+
+    def _fetch(self, bucket: str, key: str) -> Document:
+        location = (bucket, key)
+        data_path, meta_path = self._paths(bucket, key)
+        with self._lock:
+            cached = self._entries.get(location)
+
+        response = self.storage.open_object(bucket, key, if_none_match=cached.etag if cached else None)
+        if response is None:
+            with self._lock:
+                if location in self._entries:
+                    self._entries.move_to_end(location)
+                self._counters['hits'] += 1
+            try:
+                # Keeps the LRU order across restarts
+                os.utime(data_path)
+                return self._read(open(data_path, 'rb'))
+            except FileNotFoundError:
+                # Evicted by another thread since the lookup; download it again
+                response = self.storage.open_object(bucket, key)
+
+        temp_path = self._download(response)
+        size = temp_path.stat().st_size
+        with self._lock:
+            self._counters['downloads'] += 1
+
+        if size > self.max_bytes:
+            # Too large to keep: read it from the temporary file, which goes
+            # away once it is unlinked and every mapping of it closed
+            f = open(temp_path, 'rb')
+            temp_path.unlink()
+            return self._read(f)
+
+        with self._lock:
+            previous = self._entries.pop(location, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            os.replace(temp_path, data_path)
+            meta_path.write_text(json.dumps({'bucket': bucket, 'key': key, 'etag': response['etag']}))
+            self._entries[location] = _Entry(response['etag'], size)
+            self._total_bytes += size
+            self._evict()
+            # Opened before releasing the lock, so eviction can't remove it first
+            f = open(data_path, 'rb')
+        return self._read(f)
+
+    def close(self) -> None:
+        """Release the slot directory, keeping its objects for the next fetcher to claim it."""
+        if self._slot_lock is not None:
+            self._slot_lock.close()
+            self._slot_lock = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                'objects': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+            }
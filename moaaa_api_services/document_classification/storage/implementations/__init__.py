@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+from .local_document_storage import LocalDocumentStorage
+
+if TYPE_CHECKING:
+    from .s3_document_storage import S3DocumentStorage
+
+# boto3 loads with the S3 backend, on first use
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'S3DocumentStorage': '.s3_document_storage',
+})
+
+__all__ = ['S3DocumentStorage', 'LocalDocumentStorage']
@@ -0,0 +1,90 @@
+import hashlib
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from ..interfaces.document_storage import IDocumentStorage
+
+
+class LocalDocumentStorage(IDocumentStorage):
+    """
+    Filesystem stand-in for S3, for local development and tests.
+    
+    Buckets are directories under `root`. "Presigned" URLs are file:// URLs
+    of the path the client should write to, so uploads still bypass Django.
+    """
+    
+    MULTIPART_DIR = '.multipart'
+    
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+    
+    def _object_path(self, bucket: str, key: str) -> Path:
+        path = (self.root / bucket / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Key escapes storage root: {key}")
+        return path
+    
+    def _part_path(self, bucket: str, upload_id: str, part_number: int) -> Path:
+        return self.root / bucket / self.MULTIPART_DIR / upload_id / f"{part_number:05d}"
+    
+    @staticmethod
+    def _etag(path: Path) -> str:
+        digest = hashlib.md5()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def presign_put(self, bucket: str, key: str, content_type: str, expires_in: int) -> str:
+        path = self._object_path(bucket, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.as_uri()
+    
+    def create_multipart_upload(self, bucket: str, key: str, content_type: str) -> str:
+        upload_id = uuid.uuid4().hex
+        (self.root / bucket / self.MULTIPART_DIR / upload_id).mkdir(parents=True, exist_ok=True)
+        return upload_id
+    
+    def presign_upload_part(self, bucket: str, key: str, upload_id: str,
+                            part_number: int, expires_in: int) -> str:
+        return self._part_path(bucket, upload_id, part_number).resolve().as_uri()
+    
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str,
+                                  parts: List[Dict[str, Any]]) -> str:
+        path = self._object_path(bucket, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(path, 'wb') as target:
+            for part in sorted(parts, key=lambda part: part['part_number']):
+                part_path = self._part_path(bucket, upload_id, part['part_number'])
+                if not part_path.exists():
+                    raise ValueError(f"Part {part['part_number']} was not uploaded")
+                if self._etag(part_path) != part['etag'].strip('"'):
+                    raise ValueError(f"ETag mismatch for part {part['part_number']}")
+                with open(part_path, 'rb') as source:
+                    shutil.copyfileobj(source, target)
+        
+        self.abort_multipart_upload(bucket, key, upload_id)
+        return self._etag(path)
+    
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        shutil.rmtree(self.root / bucket / self.MULTIPART_DIR / upload_id, ignore_errors=True)
+    
+    def head_object(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self._object_path(bucket, key)
+        if not path.is_file():
+            return None
+        return {'size': path.stat().st_size, 'etag': self._etag(path)}
+    
+    def get_object(self, bucket: str, key: str) -> bytes:
+        return self._object_path(bucket, key).read_bytes()
+    
+    def open_object(self, bucket: str, key: str, if_none_match: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        path = self._object_path(bucket, key)
+        etag = self._etag(path)
+        if etag == if_none_match:
+            return None
+        return {'size': path.stat().st_size, 'etag': etag, 'body': open(path, 'rb')}
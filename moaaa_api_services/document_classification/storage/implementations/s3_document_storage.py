@@ -0,0 +1,117 @@
+import os
+from typing import Dict, Any, List, Optional
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from moaaa_api_services.aws import default_profile
+from ..interfaces.document_storage import IDocumentStorage
+
+
+class S3DocumentStorage(IDocumentStorage):
+    """
+    Document storage backed by Amazon S3.
+    
+    Uploads go straight from the client to S3 through presigned URLs;
+    document bytes never pass through the API servers.
+    """
+    
+    def __init__(self, profile_name: str = None, region: str = None):
+        """
+        Initialize S3 storage.
+        
+        Args:
+            profile_name: AWS profile name (default: moaaa_api_services)
+            region: AWS region (default: from profile or us-east-1)
+        """
+        self.profile_name = profile_name or default_profile()
+        self.region = region or os.environ.get('AWS_REGION', 'us-east-1')
+        
+        self.session = boto3.Session(profile_name=self.profile_name)
+        
+        # SigV4 is required for presigned URLs in most regions
+        self.s3_client = self.session.client(
+            's3',
+            region_name=self.region,
+            config=Config(signature_version='s3v4')
+        )
+    
+    def presign_put(self, bucket: str, key: str, content_type: str, expires_in: int) -> str:
+        return self.s3_client.generate_presigned_url(
+            'put_object',
+            Params={'Bucket': bucket, 'Key': key, 'ContentType': content_type},
+            ExpiresIn=expires_in
+        )
+    
+    def create_multipart_upload(self, bucket: str, key: str, content_type: str) -> str:
+        response = self.s3_client.create_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            ContentType=content_type
+        )
+        return response['UploadId']
+    
+    def presign_upload_part(self, bucket: str, key: str, upload_id: str,
+                            part_number: int, expires_in: int) -> str:
+        return self.s3_client.generate_presigned_url(
+            'upload_part',
+            Params={
+                'Bucket': bucket,
+                'Key': key,
+                'UploadId': upload_id,
+                'PartNumber': part_number
+            },
+            ExpiresIn=expires_in
+        )
+    
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str,
+                                  parts: List[Dict[str, Any]]) -> str:
+        response = self.s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                'Parts': [
+                    {'PartNumber': part['part_number'], 'ETag': part['etag']}
+                    for part in sorted(parts, key=lambda part: part['part_number'])
+                ]
+            }
+        )
+        return response['ETag'].strip('"')
+    
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        self.s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+    
+    def head_object(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = self.s3_client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        return {
+            'size': response['ContentLength'],
+            'etag': response['ETag'].strip('"')
+        }
+    
+    def get_object(self, bucket: str, key: str) -> bytes:
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        return response['Body'].read()
+    
+    def open_object(self, bucket: str, key: str, if_none_match: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        params = {'Bucket': bucket, 'Key': key}
+        if if_none_match:
+            # Conditional GET: S3 answers 304 without a body when the ETag matches
+            params['IfNoneMatch'] = f'"{if_none_match}"'
+        try:
+            response = self.s3_client.get_object(**params)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+                return None
+            raise
+        return {
+            'size': response['ContentLength'],
+            'etag': response['ETag'].strip('"'),
+            'body': response['Body']
+        }
@@ -0,0 +1,3 @@
+from .document_storage import IDocumentStorage
+
+__all__ = ['IDocumentStorage']
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, List, Optional
+
+
+class IDocumentStorage(ABC):
+    """Abstract interface for document object storage (S3 or a local stand-in)."""
+
+    @abstractmethod
+    def presign_put(self, bucket: str, key: str, content_type: str, expires_in: int) -> str:
+        """Return a URL the client can PUT the whole object to."""
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, bucket: str, key: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload ID."""
+        pass
+
+    @abstractmethod
+    def presign_upload_part(self, bucket: str, key: str, upload_id: str,
+                            part_number: int, expires_in: int) -> str:
+        """Return a URL the client can PUT a single part to."""
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(self, bucket: str, key: str, upload_id: str,
+                                  parts: List[Dict[str, Any]]) -> str:
+        """Assemble uploaded parts ({'part_number', 'etag'}) and return the object ETag."""
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        """Discard a multipart upload and its parts."""
+        pass
+
+    @abstractmethod
+    def head_object(self, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return {'size', 'etag'} for an object, or None if it does not exist."""
+        pass
+
+    @abstractmethod
+    def get_object(self, bucket: str, key: str) -> bytes:
+        """Download an object."""
+        pass
+
+    @abstractmethod
+    def open_object(self, bucket: str, key: str, if_none_match: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Start downloading an object unless its ETag is `if_none_match`.
+
+        Returns:
+            None if the object is unchanged, else {'size', 'etag', 'body'}
+            where body is a binary stream the caller reads and closes
+        """
+        pass
@@ -0,0 +1,209 @@
+import logging
+from typing import List, Optional, Tuple
+from urllib.parse import unquote_plus
+
+from django.db import close_old_connections, transaction
+
+from pipeline.bus import get_event_bus
+from pipeline.events import DOCUMENT_CLASSIFIED, DOCUMENT_UPLOADED, document_classified
+from pipeline.outbox import record_event
+from .ai_ml import BedrockClassifier, ClassificationInput
+from .models import ClassificationJob, ClassificationResult, DocumentUpload
+from .storage import get_document_fetcher, get_document_storage
+
+logger = logging.getLogger(__name__)
+
+_classifier = None
+
+
+def get_classifier() -> BedrockClassifier:
+    """Classifier shared across requests, workers and warm Lambda invocations (boto3 clients are thread-safe)."""
+    global _classifier
+    if _classifier is None:
+        _classifier = BedrockClassifier(fetcher=get_document_fetcher())
+    return _classifier
+
+
+def finalize_upload(upload: DocumentUpload, parts=None) -> str:
+    """
+    Finalize an upload's object in storage: assemble its parts (multipart)
+    or check the object is there with the declared size (single PUT).
+
+    Returns:
+        The object's ETag
+
+    Raises:
+        ValueError: If the object or its parts are missing or inconsistent
+    """
+    storage = get_document_storage()
+
+    if upload.is_multipart:
+        if len(parts or []) != upload.part_count:
+            raise ValueError(f"Expected {upload.part_count} parts, got {len(parts or [])}")
+        return storage.complete_multipart_upload(
+            upload.s3_bucket, upload.s3_key, upload.multipart_upload_id, parts
+        )
+
+    head = storage.head_object(upload.s3_bucket, upload.s3_key)
+    if head is None:
+        raise ValueError("Object has not been uploaded yet")
+    if head['size'] != upload.size_bytes:
+        raise ValueError(f"Expected {upload.size_bytes} bytes, found {head['size']}")
+    return head['etag']
+
+
+def s3_created_objects(event: dict) -> Tuple[List[Tuple[str, str]], int]:
+    """
+    Objects in an S3 event notification.
+
+    Returns:
+        ((bucket, key) of every ObjectCreated record, number of other records)
+    """
+    created = []
+    skipped = 0
+    for record in event.get('Records', []):
+        if not record.get('eventName', '').startswith('ObjectCreated:'):
+            skipped += 1
+            continue
+        s3 = record.get('s3', {})
+        # Keys arrive URL-encoded, spaces as '+'
+        created.append((s3.get('bucket', {}).get('name'), unquote_plus(s3.get('object', {}).get('key', ''))))
+    return created, skipped
+
+
+def pending_single_put_upload(bucket: str, key: str) -> Optional[DocumentUpload]:
+    """
+    The pending single-PUT upload of an object, if any. Multipart uploads
+    are completed through the API, so their notifications match nothing.
+    """
+    return DocumentUpload.objects.filter(
+        s3_bucket=bucket,
+        s3_key=key,
+        status=DocumentUpload.Status.PENDING,
+        multipart_upload_id=''
+    ).first()
+
+
+def create_classification_job(upload: DocumentUpload) -> ClassificationJob:
+    """Create the pending classification job of a completed upload."""
+    job = ClassificationJob.objects.create(
+        name=f"Upload classification: {upload.filename}",
+        total_documents=1,
+        created_by=upload.created_by
+    )
+    upload.classification_job = job
+    upload.save(update_fields=['classification_job', 'updated_at'])
+    return job
+
+
+def enqueue_classification(upload: DocumentUpload) -> ClassificationJob:
+    """
+    Create a classification job for a completed upload and publish its
+    document-uploaded event; the pipeline's classify stage runs the job.
+
+    The event is delivered after the surrounding transaction commits, so
+    the stage always sees the upload and job rows.
+
+    Args:
+        upload: Completed document upload
+
+    Returns:
+        The pending ClassificationJob
+    """
+    job = create_classification_job(upload)
+    get_event_bus().publish(DOCUMENT_UPLOADED, {
+        'upload_id': str(upload.id),
+        'application_id': upload.application_id,
+    })
+    return job
+
+
+def complete_upload(upload: DocumentUpload, parts=None, enqueue: bool = True) -> Optional[ClassificationJob]:
+    """
+    Finalize an upload in storage, mark it completed and queue classification.
+
+    Safe to call concurrently for the same upload (a complete call racing
+    an S3 notification, or a notification delivered twice): only the call
+    that moves the upload out of PENDING creates and queues a job.
+
+    Args:
+        upload: Pending document upload
+        parts: Uploaded parts of a multipart upload
+        enqueue: False to only create the job, for callers that run it
+            themselves (run_upload_classification)
+
+    Returns:
+        The pending ClassificationJob, or None if another call completed
+        or ended the upload first
+
+    Raises:
+        ValueError: If the upload has expired, or the object or its parts
+            are missing or inconsistent
+    """
+    if upload.is_expired:
+        upload.fail("Upload expired")
+        raise ValueError("Upload expired")
+
+    etag = finalize_upload(upload, parts)
+
+    with transaction.atomic():
+        if not upload.complete(etag=etag):
+            return None
+        if not enqueue:
+            return create_classification_job(upload)
+        return enqueue_classification(upload)
+
+
+def run_upload_classification(upload_id) -> Optional[ClassificationResult]:
+    """
+    Classify an uploaded document and record the result on its job.
+
+    Only a PENDING job is run, so a redelivered document.uploaded does not
+    classify the upload again.
+
+    Returns:
+        The saved result, or None if classification failed or the job was
+        already started
+    """
+    close_old_connections()
+    try:
+        upload = DocumentUpload.objects.select_related('classification_job').get(id=upload_id)
+        job = upload.classification_job
+        if not job.claim():
+            logger.info("Classification job %s for upload %s already started", job.id, upload_id)
+            return None
+
+        try:
+            output = get_classifier().classify(ClassificationInput(
+                s3_bucket=upload.s3_bucket,
+                s3_key=upload.s3_key,
+                filename=upload.filename,
+                application_id=upload.application_id
+            ))
+
+            with transaction.atomic():
+                result = ClassificationResult.objects.create_with_raw_response(
+                    job=job,
+                    application_ref=upload.application_id,
+                    document_s3_bucket=upload.s3_bucket,
+                    document_s3_key=upload.s3_key,
+                    document_filename=upload.filename,
+                    document_type=output.document_type,
+                    confidence_score=output.confidence_score,
+                    requires_review=output.requires_review,
+                    raw_response=output.raw_response,
+                    created_by=upload.created_by
+                )
+                record_event(DOCUMENT_CLASSIFIED, document_classified(result))
+
+            job.processed_documents = 1
+            job.complete()
+            return result
+
+        except Exception as e:
+            logger.exception("Classification failed for upload %s", upload_id)
+            job.failed_documents = 1
+            job.fail(str(e))
+            return None
+    finally:
+        close_old_connections()
@@ -0,0 +1,43 @@
+import uuid
+
+from django.contrib.admin.sites import site
+from django.test import RequestFactory, TestCase
+
+from document_classification.models import ClassificationJob, ClassificationResult
+
+
+class ClassificationResultSearchTests(TestCase):
+    def setUp(self):
+        self.model_admin = site._registry[ClassificationResult]
+        self.request = RequestFactory().get('/admin/document_classification/classificationresult/')
+        job = ClassificationJob.objects.create()
+        self.results = [
+            ClassificationResult.objects.create(
+                job=job, application_ref=reference, document_s3_bucket='bucket',
+                document_s3_key=f'uploads/{reference}/{filename}', document_filename=filename
+            )
+            for reference, filename in [('APP-1001', 'license.pdf'), ('APP-2002', 'APP statement.pdf')]
+        ]
+
+    def search(self, term):
+        queryset, may_have_duplicates = self.model_admin.get_search_results(
+            self.request, ClassificationResult.objects.all(), term
+        )
+        self.assertFalse(may_have_duplicates)
+        return queryset
+
+    def test_prefix_matches_reference_or_filename(self):
+        self.assertEqual(set(self.search('APP-10')), {self.results[0]})
+        self.assertEqual(set(self.search('APP statement')), {self.results[1]})
+        self.assertEqual(set(self.search('APP')), set(self.results))
+
+        sql = str(self.search('APP-10').query).upper()
+        self.assertIn('LIKE', sql)
+        self.assertNotIn('UPPER(', sql)
+
+    def test_full_uuid_matches_the_primary_key(self):
+        self.assertEqual(list(self.search(f' {self.results[1].pk} ')), [self.results[1]])
+        self.assertFalse(self.search(str(uuid.uuid4())).exists())
+
+    def test_blank_term_returns_everything(self):
+        self.assertEqual(self.search('  ').count(), 2)
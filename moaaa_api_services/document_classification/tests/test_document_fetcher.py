@@ -0,0 +1,85 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from django.test import SimpleTestCase, override_settings
+
+from document_classification import storage
+from document_classification.storage import DocumentFetcher, LocalDocumentStorage, get_document_fetcher
+
+BUCKET = 'documents'
+
+
+class DocumentFetcherTests(SimpleTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.storage = LocalDocumentStorage(str(self.root / 'storage'))
+        self.cache_dir = str(self.root / 'cache')
+
+    def put(self, key: str, content: bytes) -> None:
+        url = self.storage.presign_put(BUCKET, key, 'application/pdf', 60)
+        Path(url2pathname(urlparse(url).path)).write_bytes(content)
+
+    def fetcher(self, max_bytes: int = 1024) -> DocumentFetcher:
+        fetcher = DocumentFetcher(self.storage, self.cache_dir, max_bytes=max_bytes)
+        self.addCleanup(fetcher.close)
+        return fetcher
+
+    def cached_bytes(self) -> int:
+        return sum(path.stat().st_size for path in Path(self.cache_dir).glob('*/*.bin'))
+
+    def test_fetchers_sharing_a_directory_each_keep_their_bound(self):
+        for key in ('a.pdf', 'b.pdf', 'c.pdf'):
+            self.put(key, b'x' * 20)
+        first, second = self.fetcher(max_bytes=30), self.fetcher(max_bytes=30)
+        self.assertNotEqual(first.cache_dir, second.cache_dir)
+
+        for fetcher in (first, second):
+            for key in ('a.pdf', 'b.pdf', 'c.pdf'):
+                self.assertEqual(fetcher.fetch(BUCKET, key), b'x' * 20)
+            self.assertEqual(fetcher.stats()['bytes'], 20)
+            self.assertEqual(fetcher.stats()['evictions'], 2)
+        self.assertEqual(self.cached_bytes(), 2 * 20)
+
+    def test_released_slot_is_taken_over_with_its_objects(self):
+        self.put('a.pdf', b'content')
+        first = self.fetcher()
+        first.fetch(BUCKET, 'a.pdf')
+        first.close()
+
+        second = self.fetcher()
+        self.assertEqual(second.cache_dir, first.cache_dir)
+        self.assertEqual(second.fetch(BUCKET, 'a.pdf'), b'content')
+        self.assertEqual(second.stats()['hits'], 1)
+        self.assertEqual(second.stats()['downloads'], 0)
+
+    def test_concurrent_first_calls_share_one_fetcher(self):
+        created = []
+
+        def slow_fetcher(*args, **kwargs):
+            time.sleep(0.05)
+            fetcher = DocumentFetcher(*args, **kwargs)
+            self.addCleanup(fetcher.close)
+            created.append(fetcher)
+            return fetcher
+
+        results = []
+        with override_settings(DOCUMENT_CACHE_DIR=self.cache_dir), \
+                mock.patch.object(storage, '_storage', self.storage), \
+                mock.patch.object(storage, '_fetcher', None), \
+                mock.patch.object(storage, 'DocumentFetcher', side_effect=slow_fetcher):
+            threads = [threading.Thread(target=lambda: results.append(get_document_fetcher())) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result is created[0] for result in results))
@@ -0,0 +1,32 @@
+import csv
+import io
+
+from django.test import TestCase
+
+from application_profile.models import Application
+from document_classification.models import ClassificationJob, ClassificationResult
+from merchant_profile.models import Merchant
+
+
+class ResultExportTests(TestCase):
+    def setUp(self):
+        self.application = Application.objects.create(
+            merchant=Merchant.objects.create(legal_name='Acme Corp'), reference='APP-1001'
+        )
+        self.result = ClassificationResult.objects.create(
+            job=ClassificationJob.objects.create(),
+            application_ref='APP-1001',
+            document_s3_bucket='bucket',
+            document_s3_key='uploads/APP-1001/license.pdf',
+            document_filename='license.pdf'
+        )
+
+    def test_csv_names_columns_like_the_results_api(self):
+        response = self.client.get('/api/classification/results/export/')
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+
+        api_row = self.client.get(f'/api/classification/results/{self.result.pk}/').json()
+        self.assertEqual(rows[0]['application_id'], api_row['application_id'])
+        self.assertEqual(rows[0]['application_id'], 'APP-1001')
+        self.assertEqual(rows[0]['application_pk'], str(self.application.pk))
@@ -0,0 +1,133 @@
+import importlib
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from django.test import TestCase
+from django.utils import timezone
+
+from document_classification.ai_ml import ClassificationOutput
+from document_classification.models import ClassificationJob, ClassificationResult, DocumentUpload
+from document_classification.storage import LocalDocumentStorage
+from document_classification.tasks import complete_upload
+
+EVENT_PATH = Path(__file__).resolve().parent.parent / 'lambda_events' / 's3_object_created.json'
+CONTENT = b'%PDF-1.4 business license'
+
+
+class StubClassifier:
+    """Stands in for BedrockClassifier; records what it was asked to classify."""
+
+    bedrock_client = None
+    s3_client = None
+
+    def __init__(self):
+        self.inputs = []
+
+    def classify(self, input_data):
+        self.inputs.append(input_data)
+        return ClassificationOutput(
+            document_type='BUSINESS_LICENSE',
+            confidence_score=0.97,
+            requires_review=False,
+            raw_response={}
+        )
+
+
+class LambdaHandlerTests(TestCase):
+    """Replaying the sample S3 event against LocalDocumentStorage."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.storage = LocalDocumentStorage(temp_dir.name)
+        self.classifier = StubClassifier()
+        for target, value in [
+            ('document_classification.storage._storage', self.storage),
+            ('document_classification.tasks._classifier', self.classifier),
+        ]:
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Imported here so its init-phase warm-up gets the stub
+        self.lambda_handler = importlib.import_module('document_classification.lambda_handler')
+
+        self.event = json.loads(EVENT_PATH.read_text())
+        record = self.event['Records'][0]['s3']
+        self.bucket = record['bucket']['name']
+        # The event's key is URL-encoded
+        self.key = 'uploads/APP-1001/5f0c6a52-8d1e-4b7a-9a51-2f4c1d7e9b30/business license.pdf'
+
+    def register_upload(self, content=CONTENT, put=True) -> DocumentUpload:
+        if put:
+            url = self.storage.presign_put(self.bucket, self.key, 'application/pdf', 60)
+            Path(url2pathname(urlparse(url).path)).write_bytes(content)
+        return DocumentUpload.objects.create(
+            application_id='APP-1001',
+            s3_bucket=self.bucket,
+            s3_key=self.key,
+            filename='business license.pdf',
+            content_type='application/pdf',
+            size_bytes=len(CONTENT),
+            expires_at=timezone.now() + timedelta(minutes=15)
+        )
+
+    def test_classifies_the_uploaded_document(self):
+        upload = self.register_upload()
+
+        response = self.lambda_handler.handler(self.event)
+
+        self.assertEqual(response['failed'], [])
+        self.assertEqual(response['skipped'], 0)
+        classified, = response['classified']
+        self.assertEqual(classified['upload_id'], str(upload.id))
+        self.assertEqual(classified['document_type'], 'BUSINESS_LICENSE')
+
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, DocumentUpload.Status.COMPLETED)
+        self.assertEqual(upload.classification_job.status, ClassificationJob.Status.COMPLETED)
+        result = ClassificationResult.objects.get(pk=classified['result_id'])
+        self.assertEqual(result.document_filename, 'business license.pdf')
+        self.assertEqual([input_data.s3_key for input_data in self.classifier.inputs], [self.key])
+
+    def test_repeated_notification_is_skipped(self):
+        self.register_upload()
+        self.lambda_handler.handler(self.event)
+
+        response = self.lambda_handler.handler(self.event)
+
+        self.assertEqual(response['classified'], [])
+        self.assertEqual(response['skipped'], 1)
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+        self.assertEqual(len(self.classifier.inputs), 1)
+
+    def test_upload_completed_by_a_concurrent_call_is_skipped(self):
+        upload = self.register_upload()
+        # Looked up as pending, then completed elsewhere before this invocation claims it
+        stale = DocumentUpload.objects.get(pk=upload.pk)
+        self.assertIsNotNone(complete_upload(upload, enqueue=False))
+
+        with mock.patch.object(self.lambda_handler, 'pending_single_put_upload', return_value=stale):
+            response = self.lambda_handler.handler(self.event)
+
+        self.assertEqual(response['classified'], [])
+        self.assertEqual(response['skipped'], 1)
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+        self.assertEqual(self.classifier.inputs, [])
+
+    def test_missing_object_fails_the_upload(self):
+        upload = self.register_upload(put=False)
+
+        response = self.lambda_handler.handler(self.event)
+
+        self.assertEqual(response['failed'], [
+            {'upload_id': str(upload.id), 'error': 'Object has not been uploaded yet'}
+        ])
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, DocumentUpload.Status.FAILED)
+        self.assertFalse(ClassificationJob.objects.exists())
@@ -0,0 +1,129 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from document_classification.models import ClassificationJob, DocumentUpload
+from document_classification.storage import LocalDocumentStorage
+from document_classification.tasks import complete_upload
+
+CONTENT = b'%PDF-1.4 test document'
+
+
+class DocumentUploadTests(TestCase):
+    """Completing uploads against LocalDocumentStorage."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.storage = LocalDocumentStorage(temp_dir.name)
+        patcher = mock.patch('document_classification.storage._storage', self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = APIClient()
+
+    def start_upload(self, content=CONTENT) -> DocumentUpload:
+        response = self.client.post('/api/classification/uploads/', {
+            'application_id': 'APP-1001',
+            'filename': 'license.pdf',
+            'content_type': 'application/pdf',
+            'size_bytes': len(content),
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return DocumentUpload.objects.get(id=response.data['upload_id'])
+
+    def put_object(self, upload: DocumentUpload, content=CONTENT) -> None:
+        url = self.storage.presign_put(upload.s3_bucket, upload.s3_key, upload.content_type, 60)
+        Path(url2pathname(urlparse(url).path)).write_bytes(content)
+
+    def s3_event(self, upload: DocumentUpload) -> dict:
+        return {'Records': [{
+            'eventName': 'ObjectCreated:Put',
+            's3': {'bucket': {'name': upload.s3_bucket}, 'object': {'key': upload.s3_key}},
+        }]}
+
+    def test_complete_queues_one_classification_job(self):
+        upload = self.start_upload()
+        self.put_object(upload)
+
+        response = self.client.post(f'/api/classification/uploads/{upload.id}/complete/', {}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], DocumentUpload.Status.COMPLETED)
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+
+        response = self.client.post(f'/api/classification/uploads/{upload.id}/complete/', {}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+
+    def test_complete_before_put_leaves_upload_pending(self):
+        upload = self.start_upload()
+
+        response = self.client.post(f'/api/classification/uploads/{upload.id}/complete/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, DocumentUpload.Status.PENDING)
+
+    def test_concurrent_completions_create_one_job(self):
+        upload = self.start_upload()
+        self.put_object(upload)
+        # Both callers loaded the upload while it was still pending
+        first = DocumentUpload.objects.get(id=upload.id)
+        second = DocumentUpload.objects.get(id=upload.id)
+
+        self.assertIsNotNone(complete_upload(first))
+        self.assertIsNone(complete_upload(second))
+        self.assertEqual(second.status, DocumentUpload.Status.COMPLETED)
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+
+    def test_complete_racing_s3_notification_creates_one_job(self):
+        upload = self.start_upload()
+        self.put_object(upload)
+        stale = DocumentUpload.objects.get(id=upload.id)
+
+        response = self.client.post('/api/classification/uploads/s3_events/', self.s3_event(upload), format='json')
+        self.assertEqual(response.data, {'completed': [str(upload.id)], 'skipped': 0})
+
+        self.assertIsNone(complete_upload(stale))
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+
+    def test_repeated_s3_notification_is_skipped(self):
+        upload = self.start_upload()
+        self.put_object(upload)
+        event = self.s3_event(upload)
+
+        first = self.client.post('/api/classification/uploads/s3_events/', event, format='json')
+        second = self.client.post('/api/classification/uploads/s3_events/', event, format='json')
+
+        self.assertEqual(first.data['completed'], [str(upload.id)])
+        self.assertEqual(second.data, {'completed': [], 'skipped': 1})
+        self.assertEqual(ClassificationJob.objects.count(), 1)
+
+    def test_expired_upload_is_rejected(self):
+        upload = self.start_upload()
+        self.put_object(upload)
+        DocumentUpload.objects.filter(id=upload.id).update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = self.client.post(f'/api/classification/uploads/{upload.id}/complete/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['error'], 'Upload expired')
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, DocumentUpload.Status.FAILED)
+        self.assertFalse(ClassificationJob.objects.exists())
+
+        response = self.client.post('/api/classification/uploads/s3_events/', self.s3_event(upload), format='json')
+        self.assertEqual(response.data, {'completed': [], 'skipped': 1})
+
+    def test_abort_after_completion_conflicts(self):
+        upload = self.start_upload()
+        self.put_object(upload)
+        stale = DocumentUpload.objects.get(id=upload.id)
+        complete_upload(upload)
+
+        self.assertFalse(stale.abort())
+        self.assertEqual(stale.status, DocumentUpload.Status.COMPLETED)
@@ -1,3 +1,38 @@
 from django.contrib import admin
+from .models import ExtractionJob, ExtractionResult, ExtractionRawResponse
 
-# Register your models here.
+
+@admin.register(ExtractionJob)
+class ExtractionJobAdmin(admin.ModelAdmin):
+    list_display = [
+        'id', 'name', 'status', 'total_documents',
+        'processed_documents', 'failed_documents', 'created_at'
+    ]
+    list_filter = ['status', 'created_at']
+    search_fields = ['name']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'started_at', 'completed_at']
+
+
+class ExtractionRawResponseInline(admin.StackedInline):
+    """Raw Bedrock response, shown on the change page only."""
+    model = ExtractionRawResponse
+    fields = ['payload', 'created_at']
+    readonly_fields = ['payload', 'created_at']
+    can_delete = False
+    classes = ['collapse']
+    
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ExtractionResult)
+class ExtractionResultAdmin(admin.ModelAdmin):
+    list_display = [
+        'id', 'job', 'application_id', 'document_type',
+        'is_valid', 'requires_review', 'is_active', 'created_at'
+    ]
+    list_filter = ['document_type', 'is_valid', 'requires_review', 'is_active', 'created_at']
+    list_select_related = ['job']
+    search_fields = ['^application_id']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+    inlines = [ExtractionRawResponseInline]
@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+from .interfaces import IDocument_extraction
+
+if TYPE_CHECKING:
+    from .implementations import Document_extractionImpl, FusedClassifyExtractPipeline
+
+# Implementations (and boto3, numpy) load on first use
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Document_extractionImpl': '.implementations',
+    'FusedClassifyExtractPipeline': '.implementations',
+})
+
+__all__ = [
+    'IDocument_extraction',
+    'Document_extractionImpl',
+    'FusedClassifyExtractPipeline'
+]
@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .extractor_impl import Document_extractionImpl
+    from .fused_pipeline import FusedClassifyExtractPipeline
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Document_extractionImpl': '.extractor_impl',
+    'FusedClassifyExtractPipeline': '.fused_pipeline',
+})
+
+__all__ = ['Document_extractionImpl', 'FusedClassifyExtractPipeline']
@@ -1,26 +1,361 @@
-from typing import List, Dict, Any
-import boto3
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, Dict, Any, Optional
+
+from moaaa_api_services.aws import default_profile
+from document_classification.ai_ml.text_layer import (
+    PATH_LOCAL_REGEX,
+    PATH_TEXT_MODEL,
+    PATH_VISION,
+    document_content_block,
+    extract_text_layer,
+    media_type_for,
+    path_latency,
+)
 from ..interfaces.extractor import IDocument_extraction
+from ..local_extraction import extract_fields_from_text
+from ..schemas import FIELD_DESCRIPTIONS, fields_for, normalize_fields
+from ..validation import validate_records
+
+
+def extraction_output(document_type: str, fields: Dict[str, Any], errors: Dict[str, str],
+                      raw_response: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an extraction output dict (see Document_extractionImpl)."""
+    return {
+        'document_type': document_type,
+        'fields': fields,
+        'field_errors': errors,
+        'is_valid': not errors,
+        'requires_review': bool(errors),
+        'raw_response': raw_response,
+    }
 
 
 class Document_extractionImpl(IDocument_extraction):
-    """Concrete implementation using Amazon Bedrock."""
+    """
+    Field extraction engine using Amazon Bedrock with Claude.
+
+    Extracts every field for a document's type in a single model call and
+    validates the structured output. Batches fan out across a thread pool.
+
+    Digital PDFs are read from their text layer: label-anchored fields are
+    matched locally, and the model is only called (with text, not images)
+    for fields that could not be matched. Scans and images use vision.
+
+    Routing numbers, account numbers and EINs are then validated across the
+    whole batch at once (see validation.py); only the fields that fail are
+    re-extracted, by the model, for only the documents they came from.
+
+    Input:
+        {
+            "s3_bucket": "my-bucket",
+            "s3_key": "documents/statement.pdf",
+            "filename": "statement.pdf",
+            "document_type": "BANK_STATEMENT",
+            "fields": ["routing_number"],   # optional subset
+            "skip_local_extraction": false  # optional, always ask the model
+        }
+
+    Output:
+        {
+            "document_type": "BANK_STATEMENT",
+            "fields": {"routing_number": "021000021", ...},
+            "field_errors": {"closing_balance": "missing"},
+            "is_valid": false,
+            "requires_review": true,
+            "raw_response": {...}
+        }
+    """
+
+    # Default number of documents extracted concurrently
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, profile_name: str = None, region: str = None,
+                 max_workers: int = None, storage=None, fetcher=None):
+        """
+        Initialize the extraction engine.
+
+        Args:
+            profile_name: AWS profile name (default: moaaa_api_services)
+            region: AWS region (default: from profile or us-east-1)
+            max_workers: Concurrent documents in process_batch
+            storage: Optional IDocumentStorage to read documents from
+                instead of S3 directly
+            fetcher: Optional DocumentFetcher to read documents through its
+                disk cache (takes precedence over storage)
+        """
+        self.profile_name = profile_name or default_profile()
+        self.region = region or os.environ.get('AWS_REGION', 'us-east-1')
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+
+        # Model ID for Claude
+        self.model_id = 'anthropic.claude-3-sonnet-20240229-v1:0'
+
+        self.storage = storage
+        self.fetcher = fetcher
 
-    def __init__(self, region: str = "us-east-1"):
-        self.bedrock_client = boto3.client(
-            "bedrock-runtime",
-            region_name=region
+    # boto3 and the clients are created on first use, not at construction
+
+    @cached_property
+    def session(self):
+        import boto3
+        return boto3.Session(profile_name=self.profile_name)
+
+    @cached_property
+    def bedrock_client(self):
+        from botocore.config import Config
+
+        # Enough pooled connections for every worker thread
+        return self.session.client(
+            'bedrock-runtime',
+            region_name=self.region,
+            config=Config(
+                retries={'max_attempts': 3, 'mode': 'adaptive'},
+                max_pool_connections=self.max_workers
+            )
+        )
+
+    @cached_property
+    def s3_client(self):
+        from botocore.config import Config
+        return self.session.client(
+            's3',
+            region_name=self.region,
+            config=Config(max_pool_connections=self.max_workers)
+        )
+
+    def fetch_document(self, bucket: str, key: str) -> bytes:
+        """
+        Download document from S3 (through the fetcher's cache when set).
+        Large cached documents come back as a read-only mmap, not bytes.
+        """
+        if self.fetcher is not None:
+            return self.fetcher.fetch(bucket, key)
+        if self.storage is not None:
+            return self.storage.get_object(bucket, key)
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        return response['Body'].read()
+
+    def _build_extraction_prompt(self, document_type: str, field_names: List[str]) -> str:
+        """Build the extraction prompt for the requested fields."""
+        field_lines = '\n'.join(
+            f'- {name}: {FIELD_DESCRIPTIONS[name]}' for name in field_names
         )
+        json_fields = ',\n        '.join(f'"{name}": <value or null>' for name in field_names)
+        return f"""You are a data extraction expert for a payment processing company.
+
+The provided document is a {document_type.replace('_', ' ').lower()}.
+Extract these fields:
+{field_lines}
+
+Respond with ONLY a JSON object in this exact format:
+{{
+    "fields": {{
+        {json_fields}
+    }},
+    "confidence": <number between 0 and 1>
+}}
+
+Important:
+- Copy values exactly as printed; do not guess
+- Use null for any field that is not present or not legible
+"""
+
+    @staticmethod
+    def _parse_model_json(text: str) -> Dict[str, Any]:
+        """Parse the JSON object from a model reply, tolerating code fences."""
+        text = text.strip()
+        if text.startswith('```'):
+            text = text.split('\n', 1)[1] if '\n' in text else ''
+            text = text.rsplit('```', 1)[0]
+        return json.loads(text)
+
+    def invoke(self, content: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Call Bedrock with a single user message and return the parsed JSON reply."""
+        response = self.bedrock_client.invoke_model(
+            modelId=self.model_id,
+            contentType='application/json',
+            accept='application/json',
+            body=json.dumps({
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": 1024,
+                "messages": [{"role": "user", "content": content}]
+            })
+        )
+        response_body = json.loads(response['body'].read())
+        return self._parse_model_json(response_body['content'][0]['text'])
+
+    def extract_from_bytes(self, document_bytes: bytes, filename: str, document_type: str,
+                           field_names: Optional[List[str]] = None,
+                           skip_local_extraction: bool = False) -> Dict[str, Any]:
+        """
+        Extract fields from document bytes that have already been fetched.
+
+        Args:
+            document_bytes: Raw document content
+            filename: Original filename (used for the media type)
+            document_type: Classified document type
+            field_names: Subset of fields to extract (default: all for the type)
+            skip_local_extraction: Ignore regex matches and ask the model for
+                every field (used when re-extracting fields that failed validation)
+
+        Returns:
+            Extraction output dict (see class docstring)
+        """
+        field_names = field_names or fields_for(document_type)
+        if not field_names:
+            return extraction_output(document_type, {}, {}, {'skipped': 'no fields defined for document type'})
+
+        started = time.perf_counter()
+        media_type = media_type_for(filename)
+        text_layer = extract_text_layer(document_bytes, media_type)
+
+        # Local regex pass over the text layer
+        local_fields = {}
+        if text_layer is not None and not skip_local_extraction:
+            local_raw = extract_fields_from_text(text_layer.text, field_names)
+            if local_raw:
+                matched, _ = normalize_fields(document_type, local_raw, only=list(local_raw))
+                local_fields = {name: value for name, value in matched.items() if value is not None}
+
+        remaining = [name for name in field_names if name not in local_fields]
+        if not remaining:
+            path = PATH_LOCAL_REGEX
+            result = {'fields': local_fields}
+        else:
+            path = PATH_TEXT_MODEL if text_layer is not None else PATH_VISION
+            result = self.invoke([
+                document_content_block(document_bytes, media_type, text_layer),
+                {
+                    "type": "text",
+                    "text": self._build_extraction_prompt(document_type, remaining)
+                }
+            ])
+
+        raw_fields = {**(result.get('fields') or {}), **local_fields}
+        fields, errors = normalize_fields(document_type, raw_fields, only=field_names)
+
+        elapsed = time.perf_counter() - started
+        path_latency.record('extraction', path, elapsed)
+        result = {
+            **result,
+            'pipeline_path': path,
+            'local_fields': sorted(local_fields),
+            'latency_ms': round(elapsed * 1000, 1)
+        }
+        return extraction_output(document_type, fields, errors, result)
+
+    def _extract(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract fields from a single document without the validation stage."""
+        document_type = input_data['document_type']
+        try:
+            document_bytes = self.fetch_document(input_data['s3_bucket'], input_data['s3_key'])
+            return self.extract_from_bytes(
+                document_bytes,
+                input_data['filename'],
+                document_type,
+                input_data.get('fields'),
+                input_data.get('skip_local_extraction', False)
+            )
+        except Exception as e:
+            field_names = input_data.get('fields') or fields_for(document_type)
+            return extraction_output(
+                document_type,
+                {name: None for name in field_names},
+                {name: 'extraction failed' for name in field_names},
+                {'error': str(e)}
+            )
+
+    def _extract_all(self, input_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run _extract over the inputs concurrently, preserving order."""
+        if len(input_data_list) <= 1:
+            return [self._extract(input_data) for input_data in input_data_list]
+
+        workers = min(self.max_workers, len(input_data_list))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='extraction') as executor:
+            return list(executor.map(self._extract, input_data_list))
+
+    def validate_outputs(self, input_data_list: List[Dict[str, Any]],
+                         outputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Post-extraction validation stage.
+
+        Validates every output's financial identifiers in one vectorized pass,
+        then re-extracts only the failing fields of the failing documents.
+        A re-extracted value is kept only if it passes validation; otherwise
+        the field keeps its validation error and the output requires review.
+
+        Args:
+            input_data_list: Extraction inputs (document location per output)
+            outputs: Extraction outputs in the same order
+
+        Returns:
+            Outputs with re-extracted fields merged and errors updated
+        """
+        failures = validate_records([output['fields'] for output in outputs])
+        if not failures:
+            return outputs
+
+        retry_indexes = sorted(failures)
+        retried = self._extract_all([
+            {
+                **input_data_list[i],
+                'document_type': outputs[i]['document_type'],
+                'fields': sorted(failures[i]),
+                'skip_local_extraction': True
+            }
+            for i in retry_indexes
+        ])
+        retry_failures = validate_records([retry['fields'] for retry in retried])
+
+        outputs = list(outputs)
+        for n, i in enumerate(retry_indexes):
+            output, retry = outputs[i], retried[n]
+            fields = dict(output['fields'])
+            errors = dict(output['field_errors'])
+            for name, message in failures[i].items():
+                value = retry['fields'].get(name)
+                if value is not None and name not in retry['field_errors'] and name not in retry_failures.get(n, {}):
+                    fields[name] = value
+                    errors.pop(name, None)
+                else:
+                    errors[name] = message
+
+            raw_response = {
+                **output['raw_response'],
+                'validation': {
+                    'failed': failures[i],
+                    'reextraction': retry['raw_response']
+                }
+            }
+            outputs[i] = extraction_output(output['document_type'], fields, errors, raw_response)
+        return outputs
 
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process single input using Bedrock."""
-        # TODO: Implement Bedrock API call
-        pass
+        """
+        Extract and validate fields from a single document.
+
+        Args:
+            input_data: Extraction input (see class docstring)
+
+        Returns:
+            Extraction output; on failure every field is None and the
+            error is recorded in raw_response
+        """
+        return self.validate_outputs([input_data], [self._extract(input_data)])[0]
 
     def process_batch(self, input_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process multiple inputs using Bedrock."""
-        results = []
-        for input_data in input_data_list:
-            result = self.process(input_data)
-            results.append(result)
-        return results
+        """
+        Extract fields from many documents concurrently, then validate the
+        whole batch at once.
+
+        Args:
+            input_data_list: List of extraction inputs
+
+        Returns:
+            Extraction outputs in the same order as the inputs
+        """
+        return self.validate_outputs(input_data_list, self._extract_all(input_data_list))
@@ -0,0 +1,181 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable
+
+from document_classification.ai_ml import BedrockClassifier, ClassificationOutput
+from document_classification.ai_ml.text_layer import (
+    PATH_TEXT_MODEL,
+    PATH_VISION,
+    document_content_block,
+    extract_text_layer,
+    media_type_for,
+    path_latency,
+)
+
+from ..schemas import DOCUMENT_FIELDS, FIELD_DESCRIPTIONS, normalize_fields
+from .extractor_impl import Document_extractionImpl, extraction_output
+
+
+class FusedClassifyExtractPipeline:
+    """
+    Classifies a document and extracts its type-specific fields in one
+    Bedrock invocation, reading the document from storage once.
+
+    When the fused classification is below the classifier's confidence
+    threshold (or the type is configured for two-pass), the dedicated
+    classifier and extractor are re-run on the same bytes.
+
+    Extracted identifiers go through the extractor's validation stage, so
+    only failing fields are re-extracted.
+
+    Input:
+        {"s3_bucket": "...", "s3_key": "...", "filename": "..."}
+
+    Output:
+        {
+            "mode": "fused" | "two_pass",
+            "classification": ClassificationOutput,
+            "extraction": Document_extractionImpl output dict
+        }
+    """
+
+    def __init__(self, classifier: BedrockClassifier, extractor: Document_extractionImpl,
+                 two_pass_document_types: Iterable[str] = ()):
+        """
+        Args:
+            classifier: Classifier used for the fallback pass (its confidence
+                threshold also decides when to fall back)
+            extractor: Extraction engine (its Bedrock client, storage and
+                worker count are reused)
+            two_pass_document_types: Document types that always use two passes
+        """
+        self.classifier = classifier
+        self.extractor = extractor
+        self.two_pass_document_types = set(two_pass_document_types)
+
+    def _build_fused_prompt(self) -> str:
+        """Build the combined classification + extraction prompt."""
+        type_sections = []
+        for document_type, field_names in DOCUMENT_FIELDS.items():
+            field_lines = '\n'.join(f'    - {name}: {FIELD_DESCRIPTIONS[name]}' for name in field_names)
+            type_sections.append(f'- {document_type}:\n{field_lines}')
+
+        return f"""You are a document classification and data extraction expert for a payment processing company.
+
+Step 1. Classify the provided document into ONE of these categories:
+- BUSINESS_LICENSE: Business license, operating permit, or similar government-issued business authorization
+- BANK_STATEMENT: Bank account statement showing transactions and balances
+- VOIDED_CHECK: A voided check showing routing and account numbers
+- TAX_RETURN: Tax return documents (1040, W-2, 1099, etc.)
+- DRIVERS_LICENSE: Driver's license or state ID
+- ARTICLES_OF_INCORPORATION: Articles of incorporation, certificate of formation, or similar
+- OTHER: A valid business document that doesn't fit the above categories
+- UNKNOWN: Cannot determine what this document is
+
+Step 2. Extract the fields for the category you chose (other categories have no fields):
+{chr(10).join(type_sections)}
+
+Respond with ONLY a JSON object in this exact format:
+{{
+    "document_type": "<one of the types above>",
+    "confidence": <number between 0 and 1>,
+    "reasoning": "<brief explanation of why you chose this classification>",
+    "fields": {{"<field name>": <value or null>, ...}}
+}}
+
+Important:
+- Be precise with confidence scores
+- If the document is blurry, partial, or unclear, lower your confidence
+- Copy field values exactly as printed; use null for anything missing or illegible
+"""
+
+    def _fused_call(self, document_bytes: bytes, filename: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        media_type = media_type_for(filename)
+        text_layer = extract_text_layer(document_bytes, media_type)
+        path = PATH_TEXT_MODEL if text_layer is not None else PATH_VISION
+
+        result = self.extractor.invoke([
+            document_content_block(document_bytes, media_type, text_layer),
+            {
+                "type": "text",
+                "text": self._build_fused_prompt()
+            }
+        ])
+
+        elapsed = time.perf_counter() - started
+        path_latency.record('fused', path, elapsed)
+        return {**result, 'pipeline_path': path, 'latency_ms': round(elapsed * 1000, 1)}
+
+    def _two_pass(self, document_bytes: bytes, filename: str, fused_response: Dict[str, Any]) -> Dict[str, Any]:
+        classification = self.classifier.classify_bytes(document_bytes, filename)
+        extraction = self.extractor.extract_from_bytes(document_bytes, filename, classification.document_type)
+        classification.raw_response = {**classification.raw_response, 'fused_response': fused_response}
+        return {'mode': 'two_pass', 'classification': classification, 'extraction': extraction}
+
+    def _validate(self, input_data_list: List[Dict[str, Any]],
+                  results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run the extractor's validation stage over the extraction part of each result."""
+        extractions = self.extractor.validate_outputs(
+            [
+                {**input_data, 'document_type': result['extraction']['document_type']}
+                for input_data, result in zip(input_data_list, results)
+            ],
+            [result['extraction'] for result in results]
+        )
+        for result, extraction in zip(results, extractions):
+            result['extraction'] = extraction
+        return results
+
+    def _process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Classify and extract a single document without the validation stage."""
+        try:
+            document_bytes = self.extractor.fetch_document(input_data['s3_bucket'], input_data['s3_key'])
+            filename = input_data['filename']
+
+            result = self._fused_call(document_bytes, filename)
+            classification = self.classifier.parse_classification(result)
+
+            if (classification.requires_review
+                    or classification.document_type in self.two_pass_document_types):
+                return self._two_pass(document_bytes, filename, result)
+
+            fields, errors = normalize_fields(classification.document_type, result.get('fields') or {})
+            extraction = extraction_output(classification.document_type, fields, errors, result)
+            return {'mode': 'fused', 'classification': classification, 'extraction': extraction}
+
+        except Exception as e:
+            return {
+                'mode': 'fused',
+                'classification': ClassificationOutput(
+                    document_type='UNKNOWN',
+                    confidence_score=0.0,
+                    requires_review=True,
+                    raw_response={'error': str(e)}
+                ),
+                'extraction': extraction_output('UNKNOWN', {}, {}, {'error': str(e)})
+            }
+
+    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Classify, extract and validate a single document.
+
+        Args:
+            input_data: Document location (see class docstring)
+
+        Returns:
+            Pipeline output; on failure the classification is UNKNOWN with
+            the error in raw_response and no fields are extracted
+        """
+        return self._validate([input_data], [self._process(input_data)])[0]
+
+    def process_batch(self, input_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Classify and extract many documents concurrently, preserving input order."""
+        if len(input_data_list) <= 1:
+            results = [self._process(input_data) for input_data in input_data_list]
+        else:
+            workers = min(self.extractor.max_workers, len(input_data_list))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fused') as executor:
+                results = list(executor.map(self._process, input_data_list))
+        return self._validate(input_data_list, results)
+
@@ -0,0 +1,3 @@
+from .extractor import IDocument_extraction
+
+__all__ = ['IDocument_extraction']
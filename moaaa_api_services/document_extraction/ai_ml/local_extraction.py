@@ -0,0 +1,50 @@
+import re
+from typing import Dict, List
+
+# Label-anchored patterns for fields that can be read reliably from a text
+# layer. Free-form fields (business name, address) are left to the model.
+_AMOUNT = r'(\(?-?\$?\s?[\d,]+\.\d{2}\)?)'
+
+FIELD_PATTERNS: Dict[str, List[re.Pattern]] = {
+    'routing_number': [
+        re.compile(r'(?:routing|ABA|RTN|transit)(?:\s*(?:number|no\.?|#))?\W{0,10}(\d{9})\b', re.IGNORECASE),
+        # MICR line: routing number between transit symbols
+        re.compile(r'[⑆:](\d{9})[⑆:]'),
+    ],
+    'account_number': [
+        re.compile(r'account\s*(?:number|no\.?|#)\W{0,10}(\d[\d\- ]{2,22}\d)\b', re.IGNORECASE),
+    ],
+    'ein': [
+        re.compile(
+            r'(?:EIN|employer\s+identification\s+(?:number|no\.?)|federal\s+tax\s+id)\W{0,20}(\d{2}-?\d{7})\b',
+            re.IGNORECASE
+        ),
+    ],
+    'opening_balance': [
+        re.compile(r'(?:opening|beginning|previous)\s+balance[^\d$(\-\n]{0,30}' + _AMOUNT, re.IGNORECASE),
+    ],
+    'closing_balance': [
+        re.compile(r'(?:closing|ending|new)\s+balance[^\d$(\-\n]{0,30}' + _AMOUNT, re.IGNORECASE),
+    ],
+}
+
+
+def extract_fields_from_text(text: str, field_names: List[str]) -> Dict[str, str]:
+    """
+    Extract label-anchored fields from document text with regular expressions.
+
+    Args:
+        text: Document text (e.g. from the PDF text layer)
+        field_names: Fields wanted
+
+    Returns:
+        Raw values for the fields that were found (unnormalized)
+    """
+    found = {}
+    for name in field_names:
+        for pattern in FIELD_PATTERNS.get(name, []):
+            match = pattern.search(text)
+            if match:
+                found[name] = match.group(1).strip()
+                break
+    return found
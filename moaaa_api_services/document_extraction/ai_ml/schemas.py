@@ -0,0 +1,123 @@
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
+
+# Fields extracted for each document type, all in a single model call
+DOCUMENT_FIELDS: Dict[str, List[str]] = {
+    'BANK_STATEMENT': [
+        'business_name', 'address', 'routing_number', 'account_number',
+        'opening_balance', 'closing_balance',
+    ],
+    'VOIDED_CHECK': ['business_name', 'address', 'routing_number', 'account_number'],
+    'TAX_RETURN': ['business_name', 'address', 'ein'],
+    'BUSINESS_LICENSE': ['business_name', 'address'],
+    'ARTICLES_OF_INCORPORATION': ['business_name', 'address', 'ein'],
+}
+
+# Prompt descriptions for each field
+FIELD_DESCRIPTIONS: Dict[str, str] = {
+    'business_name': 'Legal business name',
+    'address': 'Business mailing or street address, single line',
+    'ein': 'Employer Identification Number (9 digits, formatted XX-XXXXXXX)',
+    'routing_number': 'ABA bank routing number (9 digits)',
+    'account_number': 'Bank account number (digits only)',
+    'opening_balance': 'Opening/beginning balance for the statement period, as a number',
+    'closing_balance': 'Closing/ending balance for the statement period, as a number',
+}
+
+MAX_TEXT_LENGTH = 500
+
+_NON_DIGITS = re.compile(r'\D')
+_NON_AMOUNT = re.compile(r'[^\d.\-]')
+
+
+def _digits(value: Any) -> str:
+    return _NON_DIGITS.sub('', str(value))
+
+
+def _normalize_text(value: Any) -> str:
+    text = ' '.join(str(value).split())
+    if not text:
+        raise ValueError('empty value')
+    if len(text) > MAX_TEXT_LENGTH:
+        raise ValueError(f'longer than {MAX_TEXT_LENGTH} characters')
+    return text
+
+
+def _normalize_ein(value: Any) -> str:
+    digits = _digits(value)
+    if len(digits) != 9:
+        raise ValueError('EIN must have 9 digits')
+    return f'{digits[:2]}-{digits[2:]}'
+
+
+def _normalize_routing_number(value: Any) -> str:
+    digits = _digits(value)
+    if len(digits) != 9:
+        raise ValueError('routing number must have 9 digits')
+    return digits
+
+
+def _normalize_account_number(value: Any) -> str:
+    digits = _digits(value)
+    if not 4 <= len(digits) <= 17:
+        raise ValueError('account number must have 4-17 digits')
+    return digits
+
+
+def _normalize_amount(value: Any) -> str:
+    text = str(value).strip()
+    negative = text.startswith('(') and text.endswith(')')
+    try:
+        amount = Decimal(_NON_AMOUNT.sub('', text))
+    except InvalidOperation:
+        raise ValueError('not a number')
+    if negative:
+        amount = -abs(amount)
+    return str(amount.quantize(Decimal('0.01')))
+
+
+_NORMALIZERS = {
+    'business_name': _normalize_text,
+    'address': _normalize_text,
+    'ein': _normalize_ein,
+    'routing_number': _normalize_routing_number,
+    'account_number': _normalize_account_number,
+    'opening_balance': _normalize_amount,
+    'closing_balance': _normalize_amount,
+}
+
+
+def fields_for(document_type: str) -> List[str]:
+    """Fields to extract for a document type (empty if none are defined)."""
+    return DOCUMENT_FIELDS.get(document_type, [])
+
+
+def normalize_fields(document_type: str, raw_fields: Dict[str, Any],
+                     only: Optional[List[str]] = None) -> Tuple[Dict[str, Optional[str]], Dict[str, str]]:
+    """
+    Validate and normalize model output against the schema for a document type.
+
+    Args:
+        document_type: Classified document type
+        raw_fields: Field values as returned by the model
+        only: Restrict to these fields (defaults to every field for the type)
+
+    Returns:
+        (fields, errors) - normalized values (None when missing or invalid)
+        and an error message per invalid or missing field
+    """
+    fields = {}
+    errors = {}
+    for name in only or fields_for(document_type):
+        value = raw_fields.get(name)
+        if value is None or value == '':
+            fields[name] = None
+            errors[name] = 'missing'
+            continue
+        try:
+            fields[name] = _NORMALIZERS[name](value)
+        except ValueError as e:
+            fields[name] = None
+            errors[name] = str(e)
+    return fields, errors
@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# ABA routing checksum: 3*(d1+d4+d7) + 7*(d2+d5+d8) + (d3+d6+d9) must be a multiple of 10
+ABA_WEIGHTS = np.array([3, 7, 1, 3, 7, 1, 3, 7, 1], dtype=np.int32)
+
+# Valid first two digits of a routing number (Federal Reserve districts,
+# thrift institutions and electronic/traveler's check ranges)
+_ROUTING_PREFIX_TABLE = np.zeros(100, dtype=bool)
+_ROUTING_PREFIX_TABLE[0:13] = True
+_ROUTING_PREFIX_TABLE[21:33] = True
+_ROUTING_PREFIX_TABLE[61:73] = True
+_ROUTING_PREFIX_TABLE[80] = True
+
+# EIN prefixes never assigned by the IRS
+INVALID_EIN_PREFIXES = [0, 7, 8, 9, 17, 18, 19, 28, 29, 49, 69, 70, 78, 79, 89, 96, 97]
+_EIN_PREFIX_TABLE = np.ones(100, dtype=bool)
+_EIN_PREFIX_TABLE[INVALID_EIN_PREFIXES] = False
+
+ACCOUNT_NUMBER_MIN_LENGTH = 4
+ACCOUNT_NUMBER_MAX_LENGTH = 17
+
+
+def _fixed_width_digits(values: Sequence[str], width: int):
+    """
+    Convert strings to an (n, width) digit matrix.
+
+    Returns:
+        (digits, well_formed) - rows that are not exactly `width` ASCII
+        digits are zero-filled and marked False in `well_formed`
+    """
+    well_formed = np.fromiter(
+        (len(value) == width and value.isascii() and value.isdigit() for value in values),
+        dtype=bool,
+        count=len(values)
+    )
+    padded = ''.join(value if ok else '0' * width for value, ok in zip(values, well_formed))
+    digits = np.frombuffer(padded.encode('ascii'), dtype=np.uint8).reshape(len(values), width) - ord('0')
+    return digits.astype(np.int32), well_formed
+
+
+def validate_routing_numbers(values: Sequence[str]) -> np.ndarray:
+    """Boolean mask of routing numbers that pass the prefix table and ABA checksum."""
+    if not values:
+        return np.zeros(0, dtype=bool)
+    digits, well_formed = _fixed_width_digits(values, 9)
+    checksum_ok = (digits @ ABA_WEIGHTS) % 10 == 0
+    prefix_ok = _ROUTING_PREFIX_TABLE[digits[:, 0] * 10 + digits[:, 1]]
+    return well_formed & checksum_ok & prefix_ok
+
+
+def validate_eins(values: Sequence[str]) -> np.ndarray:
+    """Boolean mask of EINs (XX-XXXXXXX or 9 digits) with an assigned IRS prefix."""
+    if not values:
+        return np.zeros(0, dtype=bool)
+    digits, well_formed = _fixed_width_digits([value.replace('-', '', 1) for value in values], 9)
+    prefix_ok = _EIN_PREFIX_TABLE[digits[:, 0] * 10 + digits[:, 1]]
+    return well_formed & prefix_ok
+
+
+def validate_account_numbers(values: Sequence[str]) -> np.ndarray:
+    """Boolean mask of account numbers that are 4-17 digits and not all zeros."""
+    if not values:
+        return np.zeros(0, dtype=bool)
+    array = np.array(values, dtype=str)
+    lengths = np.char.str_len(array)
+    return (
+        np.char.isdigit(array)
+        & (lengths >= ACCOUNT_NUMBER_MIN_LENGTH)
+        & (lengths <= ACCOUNT_NUMBER_MAX_LENGTH)
+        & (np.char.strip(array, '0') != '')
+    )
+
+
+# Field name -> (vectorized validator, error message)
+FIELD_VALIDATORS = {
+    'routing_number': (validate_routing_numbers, 'failed ABA routing checksum'),
+    'ein': (validate_eins, 'EIN prefix is not assigned by the IRS'),
+    'account_number': (validate_account_numbers, 'invalid account number format'),
+}
+
+
+def validate_records(records: List[Dict[str, Optional[str]]]) -> Dict[int, Dict[str, str]]:
+    """
+    Validate financial identifiers across many extracted records at once.
+
+    Each validated field is checked in a single vectorized pass over every
+    record that has a value for it.
+
+    Args:
+        records: Extracted field dicts (normalized values, None if missing)
+
+    Returns:
+        {record index: {field name: error}} for failing records only
+    """
+    failures: Dict[int, Dict[str, str]] = {}
+    for name, (validator, message) in FIELD_VALIDATORS.items():
+        indexes = [i for i, record in enumerate(records) if record.get(name) is not None]
+        if not indexes:
+            continue
+        valid = validator([records[i][name] for i in indexes])
+        for i in np.asarray(indexes)[~valid]:
+            failures.setdefault(int(i), {})[name] = message
+    return failures
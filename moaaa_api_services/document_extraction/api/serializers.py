@@ -1,4 +1,116 @@
 from rest_framework import serializers
+from document_classification.models import ClassificationResult
+from ..models import ExtractionJob, ExtractionResult
 
 
-# TODO: Add serializers for document_extraction models
+class ExtractionResultSerializer(serializers.ModelSerializer):
+    """Serializer for ExtractionResult."""
+    
+    class Meta:
+        model = ExtractionResult
+        fields = [
+            'id',
+            'job',
+            'classification_result',
+            'application_id',
+            'document_s3_bucket',
+            'document_s3_key',
+            'document_filename',
+            'document_type',
+            'extracted_fields',
+            'field_errors',
+            'is_valid',
+            'is_active',
+            'requires_review',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
+
+
+class ExtractionJobSerializer(serializers.ModelSerializer):
+    """Serializer for ExtractionJob."""
+    
+    class Meta:
+        model = ExtractionJob
+        fields = [
+            'id',
+            'name',
+            'description',
+            'status',
+            'total_documents',
+            'processed_documents',
+            'failed_documents',
+            'error_message',
+            'created_at',
+            'updated_at',
+            'started_at',
+            'completed_at',
+        ]
+        read_only_fields = fields
+
+
+class ExtractDocumentRequestSerializer(serializers.Serializer):
+    """
+    Request serializer for extracting fields from a single document.
+    
+    Either reference a classification result (document location and type are
+    taken from it) or give the document location and type directly.
+    """
+    
+    classification_result = serializers.PrimaryKeyRelatedField(
+        queryset=ClassificationResult.objects.all(),
+        required=False
+    )
+    s3_bucket = serializers.CharField(max_length=255, required=False)
+    s3_key = serializers.CharField(max_length=1024, required=False)
+    filename = serializers.CharField(max_length=255, required=False)
+    application_id = serializers.CharField(max_length=255, required=False)
+    document_type = serializers.ChoiceField(
+        choices=ClassificationResult.DocumentType.choices,
+        required=False
+    )
+    
+    def validate(self, attrs):
+        result = attrs.get('classification_result')
+        if result is not None:
+            attrs.setdefault('s3_bucket', result.document_s3_bucket)
+            attrs.setdefault('s3_key', result.document_s3_key)
+            attrs.setdefault('filename', result.document_filename)
+            attrs.setdefault('application_id', result.application_ref)
+            attrs.setdefault('document_type', result.document_type)
+        
+        missing = [
+            name for name in ('s3_bucket', 's3_key', 'filename', 'application_id', 'document_type')
+            if not attrs.get(name)
+        ]
+        if missing:
+            raise serializers.ValidationError(
+                f"Missing {', '.join(missing)} (or provide classification_result)."
+            )
+        return attrs
+
+
+class ExtractBatchRequestSerializer(serializers.Serializer):
+    """Request serializer for batch extraction."""
+    
+    documents = ExtractDocumentRequestSerializer(many=True)
+    job_name = serializers.CharField(max_length=255, required=False, default='')
+    job_description = serializers.CharField(required=False, default='')
+
+
+class ClassifyExtractDocumentSerializer(serializers.Serializer):
+    """A document to classify and extract in one pass."""
+    
+    s3_bucket = serializers.CharField(max_length=255)
+    s3_key = serializers.CharField(max_length=1024)
+    filename = serializers.CharField(max_length=255)
+    application_id = serializers.CharField(max_length=255)
+
+
+class ClassifyExtractRequestSerializer(serializers.Serializer):
+    """Request serializer for the fused classify-and-extract pipeline."""
+    
+    documents = ClassifyExtractDocumentSerializer(many=True, allow_empty=False)
+    job_name = serializers.CharField(max_length=255, required=False, default='')
+    supersede_previous = serializers.BooleanField(required=False, default=False)
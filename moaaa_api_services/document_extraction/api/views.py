@@ -1,39 +1,324 @@
+from django.conf import settings
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
+from document_classification.models import ClassificationJob, ClassificationResult
+from document_classification.tasks import get_classifier
+from ..ai_ml.schemas import fields_for
+from ..models import ExtractionJob, ExtractionResult
+from ..tasks import engine_input, get_extraction_engine, save_extraction_results
+from .serializers import (
+    ExtractionResultSerializer,
+    ExtractionJobSerializer,
+    ExtractDocumentRequestSerializer,
+    ExtractBatchRequestSerializer,
+    ClassifyExtractRequestSerializer,
+)
 
-class Document_extractionViewSet(viewsets.ViewSet):
-    """API ViewSet for document_extraction."""
+_fused_pipeline = None
 
-    def list(self, request):
-        # TODO: Implement
-        return Response([])
 
-    def retrieve(self, request, pk=None):
-        # TODO: Implement
-        return Response({})
+def _get_fused_pipeline():
+    """Fused classify-and-extract pipeline sharing the classifier and extraction engine."""
+    global _fused_pipeline
+    if _fused_pipeline is None:
+        from ..ai_ml import FusedClassifyExtractPipeline
+        _fused_pipeline = FusedClassifyExtractPipeline(
+            classifier=get_classifier(),
+            extractor=get_extraction_engine(),
+            two_pass_document_types=settings.EXTRACTION_TWO_PASS_DOCUMENT_TYPES
+        )
+    return _fused_pipeline
 
-    def create(self, request):
-        # TODO: Implement
-        return Response({}, status=status.HTTP_201_CREATED)
-
-    def update(self, request, pk=None):
-        # TODO: Implement
-        return Response({})
-
-    def destroy(self, request, pk=None):
-        # TODO: Implement
-        return Response(status=status.HTTP_204_NO_CONTENT)
 
+class Document_extractionViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    API ViewSet for document_extraction.
+    
+    Endpoints:
+        GET /api/extraction/document_extraction/ - List extraction results
+        GET /api/extraction/document_extraction/{id}/ - Get result details
+        GET /api/extraction/document_extraction/jobs/ - List extraction jobs
+        POST /api/extraction/document_extraction/process/ - Extract one document
+        POST /api/extraction/document_extraction/process_batch/ - Extract many documents
+        POST /api/extraction/document_extraction/classify_and_extract/ - Fused single-pass pipeline
+    """
+    
+    queryset = ExtractionResult.objects.all()
+    serializer_class = ExtractionResultSerializer
+    
     @action(detail=False, methods=['post'])
     def process(self, request):
-        """Trigger AI/ML processing."""
-        # TODO: Implement
-        return Response({"status": "processing"})
-
+        """
+        Extract fields from a single document.
+        
+        Request:
+            {"classification_result": "uuid"}
+            or
+            {
+                "s3_bucket": "my-bucket",
+                "s3_key": "documents/statement.pdf",
+                "filename": "statement.pdf",
+                "application_id": "app-001",
+                "document_type": "BANK_STATEMENT"
+            }
+        """
+        serializer = ExtractDocumentRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        document = serializer.validated_data
+        created_by = request.user.username if request.user.is_authenticated else 'anonymous'
+        
+        job = ExtractionJob.objects.create(
+            name=f"Single extraction: {document['filename']}",
+            total_documents=1,
+            created_by=created_by
+        )
+        job.start()
+        
+        try:
+            output = get_extraction_engine().process(engine_input(document))
+            result, = save_extraction_results(job, [document], [output], created_by)
+            
+            # The engine reports a failed document in raw_response rather than raising
+            error = output['raw_response'].get('error')
+            if error is not None:
+                job.failed_documents = 1
+                job.fail(error)
+                return Response(
+                    {'error': error, 'job_id': str(job.id), 'result_id': str(result.id)},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            
+            job.processed_documents = 1
+            job.complete()
+            
+            return Response({
+                'result_id': str(result.id),
+                'job_id': str(job.id),
+                'document_type': result.document_type,
+                'fields': result.extracted_fields,
+                'field_errors': result.field_errors,
+                'is_valid': result.is_valid,
+                'requires_review': result.requires_review
+            }, status=status.HTTP_201_CREATED)
+            
+        except Exception as e:
+            job.fail(str(e))
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
     @action(detail=False, methods=['post'])
     def process_batch(self, request):
-        """Trigger batch AI/ML processing."""
-        # TODO: Implement
-        return Response({"status": "batch_processing"})
+        """
+        Extract fields from many documents concurrently.
+        
+        Request:
+            {
+                "job_name": "Batch extraction",
+                "documents": [{"classification_result": "uuid"}, ...]
+            }
+        
+        Response:
+            {
+                "job_id": "uuid",
+                "status": "COMPLETED",
+                "total": 3,
+                "processed": 3,
+                "failed": 0,
+                "results": [...]
+            }
+        """
+        serializer = ExtractBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        documents = data['documents']
+        created_by = request.user.username if request.user.is_authenticated else 'anonymous'
+        
+        job = ExtractionJob.objects.create(
+            name=data.get('job_name') or f"Batch extraction: {len(documents)} documents",
+            description=data.get('job_description', ''),
+            total_documents=len(documents),
+            created_by=created_by
+        )
+        job.start()
+        
+        try:
+            outputs = get_extraction_engine().process_batch([engine_input(document) for document in documents])
+            results = save_extraction_results(job, documents, outputs, created_by)
+        except Exception as e:
+            job.fail(str(e))
+            return Response(
+                {'error': str(e), 'job_id': str(job.id)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        failed = sum(1 for output in outputs if 'error' in output['raw_response'])
+        job.processed_documents = len(documents) - failed
+        job.failed_documents = failed
+        
+        if failed == len(documents):
+            job.fail("All documents failed to process")
+        else:
+            job.complete()
+        
+        return Response({
+            'job_id': str(job.id),
+            'status': job.status,
+            'total': len(documents),
+            'processed': job.processed_documents,
+            'failed': job.failed_documents,
+            'results': [
+                {
+                    'result_id': str(result.id),
+                    'filename': result.document_filename,
+                    'document_type': result.document_type,
+                    'fields': result.extracted_fields,
+                    'field_errors': result.field_errors,
+                    'is_valid': result.is_valid,
+                    'requires_review': result.requires_review
+                }
+                for result in results
+            ]
+        }, status=status.HTTP_201_CREATED)
+    
+    @action(detail=False, methods=['post'])
+    def classify_and_extract(self, request):
+        """
+        Classify documents and extract their fields in one model call each.
+        
+        Each document is read from storage once. Documents whose fused
+        classification needs review fall back to separate classification
+        and extraction passes over the same bytes.
+        
+        Request:
+            {
+                "job_name": "Optional name",
+                "supersede_previous": false,
+                "documents": [
+                    {
+                        "s3_bucket": "my-bucket",
+                        "s3_key": "documents/statement.pdf",
+                        "filename": "statement.pdf",
+                        "application_id": "app-001"
+                    },
+                    ...
+                ]
+            }
+        
+        Response:
+            {
+                "classification_job_id": "uuid",
+                "extraction_job_id": "uuid",
+                "results": [
+                    {
+                        "filename": "statement.pdf",
+                        "mode": "fused",
+                        "classification_result_id": "uuid",
+                        "document_type": "BANK_STATEMENT",
+                        "confidence_score": 0.97,
+                        "extraction_result_id": "uuid",
+                        "fields": {...},
+                        "field_errors": {},
+                        "requires_review": false
+                    },
+                    ...
+                ]
+            }
+        """
+        serializer = ClassifyExtractRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        documents = data['documents']
+        created_by = request.user.username if request.user.is_authenticated else 'anonymous'
+        name = data.get('job_name') or f"Classify and extract: {len(documents)} documents"
+        
+        classification_job = ClassificationJob.objects.create(
+            name=name, total_documents=len(documents), created_by=created_by
+        )
+        extraction_job = ExtractionJob.objects.create(
+            name=name, total_documents=len(documents), created_by=created_by
+        )
+        classification_job.start()
+        extraction_job.start()
+        
+        outputs = _get_fused_pipeline().process_batch([
+            {'s3_bucket': doc['s3_bucket'], 's3_key': doc['s3_key'], 'filename': doc['filename']}
+            for doc in documents
+        ])
+        
+        results = []
+        extract_documents = []
+        extract_outputs = []
+        failed = 0
+        
+        for doc, output in zip(documents, outputs):
+            classification = output['classification']
+            if 'error' in classification.raw_response:
+                failed += 1
+            
+            result = ClassificationResult.objects.create_with_raw_response(
+                job=classification_job,
+                application_ref=doc['application_id'],
+                document_s3_bucket=doc['s3_bucket'],
+                document_s3_key=doc['s3_key'],
+                document_filename=doc['filename'],
+                document_type=classification.document_type,
+                confidence_score=classification.confidence_score,
+                requires_review=classification.requires_review,
+                raw_response={**classification.raw_response, 'pipeline_mode': output['mode']},
+                supersede_previous=data['supersede_previous'],
+                created_by=created_by
+            )
+            results.append({
+                'filename': doc['filename'],
+                'mode': output['mode'],
+                'classification_result_id': str(result.id),
+                'document_type': result.document_type,
+                'confidence_score': result.confidence_score,
+                'requires_review': result.requires_review,
+            })
+            
+            # Only types with an extraction schema get an extraction record
+            if fields_for(classification.document_type) and 'error' not in classification.raw_response:
+                extract_documents.append({**doc, 'classification_result': result})
+                extract_outputs.append(output['extraction'])
+        
+        extraction_results = save_extraction_results(extraction_job, extract_documents, extract_outputs, created_by)
+        by_classification = {str(item.classification_result_id): item for item in extraction_results}
+        for item in results:
+            extraction = by_classification.get(item['classification_result_id'])
+            if extraction is not None:
+                item['extraction_result_id'] = str(extraction.id)
+                item['fields'] = extraction.extracted_fields
+                item['field_errors'] = extraction.field_errors
+                item['requires_review'] = item['requires_review'] or extraction.requires_review
+        
+        # Update jobs
+        classification_job.processed_documents = len(documents) - failed
+        classification_job.failed_documents = failed
+        if failed == len(documents):
+            classification_job.fail("All documents failed to process")
+        else:
+            classification_job.complete()
+        
+        extraction_job.total_documents = len(extract_documents)
+        extraction_job.processed_documents = len(extract_documents)
+        extraction_job.complete()
+        
+        return Response({
+            'classification_job_id': str(classification_job.id),
+            'extraction_job_id': str(extraction_job.id),
+            'results': results
+        }, status=status.HTTP_201_CREATED)
+    
+    @action(detail=False, methods=['get'])
+    def jobs(self, request):
+        """List extraction jobs, paginated like the viewset's list."""
+        jobs = ExtractionJob.objects.all()
+        page = self.paginate_queryset(jobs)
+        if page is not None:
+            return self.get_paginated_response(ExtractionJobSerializer(page, many=True).data)
+        return Response(ExtractionJobSerializer(jobs, many=True).data)
@@ -1,27 +1,15 @@
-from typing import List, Optional
+from typing import List
+from moaaa_api_services.repository import DjangoModelRepository
 from ..interfaces.document_extraction_repository import IDocument_extractionRepository
-from ..models import *
+from ...models import ExtractionResult
+from ...signals import results_changed
 
 
-class Document_extractionRepositoryImpl(IDocument_extractionRepository):
-    """Concrete implementation of document_extraction repository."""
+class Document_extractionRepositoryImpl(DjangoModelRepository, IDocument_extractionRepository):
+    """Concrete implementation of document_extraction repository, over ExtractionResult."""
 
-    def get_by_id(self, id: str) -> Optional[dict]:
-        # TODO: Implement
-        pass
+    model = ExtractionResult
 
-    def get_all(self) -> List[dict]:
-        # TODO: Implement
-        pass
-
-    def create(self, data: dict) -> dict:
-        # TODO: Implement
-        pass
-
-    def update(self, id: str, data: dict) -> Optional[dict]:
-        # TODO: Implement
-        pass
-
-    def delete(self, id: str) -> bool:
-        # TODO: Implement
-        pass
+    def _bulk_written(self, rows: List[dict]) -> None:
+        # Bulk writes skip post_save; keep the application status snapshots current
+        results_changed.send(sender=self.model, application_ids={row['application_id'] for row in rows})
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('document_extraction', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='extractionjob',
+            name='source_event_id',
+            field=models.UUIDField(blank=True, null=True, unique=True),
+        ),
+    ]
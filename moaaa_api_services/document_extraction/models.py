@@ -1,3 +1,173 @@
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.utils import timezone
+import uuid
 
-# Create your models here.
+from document_classification.models import ClassificationResult
+
+
+class ExtractionJob(models.Model):
+    """
+    Represents an extraction job that processes one or more documents.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        IN_PROGRESS = 'IN_PROGRESS', 'In Progress'
+        COMPLETED = 'COMPLETED', 'Completed'
+        FAILED = 'FAILED', 'Failed'
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    # Job metadata
+    name = models.CharField(max_length=255, blank=True)
+    description = models.TextField(blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    
+    # Processing info
+    total_documents = models.IntegerField(default=0)
+    processed_documents = models.IntegerField(default=0)
+    failed_documents = models.IntegerField(default=0)
+    
+    # Error tracking
+    error_message = models.TextField(blank=True)
+    
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    # Created by (for audit)
+    created_by = models.CharField(max_length=255, blank=True)
+    
+    # Pipeline event the job extracts for; a redelivered event finds its job
+    source_event_id = models.UUIDField(null=True, blank=True, unique=True)
+    
+    class Meta:
+        db_table = 'extraction_job'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"ExtractionJob({self.id}) - {self.status}"
+    
+    def start(self):
+        self.status = self.Status.IN_PROGRESS
+        self.started_at = timezone.now()
+        self.save()
+    
+    def complete(self):
+        self.status = self.Status.COMPLETED
+        self.completed_at = timezone.now()
+        self.save()
+    
+    def fail(self, error_message: str):
+        self.status = self.Status.FAILED
+        self.error_message = error_message
+        self.completed_at = timezone.now()
+        self.save()
+
+
+class ExtractionResult(models.Model):
+    """
+    Fields extracted from a single document.
+    Multiple results can exist per document (different runs).
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    
+    # Relationships
+    job = models.ForeignKey(
+        ExtractionJob,
+        on_delete=models.CASCADE,
+        related_name='results'
+    )
+    classification_result = models.ForeignKey(
+        ClassificationResult,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='extraction_results'
+    )
+    
+    # Application reference (string for now, FK to application_profile later)
+    application_id = models.CharField(max_length=255, db_index=True)
+    
+    # Document info
+    document_s3_bucket = models.CharField(max_length=255)
+    document_s3_key = models.CharField(max_length=1024)
+    document_filename = models.CharField(max_length=255)
+    document_type = models.CharField(
+        max_length=50,
+        choices=ClassificationResult.DocumentType.choices
+    )
+    
+    # Extracted values, keyed by field name (None when missing or invalid)
+    extracted_fields = models.JSONField(default=dict, blank=True)
+    # Validation error per field
+    field_errors = models.JSONField(default=dict, blank=True)
+    
+    # Status flags
+    is_valid = models.BooleanField(default=False)
+    is_active = models.BooleanField(default=True)
+    requires_review = models.BooleanField(default=False)
+    
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    # Audit
+    created_by = models.CharField(max_length=255, blank=True)
+    
+    class Meta:
+        db_table = 'extraction_result'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"ExtractionResult({self.document_type}, valid={self.is_valid})"
+    
+    @property
+    def raw_response(self) -> dict:
+        """Raw Bedrock response, loaded from its own table on first access."""
+        try:
+            return self.raw.payload
+        except ObjectDoesNotExist:
+            return {}
+    
+    @classmethod
+    def from_output(cls, output: dict, **fields) -> 'ExtractionResult':
+        """Build an unsaved result from a Document_extractionImpl output dict."""
+        return cls(
+            document_type=output['document_type'],
+            extracted_fields=output['fields'],
+            field_errors=output['field_errors'],
+            is_valid=output['is_valid'],
+            requires_review=output['requires_review'],
+            **fields
+        )
+
+
+class ExtractionRawResponse(models.Model):
+    """
+    Raw Bedrock response for an extraction result, stored outside
+    extraction_result so list queries stay narrow.
+    """
+    
+    result = models.OneToOneField(
+        ExtractionResult,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='raw'
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'extraction_raw_response'
+    
+    def __str__(self):
+        return f"ExtractionRawResponse({self.result_id})"
@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent after extraction results are bulk-created (bulk_create bypasses
+# post_save). Receivers get `application_ids`.
+results_changed = Signal()
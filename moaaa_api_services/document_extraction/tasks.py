@@ -0,0 +1,134 @@
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from document_classification.models import ClassificationResult
+from document_classification.storage import get_document_fetcher
+from .ai_ml import IDocument_extraction
+from .ai_ml.schemas import fields_for
+from .models import ExtractionJob, ExtractionResult, ExtractionRawResponse
+from .signals import results_changed
+
+logger = logging.getLogger(__name__)
+
+_engine = None
+
+
+def get_extraction_engine() -> IDocument_extraction:
+    """Extraction engine shared across requests and workers (boto3 clients are thread-safe)."""
+    global _engine
+    if _engine is None:
+        # Imported here: the engine pulls in boto3 and numpy
+        from .ai_ml import Document_extractionImpl
+        _engine = Document_extractionImpl(
+            max_workers=settings.EXTRACTION_MAX_WORKERS,
+            fetcher=get_document_fetcher()
+        )
+    return _engine
+
+
+def engine_input(document: dict) -> dict:
+    return {
+        's3_bucket': document['s3_bucket'],
+        's3_key': document['s3_key'],
+        'filename': document['filename'],
+        'document_type': document['document_type'],
+    }
+
+
+def save_extraction_results(job: ExtractionJob, documents: list, outputs: list, created_by: str) -> list:
+    """Persist extraction outputs and their raw responses with two bulk inserts."""
+    results = [
+        ExtractionResult.from_output(
+            output,
+            job=job,
+            classification_result=document.get('classification_result'),
+            application_id=document['application_id'],
+            document_s3_bucket=document['s3_bucket'],
+            document_s3_key=document['s3_key'],
+            document_filename=document['filename'],
+            created_by=created_by
+        )
+        for document, output in zip(documents, outputs)
+    ]
+    with transaction.atomic():
+        ExtractionResult.objects.bulk_create(results)
+        ExtractionRawResponse.objects.bulk_create([
+            ExtractionRawResponse(result=result, payload=output['raw_response'])
+            for result, output in zip(results, outputs)
+        ])
+        results_changed.send(
+            sender=ExtractionResult,
+            application_ids={result.application_id for result in results}
+        )
+    return results
+
+
+def run_classified_extraction(classification_result_id, event_id=None) -> Optional[ExtractionResult]:
+    """
+    Extract the fields of a classified document and record them on a new job.
+
+    Args:
+        classification_result_id: The classification to extract
+        event_id: Pipeline event the extraction is for. The job is keyed on
+            it before the engine runs, so a redelivered event extracts nothing
+
+    Returns:
+        The saved result, or None if the classification was superseded, its
+        type has no extraction schema, the event was already handled, or
+        extraction failed
+    """
+    close_old_connections()
+    try:
+        classification = ClassificationResult.objects.filter(
+            pk=classification_result_id, is_active=True
+        ).first()
+        if classification is None or not fields_for(classification.document_type):
+            return None
+
+        document = {
+            'classification_result': classification,
+            'application_id': classification.application_ref,
+            's3_bucket': classification.document_s3_bucket,
+            's3_key': classification.document_s3_key,
+            'filename': classification.document_filename,
+            'document_type': classification.document_type,
+        }
+        job_fields = {
+            'name': f"Pipeline extraction: {classification.document_filename}",
+            'total_documents': 1,
+            'created_by': classification.created_by,
+        }
+        if event_id is None:
+            job = ExtractionJob.objects.create(**job_fields)
+        else:
+            job, created = ExtractionJob.objects.get_or_create(source_event_id=event_id, defaults=job_fields)
+            if not created:
+                logger.info("Event %s already extracted by job %s", event_id, job.id)
+                return None
+        job.start()
+
+        try:
+            output = get_extraction_engine().process(engine_input(document))
+            result, = save_extraction_results(job, [document], [output], classification.created_by)
+
+            # Failed extractions are recorded with every field empty
+            error = output['raw_response'].get('error')
+            if error:
+                job.failed_documents = 1
+                job.fail(str(error))
+                return None
+
+            job.processed_documents = 1
+            job.complete()
+            return result
+
+        except Exception as e:
+            logger.exception("Extraction failed for classification result %s", classification_result_id)
+            job.failed_documents = 1
+            job.fail(str(e))
+            return None
+    finally:
+        close_old_connections()
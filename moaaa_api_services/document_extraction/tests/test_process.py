@@ -0,0 +1,46 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from document_extraction.ai_ml.implementations.extractor_impl import extraction_output
+from document_extraction.models import ExtractionJob, ExtractionResult
+
+DOCUMENT = {
+    's3_bucket': 'bucket',
+    's3_key': 'uploads/APP-1001/statement.pdf',
+    'filename': 'statement.pdf',
+    'application_id': 'APP-1001',
+    'document_type': 'BANK_STATEMENT',
+}
+
+
+class ProcessTests(TestCase):
+    def process(self, output):
+        engine = mock.Mock()
+        engine.process.return_value = output
+        with mock.patch('document_extraction.api.views.get_extraction_engine', return_value=engine):
+            return self.client.post('/api/extraction/document_extraction/process/', DOCUMENT,
+                                    content_type='application/json')
+
+    def test_extracted_document_completes_the_job(self):
+        response = self.process(extraction_output('BANK_STATEMENT', {'account_number': '1234'}, {}, {}))
+
+        self.assertEqual(response.status_code, 201)
+        job = ExtractionJob.objects.get(pk=response.data['job_id'])
+        self.assertEqual(job.status, ExtractionJob.Status.COMPLETED)
+        self.assertEqual((job.processed_documents, job.failed_documents), (1, 0))
+
+    def test_failed_document_fails_the_job(self):
+        response = self.process(extraction_output(
+            'BANK_STATEMENT', {'account_number': None}, {'account_number': 'extraction failed'},
+            {'error': 'Bedrock throttled'}
+        ))
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.data['error'], 'Bedrock throttled')
+        job = ExtractionJob.objects.get(pk=response.data['job_id'])
+        self.assertEqual(job.status, ExtractionJob.Status.FAILED)
+        self.assertEqual(job.error_message, 'Bedrock throttled')
+        self.assertEqual((job.processed_documents, job.failed_documents), (0, 1))
+        # The failed attempt is kept, as in process_batch
+        self.assertTrue(ExtractionResult.objects.filter(pk=response.data['result_id']).exists())
@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import Merchant
 
-# Register your models here.
+
+@admin.register(Merchant)
+class MerchantAdmin(admin.ModelAdmin):
+    list_display = ['id', 'legal_name', 'dba_name', 'ein', 'status', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['legal_name', 'dba_name', '=ein']
+    readonly_fields = ['id', 'created_at', 'updated_at']
@@ -1,4 +1,25 @@
 from rest_framework import serializers
+from ..models import Merchant
 
 
-# TODO: Add serializers for merchant_profile models
+class MerchantSerializer(serializers.ModelSerializer):
+    """Serializer for Merchant."""
+    
+    class Meta:
+        model = Merchant
+        fields = [
+            'id',
+            'legal_name',
+            'dba_name',
+            'ein',
+            'business_type',
+            'email',
+            'phone',
+            'website',
+            'address',
+            'status',
+            'created_at',
+            'updated_at',
+            'created_by',
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at', 'created_by']
@@ -1,26 +1,37 @@
-from rest_framework import viewsets, status
+from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from moaaa_api_services.read_through_cache import get_profile_cache
 
-class Merchant_profileViewSet(viewsets.ViewSet):
-    """API ViewSet for merchant_profile."""
+from ..models import Merchant
+from .serializers import MerchantSerializer
 
-    def list(self, request):
-        # TODO: Implement
-        return Response([])
 
-    def retrieve(self, request, pk=None):
-        # TODO: Implement
-        return Response({})
-
-    def create(self, request):
-        # TODO: Implement
-        return Response({}, status=status.HTTP_201_CREATED)
-
-    def update(self, request, pk=None):
-        # TODO: Implement
-        return Response({})
-
-    def destroy(self, request, pk=None):
-        # TODO: Implement
-        return Response(status=status.HTTP_204_NO_CONTENT)
+class Merchant_profileViewSet(viewsets.ModelViewSet):
+    """
+    API ViewSet for merchant_profile.
+    
+    Endpoints:
+        GET /api/merchants/merchant_profile/ - List merchants
+        POST /api/merchants/merchant_profile/ - Create a merchant
+        GET /api/merchants/merchant_profile/{id}/ - Get a merchant
+        PUT/PATCH /api/merchants/merchant_profile/{id}/ - Update a merchant
+        DELETE /api/merchants/merchant_profile/{id}/ - Delete a merchant
+        GET /api/merchants/merchant_profile/cache_stats/ - Profile cache hit-rate metrics
+    
+    A merchant's applications and their status:
+        GET /api/applications/status/dashboard/?merchant_id={id}
+    """
+    
+    queryset = Merchant.objects.all()
+    serializer_class = MerchantSerializer
+    
+    def perform_create(self, serializer):
+        created_by = self.request.user.username if self.request.user.is_authenticated else 'anonymous'
+        serializer.save(created_by=created_by)
+    
+    @action(detail=False, methods=['get'])
+    def cache_stats(self, request):
+        """Merchant lookup cache metrics for this process (hits, misses, loads, hit_rate, ...)."""
+        return Response(get_profile_cache('merchant').stats())
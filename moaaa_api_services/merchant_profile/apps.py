@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MerchantProfileConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'merchant_profile'
+
+    def ready(self):
+        # Invalidate cached merchant lookups on writes
+        from . import signals  # noqa: F401
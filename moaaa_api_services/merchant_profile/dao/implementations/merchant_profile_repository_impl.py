@@ -1,27 +1,16 @@
-from typing import List, Optional
-from ..interfaces.merchant_profile_repository import IMerchant_profileRepository
-from ..models import *
-
+from typing import Any, Dict, List
 
-class Merchant_profileRepositoryImpl(IMerchant_profileRepository):
-    """Concrete implementation of merchant_profile repository."""
-
-    def get_by_id(self, id: str) -> Optional[dict]:
-        # TODO: Implement
-        pass
+from moaaa_api_services.read_through_cache import invalidate_on_commit
+from moaaa_api_services.repository import DjangoModelRepository
+from ..interfaces.merchant_profile_repository import IMerchant_profileRepository
+from ...models import Merchant
 
-    def get_all(self) -> List[dict]:
-        # TODO: Implement
-        pass
 
-    def create(self, data: dict) -> dict:
-        # TODO: Implement
-        pass
+class Merchant_profileRepositoryImpl(DjangoModelRepository, IMerchant_profileRepository):
+    """Concrete implementation of merchant_profile repository, over Merchant."""
 
-    def update(self, id: str, data: dict) -> Optional[dict]:
-        # TODO: Implement
-        pass
+    model = Merchant
 
-    def delete(self, id: str) -> bool:
-        # TODO: Implement
-        pass
+    def _bulk_written(self, rows: List[Dict[str, Any]]) -> None:
+        # Single-row writes invalidate through the Merchant signal handlers
+        invalidate_on_commit('merchant', [row['id'] for row in rows])
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:26
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Merchant',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('legal_name', models.CharField(max_length=500)),
+                ('dba_name', models.CharField(blank=True, max_length=500)),
+                ('ein', models.CharField(blank=True, db_index=True, max_length=20)),
+                ('business_type', models.CharField(blank=True, max_length=100)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('phone', models.CharField(blank=True, max_length=50)),
+                ('website', models.URLField(blank=True)),
+                ('address', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('ONBOARDING', 'Onboarding'), ('ACTIVE', 'Active'), ('SUSPENDED', 'Suspended'), ('CLOSED', 'Closed')], default='ONBOARDING', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'db_table': 'merchant',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
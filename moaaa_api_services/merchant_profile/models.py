@@ -1,3 +1,48 @@
 from django.db import models
+import uuid
 
-# Create your models here.
+
+class Merchant(models.Model):
+    """
+    A business being onboarded. A merchant can file several applications.
+    """
+
+    class Status(models.TextChoices):
+        ONBOARDING = 'ONBOARDING', 'Onboarding'
+        ACTIVE = 'ACTIVE', 'Active'
+        SUSPENDED = 'SUSPENDED', 'Suspended'
+        CLOSED = 'CLOSED', 'Closed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Business identity
+    legal_name = models.CharField(max_length=500)
+    dba_name = models.CharField(max_length=500, blank=True)
+    ein = models.CharField(max_length=20, blank=True, db_index=True)
+    business_type = models.CharField(max_length=100, blank=True)
+
+    # Contact
+    email = models.EmailField(blank=True)
+    phone = models.CharField(max_length=50, blank=True)
+    website = models.URLField(blank=True)
+    address = models.TextField(blank=True)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.ONBOARDING
+    )
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Created by (for audit)
+    created_by = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = 'merchant'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Merchant({self.legal_name})"
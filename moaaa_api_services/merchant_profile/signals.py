@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from moaaa_api_services.read_through_cache import invalidate_on_commit
+from .models import Merchant
+
+
+@receiver(post_save, sender=Merchant)
+@receiver(post_delete, sender=Merchant)
+def merchant_changed(sender, instance, **kwargs):
+    # Covers repository, API and admin writes; queryset.update() bypasses it
+    invalidate_on_commit('merchant', [instance.pk])
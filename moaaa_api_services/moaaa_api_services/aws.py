@@ -0,0 +1,22 @@
+"""
+AWS credentials defaults shared by the boto3-backed implementations.
+"""
+import os
+from typing import Optional
+
+# Named profile used for local development (~/.aws/config)
+DEFAULT_PROFILE = 'moaaa_api_services'
+
+
+def default_profile() -> Optional[str]:
+    """
+    The AWS profile to use when none is given: AWS_PROFILE, else the
+    project's profile. On Lambda (and with AWS_PROFILE set but empty) None,
+    so boto3 uses the default credential chain, i.e. the function's role;
+    there are no config files to hold a named profile there.
+    """
+    if 'AWS_PROFILE' in os.environ:
+        return os.environ['AWS_PROFILE'] or None
+    if 'AWS_LAMBDA_FUNCTION_NAME' in os.environ:
+        return None
+    return DEFAULT_PROFILE
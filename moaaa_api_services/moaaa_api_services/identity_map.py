@@ -0,0 +1,55 @@
+"""
+Per-request identity map.
+
+Repositories record every row they load or write here, so a request that
+asks for the same row several times (often from different services) hits
+the database once. The map lives in a context variable set by
+IdentityMapMiddleware; outside a request there is no map and repositories
+always query.
+"""
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+_current: ContextVar[Optional['IdentityMap']] = ContextVar('identity_map', default=None)
+
+
+class IdentityMap:
+    """Rows keyed by (model label, primary key)."""
+
+    def __init__(self):
+        self._rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def get(self, model_label: str, pk) -> Optional[Dict[str, Any]]:
+        return self._rows.get((model_label, str(pk)))
+
+    def put(self, model_label: str, pk, row: Dict[str, Any]) -> None:
+        self._rows[(model_label, str(pk))] = row
+
+    def discard(self, model_label: str, pks: Iterable) -> None:
+        for pk in pks:
+            self._rows.pop((model_label, str(pk)), None)
+
+    def clear(self) -> None:
+        self._rows.clear()
+
+    def __len__(self):
+        return len(self._rows)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """The identity map of the request being handled, if any."""
+    return _current.get()
+
+
+class IdentityMapMiddleware:
+    """Give each request a fresh identity map, dropped when the view returns."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _current.set(IdentityMap())
+        try:
+            return self.get_response(request)
+        finally:
+            _current.reset(token)
@@ -0,0 +1,47 @@
+"""
+Lazy package exports (PEP 562).
+
+The AI/ML and AWS packages re-export their implementations so callers can
+write `from document_classification.ai_ml import BedrockClassifier`, but
+an implementation drags in boto3/botocore and numpy, a few hundred
+milliseconds that every `manage.py` command, worker process and cold start
+would pay whether or not it calls Bedrock. A package built with
+lazy_exports() imports the module behind a name the first time the name is
+looked up, so importing the package (or a light sibling such as
+`support_agent.ai_ml.context`) stays cheap:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        'BedrockClassifier': '.implementations',
+    })
+
+`manage.py check_import_time` fails when startup imports these again.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module __getattr__ and __dir__ resolving names on first use.
+
+    Args:
+        package: The package's __name__
+        exports: Exported name -> module it is defined in (relative to the package)
+
+    Returns:
+        (__getattr__, __dir__) for the package's namespace
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        # Later lookups find the name without coming back here
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,293 @@
+"""
+Read-through cache for profile lookups.
+
+Entries are stored under versioned keys (`<namespace>:<id>:<version>`).
+Invalidating an ID bumps its version instead of deleting the entry, so a
+reader that loaded the row before the write can only fill a key nobody
+reads any more. Concurrent misses for the same ID are coalesced: one
+thread loads while the others in the process wait for its result, and with
+a shared backend a short lock key keeps other processes from loading the
+same row at the same time.
+
+Backends are pluggable (PROFILE_CACHE_BACKEND): LocalMemoryBackend keeps
+entries per process; DjangoCacheBackend uses one of the configured CACHES.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+class LocalMemoryBackend:
+    """In-process LRU store with per-entry expiry."""
+
+    # Other processes can't see entries, so cross-process locking is pointless
+    shared = False
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Any:
+        """Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: Any, timeout: Optional[float]) -> None:
+        """Caller holds the lock."""
+        self._entries[key] = (value, time.monotonic() + timeout if timeout is not None else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        with self._lock:
+            values = {key: self._get(key) for key in keys}
+        # Copies of dict rows, so callers can't change the cached ones
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in values.items() if value is not None}
+
+    def set_many(self, values: Dict[str, Any], timeout: Optional[float]) -> None:
+        with self._lock:
+            for key, value in values.items():
+                self._set(key, dict(value) if isinstance(value, dict) else value, timeout)
+
+    def add(self, key: str, value: Any, timeout: Optional[float]) -> bool:
+        with self._lock:
+            if self._get(key) is not None:
+                return False
+            self._set(key, value, timeout)
+            return True
+
+    def incr(self, key: str) -> int:
+        """Increment a counter; raises ValueError if it doesn't exist."""
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                raise ValueError(f"Key '{key}' not found")
+            self._set(key, value + 1, None)
+            return value + 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class DjangoCacheBackend:
+    """Store in one of the Django CACHES (e.g. Redis or Memcached shared by every process)."""
+
+    shared = True
+
+    def __init__(self, alias: str = 'default'):
+        from django.core.cache import caches
+        self.cache = caches[alias]
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        return self.cache.get_many(keys)
+
+    def set_many(self, values: Dict[str, Any], timeout: Optional[float]) -> None:
+        self.cache.set_many(values, timeout)
+
+    def add(self, key: str, value: Any, timeout: Optional[float]) -> bool:
+        return self.cache.add(key, value, timeout)
+
+    def incr(self, key: str) -> int:
+        return self.cache.incr(key)
+
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+
+class ReadThroughCache:
+    """Versioned read-through cache of rows keyed by ID."""
+
+    def __init__(self, namespace: str, backend, ttl_seconds: float = 300,
+                 lock_timeout: float = 5.0):
+        """
+        Args:
+            namespace: Key prefix, e.g. "merchant"
+            backend: LocalMemoryBackend, DjangoCacheBackend or compatible
+            ttl_seconds: Lifetime of cached rows
+            lock_timeout: How long other processes wait for a row being loaded
+        """
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout = lock_timeout
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._counters = {'hits': 0, 'misses': 0, 'loads': 0, 'coalesced': 0, 'invalidations': 0}
+
+    def _record(self, counter: str, count: int = 1) -> None:
+        with self._lock:
+            self._counters[counter] += count
+
+    def _version_key(self, id: str) -> str:
+        return f"{self.namespace}:{id}:version"
+
+    def _versions(self, ids: List[str]) -> Dict[str, int]:
+        """Current version of each ID, starting new ones at a value no old key used."""
+        keys = {id: self._version_key(id) for id in ids}
+        stored = self.backend.get_many(list(keys.values()))
+        versions = {}
+        for id, key in keys.items():
+            if key not in stored:
+                # Versions aren't persisted forever; start past any earlier one
+                self.backend.add(key, time.time_ns(), None)
+                stored.update(self.backend.get_many([key]))
+            versions[id] = stored.get(key, 0)
+        return versions
+
+    def _entry_keys(self, ids: List[str]) -> Dict[str, str]:
+        versions = self._versions(ids)
+        return {id: f"{self.namespace}:{id}:{versions[id]}" for id in ids}
+
+    def get(self, id: str, load: Callable[[str], Optional[dict]]) -> Optional[dict]:
+        """
+        Cached row for an ID, loading (and caching) it on a miss.
+
+        Args:
+            id: Row ID
+            load: fn(id) -> row or None
+
+        Returns:
+            The row, or None if it doesn't exist (misses aren't cached)
+        """
+        id = str(id)
+        key = self._entry_keys([id])[id]
+        row = self.backend.get_many([key]).get(key)
+        if row is not None:
+            self._record('hits')
+            return row
+        self._record('misses')
+
+        # Coalesce concurrent misses in this process
+        with self._lock:
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+        if not leader:
+            self._record('coalesced')
+            event.wait(self.lock_timeout)
+            row = self.backend.get_many([key]).get(key)
+            return row if row is not None else load(id)
+
+        try:
+            return self._load(id, key, load)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def _load(self, id: str, key: str, load: Callable[[str], Optional[dict]]) -> Optional[dict]:
+        lock_key = f"{key}:lock"
+        if self.backend.shared and not self.backend.add(lock_key, 1, self.lock_timeout):
+            # Another process is loading it; wait briefly for its result
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                row = self.backend.get_many([key]).get(key)
+                if row is not None:
+                    self._record('coalesced')
+                    return row
+
+        try:
+            self._record('loads')
+            row = load(id)
+            if row is not None:
+                self.backend.set_many({key: row}, self.ttl_seconds)
+            return row
+        finally:
+            if self.backend.shared:
+                self.backend.delete(lock_key)
+
+    def get_many(self, ids: Iterable[str], load_many: Callable[[List[str]], Dict[str, dict]]) -> Dict[str, dict]:
+        """
+        Cached rows for many IDs; the misses are loaded with one load_many call.
+
+        Args:
+            ids: Row IDs
+            load_many: fn(ids) -> {id: row}
+
+        Returns:
+            {id: row} for the IDs that exist
+        """
+        ids = list(dict.fromkeys(str(id) for id in ids))
+        if not ids:
+            return {}
+        keys = self._entry_keys(ids)
+        cached = self.backend.get_many(list(keys.values()))
+        rows = {id: cached[key] for id, key in keys.items() if key in cached}
+        missing = [id for id in ids if id not in rows]
+        self._record('hits', len(rows))
+        self._record('misses', len(missing))
+
+        if missing:
+            self._record('loads')
+            loaded = load_many(missing)
+            self.backend.set_many({keys[id]: row for id, row in loaded.items() if id in keys}, self.ttl_seconds)
+            rows.update(loaded)
+        return {id: rows[id] for id in ids if id in rows}
+
+    def invalidate_many(self, ids: Iterable) -> None:
+        """Move the IDs to new versions, orphaning their cached rows."""
+        for id in dict.fromkeys(str(id) for id in ids):
+            key = self._version_key(id)
+            try:
+                self.backend.incr(key)
+            except ValueError:
+                self.backend.add(key, time.time_ns(), None)
+            self._record('invalidations')
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate metrics since the process started."""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                'namespace': self.namespace,
+                'backend': type(self.backend).__name__,
+                **self._counters,
+                'hit_rate': round(self._counters['hits'] / lookups, 4) if lookups else 0.0,
+            }
+
+
+_caches: Dict[str, ReadThroughCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_profile_cache(namespace: str) -> ReadThroughCache:
+    """Process-wide cache for a namespace, built from the PROFILE_CACHE_* settings."""
+    with _caches_lock:
+        if namespace not in _caches:
+            backend = import_string(settings.PROFILE_CACHE_BACKEND)(**settings.PROFILE_CACHE_OPTIONS)
+            _caches[namespace] = ReadThroughCache(
+                namespace,
+                backend,
+                ttl_seconds=settings.PROFILE_CACHE_TTL_SECONDS
+            )
+        return _caches[namespace]
+
+
+def invalidate_on_commit(namespace: str, ids: Iterable) -> None:
+    """
+    Invalidate IDs once the current transaction commits (immediately in
+    autocommit mode), so no reader can cache the pre-commit row under the
+    new version.
+    """
+    ids = [str(id) for id in ids]
+    if ids:
+        transaction.on_commit(lambda: get_profile_cache(namespace).invalidate_many(ids))
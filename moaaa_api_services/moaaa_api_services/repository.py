@@ -0,0 +1,195 @@
+"""
+Shared Django implementation of the app repositories.
+
+Every app's `*RepositoryImpl` subclasses DjangoModelRepository and names
+its model. Rows are plain dicts keyed by field attname (`merchant_id` for
+a foreign key). Batched operations take one query per call instead of one
+per row, and reads and writes go through the request's identity map (see
+identity_map.py).
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+
+from .identity_map import current_identity_map
+
+
+class DjangoModelRepository:
+    """Dict-returning repository over one Django model."""
+
+    # Set by subclasses
+    model: type = None
+
+    # Rows per INSERT / UPDATE statement in upsert_many
+    upsert_batch_size = 500
+
+    @property
+    def _label(self) -> str:
+        return self.model._meta.label
+
+    @property
+    def _pk(self) -> str:
+        return self.model._meta.pk.attname
+
+    def _to_dict(self, obj: models.Model) -> Dict[str, Any]:
+        return {field.attname: getattr(obj, field.attname) for field in self.model._meta.concrete_fields}
+
+    def _normalize_ids(self, ids: Iterable) -> List[str]:
+        """IDs as canonical strings, dropping duplicates and malformed values."""
+        normalized = []
+        for id in ids:
+            try:
+                value = self.model._meta.pk.to_python(id)
+            except ValidationError:
+                continue
+            if value is not None:
+                normalized.append(str(value))
+        return list(dict.fromkeys(normalized))
+
+    def _remember(self, rows: List[Dict[str, Any]]) -> None:
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            for row in rows:
+                identity_map.put(self._label, row[self._pk], row)
+
+    def _forget(self, ids: Iterable) -> None:
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            identity_map.discard(self._label, ids)
+
+    def _bulk_written(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Hook run after upsert_many, which bypasses save() and the model
+        signals. Changes made to `rows` are returned to the caller.
+        """
+        pass
+
+    def get_by_id(self, id: str) -> Optional[dict]:
+        rows = self.get_many([id])
+        return next(iter(rows.values()), None)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, dict]:
+        """
+        Rows for many IDs with at most one query.
+
+        Returns:
+            {id: row} for the IDs that exist; rows already loaded in this
+            request come from the identity map
+        """
+        ids = self._normalize_ids(ids)
+        identity_map = current_identity_map()
+
+        found = {}
+        missing = []
+        for id in ids:
+            row = identity_map.get(self._label, id) if identity_map is not None else None
+            if row is None:
+                missing.append(id)
+            else:
+                found[id] = row
+
+        if missing:
+            rows = [self._to_dict(obj) for obj in self.model.objects.filter(pk__in=missing)]
+            self._remember(rows)
+            found.update((str(row[self._pk]), row) for row in rows)
+
+        # Copies, so callers can't change what later lookups see
+        return {id: dict(found[id]) for id in ids if id in found}
+
+    def get_all(self) -> List[dict]:
+        return list(self.iter_all())
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[dict]:
+        """
+        Stream every row in primary-key order, fetching chunk_size rows per
+        round trip. Rows are not kept in the identity map.
+        """
+        return self.model.objects.order_by(self._pk).values().iterator(chunk_size=chunk_size)
+
+    def create(self, data: dict) -> dict:
+        row = self._to_dict(self.model.objects.create(**data))
+        self._remember([row])
+        return dict(row)
+
+    def update(self, id: str, data: dict) -> Optional[dict]:
+        obj = self.model.objects.filter(pk__in=self._normalize_ids([id])).first()
+        if obj is None:
+            return None
+        for name, value in data.items():
+            setattr(obj, name, value)
+        obj.save()
+        row = self._to_dict(obj)
+        self._remember([row])
+        return dict(row)
+
+    def delete(self, id: str) -> bool:
+        self._forget([id])
+        _, deleted = self.model.objects.filter(pk__in=self._normalize_ids([id])).delete()
+        return bool(deleted.get(self._label))
+
+    def upsert_many(self, rows: List[dict]) -> List[dict]:
+        """
+        Insert or update many rows in bulk.
+
+        Rows without a primary key, or with one that isn't stored yet, are
+        inserted and must be complete. Rows for stored keys update only the
+        keys present in the row, so they are grouped by key set and each
+        group is written with one UPDATE per batch. Bulk writes skip save()
+        and the model signals; subclasses make up for them in _bulk_written.
+
+        Returns:
+            The stored rows, in input order
+        """
+        data = []
+        for row in rows:
+            row = dict(row)
+            if 'pk' in row:
+                row[self._pk] = row.pop('pk')
+            data.append(row)
+
+        given = self._normalize_ids(row[self._pk] for row in data if row.get(self._pk) is not None)
+        existing = {
+            str(pk) for pk in self.model.objects.filter(pk__in=given).values_list('pk', flat=True)
+        } if given else set()
+
+        auto_now = [
+            field.attname for field in self.model._meta.concrete_fields
+            if getattr(field, 'auto_now', False)
+        ]
+        now = timezone.now()
+
+        objs = []
+        inserts = []
+        updates = defaultdict(list)
+        for row in data:
+            obj = self.model(**row)
+            objs.append(obj)
+            if str(obj.pk) not in existing:
+                inserts.append(obj)
+                continue
+            fields = tuple(sorted(set(row) - {self._pk}))
+            if fields:
+                for name in auto_now:
+                    if name not in fields:
+                        setattr(obj, name, now)
+                updates[fields].append(obj)
+
+        with transaction.atomic():
+            if inserts:
+                self.model.objects.bulk_create(inserts, batch_size=self.upsert_batch_size)
+            for fields, batch in updates.items():
+                self.model.objects.bulk_update(
+                    batch,
+                    list(fields) + [name for name in auto_now if name not in fields],
+                    batch_size=self.upsert_batch_size
+                )
+
+        ids = [str(obj.pk) for obj in objs]
+        self._forget(ids)
+        stored = self.get_many(ids)
+        result = [stored[id] for id in ids if id in stored]
+        self._bulk_written(result)
+        return result
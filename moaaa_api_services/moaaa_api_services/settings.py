@@ -10,8 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+import tempfile
 from pathlib import Path
 
+from moaaa_api_services.aws import default_profile
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -45,6 +49,9 @@ INSTALLED_APPS = [
     "support_agent",
     "browser_automation",
     
+    # Event-driven pipeline (upload -> classify -> extract -> status)
+    "pipeline",
+    
     # Django default apps
     'django.contrib.admin',
     'django.contrib.auth',
@@ -62,6 +69,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Per-request cache of rows loaded through the app repositories
+    'moaaa_api_services.identity_map.IdentityMapMiddleware',
 ]
 
 ROOT_URLCONF = 'moaaa_api_services.urls'
@@ -91,6 +100,14 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Take the write lock at BEGIN so concurrent pipeline workers wait
+            # for it instead of failing with "database is locked"
+            'transaction_mode': 'IMMEDIATE',
+        },
+        # Seconds a connection is reused across requests (Lambda keeps it
+        # for warm invocations with a positive value)
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 0)),
     }
 }
 
@@ -160,7 +177,168 @@ CORS_ALLOW_ALL_ORIGINS = True  # For development only
 # =============================================================================
 # AWS Settings
 # =============================================================================
-import os
-
-AWS_PROFILE = os.environ.get('AWS_PROFILE', 'moaaa_api_services')
+# None on Lambda: credentials come from the function's role (see moaaa_api_services.aws)
+AWS_PROFILE = default_profile()
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+
+
+# =============================================================================
+# Document Uploads
+# =============================================================================
+# 's3' issues real presigned URLs; 'local' uses a filesystem stand-in
+DOCUMENT_STORAGE_BACKEND = os.environ.get('DOCUMENT_STORAGE_BACKEND', 's3')
+DOCUMENT_STORAGE_LOCAL_ROOT = os.environ.get(
+    'DOCUMENT_STORAGE_LOCAL_ROOT', str(BASE_DIR / 'local_s3')
+)
+DOCUMENT_UPLOAD_BUCKET = os.environ.get('DOCUMENT_UPLOAD_BUCKET', 'moaaa-merchant-documents')
+DOCUMENT_UPLOAD_URL_EXPIRY_SECONDS = 900
+DOCUMENT_UPLOAD_MAX_BYTES = 100 * 1024 * 1024
+# Files above the threshold are uploaded as S3 multipart (parts must be >= 5 MB)
+DOCUMENT_UPLOAD_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+DOCUMENT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Local disk cache of the documents classification and extraction read,
+# revalidated with conditional GETs (If-None-Match); least recently used
+# documents are evicted above the size. Larger documents are memory-mapped
+# instead of read into memory. The size is per process: each process caches
+# in its own slot under DOCUMENT_CACHE_DIR, so the directory holds up to
+# DOCUMENT_CACHE_MAX_BYTES times the number of processes running at once
+DOCUMENT_CACHE_DIR = os.environ.get(
+    'DOCUMENT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'moaaa-document-cache')
+)
+DOCUMENT_CACHE_MAX_BYTES = int(os.environ.get('DOCUMENT_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+DOCUMENT_CACHE_MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Threads used to classify completed uploads in the background
+CLASSIFICATION_WORKER_THREADS = 4
+
+
+# =============================================================================
+# Document Extraction
+# =============================================================================
+# Documents extracted concurrently per batch request
+EXTRACTION_MAX_WORKERS = 8
+# Document types the fused classify-and-extract pipeline always runs as two passes
+EXTRACTION_TWO_PASS_DOCUMENT_TYPES = []
+
+
+# =============================================================================
+# Application Status
+# =============================================================================
+# Document types an application needs before it can be provisioned
+APPLICATION_REQUIRED_DOCUMENT_TYPES = ['BUSINESS_LICENSE', 'BANK_STATEMENT', 'VOIDED_CHECK']
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+# 'inprocess' hands events straight to this process's stage workers; 'outbox'
+# first records them in the publisher's transaction so none are lost
+# (document.classified always goes through the outbox); 'queue' writes them to
+# per-stage work queues consumed by `manage.py run_workers`
+PIPELINE_EVENT_BUS = os.environ.get('PIPELINE_EVENT_BUS', 'inprocess')
+# Worker threads per stage, i.e. the most handlers of a stage running at once
+PIPELINE_STAGE_CONCURRENCY = {
+    'classify': CLASSIFICATION_WORKER_THREADS,
+    'extract': 4,
+    'status': 2,
+}
+# Classifications not flagged for review and at least this confident are extracted
+PIPELINE_EXTRACTION_MIN_CONFIDENCE = 0.85
+
+# Transactional outbox relay. Sinks: 'local' delivers to this process's
+# stages, 'eventbridge' to PIPELINE_EVENTBRIDGE_BUS_NAME
+PIPELINE_OUTBOX_SINKS = ['local']
+# Run a relay thread in every process that records events; with False,
+# events wait for `manage.py relay_outbox` (set it to false on Lambda, which
+# freezes background threads between invocations)
+PIPELINE_OUTBOX_RELAY_IN_PROCESS = os.environ.get('PIPELINE_OUTBOX_RELAY_IN_PROCESS', 'true').lower() == 'true'
+# Events per publish, and the longest a ready event waits for its batch to fill
+PIPELINE_OUTBOX_BATCH_SIZE = 100
+PIPELINE_OUTBOX_LINGER_SECONDS = 0.2
+# A relay that dies mid-batch releases it after the lease
+PIPELINE_OUTBOX_LEASE_SECONDS = 300
+PIPELINE_OUTBOX_MAX_ATTEMPTS = 10
+PIPELINE_OUTBOX_RETRY_BACKOFF_SECONDS = 5
+PIPELINE_OUTBOX_POLL_SECONDS = 5
+PIPELINE_EVENTBRIDGE_BUS_NAME = os.environ.get('PIPELINE_EVENTBRIDGE_BUS_NAME', 'default')
+PIPELINE_EVENTBRIDGE_SOURCE = 'moaaa.onboarding'
+
+# `manage.py run_workers` (PIPELINE_EVENT_BUS = 'queue'): processes x threads
+# per node; a process is recycled above the memory limit or after max tasks
+PIPELINE_WORKER_PROCESSES = int(os.environ.get('PIPELINE_WORKER_PROCESSES', os.cpu_count() or 1))
+PIPELINE_WORKER_THREADS = int(os.environ.get('PIPELINE_WORKER_THREADS', 4))
+PIPELINE_WORKER_MAX_MEMORY_MB = 1024
+PIPELINE_WORKER_MAX_TASKS = 1000
+# How long a leased item is reserved before another worker may take it over
+PIPELINE_WORKER_LEASE_SECONDS = 600
+PIPELINE_WORKER_MAX_ATTEMPTS = 5
+PIPELINE_WORKER_RETRY_BACKOFF_SECONDS = 10
+PIPELINE_WORKER_POLL_SECONDS = 1
+
+
+# =============================================================================
+# Profile Cache
+# =============================================================================
+# Read-through cache of merchant/application lookups in the profile services.
+# LocalMemoryBackend is per process; DjangoCacheBackend ({'alias': ...}) shares
+# entries through one of the CACHES, e.g. Redis, across processes
+PROFILE_CACHE_BACKEND = 'moaaa_api_services.read_through_cache.LocalMemoryBackend'
+PROFILE_CACHE_OPTIONS = {'max_entries': 10000}
+PROFILE_CACHE_TTL_SECONDS = 300
+
+
+# =============================================================================
+# Support Agent
+# =============================================================================
+# Tokens of recent conversation sent verbatim; older turns are summarized
+SUPPORT_CONTEXT_TOKEN_BUDGET = 2000
+# Onboarding policy the agent answers general questions from; changing it
+# invalidates the semantic cache
+SUPPORT_POLICY_TEXT = os.environ.get('SUPPORT_POLICY_TEXT', '')
+
+# Semantic cache of answers to general questions
+SUPPORT_CACHE_ENABLED = True
+SUPPORT_CACHE_PATH = os.environ.get(
+    'SUPPORT_CACHE_PATH', str(BASE_DIR / 'cache' / 'support_semantic_cache.npz')
+)
+# Minimum cosine similarity between questions for a cache hit
+SUPPORT_CACHE_SIMILARITY_THRESHOLD = 0.92
+SUPPORT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+SUPPORT_CACHE_MAX_ENTRIES = 5000
+
+
+# =============================================================================
+# Browser Automation
+# =============================================================================
+# Portals merchants are provisioned into: driver class, its options and the
+# number of concurrent browser sessions kept for it, which is also the most
+# this process will ever run against the portal at once
+PROVISIONING_PORTALS = {
+    'standin': {
+        'driver': 'browser_automation.ai_ml.implementations.standin_portal.StandinPortal',
+        'options': {
+            'base_url': os.environ.get('PORTAL_STANDIN_URL', 'http://127.0.0.1:8765'),
+            'username': 'automation',
+            'password': 'automation',
+        },
+        'pool_size': 2,
+    },
+}
+# Browser sessions are recycled after this many tasks
+BROWSER_MAX_TASKS_PER_SESSION = 50
+BROWSER_HEALTH_CHECK_INTERVAL_SECONDS = 60
+BROWSER_TIMEOUT_SECONDS = 60
+BROWSER_HEADLESS = True
+# Merchants provisioned back to back on one session before it is handed
+# back to the pool
+PROVISIONING_SESSION_BATCH_SIZE = 10
+
+# =============================================================================
+# Startup
+# =============================================================================
+# `manage.py check_import_time`: startup imports (django.setup() plus the
+# URLconf) must stay under the budget and must not load these modules, which
+# the AI/ML and AWS implementations import on first use
+IMPORT_TIME_BUDGET_MS = 1000
+IMPORT_TIME_DEFERRED_MODULES = ['boto3', 'botocore', 'numpy', 'pypdf']
@@ -13,6 +13,11 @@ def api_root(request):
         'endpoints': {
             'admin': '/admin/',
             'classification': '/api/classification/',
+            'extraction': '/api/extraction/',
+            'merchants': '/api/merchants/',
+            'applications': '/api/applications/',
+            'support': '/api/support/',
+            'browser': '/api/browser/',
         }
     })
 
@@ -21,4 +26,9 @@ urlpatterns = [
     path('', api_root, name='api-root'),
     path('admin/', admin.site.urls),
     path('api/classification/', include('document_classification.api.urls')),
+    path('api/extraction/', include('document_extraction.api.urls')),
+    path('api/merchants/', include('merchant_profile.api.urls')),
+    path('api/applications/', include('application_profile.api.urls')),
+    path('api/support/', include('support_agent.api.urls')),
+    path('api/browser/', include('browser_automation.api.urls')),
 ]
@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import OutboxEvent, WorkItem
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'event_type', 'status', 'attempts', 'occurred_at', 'published_at']
+    list_filter = ['status', 'event_type']
+    search_fields = ['=id']
+    readonly_fields = ['id', 'occurred_at', 'published_at', 'lease_token']
+
+
+@admin.register(WorkItem)
+class WorkItemAdmin(admin.ModelAdmin):
+    list_display = ['id', 'queue', 'event_type', 'status', 'attempts', 'worker', 'created_at', 'completed_at']
+    list_filter = ['queue', 'status', 'event_type']
+    search_fields = ['=id', '=event_id']
+    readonly_fields = ['id', 'event_id', 'created_at', 'updated_at', 'completed_at']
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class PipelineConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'pipeline'
+
+    def ready(self):
+        # Subscribe the classify -> extract -> status stages
+        from .bus import get_event_bus
+        from .stages import register_stages
+        register_stages(get_event_bus())
@@ -0,0 +1,28 @@
+from django.conf import settings
+
+from .interfaces import IEventBus
+from .implementations import InProcessEventBus, OutboxEventBus, WorkQueueEventBus
+
+_bus = None
+
+
+def get_event_bus() -> IEventBus:
+    """Return the configured event bus (created once per process)."""
+    global _bus
+    if _bus is None:
+        if settings.PIPELINE_EVENT_BUS == 'outbox':
+            _bus = OutboxEventBus(stage_concurrency=settings.PIPELINE_STAGE_CONCURRENCY)
+        elif settings.PIPELINE_EVENT_BUS == 'queue':
+            _bus = WorkQueueEventBus(stage_concurrency=settings.PIPELINE_STAGE_CONCURRENCY)
+        else:
+            _bus = InProcessEventBus(stage_concurrency=settings.PIPELINE_STAGE_CONCURRENCY)
+    return _bus
+
+
+__all__ = [
+    'IEventBus',
+    'InProcessEventBus',
+    'OutboxEventBus',
+    'WorkQueueEventBus',
+    'get_event_bus'
+]
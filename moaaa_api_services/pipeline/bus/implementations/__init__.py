@@ -0,0 +1,5 @@
+from .in_process_event_bus import InProcessEventBus
+from .outbox_event_bus import OutboxEventBus
+from .work_queue_event_bus import WorkQueueEventBus
+
+__all__ = ['InProcessEventBus', 'OutboxEventBus', 'WorkQueueEventBus']
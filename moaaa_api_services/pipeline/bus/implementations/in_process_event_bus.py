@@ -0,0 +1,108 @@
+import logging
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from django.db import close_old_connections, transaction
+
+from ..interfaces import IEventBus
+from ...events import Event
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessEventBus(IEventBus):
+    """
+    Delivers events to subscribers in this process.
+
+    Every stage has its own thread pool sized from `stage_concurrency`, so
+    at most that many handlers of a stage run at once and a slow stage
+    queues its own backlog without holding up the others. Events are lost
+    if the process exits before they are handled; use OutboxEventBus where
+    that matters.
+    """
+
+    def __init__(self, stage_concurrency: Optional[Dict[str, int]] = None, default_concurrency: int = 2):
+        """
+        Args:
+            stage_concurrency: Worker threads per stage name
+            default_concurrency: Worker threads for stages not listed
+        """
+        self.stage_concurrency = dict(stage_concurrency or {})
+        self.default_concurrency = default_concurrency
+
+        self._subscriptions: Dict[str, list] = defaultdict(list)
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._counters: Dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: str, stage: str, handler: Callable[[Event], None]) -> None:
+        with self._lock:
+            self._subscriptions[event_type].append((stage, handler))
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Event:
+        event = Event(type=event_type, payload=payload)
+        transaction.on_commit(lambda: self.dispatch(event))
+        return event
+
+    def dispatch(self, event: Event) -> List[Future]:
+        """Queue an event on the workers of every stage subscribed to it."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.type, []))
+            for stage, _ in subscriptions:
+                self._counters[stage]['submitted'] += 1
+        return [
+            self._executor(stage).submit(self._run, stage, handler, event)
+            for stage, handler in subscriptions
+        ]
+
+    def _executor(self, stage: str) -> ThreadPoolExecutor:
+        with self._lock:
+            if stage not in self._executors:
+                self._executors[stage] = ThreadPoolExecutor(
+                    max_workers=self.stage_concurrency.get(stage, self.default_concurrency),
+                    thread_name_prefix=f'pipeline-{stage}'
+                )
+            return self._executors[stage]
+
+    def _count(self, stage: str, counter: str, delta: int = 1) -> None:
+        with self._lock:
+            self._counters[stage][counter] += delta
+
+    def _run(self, stage: str, handler: Callable[[Event], None], event: Event) -> None:
+        self._count(stage, 'running')
+        close_old_connections()
+        try:
+            handler(event)
+        except Exception:
+            logger.exception("Stage %s failed on %s event %s", stage, event.type, event.id)
+            self._count(stage, 'failed')
+            raise
+        else:
+            self._count(stage, 'succeeded')
+        finally:
+            self._count(stage, 'running', -1)
+            close_old_connections()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {}
+            for stage, counters in self._counters.items():
+                finished = counters['succeeded'] + counters['failed']
+                stages[stage] = {
+                    'concurrency': self.stage_concurrency.get(stage, self.default_concurrency),
+                    'queued': counters['submitted'] - finished - counters['running'],
+                    'running': counters['running'],
+                    'succeeded': counters['succeeded'],
+                    'failed': counters['failed'],
+                }
+            return {'bus': type(self).__name__, 'stages': stages}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the stage workers, by default after the queued events are handled."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
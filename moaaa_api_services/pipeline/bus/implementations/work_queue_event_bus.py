@@ -0,0 +1,53 @@
+from typing import Any, Dict, List
+
+from django.db.models import Count
+
+from .in_process_event_bus import InProcessEventBus
+from ...events import Event
+from ...models import WorkItem
+from ... import work_queue
+
+
+class WorkQueueEventBus(InProcessEventBus):
+    """
+    Turns every event into one WorkItem per subscribed stage, written in
+    the publisher's transaction; the stages run in `manage.py run_workers`
+    processes, on any number of nodes, instead of in the publisher.
+    """
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Event:
+        event = Event(type=event_type, payload=payload)
+        self.dispatch(event)
+        return event
+
+    def dispatch(self, event: Event) -> List:
+        """Queue the event for its stages; once queued it is durable, so there is nothing to wait for."""
+        with self._lock:
+            stages = [stage for stage, _ in self._subscriptions.get(event.type, [])]
+        work_queue.enqueue(event, stages)
+        return []
+
+    def stages(self) -> List[str]:
+        """Names of the subscribed stages, i.e. the queues workers can consume."""
+        with self._lock:
+            return sorted({stage for subscriptions in self._subscriptions.values() for stage, _ in subscriptions})
+
+    def handle(self, item: WorkItem) -> None:
+        """Run the stage handler for a leased item (raises if the handler fails)."""
+        with self._lock:
+            handlers = [
+                handler for stage, handler in self._subscriptions.get(item.event_type, [])
+                if stage == item.queue
+            ]
+            self._counters[item.queue]['submitted'] += len(handlers)
+        event = item.to_event()
+        for handler in handlers:
+            self._run(item.queue, handler, event)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        queues = {}
+        for row in WorkItem.objects.values('queue', 'status').annotate(count=Count('id')):
+            queues.setdefault(row['queue'], {})[row['status']] = row['count']
+        stats['queues'] = queues
+        return stats
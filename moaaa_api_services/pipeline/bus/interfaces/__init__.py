@@ -0,0 +1,3 @@
+from .event_bus import IEventBus
+
+__all__ = ['IEventBus']
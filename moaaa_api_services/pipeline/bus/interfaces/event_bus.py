@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
+
+from ...events import Event
+
+
+class IEventBus(ABC):
+    """Abstract interface for the pipeline's event bus (in-process, DB outbox, later EventBridge)."""
+
+    @abstractmethod
+    def subscribe(self, event_type: str, stage: str, handler: Callable[[Event], None]) -> None:
+        """Run handler on the given stage's workers for every event of a type."""
+        pass
+
+    @abstractmethod
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Event:
+        """
+        Publish an event. Subscribers get it once the current transaction
+        commits (right away in autocommit mode); nothing is delivered if it
+        rolls back.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Per-stage counters for this process."""
+        pass
@@ -0,0 +1,46 @@
+"""
+Events passed between the onboarding pipeline's stages.
+
+    document.uploaded   -> classify stage
+    document.classified -> extract stage (high-confidence results only)
+    document.extracted  -> status stage
+"""
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict
+import uuid
+
+from django.utils import timezone
+
+DOCUMENT_UPLOADED = 'document.uploaded'
+DOCUMENT_CLASSIFIED = 'document.classified'
+DOCUMENT_EXTRACTED = 'document.extracted'
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    An event as published on the bus.
+
+    Shaped like an EventBridge entry: `type` maps to DetailType and
+    `payload` to Detail. `id` is unique per publish and lets consumers
+    drop redeliveries.
+    """
+
+    type: str
+    payload: Dict[str, Any]
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    occurred_at: str = field(default_factory=lambda: timezone.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def document_classified(result) -> Dict[str, Any]:
+    """Payload of the document.classified event for a ClassificationResult."""
+    return {
+        'result_id': str(result.id),
+        'application_id': result.application_ref,
+        'document_type': result.document_type,
+        'confidence_score': result.confidence_score,
+        'requires_review': result.requires_review,
+    }
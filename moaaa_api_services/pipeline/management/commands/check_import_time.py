@@ -0,0 +1,82 @@
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a worker or a cold-started API process imports before serving: the
+# apps (models, ready() hooks) and the URLconf with every view
+STARTUP_CODE = (
+    'import django; django.setup(); '
+    'from django.urls import get_resolver; get_resolver().url_patterns'
+)
+
+# import time:  self [us] | cumulative | imported package
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def measure_startup() -> dict:
+    """
+    Import a fresh interpreter's startup under `python -X importtime`.
+
+    Returns:
+        {'total_ms': float, 'top_level': {name: cumulative ms}, 'modules': {name: cumulative ms}}
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_CODE],
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)}
+    )
+    if completed.returncode != 0:
+        raise CommandError(f'Startup failed:\n{completed.stderr[-2000:]}')
+
+    top_level = {}
+    modules = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules[name] = cumulative_us / 1000
+        # Top-level imports include their children
+        if indent == 1:
+            top_level[name] = cumulative_us / 1000
+    return {'total_ms': sum(top_level.values()), 'top_level': top_level, 'modules': modules}
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure startup import time (django.setup() plus the URLconf) in a fresh interpreter and '
+        'fail if it is over IMPORT_TIME_BUDGET_MS or imports a module in IMPORT_TIME_DEFERRED_MODULES.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget-ms', type=float, default=settings.IMPORT_TIME_BUDGET_MS,
+                            help='Most milliseconds startup imports may take')
+        parser.add_argument('--repeat', type=int, default=3,
+                            help='Runs to measure; the fastest counts (the others include disk cache misses)')
+        parser.add_argument('--top', type=int, default=15, help='Slowest top-level imports to list')
+
+    def handle(self, *args, **options):
+        runs = [measure_startup() for _ in range(max(1, options['repeat']))]
+        best = min(runs, key=lambda run: run['total_ms'])
+
+        self.stdout.write(f"Startup imports: {best['total_ms']:.0f} ms (budget {options['budget_ms']:.0f} ms)")
+        for name, ms in sorted(best['top_level'].items(), key=lambda item: -item[1])[:options['top']]:
+            self.stdout.write(f'  {ms:8.1f} ms  {name}')
+
+        problems = []
+        deferred = [
+            name for name in settings.IMPORT_TIME_DEFERRED_MODULES
+            if any(module == name or module.startswith(f'{name}.') for run in runs for module in run['modules'])
+        ]
+        if deferred:
+            problems.append(f"imported at startup, should load on first use: {', '.join(deferred)}")
+        if best['total_ms'] > options['budget_ms']:
+            problems.append(f"{best['total_ms']:.0f} ms is over the {options['budget_ms']:.0f} ms budget")
+        if problems:
+            raise CommandError('; '.join(problems))
+        self.stdout.write(self.style.SUCCESS('Startup imports are within budget'))
@@ -0,0 +1,41 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from pipeline.outbox import build_outbox_relay
+
+
+class Command(BaseCommand):
+    help = (
+        'Publish pending outbox events to the configured sinks (PIPELINE_OUTBOX_SINKS) '
+        'until stopped. Safe to run alongside other relays.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Events per publish')
+        parser.add_argument('--linger', type=float, help='Seconds a ready event waits for its batch to fill')
+        parser.add_argument('--once', action='store_true', help='Publish what is ready now, then exit')
+
+    def handle(self, *args, **options):
+        overrides = {}
+        if options['batch_size']:
+            overrides['batch_size'] = options['batch_size']
+        if options['linger'] is not None:
+            overrides['linger_seconds'] = options['linger']
+        relay = build_outbox_relay(**overrides)
+
+        if options['once']:
+            published = 0
+            while True:
+                count = relay.run_once()
+                published += count
+                if count < relay.batch_size:
+                    break
+            self.stdout.write(self.style.SUCCESS(f'Published {published} events'))
+            return
+
+        # Finish the batch in flight on SIGTERM / Ctrl+C
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: relay.stop())
+        self.stdout.write(f'Relaying outbox events to {len(relay.sinks)} sink(s) (Ctrl+C to stop)')
+        relay.run()
@@ -0,0 +1,65 @@
+import signal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pipeline.bus import WorkQueueEventBus, get_event_bus
+from pipeline.workers import WorkerOptions, WorkerSupervisor
+
+
+class Command(BaseCommand):
+    help = (
+        'Run pipeline stages from the work queues (PIPELINE_EVENT_BUS = "queue") in N processes '
+        'x M threads until stopped. Safe to run on any number of nodes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=settings.PIPELINE_WORKER_PROCESSES,
+                            help='Worker processes')
+        parser.add_argument('--threads', type=int, default=settings.PIPELINE_WORKER_THREADS,
+                            help='Worker threads per process')
+        parser.add_argument('--queues', nargs='+', help='Stages to consume (default: all)')
+        parser.add_argument('--max-memory-mb', type=int, default=settings.PIPELINE_WORKER_MAX_MEMORY_MB,
+                            help='Recycle a process above this resident memory (0 = no limit)')
+        parser.add_argument('--max-tasks', type=int, default=settings.PIPELINE_WORKER_MAX_TASKS,
+                            help='Recycle a process after this many items (0 = no limit)')
+        parser.add_argument('--shutdown-timeout', type=float, default=60,
+                            help='Seconds to wait for items in flight on shutdown')
+
+    def handle(self, *args, **options):
+        bus = get_event_bus()
+        if not isinstance(bus, WorkQueueEventBus):
+            raise CommandError(f"PIPELINE_EVENT_BUS is '{settings.PIPELINE_EVENT_BUS}'; workers need 'queue'")
+
+        stages = bus.stages()
+        queues = options['queues'] or stages
+        unknown = set(queues) - set(stages)
+        if unknown:
+            raise CommandError(f"Unknown queues: {', '.join(sorted(unknown))} (stages: {', '.join(stages)})")
+        if options['processes'] < 1 or options['threads'] < 1:
+            raise CommandError('--processes and --threads must be at least 1')
+
+        supervisor = WorkerSupervisor(
+            processes=options['processes'],
+            options=WorkerOptions(
+                queues=queues,
+                threads=options['threads'],
+                max_memory_mb=options['max_memory_mb'],
+                max_tasks=options['max_tasks'],
+                lease_seconds=settings.PIPELINE_WORKER_LEASE_SECONDS,
+                max_attempts=settings.PIPELINE_WORKER_MAX_ATTEMPTS,
+                retry_backoff_seconds=settings.PIPELINE_WORKER_RETRY_BACKOFF_SECONDS,
+                poll_seconds=settings.PIPELINE_WORKER_POLL_SECONDS,
+            ),
+            shutdown_timeout=options['shutdown_timeout'],
+            log=self.stdout.write
+        )
+
+        # Stop claiming, finish the items in flight on SIGTERM / Ctrl+C
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: supervisor.stop())
+        self.stdout.write(
+            f"Running {options['processes']} x {options['threads']} workers on {', '.join(queues)} "
+            f"(Ctrl+C to stop)"
+        )
+        supervisor.run()
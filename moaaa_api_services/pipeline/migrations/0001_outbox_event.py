@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:36
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('event_type', models.CharField(max_length=100)),
+                ('payload', models.JSONField(default=dict)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('DISPATCHED', 'Dispatched'), ('DELIVERED', 'Delivered'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('error_message', models.TextField(blank=True)),
+                ('occurred_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('delivered_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'pipeline_outbox_event',
+                'ordering': ['occurred_at'],
+                'indexes': [models.Index(fields=['status', 'occurred_at'], name='outbox_event_status_idx')],
+            },
+        ),
+    ]
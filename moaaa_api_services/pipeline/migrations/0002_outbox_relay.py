@@ -0,0 +1,53 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    OutboxEvent = apps.get_model('pipeline', 'OutboxEvent')
+    OutboxEvent.objects.filter(status='DELIVERED').update(status='PUBLISHED')
+    # Dispatched but never confirmed: let the relay deliver them again
+    OutboxEvent.objects.filter(status='DISPATCHED').update(status='PENDING')
+
+
+def backwards(apps, schema_editor):
+    OutboxEvent = apps.get_model('pipeline', 'OutboxEvent')
+    OutboxEvent.objects.filter(status='PUBLISHED').update(status='DELIVERED')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pipeline', '0001_outbox_event'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='outboxevent',
+            name='outbox_event_status_idx',
+        ),
+        migrations.RenameField(
+            model_name='outboxevent',
+            old_name='delivered_at',
+            new_name='published_at',
+        ),
+        migrations.AddField(
+            model_name='outboxevent',
+            name='available_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='outboxevent',
+            name='lease_token',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='outboxevent',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('PUBLISHED', 'Published'), ('FAILED', 'Failed')], default='PENDING', max_length=20),
+        ),
+        migrations.RunPython(forwards, backwards),
+        migrations.AddIndex(
+            model_name='outboxevent',
+            index=models.Index(fields=['status', 'available_at'], name='outbox_event_available_idx'),
+        ),
+    ]
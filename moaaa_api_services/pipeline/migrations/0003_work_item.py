@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:44
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pipeline', '0002_outbox_relay'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkItem',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('queue', models.CharField(max_length=50)),
+                ('event_id', models.UUIDField()),
+                ('event_type', models.CharField(max_length=100)),
+                ('payload', models.JSONField(default=dict)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('IN_PROGRESS', 'In Progress'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('worker', models.CharField(blank=True, max_length=255)),
+                ('error_message', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'pipeline_work_item',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['queue', 'status', 'available_at'], name='work_item_claim_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event_id', 'queue'), name='work_item_event_queue_uniq')],
+            },
+        ),
+    ]
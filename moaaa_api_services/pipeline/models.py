@@ -0,0 +1,134 @@
+from django.db import models
+from django.utils import timezone
+import uuid
+
+from .events import Event
+
+
+class OutboxEvent(models.Model):
+    """
+    An event recorded in the publisher's transaction, awaiting the relay.
+
+    The row commits or rolls back together with the writes the event
+    describes, so consumers never see an event for data that doesn't
+    exist and no committed change goes unannounced. The relay (outbox.py)
+    publishes rows at least once; the row ID is the event's dedup ID.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        PUBLISHED = 'PUBLISHED', 'Published'
+        FAILED = 'FAILED', 'Failed'
+
+    # The event ID
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    attempts = models.IntegerField(default=0)
+    # Earliest time the relay may claim the row: pushed forward while a
+    # relay holds its lease, and by the backoff after a failed attempt
+    available_at = models.DateTimeField(default=timezone.now)
+    # Set by the relay holding the lease
+    lease_token = models.UUIDField(null=True, blank=True)
+
+    # Error tracking
+    error_message = models.TextField(blank=True)
+
+    # Timestamps
+    occurred_at = models.DateTimeField(default=timezone.now)
+    published_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'pipeline_outbox_event'
+        ordering = ['occurred_at']
+        indexes = [
+            # Claimable events, oldest first
+            models.Index(fields=['status', 'available_at'], name='outbox_event_available_idx'),
+        ]
+
+    def __str__(self):
+        return f"OutboxEvent({self.event_type}) - {self.status}"
+
+    def to_event(self) -> Event:
+        return Event(
+            type=self.event_type,
+            payload=self.payload,
+            id=str(self.id),
+            occurred_at=self.occurred_at.isoformat()
+        )
+
+
+class WorkItem(models.Model):
+    """
+    One event for one stage, queued for the `run_workers` processes.
+
+    Written by the work-queue bus in the publisher's transaction. A worker
+    leases the item by setting it IN_PROGRESS with `available_at` at the
+    lease expiry; an item whose worker died becomes claimable again once
+    that passes.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        IN_PROGRESS = 'IN_PROGRESS', 'In Progress'
+        DONE = 'DONE', 'Done'
+        FAILED = 'FAILED', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Stage that handles the item
+    queue = models.CharField(max_length=50)
+
+    # The event
+    event_id = models.UUIDField()
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    attempts = models.IntegerField(default=0)
+    # Earliest time a worker may claim the item (lease expiry while IN_PROGRESS)
+    available_at = models.DateTimeField(default=timezone.now)
+    # host:pid:thread of the worker holding the lease
+    worker = models.CharField(max_length=255, blank=True)
+
+    # Error tracking
+    error_message = models.TextField(blank=True)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'pipeline_work_item'
+        ordering = ['created_at']
+        constraints = [
+            # A redelivered event is queued once per stage
+            models.UniqueConstraint(fields=['event_id', 'queue'], name='work_item_event_queue_uniq'),
+        ]
+        indexes = [
+            # Claimable items of a queue, oldest first
+            models.Index(fields=['queue', 'status', 'available_at'], name='work_item_claim_idx'),
+        ]
+
+    def __str__(self):
+        return f"WorkItem({self.queue}, {self.event_type}) - {self.status}"
+
+    def to_event(self) -> Event:
+        return Event(
+            type=self.event_type,
+            payload=self.payload,
+            id=str(self.event_id),
+            occurred_at=self.created_at.isoformat()
+        )
@@ -0,0 +1,237 @@
+"""
+Transactional outbox.
+
+record_event() writes an event to the outbox table inside the caller's
+transaction. The relay then publishes pending rows to the configured sinks
+in batches:
+
+- A batch is sent once PIPELINE_OUTBOX_BATCH_SIZE events are ready or the
+  oldest ready event has waited PIPELINE_OUTBOX_LINGER_SECONDS, trading a
+  little latency for fewer, larger publishes.
+- Rows are claimed with a lease instead of being marked sent up front. A
+  relay that dies mid-batch leaves them to be claimed again once the lease
+  expires, so every event is published at least once; consumers drop
+  repeats by event ID.
+- Events a sink rejects are retried with exponential backoff and marked
+  FAILED after PIPELINE_OUTBOX_MAX_ATTEMPTS.
+
+With several sinks, an event one sink rejects is sent to all of them again.
+"""
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, models, transaction
+from django.utils import timezone
+
+from .events import Event
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+_relay = None
+_relay_lock = threading.Lock()
+
+
+def record_event(event_type: str, payload: Dict[str, Any]) -> Event:
+    """
+    Write an event to the outbox in the current transaction.
+
+    Call it inside the transaction that saves the data the event describes:
+    the event is published only if that transaction commits.
+
+    Returns:
+        The recorded event
+    """
+    event = Event(type=event_type, payload=payload)
+    OutboxEvent.objects.create(id=event.id, event_type=event.type, payload=event.payload)
+    if settings.PIPELINE_OUTBOX_RELAY_IN_PROCESS:
+        transaction.on_commit(lambda: get_outbox_relay().kick())
+    return event
+
+
+class OutboxRelay:
+    """Publishes pending outbox events to sinks, in batches, at least once."""
+
+    def __init__(self, sinks: list, batch_size: int = 100, linger_seconds: float = 0.2,
+                 lease_seconds: float = 300, max_attempts: int = 10,
+                 retry_backoff_seconds: float = 5, poll_seconds: float = 5):
+        """
+        Args:
+            sinks: IEventSink instances every event is published to
+            batch_size: Most events claimed and published at once
+            linger_seconds: Longest a ready event waits for its batch to fill
+            lease_seconds: How long a claimed batch is reserved for this relay
+            max_attempts: Attempts before an event is marked FAILED
+            retry_backoff_seconds: Delay before the first retry (doubled per attempt)
+            poll_seconds: Check interval when idle, for events from other processes
+        """
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.linger_seconds = linger_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.poll_seconds = poll_seconds
+
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _claim(self) -> List[OutboxEvent]:
+        """Lease up to batch_size ready events, oldest first."""
+        now = timezone.now()
+        ready = OutboxEvent.objects.filter(status=OutboxEvent.Status.PENDING, available_at__lte=now)
+        ids = list(ready.order_by('available_at').values_list('pk', flat=True)[:self.batch_size])
+        if not ids:
+            return []
+
+        # Rows another relay leased since the SELECT no longer match
+        token = uuid.uuid4()
+        ready.filter(pk__in=ids).update(
+            lease_token=token,
+            available_at=now + timedelta(seconds=self.lease_seconds),
+            attempts=models.F('attempts') + 1
+        )
+        return list(OutboxEvent.objects.filter(pk__in=ids, lease_token=token).order_by('occurred_at'))
+
+    def run_once(self) -> int:
+        """
+        Claim and publish one batch.
+
+        Returns:
+            Number of events published
+        """
+        rows = self._claim()
+        if not rows:
+            return 0
+
+        events = [row.to_event() for row in rows]
+        errors = {}
+        for sink in self.sinks:
+            try:
+                errors.update(sink.publish(events))
+            except Exception as e:
+                logger.exception("Outbox sink %s failed", type(sink).__name__)
+                errors.update((event.id, f'{e.__class__.__name__}: {e}') for event in events)
+
+        now = timezone.now()
+        token = rows[0].lease_token
+        published = [row.pk for row in rows if str(row.pk) not in errors]
+        OutboxEvent.objects.filter(pk__in=published, lease_token=token).update(
+            status=OutboxEvent.Status.PUBLISHED,
+            lease_token=None,
+            error_message='',
+            published_at=now
+        )
+
+        # Failed rows, grouped by what gets written back
+        retries = defaultdict(list)
+        for row in rows:
+            error = errors.get(str(row.pk))
+            if error is None:
+                continue
+            if row.attempts >= self.max_attempts:
+                retries[(OutboxEvent.Status.FAILED, now, error)].append(row.pk)
+                logger.error("Outbox event %s failed %d times: %s", row.pk, row.attempts, error)
+            else:
+                delay = self.retry_backoff_seconds * 2 ** (row.attempts - 1)
+                retries[(OutboxEvent.Status.PENDING, now + timedelta(seconds=delay), error)].append(row.pk)
+        for (status, available_at, error), ids in retries.items():
+            OutboxEvent.objects.filter(pk__in=ids, lease_token=token).update(
+                status=status,
+                lease_token=None,
+                available_at=available_at,
+                error_message=error
+            )
+        return len(published)
+
+    def _wait_for_batch(self) -> bool:
+        """
+        Wait until a batch is due: full, or its oldest event has lingered
+        long enough. False if the relay was stopped meanwhile.
+        """
+        while not self._stop.is_set():
+            now = timezone.now()
+            ready = list(
+                OutboxEvent.objects
+                .filter(status=OutboxEvent.Status.PENDING, available_at__lte=now)
+                .order_by('available_at')
+                .values_list('available_at', flat=True)[:self.batch_size]
+            )
+            if ready:
+                lingered = (now - ready[0]).total_seconds()
+                if len(ready) >= self.batch_size or lingered >= self.linger_seconds:
+                    return True
+                timeout = self.linger_seconds - lingered
+            else:
+                timeout = self.poll_seconds
+            # Woken early by kick() when new events commit in this process
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+        return False
+
+    def run(self) -> None:
+        """Publish batches until stop() is called."""
+        while True:
+            close_old_connections()
+            try:
+                if not self._wait_for_batch():
+                    return
+                # Keep going while batches come back full
+                while self.run_once() >= self.batch_size and not self._stop.is_set():
+                    pass
+            except Exception:
+                logger.exception("Outbox relay iteration failed")
+                self._stop.wait(self.poll_seconds)
+            finally:
+                close_old_connections()
+
+    def kick(self) -> None:
+        """Note that events were committed, starting the relay thread if needed."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self.run, name='pipeline-outbox-relay', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop after the batch in flight, waiting up to timeout for it."""
+        self._stop.set()
+        self._wakeup.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+def build_outbox_relay(**overrides) -> OutboxRelay:
+    """Relay configured from the PIPELINE_OUTBOX_* settings."""
+    from .sinks import get_outbox_sinks
+
+    options = {
+        'sinks': get_outbox_sinks(),
+        'batch_size': settings.PIPELINE_OUTBOX_BATCH_SIZE,
+        'linger_seconds': settings.PIPELINE_OUTBOX_LINGER_SECONDS,
+        'lease_seconds': settings.PIPELINE_OUTBOX_LEASE_SECONDS,
+        'max_attempts': settings.PIPELINE_OUTBOX_MAX_ATTEMPTS,
+        'retry_backoff_seconds': settings.PIPELINE_OUTBOX_RETRY_BACKOFF_SECONDS,
+        'poll_seconds': settings.PIPELINE_OUTBOX_POLL_SECONDS,
+    }
+    options.update(overrides)
+    return OutboxRelay(**options)
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """The relay kicked by record_event in this process (created once per process)."""
+    global _relay
+    with _relay_lock:
+        if _relay is None:
+            _relay = build_outbox_relay()
+        return _relay
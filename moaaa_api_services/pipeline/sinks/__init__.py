@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING, List
+
+from django.conf import settings
+
+from moaaa_api_services.lazy_imports import lazy_exports
+from .interfaces import IEventSink
+from .implementations import LocalEventSink
+
+if TYPE_CHECKING:
+    from .implementations import EventBridgeEventSink
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EventBridgeEventSink': '.implementations',
+})
+
+
+def get_outbox_sinks() -> List[IEventSink]:
+    """Sinks named in PIPELINE_OUTBOX_SINKS ('local' and/or 'eventbridge')."""
+    from ..bus import get_event_bus
+
+    sinks = []
+    for name in settings.PIPELINE_OUTBOX_SINKS:
+        if name == 'local':
+            sinks.append(LocalEventSink(bus=get_event_bus()))
+        elif name == 'eventbridge':
+            from .implementations import EventBridgeEventSink
+            sinks.append(EventBridgeEventSink(
+                event_bus_name=settings.PIPELINE_EVENTBRIDGE_BUS_NAME,
+                source=settings.PIPELINE_EVENTBRIDGE_SOURCE,
+                profile_name=settings.AWS_PROFILE,
+                region=settings.AWS_REGION
+            ))
+        else:
+            raise ValueError(f"Unknown outbox sink '{name}'")
+    return sinks
+
+
+__all__ = [
+    'IEventSink',
+    'LocalEventSink',
+    'EventBridgeEventSink',
+    'get_outbox_sinks'
+]
@@ -0,0 +1,14 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+from .local_event_sink import LocalEventSink
+
+if TYPE_CHECKING:
+    from .eventbridge_event_sink import EventBridgeEventSink
+
+# boto3 loads with the EventBridge sink, on first use
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EventBridgeEventSink': '.eventbridge_event_sink',
+})
+
+__all__ = ['LocalEventSink', 'EventBridgeEventSink']
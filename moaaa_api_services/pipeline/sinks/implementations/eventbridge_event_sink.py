@@ -0,0 +1,66 @@
+import json
+import os
+from typing import Dict, List
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from moaaa_api_services.aws import default_profile
+from ..interfaces.event_sink import IEventSink
+from ...events import Event
+
+
+class EventBridgeEventSink(IEventSink):
+    """
+    Publishes events to an Amazon EventBridge bus.
+
+    The event type becomes the entry's DetailType and the whole event
+    (including its `id`) its Detail, so rules can match on either and
+    consumers can drop redeliveries by ID.
+    """
+
+    # PutEvents accepts at most 10 entries per call
+    MAX_ENTRIES_PER_CALL = 10
+
+    def __init__(self, event_bus_name: str = 'default', source: str = 'moaaa.onboarding',
+                 profile_name: str = None, region: str = None):
+        """
+        Initialize the EventBridge sink.
+
+        Args:
+            event_bus_name: Target event bus name or ARN
+            source: Source of every entry
+            profile_name: AWS profile name (default: moaaa_api_services)
+            region: AWS region (default: from profile or us-east-1)
+        """
+        self.event_bus_name = event_bus_name
+        self.source = source
+        self.profile_name = profile_name or default_profile()
+        self.region = region or os.environ.get('AWS_REGION', 'us-east-1')
+
+        self.session = boto3.Session(profile_name=self.profile_name)
+        self.client = self.session.client('events', region_name=self.region)
+
+    def publish(self, events: List[Event]) -> Dict[str, str]:
+        failed = {}
+        for start in range(0, len(events), self.MAX_ENTRIES_PER_CALL):
+            chunk = events[start:start + self.MAX_ENTRIES_PER_CALL]
+            try:
+                response = self.client.put_events(Entries=[
+                    {
+                        'Source': self.source,
+                        'DetailType': event.type,
+                        'Detail': json.dumps(event.to_dict()),
+                        'EventBusName': self.event_bus_name,
+                    }
+                    for event in chunk
+                ])
+            except (BotoCoreError, ClientError) as e:
+                failed.update((event.id, f'{e.__class__.__name__}: {e}') for event in chunk)
+                continue
+
+            # Entries come back in request order; failed ones carry an ErrorCode
+            for event, entry in zip(chunk, response['Entries']):
+                if entry.get('ErrorCode'):
+                    failed[event.id] = f"{entry['ErrorCode']}: {entry.get('ErrorMessage', '')}"
+        return failed
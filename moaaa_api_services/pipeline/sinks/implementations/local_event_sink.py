@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, List
+
+from ..interfaces.event_sink import IEventSink
+from ...events import Event
+
+
+class LocalEventSink(IEventSink):
+    """
+    Delivers relayed events to this process's pipeline stages.
+
+    An event counts as published once every subscribed stage has handled
+    it. IDs of recently delivered events are remembered, so a redelivery
+    (the relay is at-least-once) reaches the stages only once. One that
+    comes while the first delivery is still running, e.g. from another
+    relay after a slow stage outlived the lease, does reach them, so the
+    stages drop repeats themselves (see pipeline.stages). Without a
+    bus the sink only records what it was sent, which is what tests need.
+    """
+
+    def __init__(self, bus=None, history: int = 10000):
+        """
+        Args:
+            bus: InProcessEventBus whose stages receive the events
+            history: Delivered events kept in `events` and event IDs
+                remembered for deduplication
+        """
+        self.bus = bus
+        self.events = deque(maxlen=history)
+        self.history = history
+
+        self._delivered: 'OrderedDict[str, None]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_duplicate(self, event_id: str) -> bool:
+        with self._lock:
+            return event_id in self._delivered
+
+    def _remember(self, event: Event) -> None:
+        with self._lock:
+            self._delivered[event.id] = None
+            while len(self._delivered) > self.history:
+                self._delivered.popitem(last=False)
+            self.events.append(event)
+
+    def publish(self, events: List[Event]) -> Dict[str, str]:
+        # Hand the whole batch to the stages first so its events run concurrently
+        dispatched = [
+            (event, self.bus.dispatch(event) if self.bus is not None else [])
+            for event in events
+            if not self._is_duplicate(event.id)
+        ]
+
+        failed = {}
+        for event, futures in dispatched:
+            errors = [future.exception() for future in futures]
+            error = next((error for error in errors if error is not None), None)
+            if error is None:
+                self._remember(event)
+            else:
+                failed[event.id] = f'{error.__class__.__name__}: {error}'
+        return failed
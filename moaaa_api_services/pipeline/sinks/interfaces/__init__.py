@@ -0,0 +1,3 @@
+from .event_sink import IEventSink
+
+__all__ = ['IEventSink']
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from ...events import Event
+
+
+class IEventSink(ABC):
+    """Abstract interface for a destination the outbox relay publishes events to."""
+
+    @abstractmethod
+    def publish(self, events: List[Event]) -> Dict[str, str]:
+        """
+        Publish a batch of events.
+
+        Returns:
+            {event_id: error} for the events that were not accepted; the
+            relay retries them
+        """
+        pass
@@ -0,0 +1,67 @@
+"""
+Onboarding pipeline stages.
+
+    upload completed --document.uploaded--> classify
+    classify --document.classified--> extract (confident results with a schema)
+    extract --document.extracted--> status (ApplicationStatus snapshot)
+
+Each stage runs on its own bounded pool of bus workers
+(PIPELINE_STAGE_CONCURRENCY) and publishes the event for the next one.
+document.classified is always recorded in the transactional outbox with
+its result, whichever bus is configured, and reaches the extract stage
+through the relay's local sink.
+
+Events are delivered at least once, so the stages that write results
+drop repeats: classify only runs a PENDING job and extract keys its job
+on the event ID.
+"""
+from django.conf import settings
+
+from application_profile.models import ApplicationStatus
+from document_classification.tasks import run_upload_classification
+from document_extraction.ai_ml.schemas import fields_for
+from document_extraction.tasks import run_classified_extraction
+from .bus import IEventBus
+from .events import DOCUMENT_CLASSIFIED, DOCUMENT_EXTRACTED, DOCUMENT_UPLOADED, Event
+
+CLASSIFY = 'classify'
+EXTRACT = 'extract'
+STATUS = 'status'
+
+
+def should_extract(payload: dict) -> bool:
+    """Whether a classification is confident enough to extract without review."""
+    return (
+        not payload['requires_review']
+        and payload['confidence_score'] >= settings.PIPELINE_EXTRACTION_MIN_CONFIDENCE
+        and bool(fields_for(payload['document_type']))
+    )
+
+
+def register_stages(bus: IEventBus) -> None:
+    """Subscribe the pipeline's stages to their events."""
+
+    def classify(event: Event) -> None:
+        # The result's document.classified event goes through the outbox
+        run_upload_classification(event.payload['upload_id'])
+
+    def extract(event: Event) -> None:
+        if not should_extract(event.payload):
+            return
+        result = run_classified_extraction(event.payload['result_id'], event_id=event.id)
+        if result is None:
+            return
+        bus.publish(DOCUMENT_EXTRACTED, {
+            'result_id': str(result.id),
+            'application_id': result.application_id,
+            'document_type': result.document_type,
+            'is_valid': result.is_valid,
+            'requires_review': result.requires_review,
+        })
+
+    def update_status(event: Event) -> None:
+        ApplicationStatus.objects.refresh([event.payload['application_id']])
+
+    bus.subscribe(DOCUMENT_UPLOADED, CLASSIFY, classify)
+    bus.subscribe(DOCUMENT_CLASSIFIED, EXTRACT, extract)
+    bus.subscribe(DOCUMENT_EXTRACTED, STATUS, update_status)
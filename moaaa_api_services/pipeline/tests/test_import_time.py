@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from pipeline.management.commands.check_import_time import measure_startup
+
+
+class StartupImportTimeTests(SimpleTestCase):
+    """What `manage.py check_import_time` checks, run with the test suite."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The fastest of a few runs, as the command does: the first pays for disk cache misses
+        cls.runs = [measure_startup() for _ in range(3)]
+
+    def test_startup_is_within_budget(self):
+        best = min(run['total_ms'] for run in self.runs)
+        self.assertLessEqual(best, settings.IMPORT_TIME_BUDGET_MS)
+
+    def test_deferred_modules_are_not_imported(self):
+        imported = {module for run in self.runs for module in run['modules']}
+        for name in settings.IMPORT_TIME_DEFERRED_MODULES:
+            with self.subTest(module=name):
+                self.assertFalse(
+                    [module for module in imported if module == name or module.startswith(f'{name}.')],
+                    f'{name} is imported at startup'
+                )
@@ -0,0 +1,156 @@
+import time
+from datetime import timedelta
+from typing import Dict, List
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from pipeline.events import Event
+from pipeline.models import OutboxEvent
+from pipeline.outbox import OutboxRelay
+from pipeline.sinks import LocalEventSink
+
+
+class RejectingSink(LocalEventSink):
+    """Records what it is sent and rejects the events listed in `reject`."""
+
+    def __init__(self, reject=()):
+        super().__init__(bus=None)
+        self.reject = set(reject)
+
+    def publish(self, events: List[Event]) -> Dict[str, str]:
+        accepted = [event for event in events if event.id not in self.reject]
+        super().publish(accepted)
+        return {event.id: 'Rejected' for event in events if event.id in self.reject}
+
+
+class OutboxRelayTests(TestCase):
+    def setUp(self):
+        self.sink = LocalEventSink(bus=None)
+
+    def _relay(self, sinks=None, **options) -> OutboxRelay:
+        options = {'batch_size': 100, 'linger_seconds': 0, 'retry_backoff_seconds': 5, **options}
+        return OutboxRelay(sinks=sinks or [self.sink], **options)
+
+    def _record(self, count: int, age_seconds: float = 0) -> List[OutboxEvent]:
+        """Ready events, oldest first, the newest one age_seconds old."""
+        now = timezone.now()
+        rows = []
+        for i in range(count):
+            at = now - timedelta(seconds=age_seconds, milliseconds=count - i)
+            rows.append(OutboxEvent.objects.create(
+                event_type='document.uploaded', payload={'n': i}, available_at=at, occurred_at=at
+            ))
+        return rows
+
+    def _status(self, row: OutboxEvent) -> str:
+        row.refresh_from_db()
+        return row.status
+
+    def test_publishes_in_batches_oldest_first(self):
+        rows = self._record(5, age_seconds=1)
+        relay = self._relay(batch_size=2)
+
+        self.assertEqual(relay.run_once(), 2)
+        self.assertEqual([event.payload['n'] for event in self.sink.events], [0, 1])
+        self.assertEqual(relay.run_once(), 2)
+        self.assertEqual(relay.run_once(), 1)
+        self.assertEqual(relay.run_once(), 0)
+
+        self.assertEqual([event.id for event in self.sink.events], [str(row.pk) for row in rows])
+        self.assertFalse(OutboxEvent.objects.exclude(status=OutboxEvent.Status.PUBLISHED).exists())
+        self.assertFalse(OutboxEvent.objects.filter(published_at__isnull=True).exists())
+
+    def test_full_batch_is_sent_without_lingering(self):
+        self._record(2)
+        relay = self._relay(batch_size=2, linger_seconds=60)
+
+        started = time.monotonic()
+        self.assertTrue(relay._wait_for_batch())
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_partial_batch_waits_for_linger(self):
+        self._record(1)
+        relay = self._relay(batch_size=10, linger_seconds=0.3)
+
+        started = time.monotonic()
+        self.assertTrue(relay._wait_for_batch())
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    def test_partial_batch_that_already_lingered_is_sent(self):
+        self._record(1, age_seconds=1)
+        relay = self._relay(batch_size=10, linger_seconds=0.5)
+
+        started = time.monotonic()
+        self.assertTrue(relay._wait_for_batch())
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_rejected_event_is_retried_with_backoff_then_failed(self):
+        rejected, accepted = self._record(2, age_seconds=1)
+        sink = RejectingSink(reject=[str(rejected.pk)])
+        relay = self._relay(sinks=[sink], max_attempts=2, retry_backoff_seconds=5)
+
+        before = timezone.now()
+        self.assertEqual(relay.run_once(), 1)
+        self.assertEqual(self._status(accepted), OutboxEvent.Status.PUBLISHED)
+        self.assertEqual(self._status(rejected), OutboxEvent.Status.PENDING)
+        self.assertEqual(rejected.attempts, 1)
+        self.assertEqual(rejected.error_message, 'Rejected')
+        self.assertIsNone(rejected.lease_token)
+        self.assertGreaterEqual(rejected.available_at, before + timedelta(seconds=5))
+
+        # Not claimable again until the backoff has passed
+        self.assertEqual(relay.run_once(), 0)
+        OutboxEvent.objects.filter(pk=rejected.pk).update(available_at=timezone.now())
+
+        self.assertEqual(relay.run_once(), 0)
+        self.assertEqual(self._status(rejected), OutboxEvent.Status.FAILED)
+        self.assertEqual(rejected.attempts, 2)
+        self.assertEqual([event.id for event in sink.events], [str(accepted.pk)])
+
+    def test_sink_exception_fails_the_whole_batch(self):
+        rows = self._record(2, age_seconds=1)
+        relay = self._relay()
+
+        with mock.patch.object(self.sink, 'publish', side_effect=RuntimeError('unreachable')):
+            self.assertEqual(relay.run_once(), 0)
+
+        for row in rows:
+            self.assertEqual(self._status(row), OutboxEvent.Status.PENDING)
+            self.assertEqual(row.error_message, 'RuntimeError: unreachable')
+
+    def test_expired_lease_is_redelivered_once(self):
+        row, = self._record(1, age_seconds=1)
+
+        # A relay claims the event and delivers it, then dies before
+        # marking it published
+        crashed = self._relay(lease_seconds=300)
+        claimed = crashed._claim()
+        self.sink.publish([claimed[0].to_event()])
+
+        relay = self._relay()
+        self.assertEqual(relay.run_once(), 0)
+
+        # The lease expires and another relay picks the event up
+        OutboxEvent.objects.filter(pk=row.pk).update(available_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(relay.run_once(), 1)
+        self.assertEqual(self._status(row), OutboxEvent.Status.PUBLISHED)
+        self.assertEqual(row.attempts, 2)
+
+        # The sink dropped the repeat
+        self.assertEqual([event.id for event in self.sink.events], [str(row.pk)])
+
+    def test_expired_lease_holder_cannot_overwrite_the_new_claim(self):
+        row, = self._record(1, age_seconds=1)
+        stale_token = self._relay(lease_seconds=0)._claim()[0].lease_token
+        token = self._relay()._claim()[0].lease_token
+
+        # The first relay's late write matches nothing
+        updated = OutboxEvent.objects.filter(pk=row.pk, lease_token=stale_token).update(
+            status=OutboxEvent.Status.PUBLISHED
+        )
+        self.assertEqual(updated, 0)
+        self.assertEqual(self._status(row), OutboxEvent.Status.PENDING)
+        self.assertEqual(row.lease_token, token)
+        self.assertEqual(row.attempts, 2)
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from document_classification.ai_ml import ClassificationOutput
+from document_classification.models import ClassificationJob, ClassificationResult, DocumentUpload
+from document_extraction.ai_ml.implementations.extractor_impl import extraction_output
+from document_extraction.models import ExtractionJob, ExtractionResult
+from pipeline.events import DOCUMENT_CLASSIFIED, DOCUMENT_UPLOADED, Event, document_classified
+from pipeline.stages import CLASSIFY, EXTRACT, register_stages
+
+
+class RedeliveryTests(TestCase):
+    """A redelivered event (the relay and the work queue are at-least-once) is handled once."""
+
+    def setUp(self):
+        self.bus = mock.Mock()
+        register_stages(self.bus)
+        self.handlers = {call.args[1]: call.args[2] for call in self.bus.subscribe.call_args_list}
+
+    def test_classify_runs_the_upload_job_once(self):
+        job = ClassificationJob.objects.create(total_documents=1)
+        upload = DocumentUpload.objects.create(
+            application_id='APP-1001',
+            s3_bucket='bucket',
+            s3_key='uploads/APP-1001/license.pdf',
+            filename='license.pdf',
+            content_type='application/pdf',
+            size_bytes=10,
+            expires_at=timezone.now() + timedelta(minutes=15),
+            classification_job=job
+        )
+        classifier = mock.Mock()
+        classifier.classify.return_value = ClassificationOutput(
+            document_type='BUSINESS_LICENSE', confidence_score=0.97, requires_review=False, raw_response={}
+        )
+        event = Event(type=DOCUMENT_UPLOADED, payload={'upload_id': str(upload.id)})
+
+        with mock.patch('document_classification.tasks._classifier', classifier):
+            self.handlers[CLASSIFY](event)
+            self.handlers[CLASSIFY](event)
+
+        self.assertEqual(classifier.classify.call_count, 1)
+        self.assertEqual(ClassificationResult.objects.filter(job=job).count(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ClassificationJob.Status.COMPLETED)
+
+    def test_extract_keys_its_job_on_the_event(self):
+        result = ClassificationResult.objects.create(
+            job=ClassificationJob.objects.create(),
+            application_ref='APP-1001',
+            document_s3_bucket='bucket',
+            document_s3_key='uploads/APP-1001/statement.pdf',
+            document_filename='statement.pdf',
+            document_type='BANK_STATEMENT',
+            confidence_score=0.99
+        )
+        engine = mock.Mock()
+        engine.process.return_value = extraction_output('BANK_STATEMENT', {'account_number': '1234'}, {}, {})
+        event = Event(type=DOCUMENT_CLASSIFIED, payload=document_classified(result))
+
+        with mock.patch('document_extraction.tasks.get_extraction_engine', return_value=engine):
+            self.handlers[EXTRACT](event)
+            self.handlers[EXTRACT](event)
+
+        self.assertEqual(engine.process.call_count, 1)
+        self.assertEqual(ExtractionResult.objects.filter(classification_result=result).count(), 1)
+        job = ExtractionJob.objects.get(source_event_id=event.id)
+        self.assertEqual(job.status, ExtractionJob.Status.COMPLETED)
+        self.assertEqual(self.bus.publish.call_count, 1)
+
+        # A new event for the same classification is a new extraction
+        with mock.patch('document_extraction.tasks.get_extraction_engine', return_value=engine):
+            self.handlers[EXTRACT](Event(type=DOCUMENT_CLASSIFIED, payload=document_classified(result)))
+        self.assertEqual(ExtractionResult.objects.filter(classification_result=result).count(), 2)
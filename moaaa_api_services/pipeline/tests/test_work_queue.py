@@ -0,0 +1,172 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from pipeline import work_queue
+from pipeline.events import Event
+from pipeline.models import WorkItem
+
+
+class WorkQueueTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+
+    def _enqueue(self, count: int, queue: str = 'classify') -> list:
+        """Ready items, oldest first."""
+        items = []
+        for i in range(count):
+            event = Event(type='document.uploaded', payload={'n': i})
+            work_queue.enqueue(event, [queue])
+            item = WorkItem.objects.get(event_id=event.id, queue=queue)
+            item.available_at = self.now - timedelta(seconds=count - i)
+            item.save(update_fields=['available_at'])
+            items.append(item)
+        return items
+
+    def _at(self, seconds: float):
+        """Run the queue as if `seconds` had passed."""
+        return mock.patch('pipeline.work_queue.timezone.now', return_value=self.now + timedelta(seconds=seconds))
+
+    def test_enqueue_writes_one_item_per_stage_once(self):
+        event = Event(type='document.classified', payload={})
+        work_queue.enqueue(event, ['extract', 'status', 'extract'])
+        work_queue.enqueue(event, ['extract', 'status'])
+
+        self.assertEqual(
+            sorted(WorkItem.objects.filter(event_id=event.id).values_list('queue', flat=True)),
+            ['extract', 'status']
+        )
+
+    def test_claims_oldest_first_from_the_given_queues(self):
+        items = self._enqueue(3)
+        self._enqueue(1, queue='extract')
+
+        with self._at(0):
+            first = work_queue.claim(['classify'], 'worker-a', limit=2)
+            second = work_queue.claim(['classify'], 'worker-a', limit=2)
+
+        self.assertEqual([item.pk for item in first], [items[0].pk, items[1].pk])
+        self.assertEqual([item.pk for item in second], [items[2].pk])
+        for item in first + second:
+            self.assertEqual(item.status, WorkItem.Status.IN_PROGRESS)
+            self.assertEqual((item.worker, item.attempts), ('worker-a', 1))
+            self.assertEqual(item.available_at, self.now + timedelta(seconds=600))
+
+    def test_items_not_yet_available_are_not_claimed(self):
+        item, = self._enqueue(1)
+        WorkItem.objects.filter(pk=item.pk).update(available_at=self.now + timedelta(seconds=30))
+
+        with self._at(0):
+            self.assertEqual(work_queue.claim(['classify'], 'worker-a'), [])
+        with self._at(31):
+            self.assertEqual([claimed.pk for claimed in work_queue.claim(['classify'], 'worker-a')], [item.pk])
+
+    def test_a_leased_item_is_not_claimed_again(self):
+        self._enqueue(2)
+
+        with self._at(0):
+            a = work_queue.claim(['classify'], 'worker-a')
+            b = work_queue.claim(['classify'], 'worker-b')
+            c = work_queue.claim(['classify'], 'worker-c')
+
+        self.assertEqual(len(a), 1)
+        self.assertEqual(len(b), 1)
+        self.assertNotEqual(a[0].pk, b[0].pk)
+        self.assertEqual(c, [])
+
+    def test_skip_locked_path_on_databases_that_support_it(self):
+        items = self._enqueue(3)
+        select_for_update = QuerySet.select_for_update
+
+        with mock.patch.object(connection.features, 'has_select_for_update_skip_locked', True), \
+                mock.patch.object(QuerySet, 'select_for_update', autospec=True,
+                                  side_effect=select_for_update) as spy, \
+                self._at(0):
+            a = work_queue.claim(['classify'], 'worker-a', limit=2)
+            b = work_queue.claim(['classify'], 'worker-b', limit=2)
+
+        self.assertEqual(spy.call_count, 2)
+        self.assertEqual(spy.call_args.kwargs, {'skip_locked': True})
+        self.assertEqual([item.pk for item in a], [items[0].pk, items[1].pk])
+        self.assertEqual([item.pk for item in b], [items[2].pk])
+
+    def test_fallback_skips_items_leased_between_select_and_update(self):
+        items = self._enqueue(2)
+        values_list = QuerySet.values_list
+        raced = []
+
+        def select_then_race(queryset, *fields, **kwargs):
+            # Another worker leases the first item right after our SELECT
+            ids = list(values_list(queryset, *fields, **kwargs))
+            if not raced:
+                raced.append(ids[0])
+                WorkItem.objects.filter(pk=ids[0]).update(
+                    status=WorkItem.Status.IN_PROGRESS, worker='worker-b',
+                    available_at=self.now + timedelta(seconds=600)
+                )
+            return ids
+
+        with mock.patch.object(connection.features, 'has_select_for_update_skip_locked', False), \
+                mock.patch.object(QuerySet, 'values_list', autospec=True, side_effect=select_then_race), \
+                self._at(0):
+            claimed = work_queue.claim(['classify'], 'worker-a', limit=2)
+
+        self.assertEqual(raced, [items[0].pk])
+        self.assertEqual([item.pk for item in claimed], [items[1].pk])
+        self.assertEqual(WorkItem.objects.get(pk=items[0].pk).worker, 'worker-b')
+
+    def test_expired_lease_is_claimed_again(self):
+        self._enqueue(1)
+        with self._at(0):
+            lost, = work_queue.claim(['classify'], 'worker-a', lease_seconds=60)
+        with self._at(59):
+            self.assertEqual(work_queue.claim(['classify'], 'worker-b'), [])
+        with self._at(61):
+            item, = work_queue.claim(['classify'], 'worker-b', lease_seconds=60)
+
+        self.assertEqual(item.pk, lost.pk)
+        self.assertEqual((item.worker, item.attempts), ('worker-b', 2))
+        # The first worker's lease is gone
+        self.assertFalse(work_queue.complete(lost))
+        self.assertFalse(work_queue.fail(lost, 'late', max_attempts=5, retry_backoff_seconds=10))
+        self.assertTrue(work_queue.complete(item))
+        item.refresh_from_db()
+        self.assertEqual(item.status, WorkItem.Status.DONE)
+        self.assertIsNotNone(item.completed_at)
+
+    def test_fail_backs_off_exponentially(self):
+        item, = self._enqueue(1)
+
+        failed_at = 0
+        for attempt, delay in [(1, 10), (2, 20), (3, 40)]:
+            with self._at(failed_at):
+                claimed, = work_queue.claim(['classify'], 'worker-a')
+                self.assertEqual(claimed.attempts, attempt)
+                self.assertTrue(work_queue.fail(claimed, 'Throttled', max_attempts=5, retry_backoff_seconds=10))
+            item.refresh_from_db()
+            self.assertEqual(item.status, WorkItem.Status.PENDING)
+            self.assertEqual(item.error_message, 'Throttled')
+            self.assertEqual(item.available_at, self.now + timedelta(seconds=failed_at + delay))
+
+            with self._at(failed_at + delay - 1):
+                self.assertEqual(work_queue.claim(['classify'], 'worker-a'), [])
+            failed_at += delay
+
+    def test_fail_dead_letters_at_max_attempts(self):
+        item, = self._enqueue(1)
+
+        for attempt in range(1, 4):
+            with self._at(1000 * attempt):
+                claimed, = work_queue.claim(['classify'], 'worker-a')
+                work_queue.fail(claimed, f'Attempt {attempt} failed', max_attempts=3, retry_backoff_seconds=1)
+
+        item.refresh_from_db()
+        self.assertEqual((item.status, item.attempts), (WorkItem.Status.FAILED, 3))
+        self.assertEqual(item.error_message, 'Attempt 3 failed')
+        self.assertIsNotNone(item.completed_at)
+        with self._at(10 ** 6):
+            self.assertEqual(work_queue.claim(['classify'], 'worker-a'), [])
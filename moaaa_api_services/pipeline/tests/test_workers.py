@@ -0,0 +1,139 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from pipeline import work_queue
+from pipeline.bus import InProcessEventBus, WorkQueueEventBus
+from pipeline.events import Event
+from pipeline.models import WorkItem
+from pipeline.stages import register_stages
+from pipeline.workers import RECYCLE_EXIT_CODE, WorkerOptions, WorkerProcess
+
+
+class WorkerProcessTests(TestCase):
+    def setUp(self):
+        self.bus = mock.Mock()
+        self.process = WorkerProcess(self.bus, WorkerOptions(
+            queues=['classify'], threads=1, max_attempts=3, retry_backoff_seconds=10, poll_seconds=0
+        ))
+
+    def _enqueue(self) -> WorkItem:
+        event = Event(type='document.uploaded', payload={'upload_id': 'u-1'})
+        work_queue.enqueue(event, ['classify'])
+        return WorkItem.objects.get(event_id=event.id)
+
+    def _run_until_released(self) -> None:
+        """Run one worker thread's loop until it has completed or failed an item."""
+        queue = mock.Mock(wraps=work_queue)
+
+        def released(release):
+            def stop_after(*args, **kwargs):
+                self.process.stop_event.set()
+                return release(*args, **kwargs)
+            return stop_after
+
+        queue.complete.side_effect = released(work_queue.complete)
+        queue.fail.side_effect = released(work_queue.fail)
+        self.process.work_queue = queue
+        self.process._loop(0)
+
+    def test_handled_item_is_completed(self):
+        item = self._enqueue()
+
+        self._run_until_released()
+
+        self.bus.handle.assert_called_once()
+        self.assertEqual(self.bus.handle.call_args.args[0].pk, item.pk)
+        item.refresh_from_db()
+        self.assertEqual(item.status, WorkItem.Status.DONE)
+        self.assertEqual(self.process.tasks_done, 1)
+
+    def test_failed_item_is_retried_later(self):
+        item = self._enqueue()
+        self.bus.handle.side_effect = RuntimeError('Bedrock throttled')
+
+        self._run_until_released()
+
+        item.refresh_from_db()
+        self.assertEqual((item.status, item.attempts), (WorkItem.Status.PENDING, 1))
+        self.assertEqual(item.error_message, 'RuntimeError: Bedrock throttled')
+        self.assertGreater(item.available_at, timezone.now() + timedelta(seconds=5))
+
+    def test_item_whose_workers_kept_dying_is_dead_lettered(self):
+        item = self._enqueue()
+        # Leased three times by workers that never released it
+        WorkItem.objects.filter(pk=item.pk).update(
+            status=WorkItem.Status.IN_PROGRESS, attempts=3, available_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self._run_until_released()
+
+        self.bus.handle.assert_not_called()
+        item.refresh_from_db()
+        self.assertEqual((item.status, item.attempts), (WorkItem.Status.FAILED, 4))
+        self.assertEqual(item.error_message, 'RuntimeError: Gave up after 3 attempts')
+
+    def test_recycles_after_max_tasks(self):
+        self.process.options.max_tasks = 2
+        self.assertIsNone(self.process._should_recycle())
+        self.process.tasks_done = 2
+        self.assertEqual(self.process._should_recycle(), 'processed 2 items')
+
+    def test_recycles_above_max_memory(self):
+        self.process.options.max_memory_mb = 100
+        with mock.patch('pipeline.workers.resident_memory_mb', return_value=50):
+            self.assertIsNone(self.process._should_recycle())
+        with mock.patch('pipeline.workers.resident_memory_mb', return_value=150):
+            self.assertEqual(self.process._should_recycle(), 'using 150 MB')
+            # Its threads find no work and stop
+            self.process.work_queue = mock.Mock(**{'claim.return_value': []})
+            self.assertEqual(self.process.run(), RECYCLE_EXIT_CODE)
+
+
+@override_settings(
+    PIPELINE_WORKER_PROCESSES=2, PIPELINE_WORKER_THREADS=3, PIPELINE_WORKER_LEASE_SECONDS=120,
+    PIPELINE_WORKER_MAX_ATTEMPTS=4, PIPELINE_WORKER_RETRY_BACKOFF_SECONDS=5, PIPELINE_WORKER_POLL_SECONDS=2,
+    PIPELINE_WORKER_MAX_MEMORY_MB=0, PIPELINE_WORKER_MAX_TASKS=0
+)
+class RunWorkersCommandTests(SimpleTestCase):
+    def _call(self, bus, *args):
+        with mock.patch('pipeline.management.commands.run_workers.get_event_bus', return_value=bus), \
+                mock.patch('pipeline.management.commands.run_workers.signal.signal'), \
+                mock.patch('pipeline.management.commands.run_workers.WorkerSupervisor') as supervisor:
+            call_command('run_workers', *args, stdout=StringIO())
+        return supervisor
+
+    def _queue_bus(self) -> WorkQueueEventBus:
+        bus = WorkQueueEventBus()
+        register_stages(bus)
+        return bus
+
+    def test_runs_every_stage_by_default(self):
+        supervisor = self._call(self._queue_bus())
+
+        kwargs = supervisor.call_args.kwargs
+        self.assertEqual(kwargs['processes'], 2)
+        self.assertEqual(kwargs['options'], WorkerOptions(
+            queues=['classify', 'extract', 'status'], threads=3, max_memory_mb=0, max_tasks=0,
+            lease_seconds=120, max_attempts=4, retry_backoff_seconds=5, poll_seconds=2
+        ))
+        supervisor.return_value.run.assert_called_once_with()
+
+    def test_runs_the_given_queues(self):
+        supervisor = self._call(self._queue_bus(), '--queues', 'extract', '--processes', '1', '--threads', '8')
+
+        kwargs = supervisor.call_args.kwargs
+        self.assertEqual(kwargs['processes'], 1)
+        self.assertEqual((kwargs['options'].queues, kwargs['options'].threads), (['extract'], 8))
+
+    def test_rejects_unknown_queues(self):
+        with self.assertRaisesMessage(CommandError, 'Unknown queues: ocr'):
+            self._call(self._queue_bus(), '--queues', 'ocr')
+
+    def test_needs_the_queue_bus(self):
+        with self.assertRaisesMessage(CommandError, "workers need 'queue'"):
+            self._call(InProcessEventBus())
@@ -0,0 +1,92 @@
+"""
+Database-backed work queues consumed by `manage.py run_workers`.
+
+Workers lease items with SELECT ... FOR UPDATE SKIP LOCKED where the
+database supports it (PostgreSQL), so any number of workers on any number
+of nodes claim disjoint items without waiting on each other's row locks.
+SQLite has no row locks (writers take the whole database), so there a
+conditional UPDATE is enough to keep two workers from taking one item.
+"""
+from datetime import timedelta
+from typing import Iterable, List
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from .events import Event
+from .models import WorkItem
+
+
+def enqueue(event: Event, queues: Iterable[str]) -> None:
+    """Queue an event for each stage, in the current transaction. Requeuing an event is a no-op."""
+    WorkItem.objects.bulk_create(
+        [
+            WorkItem(queue=queue, event_id=event.id, event_type=event.type, payload=event.payload)
+            for queue in dict.fromkeys(queues)
+        ],
+        ignore_conflicts=True
+    )
+
+
+def claim(queues: List[str], worker: str, limit: int = 1, lease_seconds: float = 600) -> List[WorkItem]:
+    """
+    Lease up to `limit` ready items from the given queues, oldest first.
+
+    Items left IN_PROGRESS by a worker that died are ready again once
+    their lease has expired.
+
+    Returns:
+        The leased items
+    """
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=lease_seconds)
+    claimable = WorkItem.objects.filter(
+        queue__in=queues,
+        status__in=[WorkItem.Status.PENDING, WorkItem.Status.IN_PROGRESS],
+        available_at__lte=now
+    ).order_by('available_at')
+    lease = {
+        'status': WorkItem.Status.IN_PROGRESS,
+        'worker': worker,
+        'available_at': lease_until,
+        'attempts': models.F('attempts') + 1,
+        'updated_at': now,
+    }
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(claimable.select_for_update(skip_locked=True).values_list('pk', flat=True)[:limit])
+            WorkItem.objects.filter(pk__in=ids).update(**lease)
+    else:
+        ids = list(claimable.values_list('pk', flat=True)[:limit])
+        # Items another worker leased since the SELECT no longer match
+        claimable.filter(pk__in=ids).update(**lease)
+
+    return list(WorkItem.objects.filter(pk__in=ids, worker=worker, available_at=lease_until))
+
+
+def complete(item: WorkItem) -> bool:
+    """Mark a leased item DONE; False if the lease was lost to another worker."""
+    now = timezone.now()
+    return bool(WorkItem.objects.filter(
+        pk=item.pk, worker=item.worker, status=WorkItem.Status.IN_PROGRESS
+    ).update(status=WorkItem.Status.DONE, error_message='', completed_at=now, updated_at=now))
+
+
+def fail(item: WorkItem, error: str, max_attempts: int, retry_backoff_seconds: float) -> bool:
+    """
+    Release a leased item after a failed attempt: back to PENDING after an
+    exponential backoff, or FAILED once it has used max_attempts.
+
+    Returns:
+        False if the lease was lost to another worker
+    """
+    now = timezone.now()
+    if item.attempts >= max_attempts:
+        values = {'status': WorkItem.Status.FAILED, 'completed_at': now}
+    else:
+        delay = retry_backoff_seconds * 2 ** (item.attempts - 1)
+        values = {'status': WorkItem.Status.PENDING, 'available_at': now + timedelta(seconds=delay)}
+    return bool(WorkItem.objects.filter(
+        pk=item.pk, worker=item.worker, status=WorkItem.Status.IN_PROGRESS
+    ).update(error_message=error, updated_at=now, **values))
@@ -0,0 +1,244 @@
+"""
+Worker processes for the work-queue bus (`manage.py run_workers`).
+
+The supervisor starts N processes and keeps them running; each process
+runs M threads that lease items from the queues and run their stage. A
+process that goes over its memory limit or task budget finishes the items
+in flight and exits, and the supervisor starts a fresh one in its place.
+On SIGTERM/SIGINT the supervisor asks every process to stop claiming work,
+waits for the items in flight, and kills what is left after the timeout;
+items a killed process held are leased again when their lease expires.
+
+Processes are started with the 'spawn' method: forking a process that
+already runs threads (relay, pools) is unsafe, and every worker gets its
+own database connections.
+
+Only stdlib imports at module level: spawned children import this module
+before Django is set up.
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Exit code of a worker process that recycled itself
+RECYCLE_EXIT_CODE = 3
+
+
+@dataclass
+class WorkerOptions:
+    queues: List[str]
+    threads: int = 4
+    # Recycle the process above this resident memory (0 = no limit)
+    max_memory_mb: int = 0
+    # Recycle the process after this many items (0 = no limit)
+    max_tasks: int = 0
+    lease_seconds: float = 600
+    max_attempts: int = 5
+    retry_backoff_seconds: float = 10
+    poll_seconds: float = 1
+
+
+def resident_memory_mb() -> float:
+    """Current resident set size of this process (peak RSS where /proc isn't available)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+class WorkerProcess:
+    """The threads of one worker process."""
+
+    def __init__(self, bus, options: WorkerOptions):
+        from . import work_queue
+        self.work_queue = work_queue
+
+        self.bus = bus
+        self.options = options
+        self.stop_event = threading.Event()
+        self.tasks_done = 0
+        self._lock = threading.Lock()
+
+    def _worker_id(self, index: int) -> str:
+        return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+    def _loop(self, index: int) -> None:
+        from django.db import close_old_connections
+
+        worker = self._worker_id(index)
+        while not self.stop_event.is_set():
+            close_old_connections()
+            try:
+                items = self.work_queue.claim(self.options.queues, worker, 1, self.options.lease_seconds)
+            except Exception:
+                logger.exception("Worker %s could not claim work", worker)
+                items = []
+            if not items:
+                self.stop_event.wait(self.options.poll_seconds)
+                continue
+
+            item = items[0]
+            try:
+                if item.attempts > self.options.max_attempts:
+                    # Its earlier workers died holding it
+                    raise RuntimeError(f"Gave up after {item.attempts - 1} attempts")
+                self.bus.handle(item)
+            except Exception as e:
+                self.work_queue.fail(
+                    item, f'{e.__class__.__name__}: {e}',
+                    self.options.max_attempts, self.options.retry_backoff_seconds
+                )
+            else:
+                self.work_queue.complete(item)
+            finally:
+                with self._lock:
+                    self.tasks_done += 1
+        close_old_connections()
+
+    def _should_recycle(self) -> Optional[str]:
+        if self.options.max_tasks and self.tasks_done >= self.options.max_tasks:
+            return f"processed {self.tasks_done} items"
+        if self.options.max_memory_mb:
+            memory = resident_memory_mb()
+            if memory > self.options.max_memory_mb:
+                return f"using {memory:.0f} MB"
+        return None
+
+    def run(self) -> int:
+        """
+        Run the worker threads until stopped or due for recycling.
+
+        Returns:
+            The process exit code
+        """
+        threads = [
+            threading.Thread(target=self._loop, args=(index,), name=f'pipeline-worker-{index}')
+            for index in range(self.options.threads)
+        ]
+        for thread in threads:
+            thread.start()
+
+        exit_code = 0
+        while not self.stop_event.is_set():
+            reason = self._should_recycle()
+            if reason:
+                logger.info("Recycling worker process %s: %s", os.getpid(), reason)
+                exit_code = RECYCLE_EXIT_CODE
+                self.stop_event.set()
+                break
+            self.stop_event.wait(1)
+
+        # Finish the items in flight
+        for thread in threads:
+            thread.join()
+        return exit_code
+
+
+def worker_main(options: WorkerOptions) -> None:
+    """Entry point of a spawned worker process."""
+    # Ctrl+C reaches the whole process group; shutdown is driven by the supervisor's SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    import django
+    django.setup()
+
+    from .bus import WorkQueueEventBus, get_event_bus
+    bus = get_event_bus()
+    if not isinstance(bus, WorkQueueEventBus):
+        raise RuntimeError("Workers need PIPELINE_EVENT_BUS = 'queue'")
+
+    process = WorkerProcess(bus, options)
+    signal.signal(signal.SIGTERM, lambda *_: process.stop_event.set())
+    sys.exit(process.run())
+
+
+class WorkerSupervisor:
+    """Keeps N worker processes running until told to stop."""
+
+    def __init__(self, processes: int, options: WorkerOptions, shutdown_timeout: float = 60,
+                 log: Callable[[str], None] = logger.info):
+        """
+        Args:
+            processes: Worker processes to keep running
+            options: Options passed to every process
+            shutdown_timeout: Seconds to wait for items in flight on shutdown
+            log: Progress output
+        """
+        self.processes = processes
+        self.options = options
+        self.shutdown_timeout = shutdown_timeout
+        self.log = log
+
+        self.stop_event = threading.Event()
+        self._context = multiprocessing.get_context('spawn')
+        self._children: Dict[int, multiprocessing.Process] = {}
+        self._started_at: Dict[int, float] = {}
+
+    def _start(self, slot: int) -> None:
+        process = self._context.Process(
+            target=worker_main,
+            args=(self.options,),
+            name=f'pipeline-worker-{slot}'
+        )
+        process.start()
+        self._children[slot] = process
+        self._started_at[slot] = time.monotonic()
+        self.log(f"Started worker {slot} (pid {process.pid})")
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def run(self) -> None:
+        """Start the workers and restart any that exit, until stop() is called."""
+        for slot in range(self.processes):
+            self._start(slot)
+
+        while not self.stop_event.is_set():
+            for slot, process in list(self._children.items()):
+                if process.is_alive():
+                    continue
+                process.join()
+                if process.exitcode == RECYCLE_EXIT_CODE:
+                    self.log(f"Worker {slot} (pid {process.pid}) recycled")
+                else:
+                    self.log(f"Worker {slot} (pid {process.pid}) exited with code {process.exitcode}")
+                    # Don't spin on a worker that dies at startup
+                    if time.monotonic() - self._started_at[slot] < 5:
+                        self.stop_event.wait(5)
+                        if self.stop_event.is_set():
+                            break
+                self._start(slot)
+            self.stop_event.wait(1)
+
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        self.log(f"Stopping {len(self._children)} workers (waiting up to {self.shutdown_timeout:.0f}s)")
+        for process in self._children.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for slot, process in self._children.items():
+            process.join(max(0, deadline - time.monotonic()))
+            if process.is_alive():
+                self.log(f"Worker {slot} (pid {process.pid}) did not stop in time; killing it")
+                process.kill()
+                process.join()
@@ -1,3 +1,18 @@
 from django.contrib import admin
+from .models import Conversation, Message
 
-# Register your models here.
+
+class MessageInline(admin.TabularInline):
+    model = Message
+    fields = ['sequence', 'role', 'content', 'token_count', 'created_at']
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(Conversation)
+class ConversationAdmin(admin.ModelAdmin):
+    list_display = ['id', 'application_id', 'message_count', 'created_at', 'updated_at']
+    search_fields = ['^application_id']
+    readonly_fields = ['id', 'summary_through', 'message_count', 'created_at', 'updated_at']
+    inlines = [MessageInline]
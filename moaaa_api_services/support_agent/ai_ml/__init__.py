@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+from .interfaces import ISupport_agent
+
+if TYPE_CHECKING:
+    from .implementations import Support_agentImpl
+    from .semantic_cache import SemanticCache
+
+# Implementations (and boto3, numpy) load on first use; support_agent.models
+# only needs ai_ml.context
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Support_agentImpl': '.implementations',
+    'SemanticCache': '.semantic_cache',
+})
+
+__all__ = [
+    'ISupport_agent',
+    'Support_agentImpl',
+    'SemanticCache'
+]
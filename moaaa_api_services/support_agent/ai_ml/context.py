@@ -0,0 +1,51 @@
+import math
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Rough characters per token for English chat text; close enough for budgeting
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a message."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def split_window(messages: Sequence[Any], budget: int) -> Tuple[List[Any], List[Any]]:
+    """
+    Split a conversation into turns to evict and the recent window to keep.
+
+    The window is the longest run of most recent messages whose token
+    counts fit the budget, trimmed so it starts with a user message
+    (Bedrock requires the first message to be from the user).
+
+    Args:
+        messages: Messages oldest first, each with `role` and `token_count`
+        budget: Token budget for the verbatim window
+
+    Returns:
+        (evicted, window), both oldest first
+    """
+    start = len(messages)
+    used = 0
+    while start > 0 and used + messages[start - 1].token_count <= budget:
+        start -= 1
+        used += messages[start].token_count
+
+    while start < len(messages) and messages[start].role != 'user':
+        start += 1
+
+    return list(messages[:start]), list(messages[start:])
+
+
+def to_turns(messages: Sequence[Any]) -> List[Dict[str, str]]:
+    """
+    Convert messages to Bedrock turns, merging consecutive messages from the
+    same role (e.g. a user message whose reply failed) so roles alternate.
+    """
+    turns: List[Dict[str, str]] = []
+    for message in messages:
+        if turns and turns[-1]['role'] == message.role:
+            turns[-1]['content'] += f"\n\n{message.content}"
+        else:
+            turns.append({'role': message.role, 'content': message.content})
+    return turns
@@ -0,0 +1,12 @@
+from typing import TYPE_CHECKING
+
+from moaaa_api_services.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent_impl import Support_agentImpl
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'Support_agentImpl': '.agent_impl',
+})
+
+__all__ = ['Support_agentImpl']
@@ -1,26 +1,459 @@
-from typing import List, Dict, Any
-import boto3
+import os
+import re
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import List, Dict, Any, Iterator, Optional
+
+import numpy as np
+
+from moaaa_api_services.aws import default_profile
+from document_classification.ai_ml.text_layer import path_latency
 from ..interfaces.agent import ISupport_agent
+from ..semantic_cache import SemanticCache, is_cacheable
+
+logger = logging.getLogger(__name__)
+
+# Answered by the agent itself
+ANSWERED_BY_SNAPSHOT = 'snapshot'
+# Answered from the semantic cache
+ANSWERED_BY_CACHE = 'cache'
+# Answered by a Bedrock call
+ANSWERED_BY_MODEL = 'model'
+
+# Intents answered from the status snapshot, checked in order. A message
+# only matches when it is also about the merchant's own application (see
+# _OWN_APPLICATION); "How long does approval take?" or "What documents do
+# I need?" are general questions for the model and the semantic cache.
+INTENT_PATTERNS = [
+    ('missing_documents', re.compile(
+        r'\b(missing|still need|what else|need to (?:upload|send|provide))\b',
+        re.IGNORECASE
+    )),
+    ('review', re.compile(
+        r'\b(review|rejected|wrong with|declined)\b',
+        re.IGNORECASE
+    )),
+    ('status', re.compile(
+        r"\b(status|progress|where (?:is|are) (?:my|our)|how far|approved|done yet|"
+        r"(?:any|what's the) news)\b",
+        re.IGNORECASE
+    )),
+]
+
+# Phrasings that refer to the merchant's own application ("my application",
+# "am I approved", "what's still missing")
+_OWN_APPLICATION = re.compile(
+    r"\b(my|mine|our|ours|me|us|(?:am|have|did) i|(?:are|have|did) we|still)\b",
+    re.IGNORECASE
+)
+
+_STAGE_SUMMARIES = {
+    'AWAITING_DOCUMENTS': "we're waiting on a few more documents from you",
+    'PROCESSING': "we're processing the documents you sent",
+    'NEEDS_REVIEW': "some of your documents are with our review team",
+    'READY': "we have everything we need and your application is ready for the next step",
+}
+
+
+def _humanize(document_type: str) -> str:
+    return document_type.replace('_', ' ').lower()
+
+
+def _join(items: List[str]) -> str:
+    if len(items) <= 1:
+        return ''.join(items)
+    return f"{', '.join(items[:-1])} and {items[-1]}"
 
 
 class Support_agentImpl(ISupport_agent):
-    """Concrete implementation using Amazon Bedrock."""
+    """
+    Merchant support agent using Amazon Bedrock with Claude.
+
+    Built around the application's precomputed status snapshot
+    (application_profile.ApplicationStatus): status, missing-document and
+    review questions about the merchant's own application are answered from
+    the snapshot without a model call.
+    Only open-ended questions go to Bedrock, with the snapshot and the
+    merchant's profile as context, so no turn queries jobs or results. Conversation memory is passed in as
+    a rolling summary plus a bounded window of recent turns (see context.py).
+
+    With a semantic cache, general (non-personal, self-contained) questions
+    are answered without the merchant's context, and those answers are
+    reused for near-duplicate questions without a generation call.
+
+    Input:
+        {
+            "message": "What's the status of my application?",
+            "status": {...},    # ApplicationStatus snapshot, or None
+            "merchant": {...},  # optional legal_name, dba_name, business_type
+            "summary": "...",   # optional rolling summary of earlier turns
+            "history": [{"role": "user", "content": "..."}, ...]  # optional recent turns
+        }
+
+    Output:
+        {
+            "reply": "...",
+            "intent": "status",         # None for open-ended questions
+            "answered_by": "snapshot",  # or "cache" / "model"
+            "latency_ms": 0.4
+        }
+    """
+
+    # Default number of messages answered concurrently in process_batch
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, profile_name: str = None, region: str = None, max_workers: int = None,
+                 policy_text: str = '', cache: Optional[SemanticCache] = None):
+        """
+        Initialize the support agent.
+
+        Args:
+            profile_name: AWS profile name (default: moaaa_api_services)
+            region: AWS region (default: from profile or us-east-1)
+            max_workers: Concurrent messages in process_batch
+            policy_text: Onboarding policy the model answers from
+            cache: Optional semantic cache for general questions (its
+                embed function is usually this agent's embed())
+        """
+        self.profile_name = profile_name or default_profile()
+        self.region = region or os.environ.get('AWS_REGION', 'us-east-1')
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+
+        # Model ID for Claude
+        self.model_id = 'anthropic.claude-3-sonnet-20240229-v1:0'
+        # Model ID for question embeddings
+        self.embedding_model_id = 'amazon.titan-embed-text-v2:0'
+
+        self.policy_text = policy_text
+        self.cache = cache
+
+    # boto3 and the client are created on first use, not at construction
+
+    @cached_property
+    def session(self):
+        import boto3
+        return boto3.Session(profile_name=self.profile_name)
+
+    @cached_property
+    def bedrock_client(self):
+        from botocore.config import Config
+        return self.session.client(
+            'bedrock-runtime',
+            region_name=self.region,
+            config=Config(
+                retries={'max_attempts': 3, 'mode': 'adaptive'},
+                max_pool_connections=self.max_workers
+            )
+        )
+
+    @staticmethod
+    def detect_intent(message: str) -> Optional[str]:
+        """
+        Return the snapshot-answerable intent of a message, or None.
+
+        Only questions about the merchant's own application have one;
+        general questions return None even when they mention a status word.
+        """
+        if not _OWN_APPLICATION.search(message):
+            return None
+        for intent, pattern in INTENT_PATTERNS:
+            if pattern.search(message):
+                return intent
+        return None
+
+    def _answer_from_snapshot(self, intent: str, status: Optional[Dict[str, Any]]) -> str:
+        """Templated reply for a snapshot intent."""
+        if status is None:
+            return ("I couldn't find any documents for this application yet. "
+                    "Once you upload them I'll be able to tell you how things are going.")
+
+        missing = [_humanize(document_type) for document_type in status['missing_document_types']]
+
+        if intent == 'missing_documents':
+            if not missing:
+                return "You've sent every document we need. Nothing else is required from you right now."
+            return f"We still need your {_join(missing)}."
+
+        if intent == 'review':
+            count = status['documents_requiring_review']
+            if not count:
+                return "None of your documents need review right now."
+            noun = 'document needs' if count == 1 else 'documents need'
+            return (f"{count} {noun} a closer look by our review team. "
+                    "We'll reach out if we need anything from you.")
+
+        reply = f"Your application status: {_STAGE_SUMMARIES[status['stage']]}."
+        if status['jobs_in_progress']:
+            reply += f" {status['jobs_in_progress']} processing job(s) are still running."
+        if missing:
+            reply += f" We still need your {_join(missing)}."
+        if status['jobs_failed'] or status['uploads_failed']:
+            reply += " Some documents couldn't be processed, so you may be asked to upload them again."
+        return reply
+
+    def _build_system_prompt(self, status: Optional[Dict[str, Any]], summary: str = '',
+                             merchant: Optional[Dict[str, Any]] = None) -> str:
+        """System prompt with the application snapshot (merchant, conversation summary) as context."""
+        context = json.dumps(status, default=str, indent=2) if status else 'No documents have been received yet.'
+        if merchant:
+            context += f"\n\nMerchant:\n{json.dumps(merchant, indent=2)}"
+        if summary:
+            context += f"\n\nSummary of the earlier conversation:\n{summary}"
+        if self.policy_text:
+            context += f"\n\nOnboarding policy:\n{self.policy_text}"
+        return f"""You are a friendly support agent for a payment processing company, helping a merchant with their onboarding application.
+
+Current application status:
+{context}
 
-    def __init__(self, region: str = "us-east-1"):
-        self.bedrock_client = boto3.client(
-            "bedrock-runtime",
-            region_name=region
+Guidelines:
+- Answer using only the status above and general onboarding knowledge
+- Never invent dates, decisions or document details that are not in the status
+- Keep answers short (at most 3 sentences)
+"""
+
+    def _general_request_body(self, message: str) -> str:
+        """Request for a general question, answered without any merchant's context so it can be shared."""
+        policy = f"\n\nOnboarding policy:\n{self.policy_text}" if self.policy_text else ''
+        return json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 512,
+            "system": f"""You are a friendly support agent for a payment processing company, answering a general question about merchant onboarding.{policy}
+
+Guidelines:
+- Answer for any merchant; do not refer to a specific application or its status
+- Never invent timelines, fees or requirements that are not in the policy
+- Keep answers short (at most 3 sentences)
+""",
+            "messages": [{"role": "user", "content": message}]
+        })
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a question with Titan (normalized, 256 dimensions)."""
+        response = self.bedrock_client.invoke_model(
+            modelId=self.embedding_model_id,
+            contentType='application/json',
+            accept='application/json',
+            body=json.dumps({"inputText": text, "dimensions": 256, "normalize": True})
         )
+        return np.asarray(json.loads(response['body'].read())['embedding'], dtype=np.float32)
+
+    def _plan(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decide how to answer a message.
+
+        Returns:
+            {"intent", "answered_by", "reply"} when the answer is already
+            known (snapshot or cache hit), otherwise "reply" is None and
+            "body" holds the model request; "cache_vector" is set when the
+            model's answer should be stored in the cache
+        """
+        message = input_data['message']
+        intent = self.detect_intent(message)
+        if intent is not None:
+            return {
+                'intent': intent,
+                'answered_by': ANSWERED_BY_SNAPSHOT,
+                'reply': self._answer_from_snapshot(intent, input_data.get('status'))
+            }
+
+        if self.cache is not None:
+            if is_cacheable(message, input_data.get('history') or ()):
+                try:
+                    hit, vector = self.cache.lookup(message)
+                except Exception as e:
+                    logger.warning("Semantic cache lookup failed: %s", e)
+                else:
+                    if hit is not None:
+                        return {'intent': None, 'answered_by': ANSWERED_BY_CACHE, 'reply': hit['answer']}
+                    return {
+                        'intent': None,
+                        'answered_by': ANSWERED_BY_MODEL,
+                        'reply': None,
+                        'body': self._general_request_body(message),
+                        'cache_vector': vector
+                    }
+            else:
+                self.cache.record_bypass()
+
+        return {
+            'intent': None,
+            'answered_by': ANSWERED_BY_MODEL,
+            'reply': None,
+            'body': self._model_request_body(input_data)
+        }
+
+    def _model_request_body(self, input_data: Dict[str, Any]) -> str:
+        history = list(input_data.get('history') or [])
+        if history and history[-1]['role'] == 'user':
+            history[-1] = {'role': 'user', 'content': f"{history[-1]['content']}\n\n{input_data['message']}"}
+        else:
+            history.append({'role': 'user', 'content': input_data['message']})
+        return json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 512,
+            "system": self._build_system_prompt(
+                input_data.get('status'), input_data.get('summary', ''), input_data.get('merchant')
+            ),
+            "messages": history
+        })
+
+    def _invoke_text(self, body: str) -> str:
+        response = self.bedrock_client.invoke_model(
+            modelId=self.model_id,
+            contentType='application/json',
+            accept='application/json',
+            body=body
+        )
+        response_body = json.loads(response['body'].read())
+        return response_body['content'][0]['text'].strip()
+
+    def summarize(self, summary: str, turns: List[Dict[str, str]]) -> str:
+        """
+        Fold turns leaving the context window into the rolling summary.
+
+        Only the new turns are sent along with the previous summary, so the
+        cost of a summary update does not grow with conversation length.
+
+        Args:
+            summary: Current summary ('' for none)
+            turns: Evicted turns, oldest first
+
+        Returns:
+            The updated summary
+        """
+        transcript = '\n'.join(f"{turn['role'].upper()}: {turn['content']}" for turn in turns)
+        prompt = f"""Update the running summary of a support conversation with a merchant.
+
+Current summary:
+{summary or '(none)'}
+
+New messages:
+{transcript}
+
+Respond with ONLY the updated summary (at most 150 words). Keep facts the merchant shared, open questions and commitments made; drop pleasantries.
+"""
+        return self._invoke_text(json.dumps({
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": 300,
+            "messages": [{"role": "user", "content": prompt}]
+        }))
+
+    def _stream_model(self, body: str) -> Iterator[str]:
+        """
+        Yield reply text deltas from Bedrock's response stream.
+
+        The upstream stream is read one event at a time, only when the
+        consumer asks for the next delta, and is closed when the generator
+        is closed early (e.g. the client disconnected), which ends
+        generation on the Bedrock side.
+        """
+        response = self.bedrock_client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            contentType='application/json',
+            accept='application/json',
+            body=body
+        )
+        stream = response['body']
+        try:
+            for event in stream:
+                chunk = event.get('chunk')
+                if chunk is None:
+                    continue
+                payload = json.loads(chunk['bytes'])
+                if payload.get('type') == 'content_block_delta':
+                    text = payload['delta'].get('text')
+                    if text:
+                        yield text
+                elif payload.get('type') == 'message_stop':
+                    break
+        finally:
+            stream.close()
 
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Process single input using Bedrock."""
-        # TODO: Implement Bedrock API call
-        pass
+        """
+        Answer a single merchant message.
+
+        Args:
+            input_data: Message and status snapshot (see class docstring)
+
+        Returns:
+            Reply dict (see class docstring)
+        """
+        started = time.perf_counter()
+        plan = self._plan(input_data)
+
+        reply = plan['reply']
+        if reply is None:
+            reply = self._invoke_text(plan['body'])
+            if plan.get('cache_vector') is not None:
+                self.cache.store(input_data['message'], reply, plan['cache_vector'])
+
+        return {
+            'reply': reply,
+            'intent': plan['intent'],
+            'answered_by': plan['answered_by'],
+            'latency_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+
+    def stream(self, input_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Answer a single merchant message as a stream of events.
+
+        Snapshot and cached answers are yielded as one token event right
+        away; model answers are relayed delta by delta as Bedrock generates
+        them (and cached, if eligible, once complete).
+
+        Args:
+            input_data: Message and status snapshot (see class docstring)
+
+        Yields:
+            {"type": "token", "text": "..."} events, then one
+            {"type": "done", "intent", "answered_by", "first_token_ms", "latency_ms"}
+        """
+        started = time.perf_counter()
+        plan = self._plan(input_data)
+        answered_by = plan['answered_by']
+
+        if plan['reply'] is not None:
+            tokens = iter([plan['reply']])
+        else:
+            tokens = self._stream_model(plan['body'])
+
+        first_token = None
+        parts = []
+        try:
+            for text in tokens:
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                    path_latency.record('support_first_token', answered_by, first_token)
+                parts.append(text)
+                yield {'type': 'token', 'text': text}
+        finally:
+            # Also runs when this generator is closed early (client went away)
+            if plan['reply'] is None:
+                tokens.close()
+
+        # Only complete answers are cached
+        if plan.get('cache_vector') is not None:
+            self.cache.store(input_data['message'], ''.join(parts), plan['cache_vector'])
+
+        yield {
+            'type': 'done',
+            'intent': plan['intent'],
+            'answered_by': answered_by,
+            'first_token_ms': round(first_token * 1000, 1) if first_token is not None else None,
+            'latency_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
 
     def process_batch(self, input_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process multiple inputs using Bedrock."""
-        results = []
-        for input_data in input_data_list:
-            result = self.process(input_data)
-            results.append(result)
-        return results
+        """Answer many messages concurrently, preserving input order."""
+        if len(input_data_list) <= 1:
+            return [self.process(input_data) for input_data in input_data_list]
+
+        workers = min(self.max_workers, len(input_data_list))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='support') as executor:
+            return list(executor.map(self.process, input_data_list))
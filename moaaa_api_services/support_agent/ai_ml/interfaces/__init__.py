@@ -0,0 +1,3 @@
+from .agent import ISupport_agent
+
+__all__ = ['ISupport_agent']
@@ -0,0 +1,215 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Questions about the merchant's own application are never cached
+_PERSONAL = re.compile(r"\b(my|mine|our|ours|me|us)\b", re.IGNORECASE)
+# Follow-ups that only make sense with the earlier conversation
+_FOLLOW_UP = re.compile(
+    r"^\s*(and|but|also|so|what about|how about)\b|\b(it|that|this|those|these|they|them)\b",
+    re.IGNORECASE
+)
+
+
+def is_cacheable(message: str, history: Sequence[Dict[str, str]] = ()) -> bool:
+    """
+    Whether a question is general enough to answer from the shared cache.
+
+    Personal questions are excluded outright. Follow-ups are excluded when
+    there is earlier conversation they could refer to.
+    """
+    if _PERSONAL.search(message):
+        return False
+    if history and _FOLLOW_UP.search(message):
+        return False
+    return True
+
+
+def policy_version(policy_text: str) -> str:
+    """Version tag of the policy text answers were generated from."""
+    return hashlib.sha256(policy_text.encode('utf-8')).hexdigest()[:16]
+
+
+class SemanticCache:
+    """
+    In-process semantic cache of answers to general merchant questions.
+
+    Question embeddings are kept in a normalized float32 matrix, so a lookup
+    is one matrix-vector product over every entry. The index is persisted to
+    a single .npz file (written atomically, at most every `save_interval`
+    seconds) and reloaded on start. Entries expire after `ttl_seconds`, and
+    the whole cache is dropped when the policy text it was built from
+    changes.
+
+    Each process keeps its own copy; when several processes share the file,
+    the last one to save wins, which only costs cache hits.
+    """
+
+    def __init__(self, path: str, embed: Callable[[str], np.ndarray], policy_text: str = '',
+                 threshold: float = 0.92, ttl_seconds: int = 7 * 24 * 3600,
+                 max_entries: int = 5000, save_interval: int = 60):
+        """
+        Args:
+            path: .npz file the index is persisted to
+            embed: fn(text) -> embedding vector
+            policy_text: Policy the cached answers depend on
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entry lifetime
+            max_entries: Oldest entries are evicted beyond this
+            save_interval: Minimum seconds between writes to disk
+        """
+        self.path = path
+        self.embed = embed
+        self.policy_version = policy_version(policy_text)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.save_interval = save_interval
+
+        self._lock = threading.Lock()
+        self._vectors = None
+        self._created_at = np.zeros(0, dtype=np.float64)
+        self._entries: List[Dict[str, str]] = []
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._counters = {'hits': 0, 'misses': 0, 'bypassed': 0, 'stores': 0, 'expired': 0}
+
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta['policy_version'] != self.policy_version:
+                    logger.info("Policy changed; discarding semantic cache at %s", self.path)
+                    return
+                self._vectors = data['vectors']
+                self._created_at = data['created_at']
+                self._entries = meta['entries']
+        except Exception as e:
+            logger.warning("Could not load semantic cache from %s: %s", self.path, e)
+
+    def _save(self) -> None:
+        """Write the index atomically. Caller holds the lock."""
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            vectors=self._vectors if self._vectors is not None else np.zeros((0, 0), dtype=np.float32),
+            created_at=self._created_at,
+            meta=np.array(json.dumps({'policy_version': self.policy_version, 'entries': self._entries}))
+        )
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(buffer.getvalue())
+        os.replace(temp_path, self.path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def flush(self) -> None:
+        """Persist pending changes now."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def record_bypass(self) -> None:
+        """Count a question that was not eligible for the cache."""
+        with self._lock:
+            self._counters['bypassed'] += 1
+
+    def lookup(self, question: str) -> Tuple[Optional[Dict[str, Any]], np.ndarray]:
+        """
+        Find a cached answer to a near-duplicate question.
+
+        Returns:
+            (hit, embedding) - hit is {"question", "answer", "similarity"} or
+            None; the embedding can be passed to store() on a miss
+        """
+        vector = self._normalize(self.embed(question))
+        with self._lock:
+            if self._vectors is not None and len(self._entries):
+                similarities = self._vectors @ vector
+                expired = self._created_at < time.time() - self.ttl_seconds
+                similarities[expired] = -1.0
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    self._counters['hits'] += 1
+                    return {**self._entries[best], 'similarity': round(float(similarities[best]), 4)}, vector
+            self._counters['misses'] += 1
+        return None, vector
+
+    def store(self, question: str, answer: str, vector: np.ndarray) -> None:
+        """Add an answer, evicting expired and then oldest entries beyond max_entries."""
+        with self._lock:
+            vector = vector.reshape(1, -1)
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[1]:
+                self._vectors = np.zeros((0, vector.shape[1]), dtype=np.float32)
+                self._created_at = np.zeros(0, dtype=np.float64)
+                self._entries = []
+
+            self._vectors = np.vstack([self._vectors, vector])
+            self._created_at = np.append(self._created_at, time.time())
+            self._entries.append({'question': question, 'answer': answer})
+            self._counters['stores'] += 1
+            self._evict()
+
+            self._dirty = True
+            if time.monotonic() - self._saved_at >= self.save_interval:
+                self._save()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest beyond max_entries. Caller holds the lock."""
+        keep = self._created_at >= time.time() - self.ttl_seconds
+        self._counters['expired'] += int((~keep).sum())
+        if keep.sum() > self.max_entries:
+            keep[np.flatnonzero(keep)[:-self.max_entries]] = False
+        if keep.all():
+            return
+        self._vectors = self._vectors[keep]
+        self._created_at = self._created_at[keep]
+        self._entries = [entry for entry, kept in zip(self._entries, keep) if kept]
+
+    def invalidate(self, policy_text: Optional[str] = None) -> None:
+        """
+        Drop every entry, e.g. after the policy text changed.
+
+        Args:
+            policy_text: New policy text, if it changed
+        """
+        with self._lock:
+            if policy_text is not None:
+                self.policy_version = policy_version(policy_text)
+            self._vectors = None
+            self._created_at = np.zeros(0, dtype=np.float64)
+            self._entries = []
+            self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate metrics since the process started."""
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['misses']
+            return {
+                **self._counters,
+                'hit_rate': round(self._counters['hits'] / lookups, 4) if lookups else 0.0,
+                'entries': len(self._entries),
+                'threshold': self.threshold,
+                'policy_version': self.policy_version,
+            }
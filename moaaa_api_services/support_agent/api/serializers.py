@@ -1,4 +1,20 @@
 from rest_framework import serializers
 
 
-# TODO: Add serializers for support_agent models
+class SupportMessageSerializer(serializers.Serializer):
+    """Request serializer for a single merchant message."""
+    
+    application_id = serializers.CharField(max_length=255)
+    message = serializers.CharField(max_length=4000)
+
+
+class SupportMessageBatchSerializer(serializers.Serializer):
+    """Request serializer for answering many merchant messages."""
+    
+    messages = SupportMessageSerializer(many=True, allow_empty=False)
+
+
+class SupportChatMessageSerializer(SupportMessageSerializer):
+    """Request serializer for a message in a (new or existing) conversation."""
+    
+    conversation_id = serializers.UUIDField(required=False)
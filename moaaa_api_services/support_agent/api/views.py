@@ -1,10 +1,143 @@
+import json
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
+from application_profile.api.serializers import ApplicationStatusSerializer
+from application_profile.models import ApplicationStatus
+from merchant_profile.core.implementations.merchant_profile_service_impl import Merchant_profileServiceImpl
+from merchant_profile.dao.implementations.merchant_profile_repository_impl import Merchant_profileRepositoryImpl
+from ..models import Conversation, Message
+from ..tasks import get_agent, summarize_later
+from .serializers import SupportChatMessageSerializer, SupportMessageBatchSerializer
+
+
+def _status_snapshots(application_ids) -> dict:
+    """Serialized status snapshots by application ID (None when the application has no documents)."""
+    application_ids = set(application_ids)
+    snapshots = {
+        snapshot.application_id: snapshot
+        for snapshot in ApplicationStatus.objects.filter(application_id__in=application_ids)
+    }
+    missing = application_ids - set(snapshots)
+    if missing:
+        snapshots.update(
+            (snapshot.application_id, snapshot)
+            for snapshot in ApplicationStatus.objects.refresh(missing)
+        )
+    return {
+        application_id: ApplicationStatusSerializer(snapshots[application_id]).data
+        if application_id in snapshots else None
+        for application_id in application_ids
+    }
+
+
+# Merchant fields the agent is given as context
+MERCHANT_CONTEXT_FIELDS = ['legal_name', 'dba_name', 'business_type']
+
+
+def _merchant_profiles(snapshots) -> dict:
+    """Merchant context by application ID, read through the profile cache (None when unknown)."""
+    merchant_ids = {
+        application_id: snapshot['merchant_id']
+        for application_id, snapshot in snapshots.items()
+        if snapshot is not None and snapshot['merchant_id']
+    }
+    merchants = Merchant_profileServiceImpl(Merchant_profileRepositoryImpl()).get_many(set(merchant_ids.values()))
+    profiles = {}
+    for application_id in snapshots:
+        merchant = merchants.get(str(merchant_ids.get(application_id)))
+        profiles[application_id] = (
+            {field: merchant[field] for field in MERCHANT_CONTEXT_FIELDS} if merchant is not None else None
+        )
+    return profiles
+
+
+def _start_turn(request, data: dict):
+    """
+    Record the merchant's message and build the agent input for the turn.
+    
+    Returns:
+        (conversation, agent input with status snapshot, merchant, summary and recent history)
+    """
+    if data.get('conversation_id'):
+        conversation = get_object_or_404(
+            Conversation, pk=data['conversation_id'], application_id=data['application_id']
+        )
+    else:
+        conversation = Conversation.objects.create(
+            application_id=data['application_id'],
+            created_by=request.user.username if request.user.is_authenticated else 'anonymous'
+        )
+    
+    summary, history = conversation.build_context(settings.SUPPORT_CONTEXT_TOKEN_BUDGET)
+    conversation.add_message(Message.Role.USER, data['message'])
+    
+    snapshots = _status_snapshots([data['application_id']])
+    agent_input = {
+        'message': data['message'],
+        'status': snapshots[data['application_id']],
+        'merchant': _merchant_profiles(snapshots)[data['application_id']],
+        'summary': summary,
+        'history': history,
+    }
+    return conversation, agent_input
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _stream_events(agent_input: dict, conversation: Conversation):
+    """
+    Relay the agent's stream as server-sent events.
+    
+    Events are produced one at a time as the server writes them, so a slow
+    client slows the upstream read instead of buffering the reply. When the
+    client disconnects the server closes this generator, which closes the
+    agent's stream and with it the Bedrock response stream.
+    
+    The reply is saved to the conversation before the done event; a partial
+    reply (disconnect or error) is saved as well.
+    """
+    events = get_agent().stream(agent_input)
+    parts = []
+    saved = False
+    try:
+        for event in events:
+            event_type = event.pop('type')
+            if event_type == 'token':
+                parts.append(event['text'])
+            else:
+                conversation.add_message(Message.Role.ASSISTANT, ''.join(parts))
+                saved = True
+                event['conversation_id'] = str(conversation.id)
+            yield _sse(event_type, event)
+    except Exception as e:
+        yield _sse('error', {'error': str(e)})
+    finally:
+        events.close()
+        if parts and not saved:
+            conversation.add_message(Message.Role.ASSISTANT, ''.join(parts))
+        summarize_later(conversation)
+
 
 class Support_agentViewSet(viewsets.ViewSet):
-    """API ViewSet for support_agent."""
+    """
+    API ViewSet for support_agent.
+    
+    Endpoints:
+        POST /api/support/support_agent/process/ - Answer a merchant message
+        POST /api/support/support_agent/process_batch/ - Answer many messages
+        POST /api/support/support_agent/stream/ - Answer a message as server-sent events
+        GET /api/support/support_agent/cache_stats/ - Semantic cache hit-rate metrics
+        POST /api/support/support_agent/cache_invalidate/ - Clear the semantic cache
+    """
 
     def list(self, request):
         # TODO: Implement
@@ -28,12 +161,114 @@ class Support_agentViewSet(viewsets.ViewSet):
 
     @action(detail=False, methods=['post'])
     def process(self, request):
-        """Trigger AI/ML processing."""
-        # TODO: Implement
-        return Response({"status": "processing"})
+        """
+        Answer a merchant message.
+        
+        Status questions are answered from the application's status snapshot;
+        only open-ended questions call the model. Omit conversation_id to
+        start a new conversation.
+        
+        Request:
+            {"application_id": "app-001", "message": "What's my status?", "conversation_id": "uuid"}
+        
+        Response:
+            {
+                "reply": "...",
+                "intent": "status",
+                "answered_by": "snapshot",
+                "latency_ms": 0.4,
+                "conversation_id": "uuid"
+            }
+        """
+        serializer = SupportChatMessageSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        conversation, agent_input = _start_turn(request, serializer.validated_data)
+        
+        try:
+            output = get_agent().process(agent_input)
+        except Exception as e:
+            return Response(
+                {'error': str(e), 'conversation_id': str(conversation.id)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        conversation.add_message(Message.Role.ASSISTANT, output['reply'])
+        summarize_later(conversation)
+        return Response({**output, 'conversation_id': str(conversation.id)})
 
     @action(detail=False, methods=['post'])
     def process_batch(self, request):
-        """Trigger batch AI/ML processing."""
-        # TODO: Implement
-        return Response({"status": "batch_processing"})
+        """
+        Answer many independent merchant messages (no conversation memory),
+        loading each application's snapshot and merchant once.
+        
+        Request:
+            {"messages": [{"application_id": "app-001", "message": "..."}, ...]}
+        """
+        serializer = SupportMessageBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        messages = serializer.validated_data['messages']
+        
+        snapshots = _status_snapshots(message['application_id'] for message in messages)
+        merchants = _merchant_profiles(snapshots)
+        try:
+            outputs = get_agent().process_batch([
+                {
+                    'message': message['message'],
+                    'status': snapshots[message['application_id']],
+                    'merchant': merchants[message['application_id']],
+                }
+                for message in messages
+            ])
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        return Response({'results': outputs})
+
+    @action(detail=False, methods=['post'])
+    def stream(self, request):
+        """
+        Answer a merchant message as a stream of server-sent events.
+        
+        Request:
+            {"application_id": "app-001", "message": "Can I accept Amex?", "conversation_id": "uuid"}
+        
+        Response (text/event-stream):
+            event: token
+            data: {"text": "Yes, "}
+            
+            event: done
+            data: {"intent": null, "answered_by": "model", "first_token_ms": 412.0, "latency_ms": 1830.5,
+                   "conversation_id": "uuid"}
+        """
+        serializer = SupportChatMessageSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        # Build the context before streaming so the response starts with the first token
+        conversation, agent_input = _start_turn(request, serializer.validated_data)
+        response = StreamingHttpResponse(
+            _stream_events(agent_input, conversation),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Stop nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    @action(detail=False, methods=['get'])
+    def cache_stats(self, request):
+        """Semantic cache metrics for this process (hits, misses, bypassed, hit_rate, entries)."""
+        cache = get_agent().cache
+        if cache is None:
+            return Response({'enabled': False})
+        return Response({'enabled': True, **cache.stats()})
+
+    @action(detail=False, methods=['post'])
+    def cache_invalidate(self, request):
+        """Drop every cached answer, e.g. after editing answers or policy wording out of band."""
+        cache = get_agent().cache
+        if cache is None:
+            return Response({'enabled': False})
+        cache.invalidate()
+        return Response({'status': 'invalidated', **cache.stats()})
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from ..interfaces.support_agent_service import ISupport_agentService
 from ...dao.interfaces.support_agent_repository import ISupport_agentRepository
 
@@ -25,3 +25,12 @@ class Support_agentServiceImpl(ISupport_agentService):
 
     def delete(self, id: str) -> bool:
         return self.repository.delete(id)
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, dict]:
+        return self.repository.get_many(ids)
+
+    def upsert_many(self, rows: List[dict]) -> List[dict]:
+        return self.repository.upsert_many(rows)
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[dict]:
+        return self.repository.iter_all(chunk_size)
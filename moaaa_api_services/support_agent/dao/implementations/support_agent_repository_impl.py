@@ -1,27 +1,9 @@
-from typing import List, Optional
+from moaaa_api_services.repository import DjangoModelRepository
 from ..interfaces.support_agent_repository import ISupport_agentRepository
-from ..models import *
+from ...models import Conversation
 
 
-class Support_agentRepositoryImpl(ISupport_agentRepository):
-    """Concrete implementation of support_agent repository."""
+class Support_agentRepositoryImpl(DjangoModelRepository, ISupport_agentRepository):
+    """Concrete implementation of support_agent repository, over Conversation."""
 
-    def get_by_id(self, id: str) -> Optional[dict]:
-        # TODO: Implement
-        pass
-
-    def get_all(self) -> List[dict]:
-        # TODO: Implement
-        pass
-
-    def create(self, data: dict) -> dict:
-        # TODO: Implement
-        pass
-
-    def update(self, id: str, data: dict) -> Optional[dict]:
-        # TODO: Implement
-        pass
-
-    def delete(self, id: str) -> bool:
-        # TODO: Implement
-        pass
+    model = Conversation
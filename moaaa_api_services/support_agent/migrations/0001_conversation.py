@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:15
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('application_id', models.CharField(db_index=True, max_length=255)),
+                ('summary', models.TextField(blank=True)),
+                ('summary_through', models.IntegerField(default=0)),
+                ('message_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'db_table': 'support_conversation',
+                'ordering': ['-updated_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Message',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('sequence', models.IntegerField()),
+                ('role', models.CharField(choices=[('user', 'User'), ('assistant', 'Assistant')], max_length=20)),
+                ('content', models.TextField()),
+                ('token_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('conversation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='support_agent.conversation')),
+            ],
+            options={
+                'db_table': 'support_message',
+                'ordering': ['conversation', 'sequence'],
+                'constraints': [models.UniqueConstraint(fields=('conversation', 'sequence'), name='support_message_conversation_sequence_uniq')],
+            },
+        ),
+    ]
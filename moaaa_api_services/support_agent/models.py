@@ -1,3 +1,149 @@
-from django.db import models
+from typing import Callable, Dict, List, Tuple
+import uuid
 
-# Create your models here.
+from django.db import models, transaction
+from django.utils import timezone
+
+from .ai_ml.context import estimate_tokens, split_window, to_turns
+
+
+class Conversation(models.Model):
+    """
+    A support conversation between a merchant and the support agent.
+
+    Older turns are folded into a rolling summary as they leave the recent
+    window, so the context sent to the model stays bounded however long
+    the conversation runs.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Application reference (string for now, matching the document apps)
+    application_id = models.CharField(max_length=255, db_index=True)
+
+    # Rolling summary of every message up to and including summary_through
+    summary = models.TextField(blank=True)
+    summary_through = models.IntegerField(default=0)
+
+    # Sequence number of the latest message
+    message_count = models.IntegerField(default=0)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Audit
+    created_by = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        db_table = 'support_conversation'
+        ordering = ['-updated_at']
+
+    def __str__(self):
+        return f"Conversation({self.application_id}, {self.message_count} messages)"
+
+    def add_message(self, role: str, content: str) -> 'Message':
+        """Append a message, numbering it after the conversation's latest one."""
+        with transaction.atomic():
+            # Lock the conversation so concurrent turns get distinct sequence numbers
+            sequence = Conversation.objects.select_for_update().values_list(
+                'message_count', flat=True
+            ).get(pk=self.pk) + 1
+            message = Message.objects.create(
+                conversation=self,
+                sequence=sequence,
+                role=role,
+                content=content,
+                token_count=estimate_tokens(content)
+            )
+            Conversation.objects.filter(pk=self.pk).update(message_count=sequence, updated_at=timezone.now())
+        self.message_count = sequence
+        return message
+
+    def build_context(self, budget: int) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Build the model context for the next turn, without calling the model.
+
+        Loads only messages not yet summarized and keeps the most recent
+        ones that fit the budget verbatim. Older ones are left out: they
+        are folded into the summary by update_summary() after the turn, so
+        the summary may lag a turn behind.
+
+        Args:
+            budget: Token budget for the verbatim recent turns
+
+        Returns:
+            (summary, recent turns oldest first)
+        """
+        unsummarized = list(self.messages.filter(sequence__gt=self.summary_through).order_by('sequence'))
+        _, window = split_window(unsummarized, budget)
+        return self.summary, to_turns(window)
+
+    def update_summary(self, summarize: Callable[[str, List[Dict[str, str]]], str], budget: int) -> bool:
+        """
+        Fold the messages that no longer fit the recent window into the
+        summary (incrementally: only the newly evicted turns are summarized).
+
+        Runs after a turn, off the request (see support_agent.tasks). If
+        another process folded the same turns first, its summary is kept.
+
+        Args:
+            summarize: fn(summary, evicted turns) -> updated summary
+            budget: Token budget for the verbatim recent turns
+
+        Returns:
+            True if the summary was updated
+        """
+        unsummarized = list(self.messages.filter(sequence__gt=self.summary_through).order_by('sequence'))
+        evicted, _ = split_window(unsummarized, budget)
+        if not evicted:
+            return False
+
+        summary = summarize(self.summary, to_turns(evicted))
+        updated = Conversation.objects.filter(pk=self.pk, summary_through=self.summary_through).update(
+            summary=summary, summary_through=evicted[-1].sequence, updated_at=timezone.now()
+        )
+        if updated:
+            self.summary = summary
+            self.summary_through = evicted[-1].sequence
+        return bool(updated)
+
+
+class Message(models.Model):
+    """A single message in a support conversation."""
+
+    class Role(models.TextChoices):
+        USER = 'user', 'User'
+        ASSISTANT = 'assistant', 'Assistant'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    # Relationships
+    conversation = models.ForeignKey(
+        Conversation,
+        on_delete=models.CASCADE,
+        related_name='messages'
+    )
+
+    # Position in the conversation (1-based)
+    sequence = models.IntegerField()
+
+    role = models.CharField(max_length=20, choices=Role.choices)
+    content = models.TextField()
+    token_count = models.IntegerField(default=0)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'support_message'
+        ordering = ['conversation', 'sequence']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['conversation', 'sequence'],
+                name='support_message_conversation_sequence_uniq'
+            ),
+        ]
+
+    def __str__(self):
+        return f"Message({self.role}, #{self.sequence})"
@@ -0,0 +1,59 @@
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from .ai_ml import ISupport_agent
+from .models import Conversation
+
+logger = logging.getLogger(__name__)
+
+_agent = None
+
+# Summaries are folded in the background, one at a time per process
+_summary_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='support-summary')
+
+
+def get_agent() -> ISupport_agent:
+    """Support agent shared across requests (boto3 clients are thread-safe)."""
+    global _agent
+    if _agent is None:
+        # Imported here: the agent and its cache pull in boto3 and numpy
+        from .ai_ml import SemanticCache, Support_agentImpl
+        agent = Support_agentImpl(policy_text=settings.SUPPORT_POLICY_TEXT)
+        if settings.SUPPORT_CACHE_ENABLED:
+            agent.cache = SemanticCache(
+                path=settings.SUPPORT_CACHE_PATH,
+                embed=agent.embed,
+                policy_text=settings.SUPPORT_POLICY_TEXT,
+                threshold=settings.SUPPORT_CACHE_SIMILARITY_THRESHOLD,
+                ttl_seconds=settings.SUPPORT_CACHE_TTL_SECONDS,
+                max_entries=settings.SUPPORT_CACHE_MAX_ENTRIES
+            )
+            atexit.register(agent.cache.flush)
+        _agent = agent
+    return _agent
+
+
+def summarize_later(conversation: Conversation) -> None:
+    """
+    Fold a conversation's evicted turns into its summary after the current
+    transaction commits, on a background thread, so the summarization
+    model call never adds to a merchant's turn.
+    """
+    conversation_id = conversation.pk
+    transaction.on_commit(lambda: _summary_executor.submit(update_summary, conversation_id))
+
+
+def update_summary(conversation_id) -> None:
+    close_old_connections()
+    try:
+        conversation = Conversation.objects.get(pk=conversation_id)
+        conversation.update_summary(get_agent().summarize, settings.SUPPORT_CONTEXT_TOKEN_BUDGET)
+    except Exception:
+        # The evicted turns stay unsummarized and are retried after the next turn
+        logger.warning("Could not update summary of conversation %s", conversation_id, exc_info=True)
+    finally:
+        close_old_connections()
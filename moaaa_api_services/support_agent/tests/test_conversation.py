@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from support_agent.models import Conversation, Message
+
+
+class ConversationContextTests(TestCase):
+    """Context building and deferred summarization."""
+
+    def setUp(self):
+        self.conversation = Conversation.objects.create(application_id='APP-1001')
+        for n in range(4):
+            self.conversation.add_message(Message.Role.USER, f'question {n} ' + 'x' * 40)
+            self.conversation.add_message(Message.Role.ASSISTANT, f'answer {n} ' + 'y' * 40)
+
+    def test_build_context_does_not_call_the_model(self):
+        summary, history = self.conversation.build_context(budget=30)
+
+        self.assertEqual(summary, '')
+        self.assertEqual(history[0]['role'], 'user')
+        self.assertIn('question 3', history[0]['content'])
+        self.assertEqual(len(history), 2)
+
+    def test_update_summary_folds_evicted_turns_once(self):
+        summarize = mock.Mock(return_value='summary of 0-2')
+
+        self.assertTrue(self.conversation.update_summary(summarize, budget=30))
+        summary, turns = summarize.call_args.args
+        self.assertEqual(summary, '')
+        self.assertEqual(len(turns), 6)
+        self.assertEqual(self.conversation.summary_through, 6)
+
+        # Nothing newly evicted
+        self.assertFalse(self.conversation.update_summary(summarize, budget=30))
+        self.assertEqual(summarize.call_count, 1)
+        self.assertEqual(self.conversation.build_context(budget=30)[0], 'summary of 0-2')
+
+    def test_concurrent_update_keeps_the_first_summary(self):
+        stale = Conversation.objects.get(pk=self.conversation.pk)
+        self.conversation.update_summary(lambda summary, turns: 'first', budget=30)
+
+        self.assertFalse(stale.update_summary(lambda summary, turns: 'second', budget=30))
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.summary, 'first')
+
+    def test_process_summarizes_after_the_reply(self):
+        agent = mock.Mock()
+        agent.process.return_value = {'reply': 'Approved', 'intent': 'status', 'answered_by': 'snapshot'}
+        agent.summarize.return_value = 'summary'
+
+        with mock.patch('support_agent.api.views.get_agent', return_value=agent), \
+                mock.patch('support_agent.tasks.get_agent', return_value=agent), \
+                mock.patch('support_agent.tasks._summary_executor') as executor, \
+                self.settings(SUPPORT_CONTEXT_TOKEN_BUDGET=30):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post('/api/support/support_agent/process/', {
+                    'application_id': 'APP-1001',
+                    'conversation_id': str(self.conversation.pk),
+                    'message': "What's my status?",
+                }, content_type='application/json')
+            self.assertEqual(response.status_code, 200)
+            agent.summarize.assert_not_called()
+
+            # The deferred job runs off the request
+            function, conversation_id = executor.submit.call_args.args
+            function(conversation_id)
+        agent.summarize.assert_called_once()
@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from support_agent.ai_ml.implementations.agent_impl import (
+    ANSWERED_BY_CACHE,
+    ANSWERED_BY_SNAPSHOT,
+    Support_agentImpl,
+)
+
+STATUS = {
+    'stage': 'AWAITING_DOCUMENTS',
+    'missing_document_types': ['VOIDED_CHECK'],
+    'documents_requiring_review': 0,
+    'jobs_in_progress': 0,
+    'jobs_failed': 0,
+    'uploads_failed': 0,
+}
+
+
+class IntentRoutingTests(SimpleTestCase):
+    """Which messages the status snapshot answers, and which reach the semantic cache."""
+
+    def test_application_specific_questions_use_the_snapshot(self):
+        cases = {
+            "What's my status?": 'status',
+            'Where is my application?': 'status',
+            'Am I approved yet?': 'status',
+            'What documents are still missing?': 'missing_documents',
+            'What do I still need to send?': 'missing_documents',
+            'Why was my bank statement rejected?': 'review',
+        }
+        for message, intent in cases.items():
+            with self.subTest(message=message):
+                self.assertEqual(Support_agentImpl.detect_intent(message), intent)
+
+    def test_general_questions_have_no_intent(self):
+        for message in [
+            'how long does approval take?',
+            'what documents do I need?',
+            'How do I update the bank account on file?',
+            'What happens if a document is missing?',
+            'Who do I contact about a problem with the portal?',
+        ]:
+            with self.subTest(message=message):
+                self.assertIsNone(Support_agentImpl.detect_intent(message))
+
+    def test_general_questions_are_answered_from_the_cache(self):
+        cache = mock.Mock()
+        cache.lookup.return_value = ({'answer': 'Usually two business days.'}, None)
+        agent = Support_agentImpl(cache=cache)
+
+        plan = agent._plan({'message': 'how long does approval take?', 'status': STATUS})
+
+        self.assertEqual(plan['answered_by'], ANSWERED_BY_CACHE)
+        self.assertEqual(plan['reply'], 'Usually two business days.')
+        cache.lookup.assert_called_once_with('how long does approval take?')
+
+    def test_status_questions_skip_the_cache(self):
+        cache = mock.Mock()
+        agent = Support_agentImpl(cache=cache)
+
+        plan = agent._plan({'message': 'What documents are still missing?', 'status': STATUS})
+
+        self.assertEqual(plan['answered_by'], ANSWERED_BY_SNAPSHOT)
+        self.assertEqual(plan['reply'], 'We still need your voided check.')
+        cache.lookup.assert_not_called()
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from application_profile.models import Application
+from merchant_profile.models import Merchant
+from moaaa_api_services.read_through_cache import get_profile_cache
+from support_agent.ai_ml import Support_agentImpl
+
+
+class MerchantContextTests(TestCase):
+    """The agent gets the merchant's profile, read through the profile cache."""
+
+    def setUp(self):
+        # A fresh cache per test; the process-wide one outlives test transactions
+        patcher = mock.patch.dict('moaaa_api_services.read_through_cache._caches', clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.merchant = Merchant.objects.create(legal_name='Acme Corp LLC', dba_name='Acme', business_type='retail')
+            Application.objects.create(merchant=self.merchant, reference='APP-1001')
+
+        self.agent = mock.Mock()
+        self.agent.process.return_value = {'reply': 'Hi', 'intent': None, 'answered_by': 'model'}
+        self.agent.process_batch.side_effect = lambda inputs: [{'reply': 'Hi'} for _ in inputs]
+        for patcher in [
+            mock.patch('support_agent.api.views.get_agent', return_value=self.agent),
+            mock.patch('support_agent.tasks._summary_executor'),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def ask(self, application_id='APP-1001') -> dict:
+        response = self.client.post('/api/support/support_agent/process/', {
+            'application_id': application_id,
+            'message': 'Can I accept Amex?',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return self.agent.process.call_args.args[0]
+
+    def test_agent_input_carries_the_merchant(self):
+        agent_input = self.ask()
+        self.assertEqual(agent_input['merchant'], {
+            'legal_name': 'Acme Corp LLC', 'dba_name': 'Acme', 'business_type': 'retail',
+        })
+
+    def test_later_turns_read_the_merchant_from_the_cache(self):
+        self.ask()
+        self.ask()
+
+        stats = get_profile_cache('merchant').stats()
+        self.assertEqual(stats['loads'], 1)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_merchant_update_invalidates_the_cached_profile(self):
+        self.ask()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.merchant.dba_name = 'Acme Payments'
+            self.merchant.save()
+
+        self.assertEqual(self.ask()['merchant']['dba_name'], 'Acme Payments')
+
+    def test_application_without_merchant_has_no_merchant_context(self):
+        self.assertIsNone(self.ask('APP-UNKNOWN')['merchant'])
+
+    def test_batch_loads_each_merchant_once(self):
+        response = self.client.post('/api/support/support_agent/process_batch/', {
+            'messages': [
+                {'application_id': 'APP-1001', 'message': 'Can I accept Amex?'},
+                {'application_id': 'APP-1001', 'message': 'Do you support Apple Pay?'},
+            ],
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+        inputs = self.agent.process_batch.call_args.args[0]
+        self.assertEqual([agent_input['merchant']['dba_name'] for agent_input in inputs], ['Acme', 'Acme'])
+        self.assertEqual(get_profile_cache('merchant').stats()['loads'], 1)
+
+    def test_system_prompt_includes_the_merchant(self):
+        prompt = Support_agentImpl()._build_system_prompt(None, merchant={'dba_name': 'Acme'})
+        self.assertIn('"dba_name": "Acme"', prompt)